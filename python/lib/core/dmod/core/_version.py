@@ -1 +1 @@
-__version__ = '0.6.0'
\ No newline at end of file
+__version__ = '0.7.0'
\ No newline at end of file
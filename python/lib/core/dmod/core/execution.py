@@ -15,11 +15,20 @@ class AllocationParadigm(Enum):
                       allocations be single cpu/process
         SINGLE_NODE - require all allocation of assets to be from a single resource/host; also, require allocations to
                       be single cpu/process
+        BEST_FIT    - obtain allocations of assets from as few resources as possible, preferring the resource that most
+                      tightly fits what is outstanding; also, have allocations be single cpu/process
+        WORST_FIT   - obtain allocations of assets by always taking from the resource with the most remaining assets, to
+                      spread load evenly; also, have allocations be single cpu/process
+        PARTITION_AWARE - obtain allocations of assets such that hydrofabric partitions with many cross-partition
+                      nexus links are placed on the same resource/host; also, have allocations be single cpu/process
     """
 
     FILL_NODES = 0
     ROUND_ROBIN = 1
     SINGLE_NODE = 2
+    BEST_FIT = 3
+    WORST_FIT = 4
+    PARTITION_AWARE = 5
 
     @classmethod
     def get_default_selection(cls) -> 'AllocationParadigm':
@@ -0,0 +1,11 @@
+"""
+Benchmarks for each stage of an evaluation, run against generated data so that they may be run offline
+
+Run every stage at a given scale with:
+
+    python -m benchmarks --locations 100 --timesteps 2000 --thresholds 4
+
+or through pytest-benchmark with:
+
+    pytest benchmarks/bench_evaluate.py --benchmark-only
+"""
@@ -0,0 +1,167 @@
+"""
+Benchmarks every stage of an evaluation on generated data and prints how long each took and how much memory it used
+"""
+import typing
+import json
+import logging
+import tempfile
+import warnings
+
+from argparse import ArgumentParser
+
+from . import synthetic
+from . import stages
+
+
+class Arguments(object):
+    def __init__(self, *args):
+        self.__locations: int = 10
+        self.__timesteps: int = 1000
+        self.__thresholds: int = 3
+        self.__repeat: int = 1
+        self.__workers: typing.Optional[int] = None
+        self.__vectorize: bool = False
+        self.__output_format: str = "json"
+        self.__stages: typing.Optional[typing.Sequence[str]] = None
+        self.__json: bool = False
+        self.__trace_memory: bool = True
+
+        self.__parse_command_line(*args)
+
+    @property
+    def scale(self) -> synthetic.Scale:
+        return synthetic.Scale(locations=self.__locations, timesteps=self.__timesteps, thresholds=self.__thresholds)
+
+    @property
+    def repeat(self) -> int:
+        return self.__repeat
+
+    @property
+    def workers(self) -> typing.Optional[int]:
+        return self.__workers
+
+    @property
+    def vectorize(self) -> bool:
+        return self.__vectorize
+
+    @property
+    def output_format(self) -> str:
+        return self.__output_format
+
+    @property
+    def stages(self) -> typing.Optional[typing.Sequence[str]]:
+        return self.__stages
+
+    @property
+    def json(self) -> bool:
+        return self.__json
+
+    @property
+    def trace_memory(self) -> bool:
+        return self.__trace_memory
+
+    def __parse_command_line(self, *args):
+        parser = ArgumentParser("Benchmark each stage of an evaluation against generated data")
+
+        parser.add_argument("--locations", type=int, default=10, help="The number of locations to evaluate")
+        parser.add_argument("--timesteps", type=int, default=1000, help="The number of values per location")
+        parser.add_argument("--thresholds", type=int, default=3, help="The number of thresholds per location")
+        parser.add_argument("--repeat", type=int, default=1, help="How many times to run every stage")
+        parser.add_argument("--workers", type=int, default=None, help="The number of processes to score with")
+        parser.add_argument("--vectorize", action="store_true", help="Score every location at once")
+        parser.add_argument("--format", dest="output_format", default="json", help="The format to write results in")
+        parser.add_argument(
+            "--stage",
+            dest="stages",
+            action="append",
+            choices=stages.STAGES,
+            help="A stage to measure; every stage is measured if none are given"
+        )
+        parser.add_argument("--json", action="store_true", help="Print measurements as JSON")
+        parser.add_argument(
+            "--skip-memory",
+            dest="trace_memory",
+            action="store_false",
+            help="Don't trace allocations; timings are more accurate but peak memory per stage won't be measured"
+        )
+
+        parameters = parser.parse_args(args) if args else parser.parse_args()
+
+        self.__locations = parameters.locations
+        self.__timesteps = parameters.timesteps
+        self.__thresholds = parameters.thresholds
+        self.__repeat = max(parameters.repeat, 1)
+        self.__workers = parameters.workers
+        self.__vectorize = parameters.vectorize
+        self.__output_format = parameters.output_format
+        self.__stages = parameters.stages
+        self.__json = parameters.json
+        self.__trace_memory = parameters.trace_memory
+
+
+def format_bytes(byte_count: typing.Optional[int]) -> str:
+    if byte_count is None:
+        return "unknown"
+
+    for unit in ("B", "KiB", "MiB"):
+        if abs(byte_count) < 1024:
+            return f"{byte_count:.1f} {unit}"
+        byte_count /= 1024
+    return f"{byte_count:.1f} GiB"
+
+
+def main(arguments: Arguments = None):
+    if arguments is None:
+        arguments = Arguments()
+
+    # Deprecation warnings and progress messages would bury the measurements
+    warnings.simplefilter("ignore")
+    logging.disable(logging.INFO)
+
+    runs: typing.List[typing.List[stages.StageMeasurement]] = list()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = synthetic.write_inputs(directory, arguments.scale)
+        instructions = synthetic.create_specification(paths, arguments.scale)
+
+        for _ in range(arguments.repeat):
+            runs.append(
+                stages.run_stages(
+                    instructions,
+                    output_format=arguments.output_format,
+                    workers=arguments.workers,
+                    vectorize=arguments.vectorize,
+                    stages=arguments.stages,
+                    trace_memory=arguments.trace_memory
+                )
+            )
+
+    if arguments.json:
+        print(json.dumps(
+            {
+                "scale": vars(arguments.scale),
+                "runs": [[measurement.to_dict() for measurement in run] for run in runs]
+            },
+            indent=4
+        ))
+        return
+
+    print(f"Evaluating {arguments.scale}")
+    print(f"{'stage':<22}{'wall (s)':>12}{'cpu (s)':>12}{'peak traced':>16}{'max rss':>14}")
+
+    for run_index, run in enumerate(runs):
+        if len(runs) > 1:
+            print(f"run {run_index + 1}")
+
+        for measurement in run:
+            print(
+                f"{measurement.stage:<22}"
+                f"{measurement.wall_seconds:>12.4f}"
+                f"{measurement.cpu_seconds:>12.4f}"
+                f"{format_bytes(measurement.peak_traced_bytes):>16}"
+                f"{format_bytes(measurement.max_rss_bytes):>14}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+pytest-benchmark entry points for each stage of an evaluation
+
+Run with `pytest benchmarks/bench_evaluate.py --benchmark-only`. The scale may be changed with the
+`BENCHMARK_LOCATIONS`, `BENCHMARK_TIMESTEPS`, and `BENCHMARK_THRESHOLDS` environment variables.
+"""
+import os
+import tempfile
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from dmod.evaluations import evaluate
+from dmod.evaluations import specification
+from dmod.evaluations import writing
+
+from . import synthetic
+
+
+def get_scale() -> synthetic.Scale:
+    return synthetic.Scale(
+        locations=int(os.environ.get("BENCHMARK_LOCATIONS", 10)),
+        timesteps=int(os.environ.get("BENCHMARK_TIMESTEPS", 1000)),
+        thresholds=int(os.environ.get("BENCHMARK_THRESHOLDS", 3))
+    )
+
+
+@pytest.fixture(scope="module")
+def instructions():
+    scale = get_scale()
+    with tempfile.TemporaryDirectory() as directory:
+        yield synthetic.create_specification(synthetic.write_inputs(directory, scale), scale)
+
+
+@pytest.fixture(scope="module")
+def evaluator(instructions):
+    return evaluate.Evaluator(instructions)
+
+
+@pytest.fixture(scope="module")
+def crosswalk(evaluator):
+    return evaluator.get_crosswalk()
+
+
+@pytest.fixture(scope="module")
+def data_to_evaluate(evaluator, crosswalk):
+    return evaluator.normalize_values(evaluator.get_data_to_evaluate(crosswalk))
+
+
+@pytest.fixture(scope="module")
+def thresholds(evaluator):
+    return evaluator.get_thresholds()
+
+
+@pytest.fixture(scope="module")
+def evaluation_results(instructions, evaluator, data_to_evaluate, thresholds):
+    return specification.EvaluationResults(instructions, evaluator.score(data_to_evaluate, thresholds))
+
+
+def test_get_crosswalk(benchmark, evaluator):
+    benchmark(evaluator.get_crosswalk)
+
+
+def test_get_data_to_evaluate(benchmark, evaluator, crosswalk):
+    benchmark(evaluator.get_data_to_evaluate, crosswalk)
+
+
+def test_normalize_values(benchmark, evaluator, crosswalk):
+    data = evaluator.get_data_to_evaluate(crosswalk)
+    benchmark(lambda: evaluator.normalize_values(data.copy()))
+
+
+def test_get_thresholds(benchmark, evaluator):
+    benchmark(evaluator.get_thresholds)
+
+
+def test_score(benchmark, evaluator, data_to_evaluate, thresholds):
+    benchmark(evaluator.score, data_to_evaluate, thresholds)
+
+
+def test_results(benchmark, instructions, evaluator, data_to_evaluate, thresholds):
+    scores = evaluator.score(data_to_evaluate, thresholds)
+    benchmark(specification.EvaluationResults, instructions, scores)
+
+
+@pytest.mark.parametrize("output_format", ["json", "netcdf"])
+def test_writing(benchmark, evaluation_results, output_format, tmp_path):
+    output_writer = writing.get_writer(output_format, str(tmp_path / f"results.{output_format}"))
+    benchmark(output_writer.write, evaluation_results)
@@ -0,0 +1,151 @@
+"""
+Runs each stage of an evaluation separately, measuring how long it took and how much memory it needed
+"""
+import typing
+import os
+import time
+import tempfile
+import tracemalloc
+
+from dataclasses import dataclass
+from dataclasses import asdict
+
+from dmod.evaluations import evaluate
+from dmod.evaluations import instrumentation
+from dmod.evaluations import specification
+from dmod.evaluations import writing
+
+STAGES = (
+    "get_crosswalk",
+    "get_data_to_evaluate",
+    "normalize_values",
+    "get_thresholds",
+    "score",
+    "results",
+    "writing",
+)
+"""The stages of an evaluation, in the order that they are run"""
+
+
+@dataclass
+class StageMeasurement:
+    """
+    How long a stage took and how much memory it needed
+    """
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_traced_bytes: int
+    """The most memory allocated through python (including numpy and pandas) at once during the stage; 0 if untraced"""
+    max_rss_bytes: typing.Optional[int]
+    """The highest resident set size of the process so far; only grows, so it marks the stage where the peak occurred.
+    None where it can't be determined"""
+
+    def to_dict(self) -> typing.Dict[str, typing.Union[str, float, int]]:
+        return asdict(self)
+
+
+def measure(
+    stage: str,
+    function: typing.Callable,
+    *args,
+    trace_memory: bool = True,
+    **kwargs
+) -> typing.Tuple[typing.Any, StageMeasurement]:
+    """
+    Call a function and measure it
+
+    Args:
+        stage: The name of the stage that the function performs
+        function: The function to call
+        *args: Positional arguments for the function
+        trace_memory: Whether to trace allocations. Tracing finds the peak memory of the stage but slows it down
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        The result of the function and its measurements
+    """
+    already_tracing = tracemalloc.is_tracing()
+
+    if trace_memory and not already_tracing:
+        tracemalloc.start()
+
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+
+    starting_memory, _ = tracemalloc.get_traced_memory()
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+
+    try:
+        result = function(*args, **kwargs)
+
+        wall_seconds = time.perf_counter() - start_wall
+        cpu_seconds = time.process_time() - start_cpu
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        if trace_memory and not already_tracing:
+            tracemalloc.stop()
+
+    return result, StageMeasurement(
+        stage=stage,
+        wall_seconds=wall_seconds,
+        cpu_seconds=cpu_seconds,
+        peak_traced_bytes=max(peak_memory - starting_memory, 0),
+        max_rss_bytes=instrumentation.get_peak_rss()
+    )
+
+
+def run_stages(
+    instructions: specification.EvaluationSpecification,
+    output_format: str = "json",
+    output_directory: str = None,
+    workers: int = None,
+    vectorize: bool = None,
+    stages: typing.Collection[str] = None,
+    trace_memory: bool = True
+) -> typing.List[StageMeasurement]:
+    """
+    Run an evaluation one stage at a time
+
+    Stages that aren't requested are still run when later stages need their output, but aren't measured
+
+    Args:
+        instructions: What to evaluate
+        output_format: The format to write results in
+        output_directory: Where to write results; a temporary directory is used if not given
+        workers: The number of processes to score with
+        vectorize: Whether to score every location at once
+        stages: The names of the stages to measure; every stage is measured if not given
+        trace_memory: Whether to trace allocations to find the peak memory of each stage
+
+    Returns:
+        Measurements for each requested stage
+    """
+    stages = set(stages or STAGES)
+    measurements: typing.List[StageMeasurement] = list()
+
+    def run(stage: str, function: typing.Callable, *args, **kwargs):
+        if stage not in stages:
+            return function(*args, **kwargs)
+
+        result, measurement = measure(stage, function, *args, trace_memory=trace_memory, **kwargs)
+        measurements.append(measurement)
+        return result
+
+    evaluator = evaluate.Evaluator(instructions, workers=workers, vectorize=vectorize)
+
+    crosswalk = run("get_crosswalk", evaluator.get_crosswalk)
+    data_to_evaluate = run("get_data_to_evaluate", evaluator.get_data_to_evaluate, crosswalk)
+    data_to_evaluate = run("normalize_values", evaluator.normalize_values, data_to_evaluate)
+    thresholds = run("get_thresholds", evaluator.get_thresholds)
+    scores = run("score", evaluator.score, data_to_evaluate, thresholds)
+    evaluation_results = run("results", specification.EvaluationResults, instructions, scores)
+
+    if "writing" in stages:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            destination = os.path.join(output_directory or temporary_directory, f"results.{output_format}")
+            output_writer = writing.get_writer(output_format, destination)
+            run("writing", output_writer.write, evaluation_results)
+
+    return measurements
@@ -0,0 +1,254 @@
+"""
+Generates observations, predictions, crosswalks, and thresholds that may be evaluated at an arbitrary scale
+"""
+import typing
+import json
+import pathlib
+
+from dataclasses import dataclass
+
+import numpy
+import pandas
+
+from dmod.evaluations import specification
+
+
+@dataclass
+class Scale:
+    """
+    How large a generated evaluation should be
+    """
+    locations: int = 10
+    """The number of observed locations; each is paired with a single predicted location"""
+
+    timesteps: int = 1000
+    """The number of hourly values for each location"""
+
+    thresholds: int = 3
+    """The number of thresholds for each location"""
+
+    seed: int = 2023
+    """The seed for the random values"""
+
+    def __str__(self):
+        return f"{self.locations} locations × {self.timesteps} timesteps × {self.thresholds} thresholds"
+
+
+def get_observed_location(index: int) -> str:
+    return f"{index:010d}"
+
+
+def get_predicted_location(index: int) -> str:
+    return f"cat-{index}"
+
+
+def get_threshold_quantiles(scale: Scale) -> numpy.ndarray:
+    return numpy.linspace(0.5, 0.95, scale.thresholds)
+
+
+def get_threshold_fields(scale: Scale) -> typing.List[str]:
+    return [f"p{quantile * 100:.0f}_{index}_va" for index, quantile in enumerate(get_threshold_quantiles(scale))]
+
+
+def write_inputs(directory: typing.Union[str, pathlib.Path], scale: Scale) -> typing.Dict[str, str]:
+    """
+    Write generated inputs to a directory
+
+    Args:
+        directory: Where to write the inputs
+        scale: How much data to generate
+
+    Returns:
+        The paths to the observations, predictions, crosswalk, and thresholds
+    """
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    random_generator = numpy.random.default_rng(scale.seed)
+    dates = pandas.date_range("2015-01-01T00:00:00Z", periods=scale.timesteps, freq="H")
+    formatted_dates = numpy.tile(dates.strftime("%Y-%m-%dT%H:%M:%S%z").to_numpy(), scale.locations)
+
+    # Flows follow a daily cycle around a per-location base flow; predictions are a noisy, biased copy
+    base_flows = random_generator.uniform(10, 1000, size=(scale.locations, 1))
+    cycle = numpy.sin(numpy.arange(scale.timesteps) * 2 * numpy.pi / 24)
+    noise = random_generator.lognormal(0, 0.2, size=(scale.locations, scale.timesteps))
+    observed_values = base_flows * (1 + 0.5 * cycle) * noise
+    predicted_values = observed_values * random_generator.normal(1.05, 0.15, size=observed_values.shape)
+
+    observed_locations = numpy.repeat(
+        [get_observed_location(index) for index in range(scale.locations)],
+        scale.timesteps
+    )
+    predicted_locations = numpy.repeat(
+        [get_predicted_location(index) for index in range(scale.locations)],
+        scale.timesteps
+    )
+
+    paths = {
+        "observations": str(directory / "observations.csv"),
+        "predictions": str(directory / "predictions.csv"),
+        "crosswalk": str(directory / "crosswalk.json"),
+        "thresholds": str(directory / "thresholds.csv"),
+    }
+
+    pandas.DataFrame({
+        "observation": observed_values.ravel().round(3),
+        "value_date": formatted_dates,
+        "observation_location": observed_locations,
+        "unit": "ft^3/s",
+    }).to_csv(paths["observations"], index=False)
+
+    pandas.DataFrame({
+        "prediction": predicted_values.ravel().round(3),
+        "value_date": formatted_dates,
+        "prediction_location": predicted_locations,
+    }).to_csv(paths["predictions"], index=False)
+
+    with open(paths["crosswalk"], "w") as crosswalk_file:
+        json.dump(
+            {
+                get_predicted_location(index): {"site_no": get_observed_location(index)}
+                for index in range(scale.locations)
+            },
+            crosswalk_file
+        )
+
+    # Thresholds are spread between the median and the highest values for each location
+    quantiles = get_threshold_quantiles(scale)
+    threshold_values = numpy.quantile(observed_values, quantiles, axis=1).T
+
+    threshold_table = pandas.DataFrame(
+        threshold_values.round(3),
+        columns=get_threshold_fields(scale)
+    )
+    threshold_table.insert(0, "location", [get_observed_location(index) for index in range(scale.locations)])
+    threshold_table.to_csv(paths["thresholds"], index=False)
+
+    return paths
+
+
+def create_specification(paths: typing.Mapping[str, str], scale: Scale) -> specification.EvaluationSpecification:
+    """
+    Create instructions for evaluating generated inputs
+
+    Args:
+        paths: The paths returned by `write_inputs`
+        scale: The scale that the inputs were generated at
+
+    Returns:
+        A specification that evaluates the generated inputs
+    """
+    return specification.EvaluationSpecification.create({
+        "observations": [
+            {
+                "name": "Observations",
+                "value_field": "observation",
+                "value_selectors": [
+                    {
+                        "name": "observation",
+                        "where": "column",
+                        "datatype": "float",
+                        "associated_fields": [
+                            {"name": "value_date", "datatype": "datetime"},
+                            {"name": "observation_location", "datatype": "string"},
+                            {"name": "unit", "datatype": "string"}
+                        ]
+                    }
+                ],
+                "backend": {
+                    "backend_type": "file",
+                    "data_format": "csv",
+                    "address": paths["observations"]
+                },
+                "locations": {
+                    "identify": True,
+                    "from_field": "column",
+                    "pattern": "observation_location"
+                },
+                "unit": {"field": "unit"},
+                "x_axis": "value_date"
+            }
+        ],
+        "predictions": [
+            {
+                "name": "Predictions",
+                "value_field": "prediction",
+                "value_selectors": [
+                    {
+                        "name": "prediction",
+                        "where": "column",
+                        "datatype": "float",
+                        "associated_fields": [
+                            {"name": "value_date", "datatype": "datetime"},
+                            {"name": "prediction_location", "datatype": "string"}
+                        ]
+                    }
+                ],
+                "backend": {
+                    "backend_type": "file",
+                    "data_format": "csv",
+                    "address": paths["predictions"]
+                },
+                "locations": {
+                    "identify": True,
+                    "from_field": "column",
+                    "pattern": "prediction_location"
+                },
+                "unit": {"value": "ft^3/s"},
+                "x_axis": "value_date"
+            }
+        ],
+        "crosswalks": [
+            {
+                "backend": {
+                    "backend_type": "file",
+                    "address": paths["crosswalk"],
+                    "data_format": "json"
+                },
+                "observation_field_name": "observation_location",
+                "prediction_field_name": "prediction_location",
+                "field": {
+                    "name": "prediction_location",
+                    "where": "key",
+                    "path": ["* where site_no"],
+                    "origin": "$",
+                    "datatype": "string",
+                    "associated_fields": [
+                        {"name": "observation_location", "path": "site_no", "datatype": "string"}
+                    ]
+                }
+            }
+        ],
+        "thresholds": [
+            {
+                "backend": {
+                    "backend_type": "file",
+                    "data_format": "csv",
+                    "address": paths["thresholds"]
+                },
+                "locations": {
+                    "identify": True,
+                    "from_field": "column",
+                    "pattern": "location"
+                },
+                "definitions": [
+                    {
+                        "name": f"Threshold {index + 1}",
+                        "field": threshold_field,
+                        "weight": index + 1,
+                        "unit": {"value": "ft^3/s"}
+                    }
+                    for index, threshold_field in enumerate(get_threshold_fields(scale))
+                ]
+            }
+        ],
+        "scheme": {
+            "metrics": [
+                {"name": "False Alarm Ratio", "weight": 10},
+                {"name": "Probability of Detection", "weight": 10},
+                {"name": "Kling-Gupta Efficiency", "weight": 15},
+                {"name": "Normalized Nash-Sutcliffe Efficiency", "weight": 15},
+                {"name": "Pearson Correlation Coefficient", "weight": 18}
+            ]
+        }
+    })
@@ -2,6 +2,8 @@
 Module containing classes that handle common IO operations, such as loading input data
 """
 import os
+import typing
+import pathlib
 
 
 __all__ = [
@@ -9,6 +11,7 @@ __all__ = [
     for package_file in os.listdir(os.path.dirname(__file__))
     if package_file != "__init__.py"
        and package_file != 'backend.py'
+       and package_file != 'cache.py'
 ]
 
 from . import *
@@ -20,13 +23,20 @@ import dmod.core.common as common
 from .. import specification
 
 
-def get_backend(backend_specification: specification.BackendSpecification, cache_limit: int = None) -> Backend:
+def get_backend(
+    backend_specification: specification.BackendSpecification,
+    cache_limit: int = None,
+    cache_size: int = None,
+    cache_directory: typing.Union[str, pathlib.Path] = None
+) -> Backend:
     """
     Determine and create the right type of backend
 
     Args:
         backend_specification: Instructions for what backend to create
-        cache_limit: A limit to the amount of backend data that may be kept in memory
+        cache_limit: A limit to the number of entries of backend data that may be kept in memory
+        cache_size: A limit to the number of bytes of backend data that may be kept in memory
+        cache_directory: Where backend data may be kept on disk, if the type of backend supports it
 
     Returns:
          A backend through which to retrieve data
@@ -43,4 +53,4 @@ def get_backend(backend_specification: specification.BackendSpecification, cache
                 f"'{backend_specification.type}' is not a supported type of data backend."
         )
 
-    return data_backend(backend_specification, cache_limit)
+    return data_backend(backend_specification, cache_limit, cache_size, cache_directory)
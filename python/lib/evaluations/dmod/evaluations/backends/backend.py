@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
 import abc
+import os
 import numbers
+import pathlib
 import typing
 
-from datetime import datetime
-
 from .. import specification
 
+from .cache import ByteCache
+from .cache import CacheStatistics
+from .cache import DiskCache
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+"""The most bytes that a backend will hold in memory if no other limit is given"""
+
 
 class Backend(abc.ABC):
     @classmethod
@@ -14,12 +21,57 @@ class Backend(abc.ABC):
     def get_backend_type(cls) -> str:
         ...
 
-    def __init__(self, definition: specification.BackendSpecification, cache_limit: int = None):
+    def __init__(
+        self,
+        definition: specification.BackendSpecification,
+        cache_limit: int = None,
+        cache_size: int = None,
+        cache_directory: typing.Union[str, pathlib.Path] = None
+    ):
+        """
+        Constructor
+
+        Args:
+            definition: The specification for the backend
+            cache_limit: The maximum number of entries that may be held in memory
+            cache_size: The maximum number of bytes that may be held in memory. Defaults to the value of the
+                `EVALUATION_BACKEND_CACHE_BYTES` environment variable, then to `DEFAULT_CACHE_BYTES`
+            cache_directory: Where retrieved data may also be kept on disk if the backend supports it. Defaults to
+                the value of the `EVALUATION_BACKEND_CACHE_DIRECTORY` environment variable
+        """
         self.__definition = definition
-        self._raw_data: typing.Dict[str, typing.Tuple[datetime, bytes]] = dict()
         self.__cache_limit = cache_limit if cache_limit else -1
+
+        if cache_size is None and os.environ.get("EVALUATION_BACKEND_CACHE_BYTES"):
+            cache_size = int(os.environ["EVALUATION_BACKEND_CACHE_BYTES"])
+
+        if cache_directory is None:
+            cache_directory = os.environ.get("EVALUATION_BACKEND_CACHE_DIRECTORY") or None
+
+        disk_cache = None
+        if cache_directory and self.supports_disk_cache():
+            lifetime = os.environ.get("EVALUATION_BACKEND_CACHE_LIFETIME")
+            disk_cache = DiskCache(cache_directory, lifetime=float(lifetime) if lifetime else None)
+
+        # Data was only ever stored when explicitly requested, so only store by default if a cache was configured.
+        # Each tier is configured on its own; keeping data on disk doesn't mean it should also fill up memory
+        self.__store_in_memory_by_default = bool(cache_limit or cache_size)
+        self.__store_on_disk_by_default = disk_cache is not None
+
+        # Memory is always bounded, even when data is only stored because it was explicitly requested
+        if not cache_size or cache_size <= 0:
+            cache_size = DEFAULT_CACHE_BYTES
+
+        self.__cache = ByteCache(max_entries=cache_limit, max_bytes=cache_size, disk_cache=disk_cache)
         self._sources: typing.Sequence[str] = list()
 
+    @classmethod
+    def supports_disk_cache(cls) -> bool:
+        """
+        Whether data retrieved through this type of backend is worth keeping on disk
+        """
+        return False
+
     @property
     def sources(self) -> typing.Sequence:
         """
@@ -27,25 +79,60 @@ class Backend(abc.ABC):
         """
         return [source for source in self._sources]
 
-    def _add_to_cache(self, identifier: str, data: bytes):
-        if identifier in self._raw_data:
-            return
+    def _get_cache_key(self, identifier: str) -> str:
+        """
+        Get the key that data for the given identifier is cached under
+        """
+        return identifier
+
+    def _get_cached(self, identifier: str, store_data: bool = None) -> typing.Optional[bytes]:
+        """
+        Get previously retrieved data
 
-        if 0 < self.__cache_limit < len(self._sources):
-            ordered_sources = [
-                {
-                    "identifier": identifier,
-                    "added_date": date_and_data[0]
-                }
-                for identifier, date_and_data in self._raw_data.items()
-            ]
-            ordered_sources = sorted(ordered_sources, key=lambda source: source['added_date'])
-            del self._raw_data[ordered_sources[0]['identifier']]
+        Args:
+            identifier: The identifier for the data
+            store_data: Whether data found on disk should be brought back into memory
 
-        self._raw_data[identifier] = (datetime.utcnow(), data)
+        Returns:
+            The cached data if it is present
+        """
+        return self.__cache.get(self._get_cache_key(identifier), promote=self._should_store_in_memory(store_data))
 
-    def _update_access_time(self, identifier: str):
-        self._raw_data[identifier] = datetime.utcnow(), self._raw_data[identifier][1]
+    def _should_store(self, store_data: bool = None) -> bool:
+        """
+        Whether retrieved data should be stored in either tier of the cache
+
+        Args:
+            store_data: Whether storage was explicitly requested; the configured tiers decide if not given
+        """
+        if store_data is None:
+            return self.__store_in_memory_by_default or self.__store_on_disk_by_default
+        return bool(store_data)
+
+    def _should_store_in_memory(self, store_data: bool = None) -> bool:
+        return self.__store_in_memory_by_default if store_data is None else bool(store_data)
+
+    def _add_to_cache(self, identifier: str, data: bytes, store_data: bool = None):
+        """
+        Store retrieved data on disk, if there is a disk tier, and in memory if it should be kept there as well
+
+        Args:
+            identifier: The identifier for the data
+            data: The data to store
+            store_data: Whether storage was explicitly requested
+        """
+        self.__cache.put(self._get_cache_key(identifier), data, in_memory=self._should_store_in_memory(store_data))
+
+    @property
+    def cache(self) -> ByteCache:
+        return self.__cache
+
+    @property
+    def cache_statistics(self) -> CacheStatistics:
+        """
+        Counts of cache hits, misses, and evictions for this backend
+        """
+        return self.__cache.statistics
 
     @abc.abstractmethod
     def read(self, identifier: str, store_data: bool = None) -> bytes:
@@ -55,6 +142,29 @@ class Backend(abc.ABC):
         """
         pass
 
+    def read_many(
+        self,
+        identifiers: typing.Sequence[str] = None,
+        store_data: bool = None
+    ) -> typing.Dict[str, bytes]:
+        """
+        Read data for multiple identifiers
+
+        Args:
+            identifiers: The identifiers for the data to read; every source is read if none are given
+            store_data: Whether the data retrieved should be stored
+
+        Returns:
+            The raw data for each identifier
+        """
+        if identifiers is None:
+            identifiers = self.sources
+
+        return {
+            identifier: self.read(identifier, store_data)
+            for identifier in identifiers
+        }
+
     @abc.abstractmethod
     def read_stream(self, identifier: str, store_data: bool = None):
         """
@@ -0,0 +1,270 @@
+"""
+Defines the caches that backends use to hold onto data that they have already retrieved
+"""
+import typing
+import os
+import hashlib
+import pathlib
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+
+
+class CacheStatistics:
+    """
+    Counts of how a cache has been used
+    """
+    __slots__ = ["hits", "misses", "evictions", "disk_hits"]
+
+    def __init__(self):
+        self.hits: int = 0
+        """The number of lookups that were answered from memory"""
+
+        self.misses: int = 0
+        """The number of lookups that could not be answered from memory or disk"""
+
+        self.evictions: int = 0
+        """The number of entries removed from memory in order to make room for new ones"""
+
+        self.disk_hits: int = 0
+        """The number of lookups that were answered from the disk tier"""
+
+    def to_dict(self) -> typing.Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "disk_hits": self.disk_hits
+        }
+
+    def __str__(self):
+        return f"hits={self.hits}, misses={self.misses}, evictions={self.evictions}, disk_hits={self.disk_hits}"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class DiskCache:
+    """
+    A directory of previously retrieved data, named by the hash of the identifier used to retrieve it
+    """
+    def __init__(self, directory: typing.Union[str, pathlib.Path], lifetime: float = None):
+        """
+        Constructor
+
+        Args:
+            directory: Where to store cached data
+            lifetime: The number of seconds that stored data may be used for; stored data never expires if not given
+        """
+        self.__directory = pathlib.Path(directory)
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        self.__lifetime = lifetime if lifetime and lifetime > 0 else None
+
+    @property
+    def directory(self) -> pathlib.Path:
+        return self.__directory
+
+    def get_path(self, identifier: str) -> pathlib.Path:
+        """
+        Get the path to where data for the given identifier would be stored
+        """
+        return self.__directory / hashlib.sha256(identifier.encode()).hexdigest()
+
+    def get(self, identifier: str) -> typing.Optional[bytes]:
+        """
+        Get stored data if it exists and hasn't expired
+
+        Args:
+            identifier: The identifier for the data
+
+        Returns:
+            The stored data if it is present
+        """
+        path = self.get_path(identifier)
+
+        try:
+            if self.__lifetime is not None and time.time() - path.stat().st_mtime > self.__lifetime:
+                path.unlink()
+                return None
+
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, identifier: str, data: bytes):
+        """
+        Store data on disk
+
+        Data is written to a temporary file first so that readers never see a partial entry
+
+        Args:
+            identifier: The identifier for the data
+            data: The data to store
+        """
+        path = self.get_path(identifier)
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.__directory, prefix=".", suffix=".partial")
+
+        try:
+            with os.fdopen(descriptor, "wb") as temporary_file:
+                temporary_file.write(data)
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    def remove(self, identifier: str):
+        try:
+            self.get_path(identifier).unlink()
+        except FileNotFoundError:
+            pass
+
+    def __contains__(self, identifier: str) -> bool:
+        return self.get_path(identifier).exists()
+
+
+class ByteCache:
+    """
+    A least recently used cache of raw data, bounded by both the number of entries and the total number of bytes
+
+    Lookups, insertions, and evictions are all constant time. Data that is evicted from memory remains available from
+    the optional disk tier.
+    """
+    def __init__(
+        self,
+        max_entries: int = None,
+        max_bytes: int = None,
+        disk_cache: DiskCache = None
+    ):
+        """
+        Constructor
+
+        Args:
+            max_entries: The maximum number of entries to hold in memory; unbounded if not given or not positive
+            max_bytes: The maximum number of bytes to hold in memory; unbounded if not given or not positive
+            disk_cache: An optional second tier that holds data on disk
+        """
+        self.__max_entries = max_entries if max_entries and max_entries > 0 else None
+        self.__max_bytes = max_bytes if max_bytes and max_bytes > 0 else None
+        self.__disk_cache = disk_cache
+        self.__entries: typing.OrderedDict[str, bytes] = OrderedDict()
+        self.__size = 0
+        self.__statistics = CacheStatistics()
+        self.__lock = threading.RLock()
+
+    @property
+    def max_entries(self) -> typing.Optional[int]:
+        return self.__max_entries
+
+    @property
+    def max_bytes(self) -> typing.Optional[int]:
+        return self.__max_bytes
+
+    @property
+    def disk_cache(self) -> typing.Optional[DiskCache]:
+        return self.__disk_cache
+
+    @property
+    def size(self) -> int:
+        """
+        The total number of bytes held in memory
+        """
+        return self.__size
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        return self.__statistics
+
+    def get(self, identifier: str, promote: bool = True) -> typing.Optional[bytes]:
+        """
+        Get data from memory or, failing that, from disk
+
+        Args:
+            identifier: The identifier for the data
+            promote: Whether data found on disk should be brought back into memory
+
+        Returns:
+            The cached data if it is present
+        """
+        with self.__lock:
+            data = self.__entries.get(identifier)
+
+            if data is not None:
+                self.__entries.move_to_end(identifier)
+                self.__statistics.hits += 1
+                return data
+
+            if self.__disk_cache is not None:
+                data = self.__disk_cache.get(identifier)
+
+                if data is not None:
+                    self.__statistics.disk_hits += 1
+
+                    if promote:
+                        self.__store(identifier, data)
+
+                    return data
+
+            self.__statistics.misses += 1
+            return None
+
+    def put(self, identifier: str, data: bytes, in_memory: bool = True):
+        """
+        Store data in memory and on disk, evicting the least recently used entries if there is no longer room
+
+        Args:
+            identifier: The identifier for the data
+            data: The data to store
+            in_memory: Whether to hold the data in memory rather than only on disk
+        """
+        with self.__lock:
+            if in_memory:
+                self.__store(identifier, data)
+
+            if self.__disk_cache is not None:
+                self.__disk_cache.put(identifier, data)
+
+    def __store(self, identifier: str, data: bytes):
+        if identifier in self.__entries:
+            self.__size -= len(self.__entries.pop(identifier))
+
+        # Data that could never fit shouldn't push everything else out
+        if self.__max_bytes is not None and len(data) > self.__max_bytes:
+            return
+
+        self.__entries[identifier] = data
+        self.__size += len(data)
+
+        while self.__is_over_limit():
+            _, evicted_data = self.__entries.popitem(last=False)
+            self.__size -= len(evicted_data)
+            self.__statistics.evictions += 1
+
+    def __is_over_limit(self) -> bool:
+        if self.__max_entries is not None and len(self.__entries) > self.__max_entries:
+            return True
+        return self.__max_bytes is not None and self.__size > self.__max_bytes
+
+    def remove(self, identifier: str):
+        with self.__lock:
+            if identifier in self.__entries:
+                self.__size -= len(self.__entries.pop(identifier))
+
+            if self.__disk_cache is not None:
+                self.__disk_cache.remove(identifier)
+
+    def clear(self):
+        """
+        Remove everything from memory; data on disk is left alone
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self.__entries
+
+    def __len__(self) -> int:
+        return len(self.__entries)
@@ -34,8 +34,14 @@ class FileBackend(backend.Backend):
     def get_backend_type(cls) -> str:
         return "file"
 
-    def __init__(self, definition: specification.BackendSpecification, cache_limit: int = None):
-        super().__init__(definition, cache_limit)
+    def __init__(
+        self,
+        definition: specification.BackendSpecification,
+        cache_limit: int = None,
+        cache_size: int = None,
+        cache_directory: typing.Union[str, pathlib.Path] = None
+    ):
+        super().__init__(definition, cache_limit, cache_size, cache_directory)
         self._sources = util.get_matching_paths(self.address)
 
     def read(self, identifier: str, store_data: bool = None) -> bytes:
@@ -52,15 +58,16 @@ class FileBackend(backend.Backend):
         if identifier not in self._sources:
             raise ValueError(f"'{identifier}' is not available within this backend")
 
-        if identifier in self._raw_data:
-            self._update_access_time(identifier)
-            return self._raw_data[identifier][1]
+        cached_data = self._get_cached(identifier, store_data)
+
+        if cached_data is not None:
+            return cached_data
 
         with open(identifier, 'rb') as data_file:
             byte_data = data_file.read()
 
-            if store_data:
-                self._add_to_cache(identifier, byte_data)
+            if self._should_store(store_data):
+                self._add_to_cache(identifier, byte_data, store_data)
 
             return byte_data
 
@@ -75,24 +82,20 @@ class FileBackend(backend.Backend):
         Returns:
             An IO stream containing the loaded data
         """
-        # TODO: This just shifts data into a new buffer - find a way to return the original buffer instead
         if identifier not in self._sources:
             raise ValueError(f"'{identifier}' is not available within this backend")
 
-        if identifier in self._raw_data:
-            raw_data = self._raw_data[identifier][1]
-            self._update_access_time(identifier)
-        else:
+        raw_data = self._get_cached(identifier, store_data)
+
+        if raw_data is None:
             with open(identifier, 'rb') as data_file:
                 raw_data = data_file.read()
 
-                if store_data:
-                    self._add_to_cache(identifier, raw_data)
+                if self._should_store(store_data):
+                    self._add_to_cache(identifier, raw_data, store_data)
 
-        stream = io.BytesIO()
-        stream.write(raw_data)
-        stream.seek(0)
-        return stream
+        # BytesIO will share the given buffer rather than copy it as long as the stream isn't written to
+        return io.BytesIO(raw_data)
 
     @deprecated
     def write(
@@ -2,11 +2,19 @@
 Backends for IO that operate over some sort of network
 """
 import os
+import json
 import typing
 import io
+import pathlib
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 import dmod.core.common as common
 
 from . import backend
@@ -15,6 +23,138 @@ from .. import specification
 
 util.configure_logging()
 
+STREAM_CHUNK_SIZE = 64 * 1024
+"""The number of bytes to pull from a response at a time when streaming it"""
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+"""HTTP statuses indicating that a request may succeed if it is tried again"""
+
+
+def get_concurrency() -> int:
+    """
+    Get the number of requests that may be made at once, configured by the `EVALUATION_REST_CONCURRENCY`
+    environment variable
+    """
+    return max(int(os.environ.get("EVALUATION_REST_CONCURRENCY", 8)), 1)
+
+
+def get_timeout() -> typing.Optional[float]:
+    """
+    Get the number of seconds to wait on a server before giving up, configured by the `EVALUATION_REST_TIMEOUT`
+    environment variable. Requests will wait indefinitely if it isn't set.
+    """
+    timeout = os.environ.get("EVALUATION_REST_TIMEOUT")
+    return float(timeout) if timeout else None
+
+
+def create_session(pool_size: int = None, retries: int = None, backoff_factor: float = None) -> requests.Session:
+    """
+    Create a session that keeps connections alive and retries failed GET requests with an exponential backoff
+
+    Args:
+        pool_size: The number of connections to keep open per host. Defaults to the configured concurrency
+        retries: The number of times to retry a failed request. Defaults to the value of the
+            `EVALUATION_REST_RETRIES` environment variable or 3
+        backoff_factor: The base number of seconds to wait between retries. Defaults to the value of the
+            `EVALUATION_REST_BACKOFF` environment variable or 0.5
+
+    Returns:
+        A new session
+    """
+    if pool_size is None:
+        pool_size = get_concurrency()
+
+    if retries is None:
+        retries = int(os.environ.get("EVALUATION_REST_RETRIES", 3))
+
+    if backoff_factor is None:
+        backoff_factor = float(os.environ.get("EVALUATION_REST_BACKOFF", 0.5))
+
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=["GET"],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+__SESSIONS: typing.Dict[int, requests.Session] = dict()
+__SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the session shared by every REST backend in this process
+
+    Sessions are never shared between processes since forked children can't safely use their parent's connections
+    """
+    process_id = os.getpid()
+
+    with __SESSION_LOCK:
+        if process_id not in __SESSIONS:
+            __SESSIONS[process_id] = create_session()
+        return __SESSIONS[process_id]
+
+
+class ResponseStream(io.RawIOBase):
+    """
+    A readable stream over the body of a response that may pass everything it read along once it has been exhausted
+    """
+    def __init__(self, response: requests.Response, on_complete: typing.Callable[[bytes], typing.Any] = None):
+        """
+        Constructor
+
+        Args:
+            response: A response whose body has not yet been read
+            on_complete: A function to call with the entire body once it has been read
+        """
+        super().__init__()
+        self.__response = response
+        self.__chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        self.__remainder = b""
+        self.__on_complete = on_complete
+        self.__read_data: typing.Optional[typing.List[bytes]] = list() if on_complete else None
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.__remainder
+
+        while not data:
+            try:
+                data = next(self.__chunks)
+            except StopIteration:
+                self.__finish()
+                return 0
+
+            if self.__read_data is not None:
+                self.__read_data.append(data)
+
+        size = min(len(buffer), len(data))
+        buffer[:size] = data[:size]
+        self.__remainder = data[size:]
+        return size
+
+    def __finish(self):
+        if self.__on_complete is not None:
+            self.__on_complete(b"".join(self.__read_data))
+            self.__on_complete = None
+            self.__read_data = None
+
+        self.__response.close()
+
+    def close(self):
+        self.__response.close()
+        super().close()
+
 
 class RESTBackend(backend.Backend):
     """
@@ -24,10 +164,24 @@ class RESTBackend(backend.Backend):
     def get_backend_type(cls) -> str:
         return "rest"
 
-    def __init__(self, definition: specification.BackendSpecification, cache_limit: int = None):
-        super().__init__(definition, cache_limit)
+    def __init__(
+        self,
+        definition: specification.BackendSpecification,
+        cache_limit: int = None,
+        cache_size: int = None,
+        cache_directory: typing.Union[str, pathlib.Path] = None
+    ):
+        super().__init__(definition, cache_limit, cache_size, cache_directory)
         self._sources = [definition.address]
 
+    @classmethod
+    def supports_disk_cache(cls) -> bool:
+        return True
+
+    def _get_cache_key(self, identifier: str) -> str:
+        # The same address may produce different data based on the parameters of the request
+        return json.dumps([identifier, self.request_url, self.params], sort_keys=True, default=str)
+
     @property
     def request_url(self) -> str:
         """
@@ -94,6 +248,31 @@ class RESTBackend(backend.Backend):
         """
         return self.definition.properties.get('params')
 
+    def _get_request_url(self, identifier: str) -> str:
+        """
+        Get the URL to request data for the given identifier from
+        """
+        return self.request_url if identifier == self.address else identifier
+
+    def _request(self, identifier: str, stream: bool = False) -> requests.Response:
+        response = get_session().get(
+            url=self._get_request_url(identifier),
+            params=self.params,
+            headers=self.headers,
+            verify=self.verify,
+            cert=self.cert,
+            timeout=get_timeout(),
+            stream=stream
+        )
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+
+        return response
+
     def read(self, identifier: str, store_data: bool = None) -> bytes:
         """
         Loads data from either the cache or a REST service
@@ -105,30 +284,55 @@ class RESTBackend(backend.Backend):
         Returns:
             Raw byte data from the request
         """
-        if identifier in self._raw_data:
-            self._update_access_time(identifier)
-            return self._raw_data[identifier][1]
+        cached_data = self._get_cached(identifier, store_data)
 
-        request_arguments = dict(
-            url=self.request_url,
-            params=self.params,
-            headers=self.headers,
-            verify=self.verify,
-            cert=self.cert,
-        )
+        if cached_data is not None:
+            return cached_data
 
-        with requests.get(**request_arguments) as response:
+        with self._request(identifier) as response:
             byte_data = response.content
 
-            if store_data:
-                self._add_to_cache(identifier, byte_data)
+            if self._should_store(store_data):
+                self._add_to_cache(identifier, byte_data, store_data)
 
             return byte_data
 
+    def read_many(
+        self,
+        identifiers: typing.Sequence[str] = None,
+        store_data: bool = None
+    ) -> typing.Dict[str, bytes]:
+        """
+        Read data for multiple identifiers at once through the shared connection pool
+
+        Args:
+            identifiers: The URLs to read from; every source is read if none are given
+            store_data: Whether the data retrieved should be stored
+
+        Returns:
+            The raw data for each identifier
+        """
+        if identifiers is None:
+            identifiers = self.sources
+
+        with ThreadPoolExecutor(max_workers=min(get_concurrency(), max(len(identifiers), 1))) as executor:
+            futures = {
+                identifier: executor.submit(self.read, identifier, store_data)
+                for identifier in identifiers
+            }
+
+        return {
+            identifier: future.result()
+            for identifier, future in futures.items()
+        }
+
     def read_stream(self, identifier: str, store_data: bool = None) -> typing.IO:
         """
         Retrieves data in the form of a stream
 
+        The body of the response is read as the stream is read rather than all at once. If the data is to be stored,
+        it will be added to the cache once the stream has been exhausted.
+
         Args:
             identifier: The URL of the rest server
             store_data: Whether to store the retrieved data in the cache
@@ -136,9 +340,14 @@ class RESTBackend(backend.Backend):
         Returns:
             An IO stream containing the loaded data
         """
-        raw_data = self.read(identifier, store_data)
+        cached_data = self._get_cached(identifier, store_data)
+
+        if cached_data is not None:
+            return io.BytesIO(cached_data)
+
+        def store(data: bytes):
+            self._add_to_cache(identifier, data, store_data)
 
-        stream = io.BytesIO()
-        stream.write(raw_data)
-        stream.seek(0)
-        return stream
\ No newline at end of file
+        response = self._request(identifier, stream=True)
+        stream = ResponseStream(response, on_complete=store if self._should_store(store_data) else None)
+        return io.BufferedReader(stream, buffer_size=STREAM_CHUNK_SIZE)
@@ -41,8 +41,8 @@ class JSONCrosswalkRetriever(retriever.CrosswalkRetriever):
 
         full_document: typing.Dict[str, typing.Any] = dict()
 
-        for crosswalk_source in self.backend.sources:
-            document = json.loads(self.backend.read(crosswalk_source))
+        for crosswalk_source, raw_document in self.backend.read_many().items():
+            document = json.loads(raw_document)
             if not isinstance(document, dict):
                 raise ValueError(
                         f"'{crosswalk_source}' is not a valid source for crosswalk data. "
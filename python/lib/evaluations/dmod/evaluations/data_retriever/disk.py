@@ -37,89 +37,110 @@ class JSONDataRetriever(retrieval.Retriever):
     def get_format(cls) -> str:
         return "json"
 
-    def retrieve(self, *args, **kwargs) -> pandas.DataFrame:
-        documents = {
-            str(source): util.data_to_dictionary(self.backend.read(source))
-            for source in self.backend.sources
-        }
+    def iterate_frames(self) -> typing.Iterator[typing.Tuple[str, pandas.DataFrame]]:
+        """
+        Reads and converts one source at a time
 
-        frames = dict()
+        Each parsed document is released once its frame has been built, so only one document needs to be held in
+        memory at a time
 
-        for document_name, document in documents.items():  # type: str, typing.Dict[str, typing.Any]
-            frame = None
-            for selector in self.definition.value_selectors:
-                if selector.where == "constant":
-                    continue
+        Returns:
+            The name of each source paired with the frame built from it
+        """
+        for source in self.backend.sources:
+            document_name = str(source)
+            document = util.data_to_dictionary(self.backend.read(source))
+            frame = self._document_to_frame(document_name, document)
+            del document
+            yield document_name, frame
 
-                selected_data = reader.select_values(document, selector)
+    def _document_to_frame(self, document_name: str, document: typing.Dict[str, typing.Any]) -> pandas.DataFrame:
+        """
+        Selects the configured values out of a single parsed document
 
-                if frame is None:
-                    frame = selected_data
-                else:
-                    if util.is_indexed(frame):
-                        frame.reset_index(inplace=True)
+        Args:
+            document_name: The name of the source that the document came from
+            document: The parsed document
 
-                    if util.is_indexed(selected_data):
-                        selected_data.reset_index(inplace=True)
+        Returns:
+            A frame containing the values selected from the document
+        """
+        frame = None
+        for selector in self.definition.value_selectors:
+            if selector.where == "constant":
+                continue
 
-                    common_columns = [
-                        column_name
-                        for column_name in frame.keys()
-                        if column_name in selected_data.keys()
-                    ]
+            selected_data = reader.select_values(document, selector)
 
-                    if common_columns:
-                        frame.set_index(keys=common_columns, inplace=True)
-                        selected_data.set_index(keys=common_columns, inplace=True)
+            if frame is None:
+                frame = selected_data
+            else:
+                if util.is_indexed(frame):
+                    frame.reset_index(inplace=True)
 
-                    frame = frame.join(selected_data)
+                if util.is_indexed(selected_data):
+                    selected_data.reset_index(inplace=True)
 
-                    if util.is_indexed(frame):
-                        frame.reset_index(inplace=True)
+                common_columns = [
+                    column_name
+                    for column_name in frame.keys()
+                    if column_name in selected_data.keys()
+                ]
 
-            constants = [
-                selector
-                for selector in self.definition.value_selectors
-                if selector.where == 'constant'
-            ]
+                if common_columns:
+                    frame.set_index(keys=common_columns, inplace=True)
+                    selected_data.set_index(keys=common_columns, inplace=True)
 
-            frame_index = frame.index
+                frame = frame.join(selected_data)
 
-            for constant in constants:
-                value = constant.to_datatype(constant.path[0])
-                constant_frame = pandas.DataFrame(
-                        data={constant.name: [value for _ in range(len(frame_index))]},
-                        index=frame_index
-                )
-                frame = frame.join(constant_frame)
+                if util.is_indexed(frame):
+                    frame.reset_index(inplace=True)
 
-            if self.definition.locations.from_field.lower() == "filename":
-                name = None
+        constants = [
+            selector
+            for selector in self.definition.value_selectors
+            if selector.where == 'constant'
+        ]
 
-                if self.definition.locations.pattern:
-                    full_pattern = os.pathsep.join(self.definition.locations.pattern)
-                    search_results = re.search(full_pattern, document_name)
-                    if search_results:
-                        name = search_results.group()
+        frame_index = frame.index
 
-                if not name:
-                    name = os.path.splitext(os.path.basename(document_name))[0]
+        for constant in constants:
+            value = constant.to_datatype(constant.path[0])
+            constant_frame = pandas.DataFrame(
+                    data={constant.name: [value for _ in range(len(frame_index))]},
+                    index=frame_index
+            )
+            frame = frame.join(constant_frame)
 
-                frame['location'] = name
+        if self.definition.locations.from_field.lower() == "filename":
+            name = None
 
-            if util.is_indexed(frame):
-                frame = frame.reset_index()
+            if self.definition.locations.pattern:
+                full_pattern = os.pathsep.join(self.definition.locations.pattern)
+                search_results = re.search(full_pattern, document_name)
+                if search_results:
+                    name = search_results.group()
 
-            for mapping in self.definition.field_mapping:
-                if mapping.map_type != "column":
-                    continue
+            if not name:
+                name = os.path.splitext(os.path.basename(document_name))[0]
+
+            frame['location'] = name
 
-                if mapping.value in frame:
-                    frame.rename(columns={mapping.value: mapping.field}, inplace=True)
+        if util.is_indexed(frame):
+            frame = frame.reset_index()
 
-            frames[document_name] = frame
+        for mapping in self.definition.field_mapping:
+            if mapping.map_type != "column":
+                continue
 
-        combined_frame = pandas.concat([frame for frame in frames.values()])
+            if mapping.value in frame:
+                frame.rename(columns={mapping.value: mapping.field}, inplace=True)
+
+        return frame
+
+    def retrieve(self, *args, **kwargs) -> pandas.DataFrame:
+        frames = [frame for _, frame in self.iterate_frames()]
+        combined_frame = pandas.concat(frames)
 
         return combined_frame
 
@@ -164,9 +185,9 @@ class FrameDataRetriever(retrieval.Retriever):
                 provided_parameters[option] = value
 
         if 'date_parser' not in provided_parameters:
-            provided_parameters['date_parser'] = util.parse_non_naive_dates
+            provided_parameters['date_parser'] = util.get_date_parser(self.backend.address)
 
-        combined_table = None
+        tables: typing.List[pandas.DataFrame] = list()
 
         for source in self.backend.sources:
             try:
@@ -258,12 +279,15 @@ class FrameDataRetriever(retrieval.Retriever):
                 constant_frame = pandas.DataFrame(data=values, index=frame_index)
                 table = table.join(constant_frame)
 
-            if combined_table is None:
-                combined_table = table
-            else:
-                combined_table = pandas.concat([combined_table, table])
+            tables.append(table)
+
+        if not tables:
+            return None
+
+        if len(tables) == 1:
+            return tables[0]
 
-        return combined_table
+        return pandas.concat(tables)
 
 
 __FORMAT_MAPPING = {
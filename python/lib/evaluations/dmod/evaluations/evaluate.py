@@ -1,8 +1,16 @@
 import os
 import typing
+import pathlib
 import json
 import logging
+import multiprocessing
 
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
 import pandas
 
 from dmod.metrics.communication import Verbosity
@@ -16,9 +24,14 @@ from . import crosswalk
 from . import data_retriever
 from . import threshold
 from . import measurement_units
+from . import instrumentation
+from . import incremental
 
 COMMUNICATORS = typing.Union[metrics.Communicator, typing.Sequence[metrics.Communicator]]
 
+PARSE_HEAVY_FORMATS = ("json",)
+"""Data formats whose parsing is CPU bound enough to be worth loading in another process"""
+
 
 class UnitConverter:
     """
@@ -30,39 +43,157 @@ class UnitConverter:
         self.__from_unit_field = from_unit_field
         self.__to_unit_field = to_unit_field
 
-    def _conversion(self, row):
+    def __call__(self, rows_to_convert: pandas.DataFrame, *args, **kwargs) -> pandas.Series:
         """
-        Helper function used to convert the values in a singular row
+        Converts every value by looking up a single transformation for each pair of measurement units
 
         Args:
-            row: A row from a data source
+            rows_to_convert: Rows bearing values and the units they should be converted from and to
 
         Returns:
-            A value converted from one measurement unit to another
+            The converted values
         """
-        if row[self.__from_unit_field] == row[self.__to_unit_field]:
-            return row[self.__value_field]
+        converted_values = rows_to_convert[self.__value_field].to_numpy(dtype=float, copy=True)
 
-        return measurement_units.convert(
-            row[self.__value_field],
-            row[self.__from_unit_field],
-            row[self.__to_unit_field]
-        )
+        unit_groups = rows_to_convert.groupby(
+            by=[self.__from_unit_field, self.__to_unit_field],
+            sort=False,
+            dropna=False
+        ).indices
+
+        for (from_unit, to_unit), positions in unit_groups.items():
+            if from_unit == to_unit:
+                continue
+
+            converted_values[positions] = measurement_units.convert_values(
+                converted_values[positions],
+                from_unit,
+                to_unit
+            )
+
+        return pandas.Series(converted_values, index=rows_to_convert.index, name=self.__value_field)
+
+
+class FrameShard:
+    """
+    A slice of a DataFrame held as plain NumPy buffers so that it may be cheaply sent to another process
+    """
+    def __init__(self, frame: pandas.DataFrame, columns: typing.Sequence[str]):
+        """
+        Constructor
+
+        Args:
+            frame: The data to slice
+            columns: The names of the columns to carry over
+        """
+        self.__columns = {column: self._to_buffer(pandas.Index(frame[column])) for column in columns}
+        self.__index_names = list(frame.index.names)
+        self.__index_levels = [
+            self._to_buffer(frame.index.get_level_values(level))
+            for level in range(frame.index.nlevels)
+        ]
+
+    @staticmethod
+    def _to_buffer(values: pandas.Index) -> typing.Tuple[numpy.ndarray, typing.Optional[typing.Any]]:
+        """
+        Strips a set of values down to a numpy array and the timezone needed to rebuild it
+
+        Args:
+            values: The values to convert
+
+        Returns:
+            The raw values and the timezone they belong to, if any
+        """
+        timezone = getattr(values.dtype, "tz", None)
+
+        if timezone is not None:
+            values = values.tz_convert(None)
+
+        return values.to_numpy(), timezone
+
+    @staticmethod
+    def _from_buffer(buffer: typing.Tuple[numpy.ndarray, typing.Optional[typing.Any]], name=None) -> pandas.Index:
+        values, timezone = buffer
+        index = pandas.Index(values, name=name)
+
+        if timezone is not None:
+            index = index.tz_localize("UTC").tz_convert(timezone)
+
+        return index
+
+    def to_frame(self) -> pandas.DataFrame:
+        """
+        Returns:
+            The slice rebuilt as a DataFrame
+        """
+        levels = [
+            self._from_buffer(buffer, name)
+            for buffer, name in zip(self.__index_levels, self.__index_names)
+        ]
+        index = levels[0] if len(levels) == 1 else pandas.MultiIndex.from_arrays(levels, names=self.__index_names)
 
-    def __call__(self, rows_to_convert: pandas.Series, *args, **kwargs) -> float:
-        return rows_to_convert.apply(
-            self._conversion,
-            axis=1
+        return pandas.DataFrame(
+            {column: self._from_buffer(buffer).to_numpy() for column, buffer in self.__columns.items()},
+            index=index
         )
 
 
+def score_shard(
+    scheme: metrics.ScoringScheme,
+    shard: FrameShard,
+    group_by: typing.Sequence[str],
+    observed_value_field: str,
+    predicted_value_field: str,
+    thresholds: typing.Mapping[typing.Tuple[str, str], typing.Sequence[metrics.Threshold]]
+) -> typing.Tuple[typing.Dict[typing.Tuple[str, str], metrics.MetricResults], typing.Dict[str, float]]:
+    """
+    Scores every location within a shard of data; used as the unit of work for parallel evaluation
+
+    Args:
+        scheme: The scheme describing what metrics to use
+        shard: The data for the locations to score
+        group_by: The columns identifying each location
+        observed_value_field: The name of the column containing observations
+        predicted_value_field: The name of the column containing predictions
+        thresholds: The thresholds to apply to each location in the shard
+
+    Returns:
+        A mapping between the locations being evaluated and the results of the metrics performed on them, along with
+        the number of seconds spent on each metric
+    """
+    results = scheme.score_groups(
+        shard.to_frame(),
+        group_by,
+        observed_value_field,
+        predicted_value_field,
+        thresholds,
+        metadata_fields=["observed_location", "predicted_location"]
+    )
+    return results, scheme.metric_timings
+
+
 class Evaluator:
     def __init__(
         self,
         instructions: typing.Union[specification.EvaluationSpecification, str, dict],
         communicators: COMMUNICATORS = None,
-        verbosity: Verbosity = None
+        verbosity: Verbosity = None,
+        vectorize: bool = None,
+        workers: int = None,
+        state_path: typing.Union[str, pathlib.Path] = None
     ):
+        """
+        Constructor
+
+        Args:
+            instructions: The specification telling the Evaluator what to do
+            communicators: The communicators to use to send messages through as the evaluation goes on
+            verbosity: How chatty the evaluation should be
+            vectorize: Whether to score every location at once rather than one location at a time
+            workers: The number of processes to spread scoring across; locations are scored in this process if 1 or less
+            state_path: Where running statistics are kept between evaluations. If given, only data beyond what was
+                evaluated last time is paired and added to the statistics before they are scored
+        """
         if isinstance(instructions, str):
             instructions = json.loads(instructions)
 
@@ -78,6 +209,9 @@ class Evaluator:
         self._observed_xaxis: typing.Optional[str] = None
         self._predicted_xaxis: typing.Optional[str] = None
         self._verbosity = verbosity or Verbosity.QUIET
+        self._vectorize = bool(vectorize)
+        self._workers = workers or 1
+        self._state_path = state_path
 
         if isinstance(communicators, metrics.CommunicatorGroup):
             self._communicators: metrics.CommunicatorGroup = communicators
@@ -86,9 +220,18 @@ class Evaluator:
         else:
             self._communicators: metrics.CommunicatorGroup = metrics.CommunicatorGroup()
 
+        self._timings = instrumentation.EvaluationTimings()
+
         self._set_field_names()
         self._converter = UnitConverter(self._predicted_value_field, "unit_prediction", "unit_observation")
 
+    @property
+    def timings(self) -> instrumentation.EvaluationTimings:
+        """
+        How long each stage of the latest evaluation took, along with the time spent on each metric
+        """
+        return self._timings
+
     @property
     def instructions(self) -> specification.EvaluationSpecification:
         """
@@ -230,13 +373,51 @@ class Evaluator:
         Returns:
             Scoring results tied to crosswalk identifiers
         """
-        crosswalk_data = self.get_crosswalk()
+        self._timings = instrumentation.EvaluationTimings()
 
-        if self._verbosity == Verbosity.ALL and self._communicators.send_all():
-            self._communicators.write(reason="crosswalk", data=crosswalk_data.to_dict(), verbosity=Verbosity.ALL)
+        def load_input_data():
+            with self._timings.stage("load_input_data") as loading_stage:
+                loaded_data = self.load_input_data()
+                loading_stage.rows_out = sum(len(frame) for frame in loaded_data if frame is not None)
+            return loaded_data
+
+        # Start loading observations and predictions before the crosswalk so that they may be read at the same time
+        with ThreadPoolExecutor(max_workers=1) as loader:
+            input_data: Future = loader.submit(load_input_data)
+
+            with self._timings.stage("get_crosswalk") as stage:
+                crosswalk_data = self.get_crosswalk()
+                stage.rows_out = len(crosswalk_data)
+
+            if self._verbosity == Verbosity.ALL and self._communicators.send_all():
+                self._communicators.write(reason="crosswalk", data=crosswalk_data.to_dict(), verbosity=Verbosity.ALL)
+
+            observations, predictions = input_data.result()
 
-        data_to_evaluate = self.get_data_to_evaluate(crosswalk_data)
-        data_to_evaluate = self.normalize_values(data_to_evaluate)
+        state: typing.Optional[incremental.EvaluationState] = None
+
+        if self._state_path:
+            state = self.load_state()
+            observations, predictions = self._drop_evaluated_inputs(state, crosswalk_data, observations, predictions)
+
+        input_rows = sum(len(frame) for frame in (observations, predictions) if frame is not None)
+
+        with self._timings.stage("get_data_to_evaluate", rows_in=input_rows) as stage:
+            data_to_evaluate = self.get_data_to_evaluate(crosswalk_data, observations, predictions)
+
+            if state is not None:
+                data_to_evaluate = state.drop_evaluated_pairs(
+                    data_to_evaluate,
+                    self._observed_location_field,
+                    self._predicted_location_field,
+                    self._observed_xaxis
+                )
+
+            stage.rows_out = len(data_to_evaluate)
+
+        with self._timings.stage("normalize_values", rows_in=len(data_to_evaluate)) as stage:
+            data_to_evaluate = self.normalize_values(data_to_evaluate)
+            stage.rows_out = len(data_to_evaluate)
 
         self._communicators.info(
             "Data to evaluate has been collected",
@@ -244,7 +425,9 @@ class Evaluator:
             publish=True
         )
 
-        thresholds = self.get_thresholds()
+        with self._timings.stage("get_thresholds") as stage:
+            thresholds = self.get_thresholds()
+            stage.rows_out = sum(len(location_thresholds) for location_thresholds in thresholds.values())
 
         self._communicators.info(
             "Thresholds have been collected",
@@ -253,9 +436,25 @@ class Evaluator:
         )
 
         # Score data and arrange in a dictionary like (observed location, forecasted location) => MetricResults
-        scores: typing.Dict[typing.Tuple[str, str], metrics.MetricResults] = self.score(data_to_evaluate, thresholds)
+        with self._timings.stage("score", rows_in=len(data_to_evaluate)) as stage:
+            if state is not None:
+                scores = self.score_incrementally(state, data_to_evaluate, thresholds)
+            else:
+                scores: typing.Dict[typing.Tuple[str, str], metrics.MetricResults] = self.score(
+                    data_to_evaluate,
+                    thresholds
+                )
+            stage.rows_out = len(scores)
+
+        if state is not None:
+            with self._timings.stage("save_state", rows_in=len(state)):
+                state.save(self._state_path)
 
-        evaluation_results = specification.EvaluationResults(self._instructions, scores)
+        with self._timings.stage("results", rows_in=len(scores)) as stage:
+            evaluation_results = specification.EvaluationResults(self._instructions, scores, timings=self._timings)
+            stage.rows_out = len(evaluation_results)
+
+        self._communicators.write(reason="timing", data=self._timings.to_dict(), verbosity=Verbosity.NORMAL)
 
         if self._verbosity == Verbosity.ALL and self._communicators.send_all():
             data = evaluation_results.to_dict()
@@ -263,6 +462,74 @@ class Evaluator:
 
         return evaluation_results
 
+    def load_state(self) -> incremental.EvaluationState:
+        """
+        Load the running statistics left by previous evaluations, starting over if they can't be used
+
+        Returns:
+            The running statistics for every pair of locations that has been evaluated
+        """
+        state_key = incremental.get_state_key(
+            self._instructions,
+            self._observed_value_field,
+            self._predicted_value_field,
+            self._observed_xaxis
+        )
+        state = incremental.EvaluationState.load(self._state_path, state_key)
+
+        self._communicators.info(
+            f"Loaded running statistics for {len(state)} location pairs",
+            verbosity=Verbosity.LOUD,
+            publish=True
+        )
+
+        return state
+
+    def _drop_evaluated_inputs(
+        self,
+        state: incremental.EvaluationState,
+        crosswalk_data: pandas.DataFrame,
+        observations: typing.Optional[pandas.DataFrame],
+        predictions: typing.Optional[pandas.DataFrame]
+    ) -> typing.Tuple[typing.Optional[pandas.DataFrame], typing.Optional[pandas.DataFrame]]:
+        """
+        Remove observations and predictions that every pair of locations they belong to has already evaluated
+
+        Args:
+            state: The running statistics from previous evaluations
+            crosswalk_data: A DataFrame describing what locations bind together
+            observations: All loaded observations
+            predictions: All loaded predictions
+
+        Returns:
+            The observations and predictions that still need to be paired
+        """
+        location_pairs = list(
+            crosswalk_data[[self._observed_location_field, self._predicted_location_field]].itertuples(
+                index=False,
+                name=None
+            )
+        )
+
+        input_rows = sum(len(frame) for frame in (observations, predictions) if frame is not None)
+
+        with self._timings.stage("drop_evaluated_inputs", rows_in=input_rows) as stage:
+            observations = state.drop_evaluated_rows(
+                observations,
+                self._observed_location_field,
+                self._observed_xaxis,
+                state.get_high_water_marks(location_pairs, 0)
+            )
+            predictions = state.drop_evaluated_rows(
+                predictions,
+                self._predicted_location_field,
+                self._predicted_xaxis,
+                state.get_high_water_marks(location_pairs, 1)
+            )
+            stage.rows_out = sum(len(frame) for frame in (observations, predictions) if frame is not None)
+
+        return observations, predictions
+
     def get_crosswalk(self) -> pandas.DataFrame:
         """
         Gathers crosswalk data as specified via the instructions
@@ -307,59 +574,137 @@ class Evaluator:
 
         return crosswalk_data
 
-    def get_data_to_evaluate(self, crosswalk_data: pandas.DataFrame) -> pandas.DataFrame:
+    def _read_sources(
+        self,
+        definitions: typing.Sequence[specification.DataSourceSpecification],
+        thread_pool: Executor,
+        process_pool: typing.Optional[Executor]
+    ) -> typing.List[Future]:
         """
-        Uses internal specification and discovered crosswalk data to organize what data to evaluate and how
+        Starts reading each data source
 
         Args:
-            crosswalk_data:
-                A DataFrame describing what locations bind together
+            definitions: The data sources to read
+            thread_pool: The executor used for sources that mostly wait on I/O
+            process_pool: The executor used for sources that are expensive to parse, if one is available
+
         Returns:
-            A DataFrame of observed and predicted data matched together for evaluation
+            The pending results of each read, in the same order as the definitions
         """
-        observations: typing.Optional[pandas.DataFrame] = None
+        futures: typing.List[Future] = list()
 
+        for definition in definitions:
+            is_parse_heavy = definition.backend.format.lower() in PARSE_HEAVY_FORMATS
+
+            if process_pool is not None and is_parse_heavy:
+                futures.append(process_pool.submit(data_retriever.read, definition))
+            else:
+                futures.append(thread_pool.submit(data_retriever.read, definition))
+
+        return futures
+
+    @staticmethod
+    def _combine_frames(futures: typing.Sequence[Future]) -> typing.Optional[pandas.DataFrame]:
+        """
+        Waits on each read and joins everything that was found into a single frame
+
+        Args:
+            futures: The pending results of reading data sources
+
+        Returns:
+            Every found frame combined; None if nothing was found
+        """
+        frames = [future.result() for future in futures]
+        frames = [frame for frame in frames if frame is not None and not frame.empty]
+
+        if not frames:
+            return None
+
+        if len(frames) == 1:
+            return frames[0]
+
+        return pandas.concat(frames)
+
+    def load_input_data(self) -> typing.Tuple[typing.Optional[pandas.DataFrame], typing.Optional[pandas.DataFrame]]:
+        """
+        Reads every observation and prediction source at the same time
+
+        I/O bound sources are read on threads. Formats that are expensive to parse are read in separate processes
+        when this evaluator has been allowed more than one worker and is able to start them
+
+        Returns:
+            All observations and all predictions
+        """
         self._communicators.info(
             "Loading evaluation input data",
             verbosity=Verbosity.LOUD,
             publish=True
         )
 
-        for observation_definition in self._instructions.observations:
-            found_observations = data_retriever.read(observation_definition)
-
-            if found_observations is None or found_observations.empty:
-                continue
+        definitions = list(self._instructions.observations) + list(self._instructions.predictions)
 
-            if observations is None:
-                observations = found_observations
-            else:
-                observations = pandas.concat([observations, found_observations])
+        if not definitions:
+            return None, None
 
-        self._communicators.info(
-            "Finished loading observation data",
-            verbosity=Verbosity.LOUD,
-            publish=True
+        use_processes = self._workers > 1 and not multiprocessing.current_process().daemon
+        has_parse_heavy_sources = any(
+            definition.backend.format.lower() in PARSE_HEAVY_FORMATS
+            for definition in definitions
         )
 
-        predictions: typing.Optional[pandas.DataFrame] = None
+        process_pool = None
+        if use_processes and has_parse_heavy_sources:
+            process_pool = ProcessPoolExecutor(max_workers=min(self._workers, len(definitions)))
 
-        for prediction_definition in self._instructions.predictions:
-            found_predictions = data_retriever.read(prediction_definition)
+        try:
+            with ThreadPoolExecutor(max_workers=min(32, len(definitions))) as thread_pool:
+                observation_futures = self._read_sources(self._instructions.observations, thread_pool, process_pool)
+                prediction_futures = self._read_sources(self._instructions.predictions, thread_pool, process_pool)
 
-            if found_predictions is None or found_predictions.empty:
-                continue
+                observations = self._combine_frames(observation_futures)
 
-            if predictions is None:
-                predictions = found_predictions
-            else:
-                predictions = pandas.concat([predictions, found_predictions])
+                self._communicators.info(
+                    "Finished loading observation data",
+                    verbosity=Verbosity.LOUD,
+                    publish=True
+                )
 
-        self._communicators.info(
-            "Finished loading prediction data",
-            verbosity=Verbosity.LOUD,
-            publish=True
-        )
+                predictions = self._combine_frames(prediction_futures)
+
+                self._communicators.info(
+                    "Finished loading prediction data",
+                    verbosity=Verbosity.LOUD,
+                    publish=True
+                )
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown()
+
+        return observations, predictions
+
+    def get_data_to_evaluate(
+        self,
+        crosswalk_data: pandas.DataFrame,
+        observations: pandas.DataFrame = None,
+        predictions: pandas.DataFrame = None
+    ) -> pandas.DataFrame:
+        """
+        Uses internal specification and discovered crosswalk data to organize what data to evaluate and how
+
+        Args:
+            crosswalk_data:
+                A DataFrame describing what locations bind together
+            observations:
+                Previously loaded observations; every observation source is read if neither these nor predictions
+                are given
+            predictions:
+                Previously loaded predictions; every prediction source is read if neither these nor observations
+                are given
+        Returns:
+            A DataFrame of observed and predicted data matched together for evaluation
+        """
+        if observations is None and predictions is None:
+            observations, predictions = self.load_input_data()
 
         data = observations.merge(right=crosswalk_data, on=self._observed_location_field)
 
@@ -527,6 +872,11 @@ class Evaluator:
             self._predicted_location_field
         ]
 
+        if self._vectorize or self._workers > 1:
+            scores = self._score_all_locations(scheme, data_to_evaluate, thresholds)
+            self._timings.add_metric_timings(scheme.metric_timings)
+            return scores
+
         scores: typing.Dict[typing.Tuple[str, str], metrics.MetricResults] = dict()
 
         for identifiers, group in data_to_evaluate.groupby(by=groupby_columns):  # type: tuple, pandas.DataFrame
@@ -545,11 +895,21 @@ class Evaluator:
                 publish=True
             )
 
-            truth_tables = metrics.categorical.TruthTables(
-                group[self._observed_value_field],
-                group[self._predicted_value_field],
-                location_thresholds
-            )
+            if location_thresholds and not any(
+                location_threshold.transformation_function for location_threshold in location_thresholds
+            ):
+                truth_tables = metrics.categorical.TruthTables.from_arrays(
+                    group[self._observed_value_field].to_numpy(dtype=float, na_value=numpy.nan),
+                    group[self._predicted_value_field].to_numpy(dtype=float, na_value=numpy.nan),
+                    location_thresholds,
+                    index=group.index
+                )
+            else:
+                truth_tables = metrics.categorical.TruthTables(
+                    group[self._observed_value_field],
+                    group[self._predicted_value_field],
+                    location_thresholds
+                )
 
             self._communicators.info(
                 f"Scoring {str(identifiers)}",
@@ -582,13 +942,248 @@ class Evaluator:
             publish=True
         )
 
+        self._timings.add_metric_timings(scheme.metric_timings)
+
+        return scores
+
+    def score_incrementally(
+        self,
+        state: incremental.EvaluationState,
+        data_to_evaluate: pandas.DataFrame,
+        thresholds: typing.Dict[str, typing.Sequence[metrics.Threshold]]
+    ) -> typing.Dict[typing.Tuple[str, str], metrics.MetricResults]:
+        """
+        Add data that hasn't been evaluated yet to the running statistics and score the statistics
+
+        Args:
+            state: The running statistics from previous evaluations
+            data_to_evaluate: The values beyond what has already been evaluated, ready to compare
+            thresholds: The thresholds used to compare values
+
+        Returns:
+            A mapping between every location pair with running statistics and the results of the metrics performed
+            on them
+        """
+        scheme = self._instructions.scheme.generate_scheme(self._communicators)
+        incremental.validate_scheme(scheme)
+
+        state.update(
+            data_to_evaluate,
+            self._observed_location_field,
+            self._predicted_location_field,
+            self._observed_value_field,
+            self._predicted_value_field,
+            self._observed_xaxis,
+            thresholds
+        )
+
+        self._communicators.info(
+            f"Added {len(data_to_evaluate)} new pairs to the running statistics",
+            verbosity=Verbosity.LOUD,
+            publish=True
+        )
+
+        scores = state.score(scheme, self._observed_value_field, self._predicted_value_field, thresholds)
+
+        if self._verbosity == Verbosity.ALL:
+            for (observed_location, predicted_location), location_scores in scores.items():
+                data = {
+                    "observed_location": observed_location,
+                    "predicted_location": predicted_location,
+                    "scores": location_scores.to_dict(),
+                }
+                self._communicators.write(reason="location_scores", data=data)
+
+        self._timings.add_metric_timings(scheme.metric_timings)
+
+        return scores
+
+    def _score_all_locations(
+        self,
+        scheme: metrics.ScoringScheme,
+        data_to_evaluate: pandas.DataFrame,
+        thresholds: typing.Dict[str, typing.Sequence[metrics.Threshold]]
+    ) -> typing.Dict[typing.Tuple[str, str], metrics.MetricResults]:
+        """
+        Scores every location at once through grouped reductions rather than one location at a time
+
+        Args:
+            scheme: The scheme describing what metrics to use
+            data_to_evaluate: The values ready to compare
+            thresholds: The thresholds used to compare values
+
+        Returns:
+            A mapping between the locations being evaluated and the results of the metrics performed on them
+        """
+        groupby_columns = [
+            self._observed_location_field,
+            self._predicted_location_field
+        ]
+
+        location_pairs = data_to_evaluate[groupby_columns].drop_duplicates().itertuples(index=False, name=None)
+
+        location_thresholds = {
+            (observed_location, predicted_location): thresholds.get(observed_location)
+            for observed_location, predicted_location in location_pairs
+            if thresholds.get(observed_location)
+        }
+
+        self._communicators.info(
+            f"Scoring {len(location_thresholds)} location pairs",
+            verbosity=Verbosity.LOUD,
+            publish=True
+        )
+
+        use_processes = self._workers > 1
+
+        if use_processes and multiprocessing.current_process().daemon:
+            self._communicators.info(
+                "Locations cannot be scored in parallel from within a daemonic process; scoring them here instead",
+                verbosity=Verbosity.LOUD,
+                publish=True
+            )
+            use_processes = False
+
+        if use_processes:
+            scores = self._score_in_parallel(data_to_evaluate, location_thresholds)
+        else:
+            scores = scheme.score_groups(
+                data_to_evaluate,
+                groupby_columns,
+                self._observed_value_field,
+                self._predicted_value_field,
+                location_thresholds,
+                metadata_fields=["observed_location", "predicted_location"]
+            )
+
+        if self._verbosity == Verbosity.ALL:
+            for (observed_location, predicted_location), location_scores in scores.items():
+                data = {
+                    "observed_location": observed_location,
+                    "predicted_location": predicted_location,
+                    "scores": location_scores.to_dict(),
+                }
+                self._communicators.write(reason="location_scores", data=data)
+
+        self._communicators.info(
+            "All locations have been evaluated",
+            verbosity=Verbosity.LOUD,
+            publish=True
+        )
+
         return scores
 
+    def _score_in_parallel(
+        self,
+        data_to_evaluate: pandas.DataFrame,
+        location_thresholds: typing.Dict[typing.Tuple[str, str], typing.Sequence[metrics.Threshold]]
+    ) -> typing.Dict[typing.Tuple[str, str], metrics.MetricResults]:
+        """
+        Splits locations into contiguous shards of roughly equal size and scores each shard in its own process
+
+        Each process only receives the columns needed for scoring its own locations. Results are merged back in
+        location order, so the output does not depend on which shard finishes first.
+
+        Args:
+            data_to_evaluate: The values ready to compare
+            location_thresholds: The thresholds to use for each pair of locations
+
+        Returns:
+            A mapping between the locations being evaluated and the results of the metrics performed on them
+        """
+        groupby_columns = [
+            self._observed_location_field,
+            self._predicted_location_field
+        ]
+
+        grouped_data = data_to_evaluate.groupby(by=groupby_columns, sort=True)
+
+        # The position of each location within the sorted group sizes matches its code from `ngroup`
+        all_group_sizes = grouped_data.size()
+        is_scored = numpy.array([identifier in location_thresholds for identifier in all_group_sizes.index], dtype=bool)
+        group_sizes = all_group_sizes[is_scored]
+
+        if group_sizes.empty:
+            return dict()
+
+        shard_count = min(self._workers, len(group_sizes))
+
+        # Assign each location to a shard based on where it falls among the cumulative number of rows to score
+        cumulative_sizes = group_sizes.cumsum().to_numpy()
+        shard_per_group = numpy.minimum(
+            (cumulative_sizes - group_sizes.to_numpy()) * shard_count // cumulative_sizes[-1],
+            shard_count - 1
+        )
+
+        group_codes = grouped_data.ngroup().to_numpy()
+        shard_per_code = numpy.full(len(all_group_sizes), -1)
+        shard_per_code[is_scored] = shard_per_group
+
+        row_shards = numpy.where(group_codes >= 0, shard_per_code[group_codes], -1)
+
+        needed_columns = set(groupby_columns)
+        needed_columns.update([self._observed_value_field, self._predicted_value_field])
+
+        for thresholds in location_thresholds.values():
+            for location_threshold in thresholds:
+                needed_columns.update(
+                    key
+                    for key in (location_threshold.observed_value_key, location_threshold.predicted_value_key)
+                    if key is not None
+                )
+
+        needed_columns = [column for column in data_to_evaluate.columns if column in needed_columns]
+
+        # The scheme is regenerated without communicators since those may not be sent to other processes
+        scheme = self._instructions.scheme.generate_scheme()
+        shard_identifiers: typing.List[typing.List[typing.Tuple[str, str]]] = [list() for _ in range(shard_count)]
+
+        for identifier, shard_number in zip(group_sizes.index, shard_per_group):
+            shard_identifiers[shard_number].append(identifier)
+
+        self._communicators.info(
+            f"Scoring {len(group_sizes)} location pairs across {shard_count} processes",
+            verbosity=Verbosity.LOUD,
+            publish=True
+        )
+
+        scores: typing.Dict[typing.Tuple[str, str], metrics.MetricResults] = dict()
+
+        with ProcessPoolExecutor(max_workers=shard_count) as executor:
+            futures = [
+                executor.submit(
+                    score_shard,
+                    scheme,
+                    FrameShard(data_to_evaluate[row_shards == shard_number], needed_columns),
+                    groupby_columns,
+                    self._observed_value_field,
+                    self._predicted_value_field,
+                    {identifier: location_thresholds[identifier] for identifier in identifiers}
+                )
+                for shard_number, identifiers in enumerate(shard_identifiers)
+                if identifiers
+            ]
+
+            # Time spent on metrics in other processes is added together, so it may exceed the time spent scoring
+            for future in futures:
+                shard_scores, shard_metric_timings = future.result()
+                scores.update(shard_scores)
+                self._timings.add_metric_timings(shard_metric_timings)
+
+        return {
+            identifier: scores[identifier]
+            for identifier in group_sizes.index
+            if identifier in scores
+        }
+
 
 def evaluate(
     definition: specification.EvaluationSpecification,
     communicators: COMMUNICATORS = None,
-    verbosity: Verbosity = None
+    verbosity: Verbosity = None,
+    vectorize: bool = None,
+    workers: int = None,
+    state_path: typing.Union[str, pathlib.Path] = None
 ) -> specification.EvaluationResults:
     """
     Performs an evaluation
@@ -597,9 +1192,12 @@ def evaluate(
         definition: The instructions on how to conduct the evaluation
         communicators: The communicators to use to send messages through as the evaluation goes on
         verbosity: How chatty the evaluation should be
+        vectorize: Whether to score every location at once rather than one location at a time
+        workers: The number of processes to spread scoring across
+        state_path: Where running statistics are kept between evaluations so that only new data is evaluated
 
     Returns:
         The results of the evaluation
     """
-    evaluator = Evaluator(definition, communicators, verbosity)
+    evaluator = Evaluator(definition, communicators, verbosity, vectorize, workers, state_path)
     return evaluator.evaluate()
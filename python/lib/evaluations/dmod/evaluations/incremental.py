@@ -0,0 +1,775 @@
+"""
+Keeps running statistics for each pair of locations so that an evaluation that is repeated as new data arrives only
+needs to read, pair, and score the data that it hasn't seen yet
+
+Every metric whose result may be derived from counts, sums, sums of squares, cross products, contingency counts, and
+the areas of trapezoids between consecutive pairs may be evaluated this way. The statistics for each location are
+stored alongside the latest value along the x axis that has been evaluated for it (its high water mark); the next
+evaluation only considers rows beyond that mark, adds them to the statistics, and scores the combined statistics.
+
+History is treated as append only - rows at or before a location's high water mark are never revisited, so
+revisions to old values and pairs that only form after their location has moved past them are not reflected.
+"""
+import typing
+import os
+import json
+import hashlib
+import pathlib
+import tempfile
+import logging
+
+import numpy
+import pandas
+
+import dmod.metrics as metrics
+
+from . import specification
+from . import util
+from .threshold import cache as threshold_cache
+
+util.configure_logging()
+
+LOCATION_PAIR = typing.Tuple[str, str]
+
+DECOMPOSABLE_METRICS: typing.Tuple[typing.Type[metrics.Metric], ...] = (
+    metrics.metric.PearsonCorrelationCoefficient,
+    metrics.metric.KlingGuptaEfficiency,
+    metrics.metric.NormalizedNashSutcliffeEfficiency,
+    metrics.metric.VolumeError,
+    metrics.metric.CategoricalMetric,
+)
+"""The types of metrics that may be calculated from running statistics"""
+
+STATE_VERSION = 1
+"""The version of the layout used to store running statistics"""
+
+
+def get_state_key(
+    instructions: specification.EvaluationSpecification,
+    observed_value_field: str,
+    predicted_value_field: str,
+    x_axis: str
+) -> str:
+    """
+    Create a hash of everything about an evaluation that determines what its running statistics mean
+
+    Where observations and predictions come from is left out so that sources may change between runs
+
+    Args:
+        instructions: The specification for the evaluation
+        observed_value_field: The name of the column containing observations
+        predicted_value_field: The name of the column containing predictions
+        x_axis: The name of the column that orders the pairs
+
+    Returns:
+        A hash that will change if previously stored statistics can no longer be added to
+    """
+    details = {
+        "version": STATE_VERSION,
+        "crosswalks": [
+            [
+                crosswalk.backend.type,
+                crosswalk.backend.format,
+                crosswalk.backend.address,
+                crosswalk.observation_field_name,
+                crosswalk.prediction_field_name
+            ]
+            for crosswalk in instructions.crosswalks
+        ],
+        "thresholds": [
+            threshold_cache.get_specification_hash(definition)
+            for definition in instructions.thresholds
+        ],
+        "metrics": [[metric.name, metric.weight] for metric in instructions.scheme.metric_functions],
+        "fields": [observed_value_field, predicted_value_field, x_axis]
+    }
+    serialized_details = json.dumps(details, sort_keys=True, default=str)
+    return hashlib.sha256(serialized_details.encode()).hexdigest()
+
+
+def validate_scheme(scheme: metrics.ScoringScheme):
+    """
+    Ensure that every metric in a scheme may be calculated from running statistics
+
+    Args:
+        scheme: The scheme that will be used to score the statistics
+    """
+    invalid_metrics = [
+        metric.name
+        for metric in scheme.metrics
+        if not isinstance(metric, DECOMPOSABLE_METRICS)
+    ]
+
+    if invalid_metrics:
+        raise ValueError(
+            f"The following metrics cannot be evaluated incrementally: {', '.join(invalid_metrics)}"
+        )
+
+
+def _encode_value(value) -> typing.Any:
+    if isinstance(value, (pandas.Timestamp, numpy.datetime64)):
+        return {"timestamp": pandas.Timestamp(value).isoformat()}
+    if isinstance(value, numpy.generic):
+        return value.item()
+    return value
+
+
+def _decode_value(value) -> typing.Any:
+    if isinstance(value, dict) and "timestamp" in value:
+        return pandas.Timestamp(value["timestamp"])
+    return value
+
+
+def _combine_sum_of_squares(
+    count: int,
+    mean: float,
+    sum_of_squares: float,
+    added_count: int,
+    added_mean: float,
+    added_sum_of_squares: float
+) -> float:
+    """
+    Combine the sums of squared deviations of two sets of values (Chan et al.)
+    """
+    total = count + added_count
+
+    if count == 0 or added_count == 0:
+        return sum_of_squares + added_sum_of_squares
+
+    difference = added_mean - mean
+    return sum_of_squares + added_sum_of_squares + difference * difference * count * added_count / total
+
+
+class ThresholdAccumulator:
+    """
+    Running statistics for the pairs of a single location that have passed a single threshold
+
+    Exposes the same statistics as `dmod.metrics.statistics.ThresholdStatistics` so that metrics may be
+    calculated from it directly. Missing values are skipped for means and sums the same way.
+    """
+    def __init__(self):
+        self.size: int = 0
+        """The number of pairs that passed the threshold"""
+
+        self.observed_count: int = 0
+        self.observed_sum: float = 0.0
+        self.observed_sum_of_squares: float = 0.0
+        """The sum of the squared differences between each observation and the mean observation"""
+
+        self.predicted_count: int = 0
+        self.predicted_sum: float = 0.0
+        self.predicted_sum_of_squares: float = 0.0
+        """The sum of the squared differences between each prediction and the mean prediction"""
+
+        self.incomplete_pairs: int = 0
+        """The number of pairs missing either an observation or a prediction"""
+
+        self.sum_of_cross_products: float = 0.0
+        """
+        The sum of the products of the deviations of each observation and prediction; only meaningful if every pair
+        is complete
+        """
+
+        self.sum_of_squared_error: float = 0.0
+
+        self.observed_area: float = 0.0
+        self.predicted_area: float = 0.0
+        self.last_pair: typing.Optional[typing.Tuple[float, float, float]] = None
+        """The position, observation, and prediction of the latest pair, from which the next trapezoid starts"""
+
+    @property
+    def empty(self) -> bool:
+        return self.size == 0
+
+    @property
+    def observed_mean(self) -> float:
+        return self.observed_sum / self.observed_count if self.observed_count else numpy.nan
+
+    @property
+    def predicted_mean(self) -> float:
+        return self.predicted_sum / self.predicted_count if self.predicted_count else numpy.nan
+
+    @property
+    def observed_standard_deviation(self) -> float:
+        if self.observed_count < 2:
+            return numpy.nan
+        return numpy.sqrt(self.observed_sum_of_squares / (self.observed_count - 1))
+
+    @property
+    def predicted_standard_deviation(self) -> float:
+        if self.predicted_count < 2:
+            return numpy.nan
+        return numpy.sqrt(self.predicted_sum_of_squares / (self.predicted_count - 1))
+
+    @property
+    def pearson_correlation_coefficient(self) -> float:
+        """
+        The linear correlation between the observations and predictions, calculated the same way as `numpy.corrcoef`
+        """
+        if self.empty or self.incomplete_pairs:
+            return numpy.nan
+
+        with numpy.errstate(all="ignore"):
+            degrees_of_freedom = self.size - 1
+            covariance = self.sum_of_cross_products / degrees_of_freedom
+            correlation = covariance / numpy.sqrt(self.observed_sum_of_squares / degrees_of_freedom)
+            correlation /= numpy.sqrt(self.predicted_sum_of_squares / degrees_of_freedom)
+
+        return float(numpy.clip(correlation, -1, 1))
+
+    @property
+    def volume_error(self) -> float:
+        """
+        The difference between the area under the predictions and the area under the observations
+        """
+        if self.empty:
+            return 0
+        return self.predicted_area - self.observed_area
+
+    def update(self, positions: numpy.ndarray, observations: numpy.ndarray, predictions: numpy.ndarray):
+        """
+        Add newly passing pairs to the statistics
+
+        Args:
+            positions: Where each pair lies along the x axis; must continue to increase from previous pairs
+            observations: The observations that passed the threshold
+            predictions: The predictions that passed the threshold
+        """
+        if len(observations) == 0:
+            return
+
+        with numpy.errstate(all="ignore"):
+            observed_is_present = ~numpy.isnan(observations)
+            predicted_is_present = ~numpy.isnan(predictions)
+
+            added_observed_count = int(numpy.count_nonzero(observed_is_present))
+            added_observed_sum = float(numpy.nansum(observations))
+            added_observed_mean = added_observed_sum / added_observed_count if added_observed_count else numpy.nan
+            added_observed_deviation = observations - added_observed_mean
+
+            added_predicted_count = int(numpy.count_nonzero(predicted_is_present))
+            added_predicted_sum = float(numpy.nansum(predictions))
+            added_predicted_mean = added_predicted_sum / added_predicted_count if added_predicted_count else numpy.nan
+            added_predicted_deviation = predictions - added_predicted_mean
+
+            added_complete_pairs = int(numpy.count_nonzero(observed_is_present & predicted_is_present))
+            added_incomplete_pairs = len(observations) - added_complete_pairs
+
+            # Cross products only describe the correlation if every pair is complete, in which case the means of the
+            # observations and predictions are also the means of the complete pairs
+            if self.incomplete_pairs == 0 and added_incomplete_pairs == 0:
+                added_cross_products = float(numpy.sum(added_observed_deviation * added_predicted_deviation))
+
+                if self.size:
+                    shift = (added_observed_mean - self.observed_mean) * (added_predicted_mean - self.predicted_mean)
+                    added_cross_products += shift * self.size * len(observations) / (self.size + len(observations))
+
+                self.sum_of_cross_products += added_cross_products
+
+            self.observed_sum_of_squares = _combine_sum_of_squares(
+                self.observed_count,
+                self.observed_mean,
+                self.observed_sum_of_squares,
+                added_observed_count,
+                added_observed_mean,
+                float(numpy.nansum(added_observed_deviation ** 2))
+            )
+            self.predicted_sum_of_squares = _combine_sum_of_squares(
+                self.predicted_count,
+                self.predicted_mean,
+                self.predicted_sum_of_squares,
+                added_predicted_count,
+                added_predicted_mean,
+                float(numpy.nansum(added_predicted_deviation ** 2))
+            )
+
+            self.observed_count += added_observed_count
+            self.observed_sum += added_observed_sum
+            self.predicted_count += added_predicted_count
+            self.predicted_sum += added_predicted_sum
+            self.incomplete_pairs += added_incomplete_pairs
+            self.sum_of_squared_error += float(numpy.nansum((observations - predictions) ** 2))
+            self.size += len(observations)
+
+            self.__add_areas(positions, observations, predictions)
+
+    def __add_areas(self, positions: numpy.ndarray, observations: numpy.ndarray, predictions: numpy.ndarray):
+        """
+        Add the area of every trapezoid between consecutive pairs, including the one joining the previous pairs to
+        the new ones, the same way as `sklearn.metrics.auc`
+        """
+        positions = numpy.asarray(positions, dtype=float)
+
+        if self.last_pair is not None:
+            last_position, last_observation, last_prediction = self.last_pair
+            positions = numpy.concatenate([[last_position], positions])
+            observations = numpy.concatenate([[last_observation], observations])
+            predictions = numpy.concatenate([[last_prediction], predictions])
+
+        widths = numpy.diff(positions)
+
+        if numpy.any(widths < 0):
+            raise ValueError("Pairs must be added in increasing order along the x axis to be evaluated incrementally")
+
+        self.observed_area += float(numpy.sum(widths * (observations[1:] + observations[:-1]) / 2.0))
+        self.predicted_area += float(numpy.sum(widths * (predictions[1:] + predictions[:-1]) / 2.0))
+        self.last_pair = (float(positions[-1]), float(observations[-1]), float(predictions[-1]))
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "size": self.size,
+            "observed_count": self.observed_count,
+            "observed_sum": self.observed_sum,
+            "observed_sum_of_squares": self.observed_sum_of_squares,
+            "predicted_count": self.predicted_count,
+            "predicted_sum": self.predicted_sum,
+            "predicted_sum_of_squares": self.predicted_sum_of_squares,
+            "incomplete_pairs": self.incomplete_pairs,
+            "sum_of_cross_products": self.sum_of_cross_products,
+            "sum_of_squared_error": self.sum_of_squared_error,
+            "observed_area": self.observed_area,
+            "predicted_area": self.predicted_area,
+            "last_pair": list(self.last_pair) if self.last_pair is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: typing.Mapping[str, typing.Any]) -> "ThresholdAccumulator":
+        accumulator = cls()
+
+        for name, value in data.items():
+            if name == "last_pair":
+                value = tuple(value) if value is not None else None
+            setattr(accumulator, name, value)
+
+        return accumulator
+
+
+class LocationStatistics:
+    """
+    Running statistics for every threshold of a single pair of locations
+
+    Stands in for a `dmod.metrics.statistics.PairStatistics` when scoring so that metrics read the running
+    statistics rather than raw pairs
+    """
+    def __init__(self):
+        self.rows: int = 0
+        """The number of pairs that have been added, regardless of threshold"""
+
+        self.high_water_mark: typing.Optional[typing.Any] = None
+        """The latest value along the x axis that has been added"""
+
+        self.accumulators: typing.Dict[str, ThresholdAccumulator] = dict()
+        self.contingencies: typing.Dict[str, numpy.ndarray] = dict()
+        """Hits, misses, false positives, and true negatives for each threshold"""
+
+    def update(
+        self,
+        pairs: pandas.DataFrame,
+        observed_value_field: str,
+        predicted_value_field: str,
+        x_axis: str,
+        thresholds: typing.Sequence[metrics.Threshold]
+    ):
+        """
+        Add new pairs to the statistics for each threshold
+
+        Pairs filtered by a threshold are positioned by their place among every pair of the location, otherwise they
+        are positioned by the integer value of their index, matching how volume is calculated for a full evaluation
+
+        Args:
+            pairs: Pairs for this location beyond its high water mark, in order along the x axis
+            observed_value_field: The name of the column containing observations
+            predicted_value_field: The name of the column containing predictions
+            x_axis: The name of the column that orders the pairs
+            thresholds: The thresholds to apply to the pairs
+        """
+        if pairs.empty:
+            return
+
+        for location_threshold in thresholds:
+            if location_threshold.transformation_function:
+                raise ValueError(
+                    f"'{location_threshold.name}' transforms the data it applies to, so it cannot be evaluated "
+                    f"incrementally"
+                )
+
+        observations = pairs[observed_value_field].to_numpy(dtype=float, na_value=numpy.nan)
+        predictions = pairs[predicted_value_field].to_numpy(dtype=float, na_value=numpy.nan)
+        index_positions: typing.Optional[numpy.ndarray] = None
+
+        counts = metrics.categorical.count_contingencies(
+            observations,
+            predictions,
+            thresholds,
+            numpy.stack([location_threshold.align(pairs.index) for location_threshold in thresholds])
+        )
+
+        for location_threshold, threshold_counts in zip(thresholds, counts):
+            name = location_threshold.name
+
+            if name in self.contingencies:
+                self.contingencies[name] = self.contingencies[name] + threshold_counts
+            else:
+                self.contingencies[name] = threshold_counts
+
+            if location_threshold.filters_values:
+                mask = location_threshold.mask(pairs)
+                positions = self.rows + numpy.flatnonzero(mask)
+            else:
+                mask = slice(None)
+
+                if index_positions is None:
+                    try:
+                        index_positions = pairs.index.values.astype("int")
+                    except (TypeError, ValueError):
+                        # Areas can't be drawn along an index that isn't numeric
+                        index_positions = numpy.full(len(pairs), numpy.nan)
+
+                positions = index_positions
+
+            self.accumulators.setdefault(name, ThresholdAccumulator()).update(
+                positions,
+                observations[mask],
+                predictions[mask]
+            )
+
+        self.rows += len(pairs)
+        latest_value = pairs[x_axis].max()
+
+        if self.high_water_mark is None or latest_value > self.high_water_mark:
+            self.high_water_mark = latest_value
+
+    def truth_tables(self, thresholds: typing.Sequence[metrics.Threshold]) -> metrics.categorical.TruthTables:
+        """
+        Args:
+            thresholds: The thresholds to create tables for
+
+        Returns:
+            Truth tables built from the accumulated contingency counts
+        """
+        return metrics.categorical.TruthTables(
+            views=(
+                thresholds,
+                numpy.stack([
+                    self.contingencies.get(location_threshold.name, numpy.zeros(4, dtype=int))
+                    for location_threshold in thresholds
+                ])
+            )
+        )
+
+    def describes(self, *args, **kwargs) -> bool:
+        """
+        Running statistics describe whatever pairs they are being scored as
+        """
+        return True
+
+    def __getitem__(self, threshold: metrics.Threshold) -> ThresholdAccumulator:
+        return self.accumulators.get(threshold.name) or ThresholdAccumulator()
+
+    def __contains__(self, threshold: metrics.Threshold) -> bool:
+        return threshold.name in self.accumulators
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "rows": self.rows,
+            "high_water_mark": _encode_value(self.high_water_mark),
+            "accumulators": {name: accumulator.to_dict() for name, accumulator in self.accumulators.items()},
+            "contingencies": {name: counts.tolist() for name, counts in self.contingencies.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: typing.Mapping[str, typing.Any]) -> "LocationStatistics":
+        statistics = cls()
+        statistics.rows = data["rows"]
+        statistics.high_water_mark = _decode_value(data["high_water_mark"])
+        statistics.accumulators = {
+            name: ThresholdAccumulator.from_dict(accumulator)
+            for name, accumulator in data["accumulators"].items()
+        }
+        statistics.contingencies = {
+            name: numpy.array(counts, dtype=int)
+            for name, counts in data["contingencies"].items()
+        }
+        return statistics
+
+
+class EvaluationState:
+    """
+    Running statistics for every pair of locations within an evaluation that is performed repeatedly
+    """
+    @classmethod
+    def load(cls, path: typing.Union[str, pathlib.Path], key: str) -> "EvaluationState":
+        """
+        Load previously stored statistics, starting over if they were stored for a different evaluation
+
+        Args:
+            path: Where the statistics are stored
+            key: The key for the evaluation that the statistics should belong to
+
+        Returns:
+            The stored statistics, or empty statistics if there were none that could be used
+        """
+        path = pathlib.Path(path)
+
+        if not path.exists():
+            return cls(key)
+
+        try:
+            with open(path) as state_file:
+                data = json.load(state_file)
+        except Exception as e:
+            logging.warning(f"Evaluation state at '{path}' could not be read and will be rebuilt: {e}")
+            return cls(key)
+
+        if data.get("key") != key:
+            logging.warning(
+                f"Evaluation state at '{path}' was stored for a different evaluation and will be rebuilt"
+            )
+            return cls(key)
+
+        state = cls(key)
+
+        for entry in data["locations"]:
+            state.locations[(entry["observed_location"], entry["predicted_location"])] = LocationStatistics.from_dict(
+                entry["statistics"]
+            )
+
+        return state
+
+    def __init__(self, key: str = None):
+        """
+        Constructor
+
+        Args:
+            key: The key for the evaluation that these statistics belong to
+        """
+        self.__key = key
+        self.locations: typing.Dict[LOCATION_PAIR, LocationStatistics] = dict()
+
+    @property
+    def key(self) -> typing.Optional[str]:
+        return self.__key
+
+    def save(self, path: typing.Union[str, pathlib.Path]):
+        """
+        Store the statistics so that they may be added to later
+
+        The statistics are written to a temporary file first so that an interrupted write never replaces good
+        statistics with a partial copy
+
+        Args:
+            path: Where to store the statistics
+        """
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "key": self.__key,
+            "locations": [
+                {
+                    "observed_location": observed_location,
+                    "predicted_location": predicted_location,
+                    "statistics": statistics.to_dict()
+                }
+                for (observed_location, predicted_location), statistics in self.locations.items()
+            ]
+        }
+
+        descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".partial")
+
+        try:
+            with os.fdopen(descriptor, "w") as state_file:
+                json.dump(data, state_file)
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    def get_high_water_marks(
+        self,
+        location_pairs: typing.Iterable[LOCATION_PAIR],
+        position: int
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Find the point along the x axis that every pair involving each location has been evaluated through
+
+        Locations that belong to any pair without statistics are left out since all of their data is still needed
+
+        Args:
+            location_pairs: Every pair of observed and predicted locations that may be evaluated
+            position: 0 to find marks for observed locations, 1 to find marks for predicted locations
+
+        Returns:
+            The high water mark for each location whose older data is no longer needed
+        """
+        marks: typing.Dict[str, typing.Any] = dict()
+        unmarked_locations: typing.Set[str] = set()
+
+        for location_pair in location_pairs:
+            location = location_pair[position]
+            statistics = self.locations.get(tuple(location_pair))
+
+            if statistics is None or statistics.high_water_mark is None:
+                unmarked_locations.add(location)
+            elif location not in marks or statistics.high_water_mark < marks[location]:
+                marks[location] = statistics.high_water_mark
+
+        return {
+            location: mark
+            for location, mark in marks.items()
+            if location not in unmarked_locations
+        }
+
+    def drop_evaluated_rows(
+        self,
+        data: pandas.DataFrame,
+        location_field: str,
+        x_axis: str,
+        marks: typing.Mapping[str, typing.Any]
+    ) -> pandas.DataFrame:
+        """
+        Remove rows that lie at or before the high water mark of their location
+
+        Args:
+            data: Observations, predictions, or pairs bearing a location and a position along the x axis
+            location_field: The name of the column identifying the location of each row
+            x_axis: The name of the column that orders the rows
+            marks: The high water mark for each location
+
+        Returns:
+            The rows that haven't been evaluated yet
+        """
+        if data is None or not marks:
+            return data
+
+        row_marks = data[location_field].map(marks)
+        is_new = row_marks.isna().to_numpy() | (data[x_axis] > row_marks).to_numpy()
+        return data[is_new]
+
+    def drop_evaluated_pairs(
+        self,
+        pairs: pandas.DataFrame,
+        observed_location_field: str,
+        predicted_location_field: str,
+        x_axis: str
+    ) -> pandas.DataFrame:
+        """
+        Remove pairs that lie at or before the high water mark of their pair of locations
+
+        Args:
+            pairs: Observations and predictions paired together
+            observed_location_field: The name of the column identifying observed locations
+            predicted_location_field: The name of the column identifying predicted locations
+            x_axis: The name of the column that orders the pairs
+
+        Returns:
+            The pairs that haven't been evaluated yet
+        """
+        marks = {
+            location_pair: statistics.high_water_mark
+            for location_pair, statistics in self.locations.items()
+            if statistics.high_water_mark is not None
+        }
+
+        if pairs.empty or not marks:
+            return pairs
+
+        location_pairs = pandas.MultiIndex.from_frame(pairs[[observed_location_field, predicted_location_field]])
+        pair_marks = pandas.Series(marks).reindex(location_pairs)
+        is_new = pair_marks.isna().to_numpy() | (pairs[x_axis].to_numpy() > pair_marks.to_numpy())
+        return pairs[is_new]
+
+    def update(
+        self,
+        pairs: pandas.DataFrame,
+        observed_location_field: str,
+        predicted_location_field: str,
+        observed_value_field: str,
+        predicted_value_field: str,
+        x_axis: str,
+        thresholds: typing.Mapping[str, typing.Sequence[metrics.Threshold]]
+    ):
+        """
+        Add pairs that haven't been evaluated yet to the statistics for their locations
+
+        Args:
+            pairs: Observations and predictions beyond the high water marks of their locations
+            observed_location_field: The name of the column identifying observed locations
+            predicted_location_field: The name of the column identifying predicted locations
+            observed_value_field: The name of the column containing observations
+            predicted_value_field: The name of the column containing predictions
+            x_axis: The name of the column that orders the pairs
+            thresholds: The thresholds for each observed location
+        """
+        grouped_pairs = pairs.groupby(by=[observed_location_field, predicted_location_field])
+
+        for location_pair, group in grouped_pairs:  # type: LOCATION_PAIR, pandas.DataFrame
+            location_thresholds = thresholds.get(location_pair[0])
+
+            if not location_thresholds:
+                continue
+
+            if location_pair not in self.locations:
+                self.locations[location_pair] = LocationStatistics()
+
+            self.locations[location_pair].update(
+                group,
+                observed_value_field,
+                predicted_value_field,
+                x_axis,
+                location_thresholds
+            )
+
+    def score(
+        self,
+        scheme: metrics.ScoringScheme,
+        observed_value_field: str,
+        predicted_value_field: str,
+        thresholds: typing.Mapping[str, typing.Sequence[metrics.Threshold]]
+    ) -> typing.Dict[LOCATION_PAIR, metrics.MetricResults]:
+        """
+        Score the running statistics for every pair of locations
+
+        Args:
+            scheme: The scheme describing what metrics to use
+            observed_value_field: The name of the column containing observations
+            predicted_value_field: The name of the column containing predictions
+            thresholds: The thresholds for each observed location
+
+        Returns:
+            The results for every pair of locations that has statistics and thresholds, in sorted order
+        """
+        validate_scheme(scheme)
+
+        # Metrics read the running statistics instead of the pairs, so they are only given an empty frame
+        empty_pairs = pandas.DataFrame(columns=[observed_value_field, predicted_value_field], dtype=float)
+        scores: typing.Dict[LOCATION_PAIR, metrics.MetricResults] = dict()
+
+        for location_pair in sorted(self.locations):
+            location_thresholds = thresholds.get(location_pair[0])
+
+            if not location_thresholds:
+                continue
+
+            statistics = self.locations[location_pair]
+            scores[location_pair] = scheme.score(
+                empty_pairs,
+                observed_value_field,
+                predicted_value_field,
+                location_thresholds,
+                metadata={
+                    "observed_location": location_pair[0],
+                    "predicted_location": location_pair[1],
+                },
+                statistics=statistics,
+                truth_tables=statistics.truth_tables(location_thresholds)
+            )
+
+        return scores
+
+    def __contains__(self, location_pair) -> bool:
+        return location_pair in self.locations
+
+    def __len__(self) -> int:
+        return len(self.locations)
@@ -0,0 +1,157 @@
+"""
+Records how long each stage of an evaluation took and how much memory it needed
+"""
+import typing
+import os
+import time
+import threading
+
+from contextlib import contextmanager
+from collections import defaultdict
+
+try:
+    import resource
+except ImportError:
+    # `resource` is only available on unix-like systems
+    resource = None
+
+
+def get_peak_rss() -> typing.Optional[int]:
+    """
+    Returns:
+        The highest resident set size this process has reached in bytes, if it can be determined
+    """
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes while macOS reports bytes
+    return peak_rss if os.uname().sysname == "Darwin" else peak_rss * 1024
+
+
+class StageTiming:
+    """
+    Measurements for a single stage of an evaluation
+    """
+    def __init__(self, name: str, rows_in: int = None):
+        """
+        Constructor
+
+        Args:
+            name: The name of the stage
+            rows_in: The number of rows that the stage was given
+        """
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out: typing.Optional[int] = None
+        self.wall_seconds: float = 0.0
+        self.cpu_seconds: float = 0.0
+        self.peak_rss_delta: typing.Optional[int] = None
+        """How much the peak resident set size of the process grew while the stage ran, in bytes"""
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "name": self.name,
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "peak_rss_delta": self.peak_rss_delta,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+        }
+
+    def __str__(self):
+        return f"{self.name}: {self.wall_seconds:.4f}s"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class EvaluationTimings:
+    """
+    Measurements for every stage of an evaluation along with the time spent on each metric
+
+    CPU time is measured for the entire process, so stages that run at the same time will each count the CPU time
+    used by the other.
+    """
+    def __init__(self):
+        self.__stages: typing.List[StageTiming] = list()
+        self.__metric_seconds: typing.Dict[str, float] = defaultdict(float)
+        self.__lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str, rows_in: int = None) -> typing.Iterator[StageTiming]:
+        """
+        Measure a stage of the evaluation
+
+        Set `rows_out` on the yielded record to describe what the stage produced
+
+        Example:
+            >>> timings = EvaluationTimings()
+            >>> with timings.stage("normalize_values", rows_in=len(data)) as stage:
+            ...     data = normalize(data)
+            ...     stage.rows_out = len(data)
+
+        Args:
+            name: The name of the stage
+            rows_in: The number of rows that the stage was given
+
+        Returns:
+            The record for the stage
+        """
+        stage_timing = StageTiming(name, rows_in)
+        starting_peak_rss = get_peak_rss()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        try:
+            yield stage_timing
+        finally:
+            stage_timing.wall_seconds = time.perf_counter() - wall_start
+            stage_timing.cpu_seconds = time.process_time() - cpu_start
+
+            if starting_peak_rss is not None:
+                stage_timing.peak_rss_delta = get_peak_rss() - starting_peak_rss
+
+            with self.__lock:
+                self.__stages.append(stage_timing)
+
+    def add_metric_timings(self, metric_timings: typing.Mapping[str, float]):
+        """
+        Add time spent calculating metrics
+
+        Args:
+            metric_timings: Seconds spent on each metric, keyed by metric name
+        """
+        with self.__lock:
+            for metric_name, seconds in metric_timings.items():
+                self.__metric_seconds[metric_name] += seconds
+
+    @property
+    def stages(self) -> typing.Sequence[StageTiming]:
+        return list(self.__stages)
+
+    @property
+    def metric_seconds(self) -> typing.Dict[str, float]:
+        return dict(self.__metric_seconds)
+
+    def __getitem__(self, name: str) -> StageTiming:
+        for stage_timing in self.__stages:
+            if stage_timing.name == name:
+                return stage_timing
+        raise KeyError(f"No stage named '{name}' has been measured")
+
+    def __contains__(self, name: str) -> bool:
+        return any(stage_timing.name == name for stage_timing in self.__stages)
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "stages": [stage_timing.to_dict() for stage_timing in self.__stages],
+            "metrics": self.metric_seconds,
+        }
+
+    def __str__(self):
+        return ", ".join(str(stage_timing) for stage_timing in self.__stages)
+
+    def __repr__(self):
+        return self.__str__()
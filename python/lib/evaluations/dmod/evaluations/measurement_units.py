@@ -1,5 +1,7 @@
 import typing
 import numbers
+
+import numpy
 import pint.registry
 from pint.facets.plain import PlainQuantity
 
@@ -34,6 +36,8 @@ class UnitConverter:
 
         self.__registry.define("cms = m^3/s")
         self.__registry.define("CMS = m^3/s")
+
+        self.__transformations: typing.Dict[typing.Tuple[str, str], typing.Optional[typing.Tuple[float, float]]] = {}
         
     def convert(self, value: _T, from_unit: str, to_unit: str) -> _T:
         """
@@ -52,6 +56,63 @@ class UnitConverter:
         
         return self.__registry.convert(value, from_unit, to_unit)
 
+    def get_transformation(self, from_unit: str, to_unit: str) -> typing.Optional[typing.Tuple[float, float]]:
+        """
+        Finds the scale and offset that convert values of one unit into another as `value * scale + offset`
+
+        Transformations are only looked up within the registry once per pair of units
+
+        Args:
+            from_unit: The unit describing the original magnitude of values
+            to_unit: The unit to convert values into
+
+        Returns:
+            The scale and offset of the conversion; None if the conversion cannot be described that way
+        """
+        key = (from_unit, to_unit)
+
+        if key not in self.__transformations:
+            offset = float(self.convert(0.0, from_unit, to_unit))
+            scale = float(self.convert(1.0, from_unit, to_unit)) - offset
+
+            # Ensure that the conversion is actually linear (which logarithmic units are not) before trusting it
+            expected_value = 10.0 * scale + offset
+            is_linear = numpy.isclose(float(self.convert(10.0, from_unit, to_unit)), expected_value)
+
+            self.__transformations[key] = (scale, offset) if is_linear else None
+
+        return self.__transformations[key]
+
+    def convert_values(self, values: numpy.ndarray, from_unit: str, to_unit: str) -> numpy.ndarray:
+        """
+        Converts an array of amounts of the first unit to amounts of the second
+
+        Args:
+            values: The original amounts of the original unit
+            from_unit: The unit describing the original magnitude of the values
+            to_unit: The unit to convert the original values into
+
+        Returns:
+            The converted amounts
+        """
+        values = numpy.asarray(values, dtype=float)
+
+        if from_unit == to_unit:
+            return values
+
+        transformation = self.get_transformation(from_unit, to_unit)
+
+        if transformation is None:
+            return numpy.asarray(self.convert(values, from_unit, to_unit), dtype=float)
+
+        scale, offset = transformation
+        converted_values = values * scale
+
+        if offset:
+            converted_values += offset
+
+        return converted_values
+
     def get_quantity(self, value: _T, value_type: str) -> pint.Quantity:
         """
         Converts a value into a specified Quantity object
@@ -126,3 +187,18 @@ def convert(value: numbers.Number, from_unit: str, to_unit: str):
         A new number reflecting a change of measurement unit
     """
     return _COMMON_CONVERTER.convert(value, from_unit, to_unit)
+
+
+def convert_values(values: numpy.ndarray, from_unit: str, to_unit: str) -> numpy.ndarray:
+    """
+    Converts an array of numbers from one unit into another
+
+    Args:
+        values: The values to convert
+        from_unit: The current unit of measurement
+        to_unit: The desired unit of measurement
+
+    Returns:
+        A new array of numbers reflecting a change of measurement unit
+    """
+    return _COMMON_CONVERTER.convert_values(values, from_unit, to_unit)
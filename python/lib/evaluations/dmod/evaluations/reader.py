@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import typing
+import functools
 
 import pandas
 import jsonpath_ng as jsonpath
@@ -8,17 +9,100 @@ import jsonpath_ng as jsonpath
 from . import specification
 
 
+@functools.lru_cache(maxsize=256)
+def compile_expression(expression: str) -> jsonpath.JSONPath:
+    """
+    Parses a JSONPath expression, reusing the result if the same expression has been parsed before
+
+    Args:
+        expression: The JSONPath expression to parse
+
+    Returns:
+        The parsed expression
+    """
+    return jsonpath.parse(expression)
+
+
+class SelectorPlan:
+    """
+    The parsed JSONPath expressions needed to select values for a ValueSelector
+
+    Value and associated field expressions are relative; they are evaluated against each node matched by the origin
+    (or each matched value) rather than against the entire document
+    """
+    __slots__ = ["__origin", "__value", "__associated_fields"]
+
+    def __init__(
+        self,
+        origin: typing.Sequence[str],
+        path: typing.Sequence[str],
+        associated_paths: typing.Sequence[typing.Sequence[str]]
+    ):
+        """
+        Constructor
+
+        Args:
+            origin: The parts of the path to each node that values are selected from
+            path: The parts of the path from each origin node to the values
+            associated_paths: The parts of the path to each associated field
+        """
+        self.__origin: jsonpath.JSONPath = compile_expression(".".join(origin))
+        self.__value: jsonpath.JSONPath = compile_expression(".".join(path))
+        self.__associated_fields: typing.List[jsonpath.JSONPath] = [
+            compile_expression(".".join(associated_path))
+            for associated_path in associated_paths
+        ]
+
+    @property
+    def origin(self) -> jsonpath.JSONPath:
+        return self.__origin
+
+    @property
+    def value(self) -> jsonpath.JSONPath:
+        return self.__value
+
+    @property
+    def associated_fields(self) -> typing.Sequence[jsonpath.JSONPath]:
+        """
+        Expressions for each associated field, in the same order as the selector's associated fields
+        """
+        return self.__associated_fields
+
+
+@functools.lru_cache(maxsize=256)
+def _get_plan(
+    origin: typing.Tuple[str, ...],
+    path: typing.Tuple[str, ...],
+    associated_paths: typing.Tuple[typing.Tuple[str, ...], ...]
+) -> SelectorPlan:
+    return SelectorPlan(origin, path, associated_paths)
+
+
+def get_plan(selector: specification.ValueSelector) -> SelectorPlan:
+    """
+    Get the compiled plan for a selector, only building it the first time one with the same paths is needed
+
+    Args:
+        selector: The selector that describes what values to find
+
+    Returns:
+        The parsed expressions for the selector
+    """
+    return _get_plan(
+        tuple(selector.origin),
+        tuple(selector.path),
+        tuple(tuple(index.path) for index in selector.associated_fields)
+    )
+
+
 def select_values(document: dict, selector: specification.ValueSelector):
-    origin_expression: jsonpath.This = jsonpath.parse(".".join(selector.origin))
+    plan = get_plan(selector)
     tables: typing.List[pandas.DataFrame] = list()
 
-    for element in origin_expression.find(document):
+    for element in plan.origin.find(document):
         full_path = str(element.full_path)
 
-        main_path = full_path + "." + ".".join(selector.path)
-        value_expression: jsonpath.This = jsonpath.parse(main_path)
-
-        value_results = value_expression.find(document)
+        value_results = plan.value.find(element)
 
         if not value_results:
             continue
@@ -42,15 +126,13 @@ def select_values(document: dict, selector: specification.ValueSelector):
                     for result in value_results
                 ]
 
-        for index in selector.associated_fields:
+        for index, index_expression in zip(selector.associated_fields, plan.associated_fields):
             if selector.where.lower() == "key":
                 column_data = list()
                 missing_entries = 0
 
                 for result in value_results:
-                    index_path = f"{str(result.full_path)}.{'.'.join(index.path)}"
-                    index_expression = jsonpath.parse(index_path)
-                    index_results = index_expression.find(document)
+                    index_results = index_expression.find(result)
 
                     if not index_results:
                         missing_entries += 1
@@ -69,12 +151,10 @@ def select_values(document: dict, selector: specification.ValueSelector):
                 else:
                     columns[index.name] = column_data
             else:
-                index_path = full_path + "." + ".".join(index.path)
-
-                index_expression: jsonpath.This = jsonpath.parse(index_path)
-                index_results = index_expression.find(document)
+                index_results = index_expression.find(element)
 
                 if not index_results:
+                    index_path = full_path + "." + ".".join(index.path)
                     raise KeyError(f"There are no values for the index named '{index.name}' at '{index_path}'")
 
                 if len(index_results) == 1:
@@ -0,0 +1,337 @@
+"""
+Defines a compact, columnar store for the results of an evaluation
+
+Scoring produces a `MetricResults` object for every pair of locations, each holding `Score` objects for every
+combination of metric and threshold. Keeping all of those objects around for a large evaluation is expensive, so a
+`ResultsTable` copies their values into location × metric × threshold arrays and only rebuilds the objects for a
+pair of locations when they are asked for.
+"""
+import typing
+import array
+
+from collections import abc as abstract_collections
+
+import numpy
+import pandas
+
+import dmod.metrics as metrics
+
+LOCATION_PAIR = typing.Tuple[str, str]
+
+
+def to_sample_size(value: float) -> typing.Union[int, float]:
+    """
+    Convert a stored sample size back into a count
+
+    Args:
+        value: The sample size as it was stored in a float array
+
+    Returns:
+        The sample size as an integer, or NaN if there wasn't one
+    """
+    return int(value) if numpy.isfinite(value) else float(value)
+
+
+class ResultsTable(abstract_collections.Mapping):
+    """
+    Scores for every evaluated pair of locations, stored as location × metric × threshold arrays
+
+    Acts as a read only mapping from (observed location, predicted location) to `MetricResults`. The `MetricResults`
+    are rebuilt from the arrays every time they are requested rather than being kept.
+    """
+    def __init__(self, raw_results: typing.Mapping[LOCATION_PAIR, metrics.MetricResults] = None):
+        """
+        Constructor
+
+        Args:
+            raw_results: Results for each pair of locations to add to the table
+        """
+        self.__location_indices: typing.Dict[LOCATION_PAIR, int] = dict()
+        self.__location_pairs: typing.List[LOCATION_PAIR] = list()
+        # The thresholds of each pair of locations are the entries from its offset up to the offset of the next pair
+        self.__location_threshold_offsets = array.array("q", [0])
+        self.__location_threshold_entries = array.array("q")
+        self.__location_metrics: typing.List[typing.Tuple[int, ...]] = list()
+        self.__location_weights: typing.List[metrics.scoring.NUMBER] = list()
+        self.__location_scaled_values = array.array("d")
+
+        self.__metrics: typing.List[metrics.Metric] = list()
+        self.__metric_indices: typing.Dict[str, int] = dict()
+
+        self.__threshold_names: typing.List[str] = list()
+        self.__threshold_weights: typing.List[float] = list()
+        self.__threshold_indices: typing.Dict[typing.Tuple[str, float], int] = dict()
+
+        # Each distinct threshold object is only kept once, no matter how many pairs of locations it was scored for
+        self.__thresholds: typing.List[metrics.Threshold] = list()
+        self.__threshold_entries: typing.Dict[int, int] = dict()
+        self.__threshold_entry_indices = array.array("q")
+
+        # Every score is recorded as a flat entry until the full arrays are needed
+        self.__score_locations = array.array("q")
+        self.__score_metrics = array.array("q")
+        self.__score_thresholds = array.array("q")
+        self.__score_values = array.array("d")
+        self.__score_scaled_values = array.array("d")
+        self.__score_sample_sizes = array.array("d")
+        self.__score_failures = array.array("b")
+
+        self.__arrays: typing.Optional[typing.Dict[str, numpy.ndarray]] = None
+
+        if raw_results:
+            for (observed_location, predicted_location), results in raw_results.items():
+                self.add(observed_location, predicted_location, results)
+
+    def add(self, observed_location: str, predicted_location: str, results: metrics.MetricResults):
+        """
+        Copy the results for a pair of locations into the table
+
+        Args:
+            observed_location: The name of the location that was observed
+            predicted_location: The name of the location that was predicted
+            results: The scores for the pair of locations
+        """
+        location_pair = (observed_location, predicted_location)
+
+        if location_pair in self.__location_indices:
+            raise ValueError(f"Results for {location_pair} have already been added")
+
+        location_index = len(self.__location_pairs)
+        self.__location_indices[location_pair] = location_index
+        self.__location_pairs.append(location_pair)
+        self.__location_weights.append(results.weight)
+        self.__location_scaled_values.append(results.scaled_value)
+
+        # Scores need to be rebuilt in the same order they were added so that totals are summed identically
+        location_metrics: typing.Dict[int, None] = dict()
+
+        for score_threshold, scores in results:  # type: metrics.Threshold, typing.List[metrics.scoring.Score]
+            threshold_entry = self.__get_threshold_entry(score_threshold)
+            self.__location_threshold_entries.append(threshold_entry)
+            threshold_index = self.__threshold_entry_indices[threshold_entry]
+
+            for score in scores:
+                metric_index = self.__get_metric_index(score.metric)
+                location_metrics[metric_index] = None
+
+                self.__score_locations.append(location_index)
+                self.__score_metrics.append(metric_index)
+                self.__score_thresholds.append(threshold_index)
+                self.__score_values.append(score.value)
+                self.__score_scaled_values.append(score.scaled_value)
+                self.__score_sample_sizes.append(score.sample_size)
+                self.__score_failures.append(bool(score.failed))
+
+        self.__location_threshold_offsets.append(len(self.__location_threshold_entries))
+        self.__location_metrics.append(tuple(location_metrics))
+        self.__arrays = None
+
+    def __get_metric_index(self, metric: metrics.Metric) -> int:
+        if metric.name not in self.__metric_indices:
+            self.__metric_indices[metric.name] = len(self.__metrics)
+            self.__metrics.append(metric)
+        return self.__metric_indices[metric.name]
+
+    def __get_threshold_entry(self, threshold: metrics.Threshold) -> int:
+        # Kept thresholds can't be collected, so their ids can't be reused by other objects
+        if id(threshold) not in self.__threshold_entries:
+            self.__threshold_entries[id(threshold)] = len(self.__thresholds)
+            self.__thresholds.append(threshold)
+            self.__threshold_entry_indices.append(self.__get_threshold_index(threshold))
+        return self.__threshold_entries[id(threshold)]
+
+    def __get_threshold_index(self, threshold: metrics.Threshold) -> int:
+        # Thresholds that share a name but not a weight need their own index so each score reports the right weight
+        key = (threshold.name, threshold.weight)
+        if key not in self.__threshold_indices:
+            self.__threshold_indices[key] = len(self.__threshold_names)
+            self.__threshold_names.append(threshold.name)
+            self.__threshold_weights.append(threshold.weight)
+        return self.__threshold_indices[key]
+
+    def __get_arrays(self) -> typing.Dict[str, numpy.ndarray]:
+        if self.__arrays is not None:
+            return self.__arrays
+
+        shape = (len(self.__location_pairs), len(self.__metrics), len(self.__threshold_names))
+        positions = (
+            numpy.frombuffer(self.__score_locations, dtype=numpy.int64),
+            numpy.frombuffer(self.__score_metrics, dtype=numpy.int64),
+            numpy.frombuffer(self.__score_thresholds, dtype=numpy.int64),
+        )
+
+        arrays = {
+            "value": numpy.full(shape, numpy.nan),
+            "scaled_value": numpy.full(shape, numpy.nan),
+            "sample_size": numpy.full(shape, numpy.nan),
+            "failed": numpy.zeros(shape, dtype=bool),
+            "present": numpy.zeros(shape, dtype=bool),
+        }
+
+        arrays["value"][positions] = numpy.frombuffer(self.__score_values, dtype=numpy.float64)
+        arrays["scaled_value"][positions] = numpy.frombuffer(self.__score_scaled_values, dtype=numpy.float64)
+        arrays["sample_size"][positions] = numpy.frombuffer(self.__score_sample_sizes, dtype=numpy.float64)
+        arrays["failed"][positions] = numpy.frombuffer(self.__score_failures, dtype=numpy.int8).astype(bool)
+        arrays["present"][positions] = True
+
+        self.__arrays = arrays
+        return arrays
+
+    @property
+    def location_pairs(self) -> typing.Sequence[LOCATION_PAIR]:
+        """
+        Each pair of observed and predicted locations, in the order that they were added
+        """
+        return list(self.__location_pairs)
+
+    @property
+    def scored_metrics(self) -> typing.Sequence[metrics.Metric]:
+        """
+        Each metric that was scored, in the order that they were first encountered
+        """
+        return list(self.__metrics)
+
+    @property
+    def threshold_names(self) -> typing.Sequence[str]:
+        """
+        The name of each threshold that was scored, in the order that they were first encountered
+
+        A name appears more than once if it was used by thresholds with different weights
+        """
+        return list(self.__threshold_names)
+
+    @property
+    def threshold_weights(self) -> numpy.ndarray:
+        """
+        The weight of each threshold that was scored
+        """
+        return numpy.array(self.__threshold_weights, dtype=float)
+
+    @property
+    def score_values(self) -> numpy.ndarray:
+        """
+        The raw value of every score as a location × metric × threshold array; missing scores are NaN
+        """
+        return self.__get_arrays()["value"]
+
+    @property
+    def scaled_score_values(self) -> numpy.ndarray:
+        """
+        The scaled value of every score as a location × metric × threshold array; missing scores are NaN
+        """
+        return self.__get_arrays()["scaled_value"]
+
+    @property
+    def sample_sizes(self) -> numpy.ndarray:
+        """
+        The sample size of every score as a location × metric × threshold array; missing scores are NaN
+        """
+        return self.__get_arrays()["sample_size"]
+
+    @property
+    def failures(self) -> numpy.ndarray:
+        """
+        Whether each score failed as a location × metric × threshold array
+        """
+        return self.__get_arrays()["failed"]
+
+    @property
+    def present(self) -> numpy.ndarray:
+        """
+        Whether there is a score for each location, metric, and threshold
+        """
+        return self.__get_arrays()["present"]
+
+    @property
+    def location_weights(self) -> numpy.ndarray:
+        """
+        The weight of the results for each pair of locations
+        """
+        return numpy.array(self.__location_weights, dtype=numpy.float64)
+
+    @property
+    def location_scaled_values(self) -> numpy.ndarray:
+        """
+        The scaled value of the results for each pair of locations
+        """
+        return numpy.frombuffer(self.__location_scaled_values, dtype=numpy.float64)
+
+    def get_results(self, observed_location: str, predicted_location: str) -> metrics.MetricResults:
+        """
+        Rebuild the results for a pair of locations
+
+        Args:
+            observed_location: The name of the location that was observed
+            predicted_location: The name of the location that was predicted
+
+        Returns:
+            The results for the pair of locations, equivalent to those that were added
+        """
+        location_index = self.__location_indices[(observed_location, predicted_location)]
+        arrays = self.__get_arrays()
+
+        threshold_entries = self.__location_threshold_entries[
+            self.__location_threshold_offsets[location_index]:self.__location_threshold_offsets[location_index + 1]
+        ]
+        thresholds = [self.__thresholds[threshold_entry] for threshold_entry in threshold_entries]
+        threshold_indices = [self.__threshold_entry_indices[threshold_entry] for threshold_entry in threshold_entries]
+
+        results = metrics.MetricResults(weight=self.__location_weights[location_index])
+
+        for metric_index in self.__location_metrics[location_index]:
+            metric = self.__metrics[metric_index]
+            scores = [
+                metrics.scoring.Score(
+                    metric=metric,
+                    value=arrays["value"][location_index, metric_index, threshold_index].item(),
+                    threshold=location_threshold,
+                    sample_size=to_sample_size(arrays["sample_size"][location_index, metric_index, threshold_index])
+                )
+                for location_threshold, threshold_index in zip(thresholds, threshold_indices)
+                if arrays["present"][location_index, metric_index, threshold_index]
+            ]
+
+            if scores:
+                results.add_scores(metrics.scoring.Scores(metric, scores))
+
+        return results
+
+    def to_frame(self) -> pandas.DataFrame:
+        """
+        Create a long table containing a row for every score
+
+        Returns:
+            A DataFrame with a row for every location, metric, and threshold that was scored
+        """
+        arrays = self.__get_arrays()
+        location_indices, metric_indices, threshold_indices = numpy.nonzero(arrays["present"])
+
+        observed_locations = numpy.array([pair[0] for pair in self.__location_pairs], dtype=object)
+        predicted_locations = numpy.array([pair[1] for pair in self.__location_pairs], dtype=object)
+        metric_names = numpy.array([metric.name for metric in self.__metrics], dtype=object)
+        metric_weights = numpy.array([metric.weight for metric in self.__metrics])
+
+        return pandas.DataFrame({
+            "observed_location": observed_locations[location_indices],
+            "predicted_location": predicted_locations[location_indices],
+            "threshold_name": numpy.array(self.__threshold_names, dtype=object)[threshold_indices],
+            "threshold_weight": self.threshold_weights[threshold_indices],
+            "metric": metric_names[metric_indices],
+            "metric_weight": metric_weights[metric_indices],
+            "result": arrays["value"][location_indices, metric_indices, threshold_indices],
+            "scaled_result": arrays["scaled_value"][location_indices, metric_indices, threshold_indices],
+            "sample_size": arrays["sample_size"][location_indices, metric_indices, threshold_indices],
+            "failed": arrays["failed"][location_indices, metric_indices, threshold_indices],
+        })
+
+    def __getitem__(self, location_pair: LOCATION_PAIR) -> metrics.MetricResults:
+        return self.get_results(*location_pair)
+
+    def __contains__(self, location_pair) -> bool:
+        return location_pair in self.__location_indices
+
+    def __iter__(self) -> typing.Iterator[LOCATION_PAIR]:
+        return iter(self.__location_pairs)
+
+    def __len__(self) -> int:
+        return len(self.__location_pairs)
@@ -23,6 +23,8 @@ import dmod.metrics.metric as metric_functions
 import dmod.core.common as common
 
 from .. import util
+from .. import results
+from .. import instrumentation
 
 logging.basicConfig(
     filename='evaluation.log',
@@ -1756,48 +1758,85 @@ class EvaluationResults:
     def __init__(
         self,
         instructions: EvaluationSpecification,
-        raw_results: typing.Dict[typing.Tuple[str, str], metrics.MetricResults]
+        raw_results: typing.Union[typing.Dict[typing.Tuple[str, str], metrics.MetricResults], results.ResultsTable],
+        timings: instrumentation.EvaluationTimings = None
     ):
+        """
+        Constructor
+
+        Args:
+            instructions: The specification that described how to evaluate
+            raw_results: The results for each pair of observed and predicted locations. Results that aren't already
+                in a `ResultsTable` are copied into one so that the individual score objects may be released
+            timings: How long each stage of the evaluation took
+        """
         self._instructions = instructions
-        self._original_results = raw_results.copy()
-        self._location_map: typing.Dict[str, typing.Dict[str, metrics.MetricResults]] = collections.defaultdict(dict)
-
-        self._total = sum(
-            [
-                metric_result.scaled_value
-                for metric_result in raw_results.values()
-                if not numpy.isnan(metric_result.scaled_value)
-            ]
-        )
+        self._timings = timings
 
-        self._maximum_value = sum(
-            [
-                metric_result.weight
-                for metric_result in raw_results.values()
-                if not numpy.isnan(metric_result.weight)
-            ]
-        )
+        if not isinstance(raw_results, results.ResultsTable):
+            raw_results = results.ResultsTable(raw_results)
+
+        self._table = raw_results
+
+        # Each location maps to the pairings it took part in; results are only built when they are requested
+        self._location_map: typing.Dict[str, typing.Dict[str, typing.Tuple[str, str]]] = collections.defaultdict(dict)
 
-        for (observed_location, predicted_location), metric_result in self._original_results.items():
-            self._location_map[observed_location][predicted_location] = metric_result
-            self._location_map[predicted_location][observed_location] = metric_result
+        location_scaled_values = self._table.location_scaled_values
+        location_weights = self._table.location_weights
+
+        self._total = float(numpy.nansum(location_scaled_values))
+        self._maximum_value = float(numpy.nansum(location_weights))
+
+        # The scaled value of each location as a fraction of its weight; used for descriptive statistics
+        self._location_values = location_scaled_values / location_weights
+
+        for observed_location, predicted_location in self._table:
+            self._location_map[observed_location][predicted_location] = (observed_location, predicted_location)
+            self._location_map[predicted_location][observed_location] = (observed_location, predicted_location)
+
+    @property
+    def timings(self) -> typing.Optional[instrumentation.EvaluationTimings]:
+        """
+        How long each stage of the evaluation took, if it was measured
+        """
+        return self._timings
+
+    @property
+    def table(self) -> results.ResultsTable:
+        """
+        The columnar store of every score within the evaluation
+        """
+        return self._table
 
     def __getitem__(self, item: str) -> typing.Dict[str, metrics.MetricResults]:
-        return self._location_map[item]
+        return {
+            other_location: self._table[location_pair]
+            for other_location, location_pair in self._location_map.get(item, dict()).items()
+        }
 
-    def __iter__(self):
-        return iter(self._original_results.items())
+    def __iter__(self) -> typing.Iterator[typing.Tuple[typing.Tuple[str, str], metrics.MetricResults]]:
+        return iter(self._table.items())
 
     def __len__(self):
-        return len(self._original_results)
+        return len(self._table)
 
     def __str__(self):
         locations_in_calculations = [
             f"{observation_location} vs. {prediction_location}"
-            for (observation_location, prediction_location) in self._original_results.keys()
+            for (observation_location, prediction_location) in self._table
         ]
         return f"{', '.join(locations_in_calculations)}: {self._total}"
 
+    def to_frame(self) -> pandas.DataFrame:
+        """
+        Converts every score across every location pairing into a single long DataFrame without building
+        intermediary score objects
+
+        Returns:
+            A DataFrame with a row for every location pairing, metric, and threshold
+        """
+        return self._table.to_frame()
+
     def to_frames(self, include_metadata: bool = None) -> typing.Dict[str, pandas.DataFrame]:
         """
         Converts two or more dimensional results into a DataFrame
@@ -1812,8 +1851,8 @@ class EvaluationResults:
 
         frames: typing.Dict[str, pandas.DataFrame] = dict()
 
-        for (observation_location, prediction_location), results in self._original_results.items():
-            results_frame = results.to_dataframe(include_metadata=include_metadata)
+        for (observation_location, prediction_location), location_results in self:
+            results_frame = location_results.to_dataframe(include_metadata=include_metadata)
             results_frame['observed_location'] = observation_location
             results_frame['predicted_location'] = prediction_location
             frames[f"{observation_location} vs. {prediction_location}"] = results_frame
@@ -1826,7 +1865,7 @@ class EvaluationResults:
         Returns an aggregate value demonstrating the performance of each location within the evaluation
 
             n
-            Σ   self._original_results.values()[i].scaled_value
+            Σ   self.table.location_scaled_values[i]
           i = 0
         """
         return self._total / self._maximum_value if self._maximum_value else 0.0
@@ -1858,29 +1897,25 @@ class EvaluationResults:
         if include_specification:
             data['specification'] = self._instructions.to_dict()
 
-        included_metrics: typing.List[dict] = list()
-
-        for result in self._original_results.values():  # type: metrics.MetricResults
-            for _, scores in result:
-                for score in scores:
-                    if not [metric for metric in included_metrics if metric['name'] == score.metric.name]:
-                        included_metrics.append(
-                            {
-                                "name": score.metric.name,
-                                "weight": score.metric.weight,
-                                "description": score.metric.get_descriptions()
-                            }
-                        )
+        if self._timings is not None:
+            data['timings'] = self._timings.to_dict()
 
-        data['metrics'] = included_metrics
+        data['metrics'] = [
+            {
+                "name": metric.name,
+                "weight": metric.weight,
+                "description": metric.get_descriptions()
+            }
+            for metric in self._table.scored_metrics
+        ]
 
-        for (observation_location, prediction_location), results in self._original_results.items():
+        for (observation_location, prediction_location), location_results in self:
             result_data = {
                 "observation_location": observation_location,
                 "prediction_location": prediction_location,
             }
 
-            result_data.update(results.to_dict())
+            result_data.update(location_results.to_dict())
 
             data['results'].append(result_data)
 
@@ -1919,39 +1954,18 @@ class EvaluationResults:
         """
         The mean total value across all evaluated location pairings
         """
-        return float(
-            numpy.mean(
-                [
-                    result.scaled_value / result.weight
-                    for result in self._original_results.values()
-                ]
-            )
-        )
+        return float(numpy.mean(self._location_values))
 
     @property
     def median(self) -> float:
         """
         The median total value across all evaluated location pairings
         """
-        return float(
-            numpy.median(
-                [
-                    result.scaled_value / result.weight
-                    for result in self._original_results.values()
-                ]
-            )
-        )
+        return float(numpy.median(self._location_values))
 
     @property
     def standard_deviation(self) -> float:
         """
         The standard deviation for result values across all location pairings
         """
-        return float(
-            numpy.std(
-                [
-                    result.scaled_value / result.weight
-                    for result in self._original_results.values()
-                ]
-            )
-        )
+        return float(numpy.std(self._location_values))
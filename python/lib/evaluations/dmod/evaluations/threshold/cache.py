@@ -0,0 +1,219 @@
+"""
+Defines a persistent cache for threshold tables so that large threshold sources don't need to be read and reshaped
+for every evaluation
+"""
+import typing
+import os
+import json
+import hashlib
+import pathlib
+import tempfile
+import logging
+
+import pandas
+
+from .. import specification
+from .. import util
+
+util.configure_logging()
+
+
+def is_parquet_supported() -> bool:
+    """
+    Check whether tables may be cached, which requires an engine for reading and writing parquet
+
+    Returns:
+        Whether either pyarrow or fastparquet is installed
+    """
+    for engine in ("pyarrow", "fastparquet"):
+        try:
+            __import__(engine)
+            return True
+        except ImportError:
+            pass
+
+    return False
+
+
+def get_specification_hash(definition: specification.ThresholdSpecification) -> str:
+    """
+    Create a hash of every part of a threshold specification that affects how its thresholds are read
+
+    Args:
+        definition: The specification for the thresholds
+
+    Returns:
+        A hash that will change if the thresholds would be read differently
+    """
+    rules = definition.application_rules
+    threshold_field = rules.threshold_field if rules else None
+
+    details = {
+        "backend": {
+            "type": definition.backend.type,
+            "format": definition.backend.format,
+            "address": definition.backend.address,
+            "properties": definition.backend.properties
+        },
+        "locations": {
+            "identify": definition.locations.should_identify,
+            "from_field": definition.locations.from_field,
+            "pattern": definition.locations.pattern
+        },
+        "definitions": [
+            {
+                "name": threshold_definition.name,
+                "field": threshold_definition.field,
+                "unit": [
+                    threshold_definition.unit.field,
+                    threshold_definition.unit.path,
+                    threshold_definition.unit.value
+                ]
+            }
+            for threshold_definition in definition.definitions
+        ],
+        "threshold_field": [
+            threshold_field.name,
+            threshold_field.path,
+            threshold_field.datatype
+        ] if threshold_field else None
+    }
+
+    serialized_details = json.dumps(details, sort_keys=True, default=str)
+    return hashlib.sha256(serialized_details.encode()).hexdigest()
+
+
+class ThresholdCache:
+    """
+    A directory of previously read threshold tables
+
+    Tables are keyed by the path, modification time, and size of each of their sources along with the hash of the
+    specification used to read them, so editing a source or the specification causes the table to be read again.
+
+    Tables are only ever stored as parquet. The directory may be shared, so nothing is stored in a format, like pickle,
+    that could run code when loaded
+    """
+    @classmethod
+    def create(cls, directory: typing.Union[str, pathlib.Path] = None) -> typing.Optional["ThresholdCache"]:
+        """
+        Create a cache if one has been configured and tables may be stored
+
+        Args:
+            directory: Where cached tables should be stored. Defaults to the value of the
+                `EVALUATION_THRESHOLD_CACHE_DIRECTORY` environment variable
+
+        Returns:
+            A cache if a directory has been configured and parquet is supported
+        """
+        directory = directory or os.environ.get("EVALUATION_THRESHOLD_CACHE_DIRECTORY")
+
+        if not directory:
+            return None
+
+        if not is_parquet_supported():
+            logging.warning(
+                f"Thresholds will not be cached at '{directory}'; "
+                f"caching requires pyarrow or fastparquet to be installed"
+            )
+            return None
+
+        return cls(directory)
+
+    def __init__(self, directory: typing.Union[str, pathlib.Path]):
+        """
+        Constructor
+
+        Args:
+            directory: Where cached tables should be stored
+
+        Raises:
+            RuntimeError: If neither pyarrow nor fastparquet is installed
+        """
+        if not is_parquet_supported():
+            raise RuntimeError("Thresholds may only be cached if pyarrow or fastparquet is installed")
+
+        self.__directory = pathlib.Path(directory)
+        self.__directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def directory(self) -> pathlib.Path:
+        return self.__directory
+
+    def get_key(
+        self,
+        sources: typing.Sequence[str],
+        definition: specification.ThresholdSpecification
+    ) -> typing.Optional[str]:
+        """
+        Create the key for a table read from the given sources
+
+        Args:
+            sources: The files that thresholds are read from
+            definition: The specification used to read the thresholds
+
+        Returns:
+            The key for the table; None if a source isn't a file whose modification time can be checked
+        """
+        source_details = list()
+
+        for source in sources:
+            if not os.path.isfile(source):
+                return None
+
+            status = os.stat(source)
+            source_details.append([os.path.abspath(source), status.st_mtime_ns, status.st_size])
+
+        key_details = json.dumps(
+            [sorted(source_details), get_specification_hash(definition)]
+        )
+        return hashlib.sha256(key_details.encode()).hexdigest()
+
+    def get_path(self, key: str) -> pathlib.Path:
+        return self.__directory / f"{key}.parquet"
+
+    def load(self, key: str) -> typing.Optional[pandas.DataFrame]:
+        """
+        Load a previously stored table
+
+        Args:
+            key: The key for the table
+
+        Returns:
+            The stored table if one exists
+        """
+        path = self.get_path(key)
+
+        if not path.exists():
+            return None
+
+        try:
+            return pandas.read_parquet(path)
+        except Exception as e:
+            logging.warning(f"Cached thresholds at '{path}' could not be read and will be replaced: {e}")
+            return None
+
+    def store(self, key: str, table: pandas.DataFrame):
+        """
+        Store a table so that it may be loaded later
+
+        Tables are written to a temporary file first so that readers never see a partial table
+
+        Args:
+            key: The key for the table
+            table: The table to store
+        """
+        path = self.get_path(key)
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.__directory, prefix=".", suffix=".partial")
+        os.close(descriptor)
+
+        try:
+            table.to_parquet(temporary_path)
+            os.replace(temporary_path, path)
+        except BaseException as e:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+            if isinstance(e, Exception):
+                logging.warning(f"Thresholds could not be cached at '{path}': {e}")
+            else:
+                raise
@@ -5,6 +5,7 @@ import os
 import re
 import inspect
 
+import numpy
 import pandas
 import jsonpath_ng as jsonpath
 
@@ -14,6 +15,8 @@ from .. import specification
 from .. import util
 from .. import retrieval
 
+from .cache import ThresholdCache
+
 
 def get_datasource(threshold_specification: specification.ThresholdSpecification) -> retrieval.Retriever:
     return __FORMAT_MAPPING[threshold_specification.backend.format](threshold_specification)
@@ -38,8 +41,8 @@ class JSONThresholdRetriever(retrieval.Retriever):
 
     def retrieve(self, *args, **kwargs) -> pandas.DataFrame:
         documents = {
-            source: util.data_to_dictionary(self.backend.read(source))
-            for source in self.backend.sources
+            source: util.data_to_dictionary(raw_document)
+            for source, raw_document in self.backend.read_many().items()
         }
 
         frames = dict()
@@ -133,10 +136,44 @@ class FrameThresholdRetriever(retrieval.Retriever):
     def get_format(cls) -> str:
         return "csv"
 
+    def __init__(self, definition: specification.ThresholdSpecification, cache_directory: str = None):
+        """
+        Constructor
+
+        Args:
+            definition: The specification for the thresholds to read
+            cache_directory: Where read thresholds may be stored for later use. Defaults to the value of the
+                `EVALUATION_THRESHOLD_CACHE_DIRECTORY` environment variable; thresholds are not cached if neither
+                are given or if pyarrow (or fastparquet) isn't installed
+        """
+        super().__init__(definition)
+
+        self.__cache = ThresholdCache.create(cache_directory)
+
     def load_frame(self, source: str, **kwargs) -> pandas.DataFrame:
         return pandas.read_csv(self.backend.read_stream(source), **kwargs)
 
     def retrieve(self, *args, **kwargs) -> pandas.DataFrame:
+        cache_key = self.__cache.get_key(self.backend.sources, self.definition) if self.__cache else None
+        table = self.__cache.load(cache_key) if cache_key else None
+
+        if table is None:
+            table = self.read_table()
+
+            if cache_key:
+                self.__cache.store(cache_key, table)
+
+        return self.apply_rules(table)
+
+    def read_table(self) -> pandas.DataFrame:
+        """
+        Read and combine every source into a single table of threshold values per location
+
+        Values needed to apply custom threshold rules are left as they were read; see `apply_rules`
+
+        Returns:
+            A table of threshold values
+        """
         constructor_signature = inspect.signature(pandas.read_csv)
         provided_parameters = {
             key: value
@@ -145,7 +182,7 @@ class FrameThresholdRetriever(retrieval.Retriever):
         }
 
         if 'date_parser' not in provided_parameters:
-            provided_parameters['date_parser'] = util.parse_non_naive_dates
+            provided_parameters['date_parser'] = util.get_date_parser(self.backend.address)
 
         if self.definition.locations.from_field == 'column':
             if 'dtype' not in provided_parameters:
@@ -153,11 +190,12 @@ class FrameThresholdRetriever(retrieval.Retriever):
 
             provided_parameters['dtype'][self.definition.locations.pattern[-1]] = str
 
-        combined_table = None
+        custom_rules = self.definition.application_rules
+        rule_columns: typing.List[str] = list()
+        tables: typing.List[pandas.DataFrame] = list()
 
         for source in self.backend.sources:
             document = self.load_frame(source, **provided_parameters)
-            custom_rules = self.definition.application_rules
 
             column_names: typing.List[str] = [
                 threshold_definition.field[-1]
@@ -183,24 +221,16 @@ class FrameThresholdRetriever(retrieval.Retriever):
                 if bool(threshold_definition.unit.field)
             ])
 
-            if custom_rules and custom_rules.threshold_field.name not in document.keys():
+            if custom_rules:
                 field = custom_rules.threshold_field
 
-                def conversion_function(column_name_and_value: pandas.Series):
-                    """
-                    Converts a series of column names vs values to the desired data type
+                # Values for the threshold field are converted once the full table has been assembled
+                if field.name in document.keys():
+                    rule_columns = [field.name]
+                else:
+                    rule_columns = list(field.path)
 
-                    Args:
-                        column_name_and_value:
-                            A pandas Series mapping column names to values
-                    Returns:
-                        The converted value
-                    """
-                    converted_value = field.to_datatype([value for value in column_name_and_value])
-                    return converted_value
-
-                document[field.name] = document[field.path].apply(conversion_function, axis=1)
-                column_names.append(field.name)
+                column_names.extend([column for column in rule_columns if column not in column_names])
 
             # TODO: This is missing handling for value units
 
@@ -217,12 +247,11 @@ class FrameThresholdRetriever(retrieval.Retriever):
 
                 name = search_results.group() if search_results else file_name_without_extension
 
-                table = table.assign(location=[name for _ in range(len(table))])
+                table = table.assign(location=name)
+
+            tables.append(table)
 
-            if combined_table is None:
-                combined_table = table
-            else:
-                combined_table = pandas.concat([combined_table, table])
+        combined_table = tables[0] if len(tables) == 1 else pandas.concat(tables)
 
         definition_columns = [
             definition.field[-1]
@@ -233,20 +262,73 @@ class FrameThresholdRetriever(retrieval.Retriever):
 
         if definition_columns:
             id_variables = [self.definition.locations.pattern[-1]]
-            threshold_field = None
-            if self.definition.application_rules:
-                threshold_field = self.definition.application_rules.threshold_field
-                id_variables.append(threshold_field.name)
+            id_variables.extend([column for column in rule_columns if column not in id_variables])
 
             # This is going to take all the columns that should be rows for threshold values and rotate them
             combined_table = combined_table.melt(id_vars=id_variables, var_name="name")
 
-            # If there was a special rule for thresholding, go ahead and set the index for later joining
-            if threshold_field:
-                combined_table = combined_table.set_index(threshold_field.name)
-
         return combined_table
 
+    def apply_rules(self, table: pandas.DataFrame) -> pandas.DataFrame:
+        """
+        Add the values that custom threshold rules are applied on to a table read by `read_table`
+
+        Args:
+            table: A table of threshold values
+
+        Returns:
+            The table of threshold values, indexed by the threshold field if it was rotated
+        """
+        if not self.definition.application_rules:
+            return table
+
+        field = self.definition.application_rules.threshold_field
+
+        if field.name not in table.keys():
+            table = table.assign(**{field.name: convert_rows(table, field.path, field.to_datatype)})
+            table = table.drop(columns=[column for column in field.path if column != field.name])
+
+        # If the table was rotated, go ahead and set the index for later joining
+        if "name" in table.keys() and "value" in table.keys():
+            table = table.set_index(field.name)
+
+        return table
+
+
+def convert_rows(
+    table: pandas.DataFrame,
+    columns: typing.Sequence[str],
+    conversion_function: typing.Callable[[typing.List[typing.Any]], typing.Any]
+) -> numpy.ndarray:
+    """
+    Convert the values of multiple columns into a single value for every row
+
+    Each distinct combination of values is only converted once
+
+    Args:
+        table: The table containing the values to convert
+        columns: The columns whose values should be passed, in order, to the conversion function
+        conversion_function: A function that converts a list of values from a row into a single value
+
+    Returns:
+        The converted value for every row of the table
+    """
+    codes, combinations = pandas.MultiIndex.from_frame(table[list(columns)]).factorize()
+
+    converted_combinations = numpy.empty(len(combinations) + 1, dtype=object)
+    for combination_index, combination in enumerate(combinations):
+        converted_combinations[combination_index] = conversion_function(list(combination))
+
+    converted_values = converted_combinations[codes]
+
+    # Rows containing missing values aren't assigned a combination, so convert those individually
+    for position in numpy.flatnonzero(codes < 0):
+        converted_values[position] = conversion_function(
+            [table[column].iat[position] for column in columns]
+        )
+
+    return converted_values
+
 
 class RDBThresholdRetriever(FrameThresholdRetriever):
     @classmethod
@@ -6,6 +6,7 @@ import re
 import logging
 import logging.handlers
 import os
+import threading
 
 from datetime import datetime
 from datetime import timedelta
@@ -27,6 +28,12 @@ import pytz
 
 from dateutil.parser import parse as parse_date_string
 
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:
+    # Format guessing wasn't exposed publicly until pandas 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
 import dmod.core.common as common
 
 RE_PATTERN = re.compile(r"(\{.+\}|\[.+\]|\(.+\)|(?<!\\)\.|\{|\}|\]|\[|\(|\)|\+|\*|\\[a-zA-Z]|\?)+")
@@ -255,29 +262,178 @@ def fit_constructor_kwargs(function: typing.Callable, **kwargs) -> typing.Option
     return acceptable_arguments
 
 
-def parse_non_naive_dates(datetimes: typing.Sequence[str], *args, **kwargs) -> typing.Sequence[datetime]:
+DATE_FORMAT_SAMPLE_SIZE = 100
+"""The number of values to examine when inferring the format of a collection of dates"""
+
+
+class NonNaiveDateParser:
     """
-    A datetime parser for pandas that ensures that all parsed dates and times have a time zone
+    A vectorized datetime parser for pandas that ensures that all parsed dates and times have a time zone
+
+    Values are parsed in bulk with the first known or inferred format that fits them. Formats that work are
+    remembered so later calls don't have to infer them again. Only values that no format can handle are parsed
+    one at a time.
+    """
+    def __init__(self, formats: typing.Sequence[str] = None):
+        """
+        Constructor
+
+        Args:
+            formats: Formats that are expected to be used by the values to parse
+        """
+        self.__formats: typing.List[str] = list(formats or list())
+        self.__lock = threading.Lock()
+
+    @property
+    def formats(self) -> typing.Sequence[str]:
+        """
+        The formats that have been successfully used to parse values, most recent first
+        """
+        return list(self.__formats)
+
+    def __remember(self, date_format: str):
+        with self.__lock:
+            if date_format in self.__formats:
+                self.__formats.remove(date_format)
+            self.__formats.insert(0, date_format)
+
+    def __call__(self, datetimes: typing.Union[str, typing.Sequence[str]], *args, **kwargs) -> pandas.DatetimeIndex:
+        """
+        Parse the given dates
+
+        Dates without a timezone are considered to be in UTC
+
+        Args:
+            datetimes: A sequence of strings to be parsed as dates
+
+        Returns:
+            The parsed dates in UTC
+        """
+        # pandas will pass a lone value rather than an array when there is only one date to parse
+        if isinstance(datetimes, (str, bytes)) or numpy.ndim(datetimes) == 0:
+            datetimes = [datetimes]
+
+        values = pandas.Series(numpy.asarray(datetimes, dtype=object), dtype=object)
+        missing = values.isna().to_numpy()
+        values = values.where(missing, values.astype(str))
+
+        parsed = pandas.Series(pandas.NaT, index=values.index, dtype="datetime64[ns, UTC]")
+        unparsed = ~missing
+
+        for date_format in self.__get_candidate_formats(values[unparsed]):
+            if not unparsed.any():
+                break
+
+            attempt = pandas.to_datetime(values[unparsed], utc=True, format=date_format, errors="coerce")
+            succeeded = attempt.notna().to_numpy()
+
+            if succeeded.any():
+                parsed[attempt.index[succeeded]] = attempt[succeeded]
+                unparsed[unparsed] = ~succeeded
+                self.__remember(date_format)
+
+        # Fall back to parsing values one by one for anything the vectorized path couldn't handle
+        for position in numpy.flatnonzero(unparsed):
+            parsed.iat[position] = parse_non_naive_date(values.iat[position])
+
+        return pandas.DatetimeIndex(parsed)
+
+    def __get_candidate_formats(self, values: pandas.Series) -> typing.List[str]:
+        candidates = self.formats
+
+        sample = values.iloc[:DATE_FORMAT_SAMPLE_SIZE]
+
+        # Only infer a new format if no known format can handle the entire sample
+        for date_format in candidates:
+            if pandas.to_datetime(sample, utc=True, format=date_format, errors="coerce").notna().all():
+                candidates.remove(date_format)
+                return [date_format] + candidates
+
+        inferred_formats = list()
+        remaining_sample = sample
+
+        # Infer formats from the first value that isn't handled by a previously inferred format
+        while not remaining_sample.empty:
+            inferred_format = guess_datetime_format(remaining_sample.iloc[0])
+
+            if not inferred_format:
+                remaining_sample = remaining_sample.iloc[1:]
+                continue
+
+            handled = pandas.to_datetime(remaining_sample, utc=True, format=inferred_format, errors="coerce").notna()
+
+            if not handled.iloc[0]:
+                remaining_sample = remaining_sample.iloc[1:]
+                continue
+
+            if inferred_format not in candidates and inferred_format not in inferred_formats:
+                inferred_formats.append(inferred_format)
+
+            remaining_sample = remaining_sample[~handled.to_numpy()]
+
+        candidates = inferred_formats + candidates
+
+        if "ISO8601" not in candidates:
+            candidates.append("ISO8601")
+
+        return candidates
+
+
+__DATE_PARSERS: typing.Dict[str, NonNaiveDateParser] = dict()
+__DATE_PARSER_LOCK = threading.Lock()
+
+
+def get_date_parser(key: str = None) -> NonNaiveDateParser:
+    """
+    Get a date parser that remembers the formats of the dates it has parsed for a specific source, such as a backend
+
+    Args:
+        key: An identifier for where the dates come from
+
+    Returns:
+        A date parser that is shared by everything that parses dates from the same source
+    """
+    key = key or ""
+
+    with __DATE_PARSER_LOCK:
+        if key not in __DATE_PARSERS:
+            __DATE_PARSERS[key] = NonNaiveDateParser()
+        return __DATE_PARSERS[key]
+
+
+def parse_non_naive_date(date_string: str) -> datetime:
+    """
+    Parse a single date, ensuring that it has a time zone
 
     The timezone will be utc if none is given
 
     Args:
-        datetimes: A sequence of strings to be parsed as dates
+        date_string: The date to parse
 
     Returns:
-        A sequence of non-naive datetimes
+        A non-naive datetime
     """
-    data = list()
+    date_and_time = parse_date_string(str(date_string))
 
-    for date_string in datetimes:
-        date_and_time = parse_date_string(str(date_string))
+    if date_and_time.tzinfo is None:
+        date_and_time = date_and_time.replace(tzinfo=timezone.utc)
 
-        if date_and_time.tzinfo is None:
-            date_and_time = date_and_time.replace(tzinfo=timezone.utc)
+    return date_and_time
 
-        data.append(date_and_time)
 
-    return data
+def parse_non_naive_dates(datetimes: typing.Sequence[str], *args, **kwargs) -> typing.Sequence[datetime]:
+    """
+    A datetime parser for pandas that ensures that all parsed dates and times have a time zone
+
+    The timezone will be utc if none is given
+
+    Args:
+        datetimes: A sequence of strings to be parsed as dates
+
+    Returns:
+        A sequence of non-naive datetimes
+    """
+    return get_date_parser()(datetimes, *args, **kwargs)
 
 
 def get_timezone(timezone_details: str) -> typing.Optional[timezone]:
@@ -71,101 +71,155 @@ class JSONWriter(OutputWriter):
     def get_extension(cls) -> str:
         return "json"
 
-    def _results_to_dictionary(
-            self,
-            evaluation_results: EvaluationResults,
-            include_specification: bool = None
+    @classmethod
+    def _get_summary(cls, evaluation_results: EvaluationResults) -> typing.Dict[str, typing.Any]:
+        """
+        Get the values that describe the evaluation as a whole
+        """
+        return {
+            "total": evaluation_results.value,
+            "grade": "{:.2f}%".format(evaluation_results.grade),
+            "max_possible_total": evaluation_results.max_possible_value,
+            "mean": evaluation_results.mean,
+            "median": evaluation_results.median,
+            "standard_deviation": evaluation_results.standard_deviation,
+        }
+
+    @classmethod
+    def _get_metrics(cls, evaluation_results: EvaluationResults) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Get descriptions for each metric used in the evaluation
+        """
+        metric_descriptions = list()
+
+        for metric_function in evaluation_results.instructions.scheme.metric_functions:
+            found_metric = metrics.get_metric(metric_function.name, metric_function.weight)
+            metric_descriptions.append({
+                "name": found_metric.name,
+                "description": found_metric.get_descriptions(),
+                "weight": found_metric.weight
+            })
+
+        return metric_descriptions
+
+    @classmethod
+    def _location_to_dictionary(
+        cls,
+        observation_location: str,
+        prediction_location: str,
+        results: metrics.scoring.MetricResults
     ) -> typing.Dict[str, typing.Any]:
         """
-        Converts the results into a dictionary
+        Converts the results for a single pair of locations into a dictionary
 
         Args:
-            include_specification: Whether to include the specifications for how to conduct the evaluation
+            observation_location: The name of the location that was observed
+            prediction_location: The name of the location that was predicted
+            results: The scores for the pair of locations
 
         Returns:
-            The evaluation results in the form of a nested dictionary
+            The results for the pair of locations in the form of a nested dictionary
         """
-        data = dict()
+        result_data = {
+            "observation_location": observation_location,
+            "prediction_location": prediction_location,
+            'total': results.total,
+            "results": list()
+        }
+
+        for score_threshold, scores in results:  # type: metrics.Threshold, typing.List[metrics.scoring.Score]
+            threshold_results: typing.Dict[str, typing.Any] = {
+                "name": score_threshold.name,
+                "weight": score_threshold.weight,
+                "scores": list(),
+            }
 
-        data['total'] = evaluation_results.value
-        data['grade'] = "{:.2f}%".format(evaluation_results.grade)
-        data['max_possible_total'] = evaluation_results.max_possible_value
-        data['mean'] = evaluation_results.mean
-        data['median'] = evaluation_results.median
-        data['standard_deviation'] = evaluation_results.standard_deviation
+            if isinstance(score_threshold.value, pandas.DataFrame) \
+                    and len(score_threshold.value) == 1 \
+                    and len(score_threshold.value.keys()) == 1:
+                first_column = [key for key in score_threshold.value.keys()][0]
+                threshold_value = float(score_threshold.value[first_column].values[0])
+            elif isinstance(score_threshold.value, pandas.Series) and len(score_threshold.value) == 1:
+                threshold_value = float(score_threshold.value.values[0])
+            elif isinstance(score_threshold.value, typing.Sequence) and len(score_threshold.value) == 1:
+                threshold_value = float(score_threshold.value[0])
+            elif isinstance(score_threshold.value, (pandas.DataFrame, pandas.Series, typing.Sequence)):
+                threshold_value = "varying"
+            else:
+                threshold_value = float(score_threshold.value)
+
+            threshold_results['threshold_value'] = threshold_value
+
+            threshold_total = 0
+            maximum_value = 0
+
+            for score in scores:
+                threshold_total += 0 if numpy.isnan(score.scaled_value) else score.scaled_value
+                maximum_value += score.metric.weight
+                score_data = {
+                    "metric": score.metric.name,
+                    "weight": score.metric.weight,
+                    "value": None if numpy.isnan(score.value) else score.value,
+                    "scaled_value": None if numpy.isnan(score.scaled_value) else score.scaled_value
+                }
 
-        data['results'] = list()
+                threshold_results['scores'].append(score_data)
 
-        include_specification = bool(include_specification)
+            total_factor = threshold_total / maximum_value
+            threshold_results['result'] = threshold_total
+            threshold_results['maximum_result'] = maximum_value
+            threshold_results['scaled_result'] = score_threshold.weight * total_factor
+            result_data['results'].append(threshold_results)
 
-        if include_specification:
-            data['specification'] = evaluation_results.instructions.to_dict()
+        return result_data
 
-        data['metrics'] = list()
+    def _iterate_entries(
+        self,
+        evaluation_results: EvaluationResults,
+        include_specification: bool = None
+    ) -> typing.Iterable[typing.Tuple[str, typing.Any]]:
+        """
+        Produce each top level entry of the output, in order
 
-        for metric_function in evaluation_results.instructions.scheme.metric_functions:
-            found_metric = metrics.get_metric(metric_function.name, metric_function.weight)
-            data['metrics'].append({
-                "name": found_metric.name,
-                "description": found_metric.get_descriptions(),
-                "weight": found_metric.weight
-            })
+        Results for each pair of locations are produced lazily so that they don't all need to be in memory at once
 
-        for (observation_location, prediction_location), results in evaluation_results:
-            result_data = {
-                "observation_location": observation_location,
-                "prediction_location": prediction_location,
-                'total': results.total,
-                "results": list()
-            }
+        Args:
+            evaluation_results: The results to convert
+            include_specification: Whether to include the specifications for how to conduct the evaluation
 
-            for score_threshold, scores in results:  # type: metrics.Threshold, typing.List[metrics.scoring.Score]
-                threshold_results: typing.Dict[str, typing.Any] = {
-                    "name": score_threshold.name,
-                    "weight": score_threshold.weight,
-                    "scores": list(),
-                }
+        Returns:
+            Pairs of keys and values for the output
+        """
+        yield from self._get_summary(evaluation_results).items()
 
-                if isinstance(score_threshold.value, pandas.DataFrame) \
-                        and len(score_threshold.value) == 1 \
-                        and len(score_threshold.value.keys()) == 1:
-                    first_column = [key for key in score_threshold.value.keys()][0]
-                    threshold_value = float(score_threshold.value[first_column].values[0])
-                elif isinstance(score_threshold.value, pandas.Series) and len(score_threshold.value) == 1:
-                    threshold_value = float(score_threshold.value.values[0])
-                elif isinstance(score_threshold.value, typing.Sequence) and len(score_threshold.value) == 1:
-                    threshold_value = float(score_threshold.value[0])
-                elif isinstance(score_threshold.value, (pandas.DataFrame, pandas.Series, typing.Sequence)):
-                    threshold_value = "varying"
-                else:
-                    threshold_value = float(score_threshold.value)
-
-                threshold_results['threshold_value'] = threshold_value
-
-                threshold_total = 0
-                maximum_value = 0
-
-                for score in scores:
-                    threshold_total += 0 if numpy.isnan(score.scaled_value) else score.scaled_value
-                    maximum_value += score.metric.weight
-                    score_data = {
-                        "metric": score.metric.name,
-                        "weight": score.metric.weight,
-                        "value": None if numpy.isnan(score.value) else score.value,
-                        "scaled_value": None if numpy.isnan(score.scaled_value) else score.scaled_value
-                    }
-
-                    threshold_results['scores'].append(score_data)
-
-                total_factor = threshold_total / maximum_value
-                threshold_results['result'] = threshold_total
-                threshold_results['maximum_result'] = maximum_value
-                threshold_results['scaled_result'] = score_threshold.weight * total_factor
-                result_data['results'].append(threshold_results)
-
-            data['results'].append(result_data)
-
-        return data
+        yield "results", (
+            self._location_to_dictionary(observation_location, prediction_location, results)
+            for (observation_location, prediction_location), results in evaluation_results
+        )
+
+        if include_specification:
+            yield "specification", evaluation_results.instructions.to_dict()
+
+        yield "metrics", self._get_metrics(evaluation_results)
+
+    def _results_to_dictionary(
+            self,
+            evaluation_results: EvaluationResults,
+            include_specification: bool = None
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Converts the results into a dictionary
+
+        Args:
+            include_specification: Whether to include the specifications for how to conduct the evaluation
+
+        Returns:
+            The evaluation results in the form of a nested dictionary
+        """
+        return {
+            key: list(value) if isinstance(value, typing.Generator) else value
+            for key, value in self._iterate_entries(evaluation_results, bool(include_specification))
+        }
 
     def write(
             self,
@@ -174,14 +228,20 @@ class JSONWriter(OutputWriter):
             include_specification: bool = None,
             **kwargs
     ):
+        """
+        Writes evaluation results as JSON one pair of locations at a time
+
+        The output is the same as if the entire dictionary of results were dumped at once
+
+        Args:
+            evaluation_results: The results to write
+            buffer: An optional stream to write to instead of the destination
+            include_specification: Whether to include the specifications for how to conduct the evaluation
+            **kwargs: 'indent' may be given to control how the output is indented
+        """
         if self.destination is None and buffer is None:
             raise ValueError(f"A buffer must be passed in if no destination is declared")
 
-        data_to_write: typing.Dict[str, typing.Hashable] = self._results_to_dictionary(
-                evaluation_results,
-                include_specification
-        )
-
         indent = kwargs.get("indent", 4)
 
         buffer_was_created_here = buffer is None
@@ -190,7 +250,73 @@ class JSONWriter(OutputWriter):
             if buffer is None:
                 buffer = open(self.destination, 'w')
 
-            json.dump(data_to_write, buffer, indent=indent)
+            dump_incrementally(
+                entries=self._iterate_entries(evaluation_results, bool(include_specification)),
+                buffer=buffer,
+                indent=indent
+            )
         finally:
             if buffer_was_created_here and buffer is not None:
                 buffer.close()
+
+
+def dump_incrementally(
+    entries: typing.Iterable[typing.Tuple[str, typing.Any]],
+    buffer: typing.IO,
+    indent: typing.Union[int, str] = None
+):
+    """
+    Write a JSON object to a buffer one entry at a time, matching the output of `json.dump`
+
+    Entries whose values are generators are written as lists, one element at a time
+
+    Args:
+        entries: Pairs of keys and values for the object
+        buffer: The text stream to write to
+        indent: How to indent the output; the output will be compact if not given
+    """
+    if isinstance(indent, int):
+        indent = " " * indent
+
+    item_separator = ", " if indent is None else ","
+
+    def line_break(level: int) -> str:
+        return "" if indent is None else "\n" + indent * level
+
+    def dump(value: typing.Any, level: int) -> str:
+        serialized_value = json.dumps(value, indent=indent)
+        return serialized_value if indent is None else serialized_value.replace("\n", line_break(level))
+
+    buffer.write("{")
+    has_entries = False
+
+    for key, value in entries:
+        if has_entries:
+            buffer.write(item_separator)
+
+        buffer.write(line_break(1) + json.dumps(key) + ": ")
+        has_entries = True
+
+        if not isinstance(value, typing.Generator):
+            buffer.write(dump(value, 1))
+            continue
+
+        buffer.write("[")
+        has_elements = False
+
+        for element in value:
+            if has_elements:
+                buffer.write(item_separator)
+
+            buffer.write(line_break(2) + dump(element, 2))
+            has_elements = True
+
+        if has_elements:
+            buffer.write(line_break(1))
+
+        buffer.write("]")
+
+    if has_entries:
+        buffer.write(line_break(0))
+
+    buffer.write("}")
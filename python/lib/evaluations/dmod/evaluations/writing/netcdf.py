@@ -7,12 +7,24 @@ import numpy
 import pandas
 import xarray
 
+try:
+    import netCDF4
+except ImportError:
+    # Results may still be written, but they will need to be fully loaded into memory first
+    netCDF4 = None
+
 import dmod.metrics.metric as metric_functions
 
 from . import writer
 from .writer import OutputData
 from .. import specification
 
+LOCATION_CHUNK_SIZE = 512
+"""The number of locations to store in each chunk of a streamed NetCDF file"""
+
+THRESHOLD_CHUNK_SIZE = 16
+"""The number of thresholds to store in each chunk of a streamed NetCDF file"""
+
 
 class NetcdfOutput(writer.OutputData):
     def get_extension(self) -> str:
@@ -98,21 +110,7 @@ class NetcdfWriter(writer.OutputWriter):
 
         for metric_name, metric_frame in combined_frames.groupby("metric"):  # type: str, pandas.DataFrame
             weight = int(metric_frame.metric_weight.drop_duplicates().values[0])
-            metric_function: metric_functions.scoring.Metric = metric_functions.get_metric(metric_name, weight)
-            result_attributes = {
-                "long_name": metric_function.get_name(),
-                "description": metric_function.get_descriptions(),
-                "ideal_value": metric_function.ideal_value,
-                "greater_is_better": metric_function.greater_is_better,
-                "lower_bound": metric_function.lower_bound,
-                "upper_bound": metric_function.upper_bound
-            }
-
-            scaled_result_attributes = {
-                "long_name": "Scaled " + metric_function.get_name(),
-                "description": metric_function.get_descriptions(),
-                "ideal_value": weight,
-            }
+            result_attributes, scaled_result_attributes = self._get_metric_attributes(metric_name, weight)
             clean_metric_name = metric_name.replace(" ", "_")
             result_name = f'{clean_metric_name}_result'
             scaled_result_name = f'scaled_{clean_metric_name}_result'
@@ -188,10 +186,179 @@ class NetcdfWriter(writer.OutputWriter):
         )
         return output
 
+    @classmethod
+    def _get_metric_attributes(
+        cls,
+        metric_name: str,
+        weight: int
+    ) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, typing.Any]]:
+        """
+        Get the attributes for the variables holding the raw and scaled results of a metric
+        """
+        metric_function: metric_functions.scoring.Metric = metric_functions.get_metric(metric_name, weight)
+        result_attributes = {
+            "long_name": metric_function.get_name(),
+            "description": metric_function.get_descriptions(),
+            "ideal_value": metric_function.ideal_value,
+            "greater_is_better": metric_function.greater_is_better,
+            "lower_bound": metric_function.lower_bound,
+            "upper_bound": metric_function.upper_bound
+        }
+
+        scaled_result_attributes = {
+            "long_name": "Scaled " + metric_function.get_name(),
+            "description": metric_function.get_descriptions(),
+            "ideal_value": weight,
+        }
+
+        return result_attributes, scaled_result_attributes
+
+    def _stream_to_netcdf(self, evaluation_results: specification.EvaluationResults, path: str):
+        """
+        Write results to a NetCDF4 file one pair of locations at a time
+
+        Locations and thresholds lie along unlimited dimensions so that each pair of locations may be appended as it
+        is encountered rather than after every result has been gathered. Result variables are chunked and compressed.
+
+        Args:
+            evaluation_results: The results to write
+            path: Where to write the file
+        """
+        with netCDF4.Dataset(path, mode="w", format="NETCDF4") as dataset:
+            dataset.createDimension("location_index", None)
+            dataset.createDimension("threshold_index", None)
+
+            location_coordinate = dataset.createVariable("location_index", numpy.uint32, ("location_index",))
+            threshold_coordinate = dataset.createVariable("threshold_index", numpy.uint8, ("threshold_index",))
+
+            threshold_names = dataset.createVariable("threshold_name", str, ("threshold_index",))
+            threshold_weights = dataset.createVariable("threshold_weight", numpy.uint8, ("threshold_index",))
+            predicted_locations = dataset.createVariable(
+                "predicted_location",
+                str,
+                ("location_index",),
+                chunksizes=(LOCATION_CHUNK_SIZE,)
+            )
+            observed_locations = dataset.createVariable(
+                "observed_location",
+                str,
+                ("location_index",),
+                chunksizes=(LOCATION_CHUNK_SIZE,)
+            )
+
+            threshold_indices: typing.Dict[str, int] = dict()
+            result_variables: typing.Dict[str, typing.Tuple[netCDF4.Variable, netCDF4.Variable]] = dict()
+
+            for location_index, ((observed_location, predicted_location), results) in enumerate(evaluation_results):
+                location_coordinate[location_index] = location_index
+                observed_locations[location_index] = observed_location
+                predicted_locations[location_index] = predicted_location
+
+                location_results: typing.Dict[str, typing.Dict[int, typing.Tuple[float, float]]] = dict()
+
+                for row in results.rows():
+                    threshold_name = row['threshold_name']
+
+                    if threshold_name not in threshold_indices:
+                        threshold_index = len(threshold_indices)
+                        threshold_indices[threshold_name] = threshold_index
+                        threshold_coordinate[threshold_index] = threshold_index
+                        threshold_names[threshold_index] = threshold_name
+                        threshold_weights[threshold_index] = row['threshold_weight']
+
+                    metric_name = row['metric']
+
+                    if metric_name not in result_variables:
+                        result_variables[metric_name] = self._create_result_variables(
+                            dataset,
+                            metric_name,
+                            int(row['metric_weight'])
+                        )
+
+                    location_results.setdefault(metric_name, dict())[threshold_indices[threshold_name]] = (
+                        row['result'],
+                        row['scaled_result']
+                    )
+
+                # Write each metric's results for the location at once rather than value by value
+                for metric_name, threshold_results in location_results.items():
+                    result_variable, scaled_result_variable = result_variables[metric_name]
+                    results_for_location = numpy.full(len(threshold_indices), numpy.nan, dtype=numpy.float32)
+                    scaled_results_for_location = numpy.full(len(threshold_indices), numpy.nan, dtype=numpy.float32)
+
+                    for threshold_index, (result, scaled_result) in threshold_results.items():
+                        results_for_location[threshold_index] = result
+                        scaled_results_for_location[threshold_index] = scaled_result
+
+                    result_variable[location_index, :len(threshold_indices)] = results_for_location
+                    scaled_result_variable[location_index, :len(threshold_indices)] = scaled_results_for_location
+
+            dataset.setncatts({
+                "result": evaluation_results.value,
+                "max_possible_result": evaluation_results.max_possible_value,
+                "grade": evaluation_results.grade,
+                "mean": evaluation_results.mean,
+                "median": evaluation_results.median,
+                "standard_deviation": evaluation_results.standard_deviation
+            })
+
+    def _create_result_variables(
+        self,
+        dataset: "netCDF4.Dataset",
+        metric_name: str,
+        weight: int
+    ) -> typing.Tuple["netCDF4.Variable", "netCDF4.Variable"]:
+        """
+        Create compressed variables for the raw and scaled results of a metric
+        """
+        result_attributes, scaled_result_attributes = self._get_metric_attributes(metric_name, weight)
+        clean_metric_name = metric_name.replace(" ", "_")
+
+        variables = list()
+
+        for variable_name, attributes in (
+            (f'{clean_metric_name}_result', result_attributes),
+            (f'scaled_{clean_metric_name}_result', scaled_result_attributes)
+        ):
+            variable = dataset.createVariable(
+                variable_name,
+                numpy.float32,
+                ("location_index", "threshold_index"),
+                zlib=True,
+                complevel=4,
+                chunksizes=(LOCATION_CHUNK_SIZE, THRESHOLD_CHUNK_SIZE),
+                fill_value=numpy.float32(numpy.nan)
+            )
+
+            # NetCDF attributes may not be booleans or missing
+            variable.setncatts({
+                name: int(value) if isinstance(value, bool) else value
+                for name, value in attributes.items()
+                if value is not None
+            })
+            variables.append(variable)
+
+        return variables[0], variables[1]
+
     def write(self, evaluation_results: specification.EvaluationResults, buffer: typing.IO = None, **kwargs):
+        """
+        Write results as NetCDF
+
+        Results written to the destination are streamed into a compressed NetCDF4 file location by location if the
+        netCDF4 library is available. Results written to a buffer, or written without netCDF4, are gathered into a
+        single dataset first and written as classic NetCDF, which may be read from memory without extra libraries.
+
+        Args:
+            evaluation_results: The results to write
+            buffer: An optional binary stream to write to instead of the destination
+        """
         if self.destination is None and buffer is None:
             raise ValueError(f"A buffer must be passed in if no destination is declared")
 
+        if netCDF4 is not None and buffer is None:
+            self._stream_to_netcdf(evaluation_results, self.destination)
+            return
+
         converted_output = self._to_xarray(evaluation_results)
         responsible_for_buffer = buffer is None
 
@@ -0,0 +1,107 @@
+import unittest
+import tempfile
+import os
+
+from ...evaluations.backends import cache
+from ...evaluations.backends import file as file_backend
+from ...evaluations import specification
+
+from ..common import get_resource_path
+
+TEST_DOCUMENT_PATH = str(get_resource_path("nexus_data.geojson"))
+
+
+class TestByteCache(unittest.TestCase):
+    def test_entry_limit(self):
+        byte_cache = cache.ByteCache(max_entries=2)
+
+        byte_cache.put("one", b"1")
+        byte_cache.put("two", b"22")
+
+        # Reading 'one' makes 'two' the least recently used entry
+        self.assertEqual(byte_cache.get("one"), b"1")
+
+        byte_cache.put("three", b"333")
+
+        self.assertEqual(len(byte_cache), 2)
+        self.assertIn("one", byte_cache)
+        self.assertNotIn("two", byte_cache)
+        self.assertIn("three", byte_cache)
+        self.assertIsNone(byte_cache.get("two"))
+
+        self.assertEqual(byte_cache.statistics.hits, 1)
+        self.assertEqual(byte_cache.statistics.misses, 1)
+        self.assertEqual(byte_cache.statistics.evictions, 1)
+
+    def test_byte_limit(self):
+        byte_cache = cache.ByteCache(max_bytes=10)
+
+        byte_cache.put("one", b"1234")
+        byte_cache.put("two", b"5678")
+        self.assertEqual(byte_cache.size, 8)
+
+        byte_cache.put("three", b"9012")
+        self.assertEqual(byte_cache.size, 8)
+        self.assertNotIn("one", byte_cache)
+        self.assertEqual(byte_cache.statistics.evictions, 1)
+
+        # Replacing an entry shouldn't count its old data against the limit
+        byte_cache.put("two", b"56")
+        self.assertEqual(byte_cache.size, 6)
+
+        # Data larger than the entire cache is never held in memory
+        byte_cache.put("four", b"12345678901")
+        self.assertNotIn("four", byte_cache)
+        self.assertEqual(byte_cache.size, 6)
+
+    def test_disk_tier(self):
+        with tempfile.TemporaryDirectory() as directory:
+            byte_cache = cache.ByteCache(max_entries=1, disk_cache=cache.DiskCache(directory))
+
+            byte_cache.put("one", b"1")
+            byte_cache.put("two", b"2")
+            self.assertNotIn("one", byte_cache)
+
+            self.assertEqual(byte_cache.get("one"), b"1")
+            self.assertEqual(byte_cache.statistics.disk_hits, 1)
+            self.assertIn("one", byte_cache)
+
+            # A new cache pointed at the same directory should find everything that was previously stored
+            second_cache = cache.ByteCache(disk_cache=cache.DiskCache(directory))
+            self.assertEqual(second_cache.get("two"), b"2")
+            self.assertEqual(second_cache.statistics.misses, 0)
+
+            byte_cache.remove("two")
+            self.assertIsNone(cache.DiskCache(directory).get("two"))
+            self.assertEqual(
+                [name for name in os.listdir(directory) if name.endswith(".partial")],
+                []
+            )
+
+
+class TestBackendCache(unittest.TestCase):
+    def test_file_backend_cache(self):
+        definition = specification.BackendSpecification(
+            backend_type="file",
+            data_format="json",
+            address=TEST_DOCUMENT_PATH
+        )
+        backend = file_backend.FileBackend(definition, cache_limit=1)
+
+        first_read = backend.read(TEST_DOCUMENT_PATH)
+        second_read = backend.read(TEST_DOCUMENT_PATH)
+
+        self.assertEqual(first_read, second_read)
+        self.assertEqual(backend.cache_statistics.misses, 1)
+        self.assertEqual(backend.cache_statistics.hits, 1)
+
+        # Files are already on disk, so they should never be copied into a disk tier
+        with tempfile.TemporaryDirectory() as directory:
+            backend = file_backend.FileBackend(definition, cache_directory=directory)
+            backend.read(TEST_DOCUMENT_PATH, store_data=True)
+            self.assertIsNone(backend.cache.disk_cache)
+            self.assertEqual(os.listdir(directory), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+import threading
+import tempfile
+import os
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import requests
+
+from ...evaluations import specification
+from ...evaluations.backends import backend as base_backend
+from ...evaluations.backends import network
+
+DOCUMENT = b"date,value\n" + b"".join(
+    f"2022-12-01T{hour:02d}:00:00Z,{hour * 1.5}\n".encode()
+    for hour in range(24)
+) * 200
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Serves a fixed document, failing every other request to paths starting with '/flaky'
+    """
+    request_count = 0
+    flaky_failures = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with StandInHandler.lock:
+            StandInHandler.request_count += 1
+            should_fail = self.path.startswith("/flaky") and StandInHandler.flaky_failures == 0
+
+            if should_fail:
+                StandInHandler.flaky_failures += 1
+
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if should_fail:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(DOCUMENT)))
+        self.end_headers()
+        self.wfile.write(DOCUMENT)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRESTBackend(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        os.environ["EVALUATION_REST_BACKOFF"] = "0"
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.address = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+        del os.environ["EVALUATION_REST_BACKOFF"]
+
+    def setUp(self) -> None:
+        StandInHandler.request_count = 0
+        StandInHandler.flaky_failures = 0
+
+    def create_backend(self, path: str, **kwargs) -> network.RESTBackend:
+        definition = specification.BackendSpecification(
+            backend_type="rest",
+            data_format="csv",
+            address=self.address + path,
+            params={"site": "0214657975"}
+        )
+        return network.RESTBackend(definition, **kwargs)
+
+    def test_read(self):
+        backend = self.create_backend("/data", cache_limit=2)
+
+        self.assertEqual(backend.read(backend.address), DOCUMENT)
+        self.assertEqual(backend.read(backend.address), DOCUMENT)
+        self.assertEqual(StandInHandler.request_count, 1)
+        self.assertEqual(backend.cache_statistics.hits, 1)
+
+    def test_read_stream(self):
+        backend = self.create_backend("/data", cache_limit=2)
+
+        stream = backend.read_stream(backend.address)
+        self.assertNotIn(backend._get_cache_key(backend.address), backend.cache)
+
+        first_line = stream.readline()
+        self.assertEqual(first_line, b"date,value\n")
+        self.assertEqual(first_line + stream.read(), DOCUMENT)
+
+        # Data is only stored once the entire stream has been read
+        self.assertIn(backend._get_cache_key(backend.address), backend.cache)
+        self.assertEqual(backend.read_stream(backend.address).read(), DOCUMENT)
+        self.assertEqual(StandInHandler.request_count, 1)
+
+    def test_retry(self):
+        backend = self.create_backend("/flaky")
+
+        self.assertEqual(backend.read(backend.address, store_data=False), DOCUMENT)
+        self.assertEqual(StandInHandler.request_count, 2)
+
+        missing_backend = self.create_backend("/missing")
+        self.assertRaises(requests.HTTPError, missing_backend.read, missing_backend.address)
+
+    def test_read_many(self):
+        backend = self.create_backend("/data")
+        identifiers = [f"{self.address}/data/{index}" for index in range(6)]
+
+        data = backend.read_many(identifiers, store_data=False)
+
+        self.assertEqual(sorted(data.keys()), sorted(identifiers))
+        self.assertTrue(all(value == DOCUMENT for value in data.values()))
+        self.assertEqual(StandInHandler.request_count, len(identifiers))
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as cache_directory:
+            backend = self.create_backend("/data", cache_directory=cache_directory)
+            self.assertEqual(backend.read(backend.address), DOCUMENT)
+
+            # A backend for a later evaluation should be able to use what was already fetched
+            later_backend = self.create_backend("/data", cache_directory=cache_directory)
+            self.assertEqual(later_backend.read(later_backend.address), DOCUMENT)
+
+            self.assertEqual(StandInHandler.request_count, 1)
+            self.assertEqual(later_backend.cache_statistics.disk_hits, 1)
+
+            # Keeping data on disk shouldn't also fill memory, and memory stays bounded when asked to store anyway
+            self.assertEqual(len(backend.cache), 0)
+            self.assertEqual(len(later_backend.cache), 0)
+            self.assertEqual(later_backend.cache.max_bytes, base_backend.DEFAULT_CACHE_BYTES)
+
+            later_backend.read(later_backend.address, store_data=True)
+            self.assertEqual(len(later_backend.cache), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
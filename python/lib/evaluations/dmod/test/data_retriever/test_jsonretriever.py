@@ -127,6 +127,21 @@ class TestJSONRetrieving(unittest.TestCase):
         retriever = data_retriever.get_datasource_retriever(self.__response_data_specification)
         TestJSONRetrieving.run_response_assertions(self, retriever)
 
+    def test_iterate_frames(self):
+        retriever = disk.JSONDataRetriever(self.__table_data_specification)
+
+        frames = list(retriever.iterate_frames())
+
+        self.assertEqual(len(frames), len(retriever.backend.sources))
+
+        for document_name, frame in frames:
+            self.assertIn(document_name, retriever.backend.sources)
+            self.assertEqual(frame.prediction_location.nunique(), 1)
+            self.assertEqual(len(frame), 720)
+
+        combined_frame = pandas.concat([frame for _, frame in frames])
+        pandas.testing.assert_frame_equal(combined_frame, retriever.retrieve())
+
     def run_table_assertions(self, retriever: Retriever):
         data = retriever.retrieve()
 
@@ -6,6 +6,7 @@ import typing
 from datetime import datetime
 
 import numpy
+import pandas
 
 import dmod.metrics.scoring as scoring
 
@@ -536,6 +537,62 @@ class TestEvaluate(unittest.TestCase):
         cfs_to_cms_evaluator = evaluate.Evaluator(self.__cfs_to_cms_specification)
         self.make_assertions(cfs_to_cms_evaluator)
 
+    def test_vectorized_cfs_to_cfs(self):
+        cfs_to_cfs_evaluator = evaluate.Evaluator(self.__cfs_to_cfs_specification, vectorize=True)
+        self.make_assertions(cfs_to_cfs_evaluator)
+
+    def test_vectorized_cfs_to_cms(self):
+        cfs_to_cms_evaluator = evaluate.Evaluator(self.__cfs_to_cms_specification, vectorize=True)
+        self.make_assertions(cfs_to_cms_evaluator)
+
+    def test_parallel_cfs_to_cfs(self):
+        cfs_to_cfs_evaluator = evaluate.Evaluator(self.__cfs_to_cfs_specification, workers=2)
+        self.make_assertions(cfs_to_cfs_evaluator)
+
+    def test_parallel_cfs_to_cms(self):
+        cfs_to_cms_evaluator = evaluate.Evaluator(self.__cfs_to_cms_specification, workers=3)
+        self.make_assertions(cfs_to_cms_evaluator)
+
+    def test_preloaded_input_data(self):
+        evaluator = evaluate.Evaluator(self.__cfs_to_cfs_specification)
+        observations, predictions = evaluator.load_input_data()
+
+        self.assertIsNotNone(observations)
+        self.assertIsNotNone(predictions)
+
+        crosswalk = evaluator.get_crosswalk()
+        preloaded_data = evaluator.get_data_to_evaluate(crosswalk, observations, predictions)
+        loaded_data = evaluator.get_data_to_evaluate(crosswalk)
+
+        pandas.testing.assert_frame_equal(preloaded_data, loaded_data)
+
+    def test_timings(self):
+        evaluator = evaluate.Evaluator(self.__cfs_to_cfs_specification, vectorize=True)
+        evaluation_results = evaluator.evaluate()
+
+        timings = evaluation_results.timings
+        self.assertIs(timings, evaluator.timings)
+
+        for stage_name in (
+            "load_input_data",
+            "get_crosswalk",
+            "get_data_to_evaluate",
+            "normalize_values",
+            "get_thresholds",
+            "score",
+            "results"
+        ):
+            self.assertIn(stage_name, timings)
+            self.assertGreaterEqual(timings[stage_name].wall_seconds, 0)
+
+        self.assertEqual(timings["score"].rows_in, timings["normalize_values"].rows_out)
+        self.assertEqual(timings["score"].rows_out, len(evaluation_results))
+        self.assertEqual(
+            sorted(timings.metric_seconds.keys()),
+            sorted(metric.name for metric in evaluation_results.table.scored_metrics)
+        )
+        self.assertIn("timings", evaluation_results.to_dict())
+
     def make_assertions(self, evaluator: evaluate.Evaluator):
         evaluation_results = evaluator.evaluate()
 
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+import os
+import json
+import typing
+import tempfile
+import unittest
+
+import numpy
+import pandas
+
+from ..evaluations import evaluate
+from ..evaluations import incremental
+from ..evaluations import specification
+
+from .test_evaluate import CFS_TO_CFS_CONFIG_PATH
+
+
+def get_specification(extra_metrics: typing.Sequence[dict] = None) -> specification.EvaluationSpecification:
+    with open(CFS_TO_CFS_CONFIG_PATH) as config_file:
+        raw_config = json.load(config_file)
+
+    raw_config["scheme"]["metrics"].extend(extra_metrics or [])
+    return specification.EvaluationSpecification.create(raw_config)
+
+
+class TruncatedEvaluator(evaluate.Evaluator):
+    """
+    An evaluator that pretends that no data exists after a given date
+    """
+    def __init__(self, *args, last_date: pandas.Timestamp = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.last_date = last_date
+
+    def load_input_data(self) -> typing.Tuple[typing.Optional[pandas.DataFrame], typing.Optional[pandas.DataFrame]]:
+        observations, predictions = super().load_input_data()
+
+        if self.last_date is None:
+            return observations, predictions
+
+        return (
+            observations[observations[self._observed_xaxis] <= self.last_date],
+            predictions[predictions[self._predicted_xaxis] <= self.last_date]
+        )
+
+
+class TestIncrementalEvaluation(unittest.TestCase):
+    def setUp(self) -> None:
+        self.specification = get_specification([{"name": "Volume Error", "weight": 5}])
+        self.expected_results = evaluate.evaluate(self.specification)
+
+        self.dates = sorted(
+            set(
+                TruncatedEvaluator(self.specification).load_input_data()[0]["value_date"]
+            )
+        )
+
+    def assert_results_match(self, results: specification.EvaluationResults):
+        self.assertEqual(list(results.table.location_pairs), list(self.expected_results.table.location_pairs))
+        self.assertEqual(results.table.threshold_names, self.expected_results.table.threshold_names)
+        self.assertEqual(
+            [metric.name for metric in results.table.scored_metrics],
+            [metric.name for metric in self.expected_results.table.scored_metrics]
+        )
+        self.assertTrue(numpy.array_equal(results.table.present, self.expected_results.table.present))
+        self.assertTrue(
+            numpy.array_equal(results.table.sample_sizes, self.expected_results.table.sample_sizes, equal_nan=True)
+        )
+        self.assertTrue(
+            numpy.allclose(
+                results.table.score_values,
+                self.expected_results.table.score_values,
+                rtol=1e-9,
+                atol=1e-9,
+                equal_nan=True
+            )
+        )
+        self.assertAlmostEqual(results.value, self.expected_results.value)
+
+    def test_evaluation_in_steps(self):
+        with tempfile.TemporaryDirectory() as directory:
+            state_path = os.path.join(directory, "state.json")
+
+            first_evaluator = TruncatedEvaluator(
+                self.specification,
+                state_path=state_path,
+                last_date=self.dates[len(self.dates) // 3]
+            )
+            first_evaluator.evaluate()
+            first_rows = first_evaluator.timings["score"].rows_in
+
+            second_evaluator = TruncatedEvaluator(
+                self.specification,
+                state_path=state_path,
+                last_date=self.dates[2 * len(self.dates) // 3]
+            )
+            second_evaluator.evaluate()
+            second_rows = second_evaluator.timings["score"].rows_in
+
+            final_evaluator = TruncatedEvaluator(self.specification, state_path=state_path)
+            results = final_evaluator.evaluate()
+            final_rows = final_evaluator.timings["score"].rows_in
+
+            self.assert_results_match(results)
+
+            # Every pair should have been scored exactly once across the three runs
+            self.assertEqual(first_rows + second_rows + final_rows, self.expected_results.timings["score"].rows_in)
+
+            # Running again without new data scores nothing new but gives the same results
+            repeated_evaluator = TruncatedEvaluator(self.specification, state_path=state_path)
+            self.assert_results_match(repeated_evaluator.evaluate())
+            self.assertEqual(repeated_evaluator.timings["score"].rows_in, 0)
+
+            # Rows that never find a partner can't be marked as evaluated, but everything else should be skipped
+            dropping_stage = repeated_evaluator.timings["drop_evaluated_inputs"]
+            self.assertLess(dropping_stage.rows_out, dropping_stage.rows_in / 100)
+
+    def test_state_for_another_evaluation_is_ignored(self):
+        with tempfile.TemporaryDirectory() as directory:
+            state_path = os.path.join(directory, "state.json")
+
+            TruncatedEvaluator(
+                get_specification(),
+                state_path=state_path,
+                last_date=self.dates[len(self.dates) // 2]
+            ).evaluate()
+
+            self.assert_results_match(evaluate.evaluate(self.specification, state_path=state_path))
+
+    def test_undecomposable_metrics_are_rejected(self):
+        evaluation_specification = get_specification(
+            [{"name": "Linear Temporal Trend of Absolute Error", "weight": 5}]
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            evaluator = evaluate.Evaluator(evaluation_specification, state_path=os.path.join(directory, "state.json"))
+            self.assertRaises(ValueError, evaluator.evaluate)
+
+    def test_accumulator_matches_threshold_statistics(self):
+        from dmod.metrics.statistics import ThresholdStatistics
+
+        generator = numpy.random.default_rng(2024)
+        observations = generator.gamma(2.0, 50.0, 500)
+        predictions = observations * generator.normal(1.0, 0.2, 500)
+        predictions[37] = numpy.nan
+        positions = numpy.arange(500)
+
+        accumulator = incremental.ThresholdAccumulator()
+
+        for start, end in ((0, 1), (1, 120), (120, 121), (121, 500)):
+            accumulator.update(positions[start:end], observations[start:end], predictions[start:end])
+
+        accumulator = incremental.ThresholdAccumulator.from_dict(json.loads(json.dumps(accumulator.to_dict())))
+        expected = ThresholdStatistics(observations, predictions, pandas.Index(positions))
+
+        for name in (
+            "size",
+            "observed_count",
+            "predicted_count",
+            "observed_mean",
+            "predicted_mean",
+            "observed_sum_of_squares",
+            "predicted_sum_of_squares",
+            "observed_standard_deviation",
+            "predicted_standard_deviation",
+            "sum_of_squared_error",
+        ):
+            self.assertAlmostEqual(getattr(accumulator, name), getattr(expected, name), places=6, msg=name)
+
+        self.assertTrue(numpy.isnan(accumulator.pearson_correlation_coefficient))
+        self.assertTrue(numpy.isnan(accumulator.volume_error))
+
+        predictions[37] = observations[37]
+        accumulator = incremental.ThresholdAccumulator()
+        accumulator.update(positions[:250], observations[:250], predictions[:250])
+        accumulator.update(positions[250:], observations[250:], predictions[250:])
+        expected = ThresholdStatistics(observations, predictions, pandas.Index(positions))
+
+        self.assertAlmostEqual(accumulator.pearson_correlation_coefficient, expected.pearson_correlation_coefficient)
+        self.assertAlmostEqual(accumulator.volume_error, expected.volume_error, places=6)
+
+        self.assertRaises(ValueError, accumulator.update, positions[:2], observations[:2], predictions[:2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 import random
 
+import numpy
+
 from ..evaluations import measurement_units
 
 DELTA = 0.0001
@@ -191,6 +193,38 @@ class TestMeasurementUnits(unittest.TestCase):
 
             self.assertAlmostEqual(manual_conversion, library_conversion)
 
+    def test_array_conversion(self):
+        cross_conversions = [
+            ManualConversion('kcfs', 'CFS', factor=1000),
+            ManualConversion('m3 s-1', 'CMS', factor=1),
+            ManualConversion('ft3 s-1', 'm3 s-1', factor=1/35.314666212661),
+            ManualConversion('fahrenheit', 'celsius', factor=5/9, initial_addition=-32),
+            ManualConversion('celsius', 'fahrenheit', factor=9/5, final_addition=32)
+        ]
+
+        for cross in cross_conversions:
+            values = numpy.array([random.uniform(8.4, 29.1) for _ in range(10)] + [numpy.nan])
+
+            manual_conversion = numpy.array([cross(value) for value in values])
+            library_conversion = measurement_units.convert_values(values, cross.from_unit, cross.to_unit)
+
+            numpy.testing.assert_allclose(manual_conversion, library_conversion, rtol=1e-7)
+
+            for value, converted_value in zip(values[:-1], library_conversion):
+                self.assertAlmostEqual(
+                    measurement_units.convert(value, cross.from_unit, cross.to_unit),
+                    converted_value,
+                    delta=DELTA
+                )
+
+    def test_transformations_are_cached(self):
+        converter = measurement_units.UnitConverter()
+        transformation = converter.get_transformation("cms", "cfs")
+
+        self.assertAlmostEqual(transformation[0], 35.314666212661, delta=DELTA)
+        self.assertEqual(transformation[1], 0)
+        self.assertIs(transformation, converter.get_transformation("cms", "cfs"))
+
 
 if __name__ == '__main__':
     unittest.main()
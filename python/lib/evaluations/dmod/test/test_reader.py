@@ -0,0 +1,91 @@
+import unittest
+
+from ..evaluations import reader
+from ..evaluations import specification
+
+DOCUMENT = {
+    "unit": "cfs",
+    "sites": [
+        {
+            "id": "one",
+            "values": {
+                "2023-01-01T00:00:00Z": {"flow": 1.5, "quality": "A"},
+                "2023-01-01T01:00:00Z": {"flow": 2.5, "quality": "B"},
+            }
+        },
+        {
+            "id": "two",
+            "values": {
+                "2023-01-01T00:00:00Z": {"flow": 3.5, "quality": "A"},
+                "2023-01-01T01:00:00Z": {"flow": 4.5, "quality": "C"},
+            }
+        },
+    ]
+}
+
+
+class TestReader(unittest.TestCase):
+    def test_select_values(self):
+        selector = specification.ValueSelector(
+            name="flow",
+            where="value",
+            origin="$.sites[*]",
+            path=["values", "*", "flow"],
+            associated_fields=[
+                specification.AssociatedField(name="site", path=["id"], datatype="string"),
+                specification.AssociatedField(name="unit", path="/unit", datatype="string"),
+            ]
+        )
+
+        frame = reader.select_values(DOCUMENT, selector)
+
+        self.assertListEqual(frame["flow"].to_list(), [1.5, 2.5, 3.5, 4.5])
+        self.assertListEqual(frame["site"].to_list(), ["one", "one", "two", "two"])
+        self.assertListEqual(frame["unit"].to_list(), ["cfs", "cfs", "cfs", "cfs"])
+
+    def test_select_keys(self):
+        selector = specification.ValueSelector(
+            name="value_date",
+            where="key",
+            origin="$.sites[*]",
+            path=["values", "*"],
+            associated_fields=[
+                specification.AssociatedField(name="quality", path=["quality"], datatype="string"),
+            ]
+        )
+
+        frame = reader.select_values(DOCUMENT, selector)
+
+        self.assertListEqual(
+            [str(key).strip("'") for key in frame["value_date"]],
+            [
+                "2023-01-01T00:00:00Z",
+                "2023-01-01T01:00:00Z",
+                "2023-01-01T00:00:00Z",
+                "2023-01-01T01:00:00Z"
+            ]
+        )
+        self.assertListEqual(frame["quality"].to_list(), ["A", "B", "A", "C"])
+
+    def test_plans_are_reused(self):
+        first_selector = specification.ValueSelector(
+            name="flow",
+            where="value",
+            origin="$.sites[*]",
+            path=["values", "*", "flow"],
+            associated_fields=[specification.AssociatedField(name="site", path=["id"])]
+        )
+        second_selector = specification.ValueSelector(
+            name="flow",
+            where="value",
+            origin="$.sites[*]",
+            path=["values", "*", "flow"],
+            associated_fields=[specification.AssociatedField(name="site", path=["id"])]
+        )
+
+        self.assertIs(reader.get_plan(first_selector), reader.get_plan(second_selector))
+        self.assertEqual(len(reader.get_plan(first_selector).associated_fields), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
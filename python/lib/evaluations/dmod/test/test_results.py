@@ -0,0 +1,111 @@
+import unittest
+import json
+
+import numpy
+
+import dmod.metrics as metrics
+
+from ..evaluations import evaluate
+from ..evaluations import results
+from ..evaluations import specification
+from . import test_evaluate
+
+
+class TestResultsTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        evaluator = evaluate.Evaluator(test_evaluate.TestEvaluate.get_cfs_to_cfs_specification())
+        data_to_evaluate = evaluator.normalize_values(evaluator.get_data_to_evaluate(evaluator.get_crosswalk()))
+        cls.raw_results = evaluator.score(data_to_evaluate, evaluator.get_thresholds())
+        cls.instructions = evaluator._instructions
+        cls.table = results.ResultsTable(cls.raw_results)
+
+    def test_shape(self):
+        location_count = len(self.raw_results)
+        metric_count = len(self.table.scored_metrics)
+        threshold_count = len(self.table.threshold_names)
+
+        self.assertEqual(len(self.table), location_count)
+        self.assertEqual(self.table.score_values.shape, (location_count, metric_count, threshold_count))
+        self.assertEqual(self.table.present.shape, self.table.score_values.shape)
+
+        score_count = sum(
+            len(scores)
+            for location_results in self.raw_results.values()
+            for _, scores in location_results
+        )
+        self.assertEqual(int(self.table.present.sum()), score_count)
+        self.assertEqual(len(self.table.to_frame()), score_count)
+
+    def test_rebuilt_results(self):
+        for location_pair, expected_results in self.raw_results.items():
+            rebuilt_results = self.table[location_pair]
+
+            self.assertEqual(rebuilt_results.scaled_value, expected_results.scaled_value)
+            self.assertEqual(rebuilt_results.total, expected_results.total)
+            self.assertEqual(rebuilt_results.maximum_valid_score, expected_results.maximum_valid_score)
+            self.assertEqual(
+                json.dumps(rebuilt_results.to_dict(), default=str),
+                json.dumps(expected_results.to_dict(), default=str)
+            )
+            self.assertTrue(
+                rebuilt_results.to_dataframe().equals(expected_results.to_dataframe())
+            )
+
+    def test_aggregates(self):
+        evaluation_results = specification.EvaluationResults(self.instructions, self.raw_results)
+        location_values = [
+            location_results.scaled_value / location_results.weight
+            for location_results in self.raw_results.values()
+        ]
+
+        self.assertAlmostEqual(
+            evaluation_results.value,
+            sum(location_results.scaled_value for location_results in self.raw_results.values())
+        )
+        self.assertAlmostEqual(
+            evaluation_results.max_possible_value,
+            sum(location_results.weight for location_results in self.raw_results.values())
+        )
+        self.assertAlmostEqual(evaluation_results.mean, float(numpy.mean(location_values)))
+        self.assertAlmostEqual(evaluation_results.median, float(numpy.median(location_values)))
+        self.assertAlmostEqual(evaluation_results.standard_deviation, float(numpy.std(location_values)))
+
+        # Results for a location should be reachable from both sides of the pairing
+        observed_location, predicted_location = next(iter(self.raw_results))
+        self.assertIn(predicted_location, evaluation_results[observed_location])
+        self.assertIn(observed_location, evaluation_results[predicted_location])
+
+        self.assertRaises(ValueError, self.table.add, observed_location, predicted_location, self.raw_results[
+            (observed_location, predicted_location)
+        ])
+
+    def test_thresholds_sharing_a_name(self):
+        metric = metrics.PearsonCorrelationCoefficient(weight=1)
+        light_threshold = metrics.Threshold(name="High Flow", value=10, weight=1, observed_value_key="observed")
+        heavy_threshold = metrics.Threshold(name="High Flow", value=20, weight=5, observed_value_key="observed")
+
+        table = results.ResultsTable()
+
+        location_thresholds = (("one", light_threshold), ("two", heavy_threshold), ("three", light_threshold))
+
+        for location, location_threshold in location_thresholds:
+            table.add(location, location, metrics.MetricResults([
+                metrics.scoring.Scores(metric, [metrics.scoring.Score(metric, 0.5, location_threshold, 10)])
+            ]))
+
+        self.assertEqual(table.threshold_names, ["High Flow", "High Flow"])
+
+        frame = table.to_frame().set_index("observed_location")
+        self.assertEqual(frame.loc["one", "threshold_weight"], 1)
+        self.assertEqual(frame.loc["two", "threshold_weight"], 5)
+        self.assertEqual(frame.loc["three", "threshold_weight"], 1)
+
+        # Rebuilt scores should refer to the same thresholds that were scored, values and all
+        self.assertIs(next(iter(table[("one", "one")].keys())), light_threshold)
+        self.assertIs(next(iter(table[("two", "two")].keys())), heavy_threshold)
+        self.assertIs(next(iter(table[("three", "three")].keys())), light_threshold)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -38,7 +38,31 @@ class TestCSVRetrieving(unittest.TestCase):
         pass
 
     def test_parse_non_naive_dates(self):
-        pass
+        parser = util.NonNaiveDateParser()
+
+        parsed_dates = parser([
+            "2022-05-22 15:00:00",
+            "2022-05-22 16:00:00",
+            "2022-05-22T15:33-03:00",
+            None
+        ])
+
+        self.assertEqual(str(parsed_dates.tz), "UTC")
+        self.assertEqual(parsed_dates[0], datetime(2022, 5, 22, 15, tzinfo=timezone.utc))
+        self.assertEqual(parsed_dates[1], datetime(2022, 5, 22, 16, tzinfo=timezone.utc))
+        self.assertEqual(parsed_dates[2], datetime(2022, 5, 22, 18, 33, tzinfo=timezone.utc))
+        self.assertTrue(pandas.isna(parsed_dates[3]))
+
+        self.assertIn("%Y-%m-%d %H:%M:%S", parser.formats)
+
+        # Values that don't fit any format should still be parsed individually
+        parsed_dates = parser(["2022-05-22 17:00:00", "May 22nd, 2022 at 6 pm"])
+        self.assertEqual(parsed_dates[0], datetime(2022, 5, 22, 17, tzinfo=timezone.utc))
+        self.assertEqual(parsed_dates[1], datetime(2022, 5, 22, 18, tzinfo=timezone.utc))
+        self.assertEqual(parser.formats[0], "%Y-%m-%d %H:%M:%S")
+
+        # pandas hands over lone values instead of arrays
+        self.assertEqual(len(util.parse_non_naive_dates("2022-05-22")), 1)
 
     def test_to_date_or_time(self):
         todays_date = datetime.utcnow()
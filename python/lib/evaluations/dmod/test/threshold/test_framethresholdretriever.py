@@ -1,5 +1,8 @@
 import os.path
 import unittest
+import tempfile
+
+from unittest import mock
 
 import pandas
 
@@ -115,6 +118,46 @@ class TestFrameRetrieving(unittest.TestCase):
         retriever = threshold.get_threshold_retriever(self.__csv_threshold_specification)
         self.run_csv_assertions(retriever)
 
+    @unittest.skipUnless(threshold.cache.is_parquet_supported(), "Thresholds are only cached as parquet")
+    def test_cached_rdb(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_directory:
+            retriever = threshold.disk.RDBThresholdRetriever(
+                self.__rdb_threshold_specification,
+                cache_directory=cache_directory
+            )
+            read_data = retriever.retrieve()
+
+            cache = threshold.cache.ThresholdCache(cache_directory)
+            cache_key = cache.get_key(retriever.backend.sources, self.__rdb_threshold_specification)
+            self.assertTrue(cache.get_path(cache_key).exists())
+
+            cached_table = cache.load(cache_key)
+            self.assertIn("month_nu", cached_table.keys())
+
+            cached_data = retriever.apply_rules(cached_table)
+            pandas.testing.assert_frame_equal(read_data, cached_data)
+
+            # Data retrieved after the cache has been populated should match what was originally read
+            self.run_rdb_assertions(self, retriever, self.__rdb_threshold_specification)
+
+            # A different specification must not share the same table
+            csv_key = cache.get_key(retriever.backend.sources, self.__csv_threshold_specification)
+            self.assertNotEqual(cache_key, csv_key)
+
+    def test_cache_requires_parquet(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_directory:
+            with mock.patch.object(threshold.cache, "is_parquet_supported", return_value=False):
+                self.assertIsNone(threshold.cache.ThresholdCache.create(cache_directory))
+                self.assertRaises(RuntimeError, threshold.cache.ThresholdCache, cache_directory)
+
+                retriever = threshold.disk.RDBThresholdRetriever(
+                    self.__rdb_threshold_specification,
+                    cache_directory=cache_directory
+                )
+                self.run_rdb_assertions(self, retriever, self.__rdb_threshold_specification)
+
+            self.assertEqual(os.listdir(cache_directory), [])
+
     @classmethod
     def run_rdb_assertions(
             cls,
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+import io
+import os
+import json
+import tempfile
+import unittest
+
+import numpy
+import xarray
+
+from ...evaluations import specification
+from ...evaluations.evaluate import evaluate
+from ...evaluations import writing
+from ...evaluations.writing import netcdf
+from .. import test_evaluate
+
+
+def get_evaluation_results() -> specification.EvaluationResults:
+    return evaluate(test_evaluate.TestEvaluate.get_cfs_to_cfs_specification())
+
+
+class TestIncrementalWriting(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.evaluation_results = get_evaluation_results()
+
+    def test_json_matches_full_dump(self):
+        writer = writing.get_writer("json")
+        expected_data = writer._results_to_dictionary(self.evaluation_results)
+
+        for indent in (4, None, 0, "\t"):
+            buffer = io.StringIO()
+            writer.write(self.evaluation_results, buffer, indent=indent)
+            self.assertEqual(buffer.getvalue(), json.dumps(expected_data, indent=indent))
+
+        self.assertEqual(len(expected_data['results']), len(self.evaluation_results))
+
+    def test_dump_incrementally(self):
+        buffer = io.StringIO()
+        writing.json.dump_incrementally(
+            entries=[("values", (value for value in range(0))), ("name", "empty")],
+            buffer=buffer,
+            indent=2
+        )
+        self.assertEqual(buffer.getvalue(), json.dumps({"values": [], "name": "empty"}, indent=2))
+
+    @unittest.skipIf(netcdf.netCDF4 is None, "netCDF4 is required to stream NetCDF output")
+    def test_streamed_netcdf(self):
+        with tempfile.TemporaryDirectory() as directory:
+            writer = writing.get_writer("netcdf", os.path.join(directory, "results.nc"))
+            writer.write(self.evaluation_results)
+
+            streamed_dataset = xarray.load_dataset(writer.destination)
+
+        expected_dataset = writer._to_xarray(self.evaluation_results)
+
+        self.assertEqual(streamed_dataset.attrs, expected_dataset.attrs)
+        self.assertEqual(
+            sorted(streamed_dataset.data_vars.keys()),
+            sorted(expected_dataset.data_vars.keys())
+        )
+
+        for variable_name, expected_variable in expected_dataset.data_vars.items():
+            expected_values = expected_variable.values
+            streamed_values = streamed_dataset[variable_name].values
+
+            if expected_values.dtype.kind == 'f':
+                self.assertTrue(
+                    numpy.allclose(expected_values.astype(numpy.float32), streamed_values, equal_nan=True)
+                )
+            else:
+                self.assertEqual(
+                    [str(value) for value in expected_values],
+                    [str(value) for value in streamed_values]
+                )
+
+        self.assertTrue(streamed_dataset['Pearson_Correlation_Coefficient_result'].encoding.get("zlib"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -30,6 +30,7 @@ setup(
         'pytz',
         'requests'
     ],
+    extras_require={'parquet': ['pyarrow']},
     include_package_data=True,
-    packages=find_namespace_packages(exclude=['dmod.test', 'schemas', 'ssl', 'src'])
+    packages=find_namespace_packages(exclude=['dmod.test', 'schemas', 'ssl', 'src', 'benchmarks', 'benchmarks.*'])
 )
@@ -0,0 +1,792 @@
+"""
+Scores many groups of paired data at once
+
+Rather than calling every metric once for every group and every threshold, the pairs for every group are sorted
+into a single set of arrays and each statistic is calculated for every group of a threshold with one grouped NumPy
+reduction. Groups that can't be handled that way (such as those with missing values or thresholds that transform
+their data) and metrics that can't be expressed as grouped reductions are still evaluated group by group.
+"""
+import typing
+import time
+
+import numpy
+import pandas
+
+from . import scoring
+from . import categorical
+from . import metric as metric_functions
+from .threshold import Threshold
+from .communication import CommunicatorGroup
+from .communication import Verbosity
+
+GROUP_IDENTIFIER = typing.Tuple[typing.Hashable, ...]
+GROUP_SCORER = typing.Callable[
+    [pandas.DataFrame, str, str, typing.Sequence[Threshold], dict, categorical.TruthTables],
+    scoring.MetricResults
+]
+
+
+def _identifier_to_tuple(identifier: typing.Hashable) -> GROUP_IDENTIFIER:
+    return identifier if isinstance(identifier, tuple) else (identifier,)
+
+
+def _column_name(key) -> str:
+    return key if isinstance(key, str) else key.name
+
+
+class ThresholdSlot:
+    """
+    The nth threshold of every group of pairs, along with the statistics that may be derived from the pairs
+    that fall within each of them
+
+    Every statistic is an array with one entry per group and is only calculated once, on demand
+    """
+    def __init__(self, pairs: "GroupedPairs", position: int):
+        """
+        Constructor
+
+        Args:
+            pairs: The grouped pairs that the thresholds will be applied to
+            position: Which threshold of each group to use
+        """
+        self.__pairs = pairs
+        self.__thresholds: typing.List[typing.Optional[Threshold]] = [
+            group_thresholds[position] if position < len(group_thresholds) else None
+            for group_thresholds in pairs.thresholds
+        ]
+        self.__present = numpy.array([threshold is not None for threshold in self.__thresholds], dtype=bool)
+        self.__filters = numpy.array(
+            [threshold is not None and threshold.filters_values for threshold in self.__thresholds],
+            dtype=bool
+        )
+
+        self.__values = numpy.full(len(pairs), numpy.nan)
+        self.__operators: typing.List[typing.Callable] = list()
+        self.__operator_codes = numpy.full(len(pairs), -1, dtype=int)
+
+        observed_keys: typing.List[str] = list()
+        predicted_keys: typing.List[str] = list()
+        self.__observed_key_codes = numpy.full(len(pairs), -1, dtype=int)
+        self.__predicted_key_codes = numpy.full(len(pairs), -1, dtype=int)
+
+        for group_index, threshold in enumerate(self.__thresholds):
+            if threshold is None:
+                continue
+
+            start, end = pairs.bounds(group_index)
+            self.__values[start:end] = threshold.align(pairs.index[start:end])
+
+            if threshold.operator not in self.__operators:
+                self.__operators.append(threshold.operator)
+            self.__operator_codes[start:end] = self.__operators.index(threshold.operator)
+
+            if threshold.observed_value_key:
+                key = _column_name(threshold.observed_value_key)
+                if key not in observed_keys:
+                    observed_keys.append(key)
+                self.__observed_key_codes[start:end] = observed_keys.index(key)
+
+            if threshold.predicted_value_key:
+                key = _column_name(threshold.predicted_value_key)
+                if key not in predicted_keys:
+                    predicted_keys.append(key)
+                self.__predicted_key_codes[start:end] = predicted_keys.index(key)
+
+        # Mirror `ValueFilter.filter_dataframe` - pairs are only kept if the columns that the threshold applies to
+        # fit within it
+        self.__keep = self.__operator_codes >= 0
+
+        for key_index, key in enumerate(observed_keys):
+            rows_to_check = self.__observed_key_codes == key_index
+            self.__keep[rows_to_check] &= self.events(pairs.column(key))[rows_to_check]
+
+        for key_index, key in enumerate(predicted_keys):
+            rows_to_check = self.__predicted_key_codes == key_index
+            self.__keep[rows_to_check] &= self.events(pairs.column(key))[rows_to_check]
+
+        self.__statistics: typing.Dict[str, numpy.ndarray] = dict()
+
+    def events(self, values: numpy.ndarray) -> numpy.ndarray:
+        """
+        Determines which values fit within the threshold of their group
+
+        Args:
+            values: One value for every pair
+
+        Returns:
+            Whether each value fit within the threshold for its group
+        """
+        fits = numpy.zeros(len(values), dtype=bool)
+
+        with numpy.errstate(invalid='ignore'):
+            for operator_index, operator in enumerate(self.__operators):
+                rows_to_check = self.__operator_codes == operator_index
+                fits[rows_to_check] = operator(values[rows_to_check], self.__values[rows_to_check])
+
+        return fits
+
+    @property
+    def thresholds(self) -> typing.Sequence[typing.Optional[Threshold]]:
+        """
+        The threshold for each group; `None` if the group doesn't have a threshold at this position
+        """
+        return self.__thresholds
+
+    @property
+    def present(self) -> numpy.ndarray:
+        """
+        Whether each group has a threshold at this position
+        """
+        return self.__present
+
+    @property
+    def keep(self) -> numpy.ndarray:
+        """
+        Whether each pair would be kept after applying the threshold for its group
+        """
+        return self.__keep
+
+    def _sum(self, values: numpy.ndarray) -> numpy.ndarray:
+        return self.__pairs.group_sum(numpy.where(self.__keep, values, 0.0))
+
+    def _get(self, name: str, calculation: typing.Callable[[], numpy.ndarray]) -> numpy.ndarray:
+        if name not in self.__statistics:
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                self.__statistics[name] = calculation()
+        return self.__statistics[name]
+
+    @property
+    def sample_size(self) -> numpy.ndarray:
+        """
+        The number of pairs within the threshold for each group
+        """
+        return self._get(
+            "sample_size",
+            lambda: numpy.bincount(
+                self.__pairs.group_ids,
+                weights=self.__keep,
+                minlength=self.__pairs.group_count
+            ).astype(int)
+        )
+
+    @property
+    def observed_mean(self) -> numpy.ndarray:
+        return self._get("observed_mean", lambda: self._sum(self.__pairs.observed) / self.sample_size)
+
+    @property
+    def predicted_mean(self) -> numpy.ndarray:
+        return self._get("predicted_mean", lambda: self._sum(self.__pairs.predicted) / self.sample_size)
+
+    @property
+    def observed_deviation(self) -> numpy.ndarray:
+        """
+        The distance between each observation and the mean of the observations within the threshold
+        """
+        return self._get(
+            "observed_deviation",
+            lambda: self.__pairs.observed - self.observed_mean[self.__pairs.group_ids]
+        )
+
+    @property
+    def predicted_deviation(self) -> numpy.ndarray:
+        """
+        The distance between each prediction and the mean of the predictions within the threshold
+        """
+        return self._get(
+            "predicted_deviation",
+            lambda: self.__pairs.predicted - self.predicted_mean[self.__pairs.group_ids]
+        )
+
+    @property
+    def observed_sum_of_squares(self) -> numpy.ndarray:
+        return self._get("observed_sum_of_squares", lambda: self._sum(self.observed_deviation ** 2))
+
+    @property
+    def predicted_sum_of_squares(self) -> numpy.ndarray:
+        return self._get("predicted_sum_of_squares", lambda: self._sum(self.predicted_deviation ** 2))
+
+    @property
+    def sum_of_cross_products(self) -> numpy.ndarray:
+        return self._get(
+            "sum_of_cross_products",
+            lambda: self._sum(self.observed_deviation * self.predicted_deviation)
+        )
+
+    @property
+    def sum_of_squared_error(self) -> numpy.ndarray:
+        return self._get(
+            "sum_of_squared_error",
+            lambda: self._sum((self.__pairs.observed - self.__pairs.predicted) ** 2)
+        )
+
+    @property
+    def observed_standard_deviation(self) -> numpy.ndarray:
+        return self._get(
+            "observed_standard_deviation",
+            lambda: numpy.sqrt(self.observed_sum_of_squares / (self.sample_size - 1))
+        )
+
+    @property
+    def predicted_standard_deviation(self) -> numpy.ndarray:
+        return self._get(
+            "predicted_standard_deviation",
+            lambda: numpy.sqrt(self.predicted_sum_of_squares / (self.sample_size - 1))
+        )
+
+    @property
+    def correlation(self) -> numpy.ndarray:
+        """
+        The pearson correlation coefficient for each group, calculated the same way as `numpy.corrcoef`
+        """
+        def calculate():
+            degrees_of_freedom = self.sample_size - 1
+            covariance = self.sum_of_cross_products / degrees_of_freedom
+            correlation = covariance / self.observed_standard_deviation / self.predicted_standard_deviation
+            return numpy.clip(correlation, -1, 1)
+
+        return self._get("correlation", calculate)
+
+    def _selected(self, values: numpy.ndarray) -> numpy.ndarray:
+        return values[self.__keep]
+
+    def _trapezoid_areas(self, x_values: numpy.ndarray) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Calculates the area under the observations and predictions for each group the same way as
+        `sklearn.metrics.auc`, with trapezoids drawn between consecutive pairs that lie within the threshold
+
+        Args:
+            x_values: The positions of each pair along the x axis
+
+        Returns:
+            The area under the observations and the area under the predictions for each group
+        """
+        group_ids = self._selected(self.__pairs.group_ids)
+        x_values = self._selected(x_values)
+        observations = self._selected(self.__pairs.observed)
+        predictions = self._selected(self.__pairs.predicted)
+
+        shares_group = group_ids[1:] == group_ids[:-1]
+        left_group = group_ids[:-1][shares_group]
+        widths = numpy.diff(x_values)[shares_group]
+
+        group_count = self.__pairs.group_count
+        decreases = numpy.bincount(left_group, weights=widths < 0, minlength=group_count) > 0
+        increases = numpy.bincount(left_group, weights=widths > 0, minlength=group_count) > 0
+
+        if numpy.any(decreases & increases):
+            raise ValueError("The x axis used to calculate areas is neither increasing nor decreasing")
+
+        direction = numpy.where(decreases, -1, 1)
+
+        def area(y_values: numpy.ndarray) -> numpy.ndarray:
+            heights = (y_values[1:] + y_values[:-1])[shares_group]
+            return direction * numpy.bincount(left_group, weights=widths * heights / 2.0, minlength=group_count)
+
+        return area(observations), area(predictions)
+
+    @property
+    def volume_error(self) -> numpy.ndarray:
+        """
+        The difference between the area under the predictions and the area under the observations for each group
+        """
+        def calculate():
+            # Pairs that were filtered by the threshold are positioned by their place in the group, otherwise
+            # they are positioned by the integer value of their index
+            if self.__filters.all():
+                x_values = self.__pairs.positions
+            else:
+                x_values = numpy.where(
+                    self.__filters[self.__pairs.group_ids],
+                    self.__pairs.positions,
+                    self.__pairs.integer_index
+                )
+            observed_area, predicted_area = self._trapezoid_areas(x_values)
+            return predicted_area - observed_area
+
+        return self._get("volume_error", calculate)
+
+    @property
+    def absolute_error_trend(self) -> numpy.ndarray:
+        """
+        The slope of the line of best fit for the absolute error over the pairs within the threshold for each group
+        """
+        def calculate():
+            if self.__filters.all():
+                x_values = self.__pairs.positions.astype(float)
+            else:
+                x_values = numpy.where(
+                    self.__filters[self.__pairs.group_ids],
+                    self.__pairs.positions,
+                    self.__pairs.numeric_index
+                )
+
+            errors = numpy.abs(self.__pairs.observed - self.__pairs.predicted)
+
+            group_ids = self.__pairs.group_ids
+            x_deviation = x_values - (self._sum(x_values) / self.sample_size)[group_ids]
+            error_deviation = errors - (self._sum(errors) / self.sample_size)[group_ids]
+
+            return self._sum(x_deviation * error_deviation) / self._sum(x_deviation ** 2)
+
+        return self._get("absolute_error_trend", calculate)
+
+    def truth_tables(self) -> typing.List[typing.Optional[categorical.TruthTable]]:
+        """
+        Creates a truth table for every group with a threshold at this position
+
+        Returns:
+            A truth table for every group; `None` for groups without a threshold at this position
+        """
+        observed_events = self.events(self.__pairs.observed)
+        predicted_events = self.events(self.__pairs.predicted)
+
+        hits = self.__pairs.group_sum(observed_events & predicted_events).astype(int)
+        misses = self.__pairs.group_sum(observed_events & ~predicted_events).astype(int)
+        false_positives = self.__pairs.group_sum(~observed_events & predicted_events).astype(int)
+        true_negatives = self.__pairs.counts - hits - misses - false_positives
+
+        return [
+            categorical.TruthTable.from_counts(
+                threshold,
+                int(hits[group_index]),
+                int(misses[group_index]),
+                int(false_positives[group_index]),
+                int(true_negatives[group_index])
+            ) if threshold is not None else None
+            for group_index, threshold in enumerate(self.__thresholds)
+        ]
+
+
+class GroupedPairs:
+    """
+    Paired observations and predictions for many groups, sorted so that the members of each group are contiguous
+    """
+    def __init__(
+        self,
+        pairs: pandas.DataFrame,
+        order: numpy.ndarray,
+        group_ids: numpy.ndarray,
+        identifiers: typing.Sequence[GROUP_IDENTIFIER],
+        thresholds: typing.Sequence[typing.Sequence[Threshold]],
+        observed_value_label: str,
+        predicted_value_label: str
+    ):
+        """
+        Constructor
+
+        Args:
+            pairs: The original, unsorted pairs
+            order: The positions of the original pairs that belong to the groups, in sorted order
+            group_ids: The number of the group that each of the sorted pairs belongs to
+            identifiers: The identifier for each group
+            thresholds: The thresholds for each group
+            observed_value_label: The name of the column containing observations
+            predicted_value_label: The name of the column containing predictions
+        """
+        self.__pairs = pairs
+        self.__order = order
+        self.__group_ids = group_ids
+        self.__identifiers = identifiers
+        self.__thresholds = thresholds
+        self.__counts = numpy.bincount(group_ids, minlength=len(identifiers))
+        self.__ends = numpy.cumsum(self.__counts)
+        self.__starts = self.__ends - self.__counts
+        self.__positions = numpy.arange(len(order)) - self.__starts[group_ids]
+        self.__index = pairs.index.take(order)
+        self.__columns: typing.Dict[str, numpy.ndarray] = dict()
+        self.__observed = self.column(observed_value_label)
+        self.__predicted = self.column(predicted_value_label)
+        self.__integer_index: typing.Optional[numpy.ndarray] = None
+        self.__numeric_index: typing.Optional[numpy.ndarray] = None
+        self.__slots: typing.Dict[int, ThresholdSlot] = dict()
+
+    def __len__(self) -> int:
+        return len(self.__order)
+
+    def column(self, name: str) -> numpy.ndarray:
+        """
+        Args:
+            name: The name of a column within the pairs
+
+        Returns:
+            The values of the column in sorted order
+        """
+        if name not in self.__columns:
+            self.__columns[name] = self.__pairs[name].to_numpy(dtype=float)[self.__order]
+        return self.__columns[name]
+
+    def group_sum(self, values: numpy.ndarray) -> numpy.ndarray:
+        """
+        Args:
+            values: One value for every sorted pair
+
+        Returns:
+            The sum of the values within each group
+        """
+        return numpy.bincount(self.__group_ids, weights=values, minlength=self.group_count)
+
+    def bounds(self, group_index: int) -> typing.Tuple[int, int]:
+        """
+        Args:
+            group_index: The number of the group of interest
+
+        Returns:
+            The start and end of the group within the sorted pairs
+        """
+        return int(self.__starts[group_index]), int(self.__ends[group_index])
+
+    def group(self, group_index: int) -> pandas.DataFrame:
+        """
+        Args:
+            group_index: The number of the group of interest
+
+        Returns:
+            The original pairs for the group
+        """
+        start, end = self.bounds(group_index)
+        return self.__pairs.iloc[self.__order[start:end]]
+
+    def slot(self, position: int) -> ThresholdSlot:
+        """
+        Args:
+            position: Which threshold of each group to use
+
+        Returns:
+            The given threshold of every group and the statistics that may be derived from it
+        """
+        if position not in self.__slots:
+            self.__slots[position] = ThresholdSlot(self, position)
+        return self.__slots[position]
+
+    @property
+    def slot_count(self) -> int:
+        """
+        The largest number of thresholds attached to any one group
+        """
+        return max([len(group_thresholds) for group_thresholds in self.__thresholds], default=0)
+
+    @property
+    def group_count(self) -> int:
+        return len(self.__identifiers)
+
+    @property
+    def identifiers(self) -> typing.Sequence[GROUP_IDENTIFIER]:
+        return self.__identifiers
+
+    @property
+    def thresholds(self) -> typing.Sequence[typing.Sequence[Threshold]]:
+        return self.__thresholds
+
+    @property
+    def group_ids(self) -> numpy.ndarray:
+        return self.__group_ids
+
+    @property
+    def counts(self) -> numpy.ndarray:
+        return self.__counts
+
+    @property
+    def positions(self) -> numpy.ndarray:
+        """
+        The position of each pair within its group
+        """
+        return self.__positions
+
+    @property
+    def index(self) -> pandas.Index:
+        return self.__index
+
+    @property
+    def observed(self) -> numpy.ndarray:
+        return self.__observed
+
+    @property
+    def predicted(self) -> numpy.ndarray:
+        return self.__predicted
+
+    @property
+    def integer_index(self) -> numpy.ndarray:
+        """
+        The index of each pair cast to an integer, as used when calculating areas over unfiltered pairs
+        """
+        if self.__integer_index is None:
+            self.__integer_index = numpy.asarray(self.__index.values).astype("int64")
+        return self.__integer_index
+
+    @property
+    def numeric_index(self) -> numpy.ndarray:
+        """
+        The index of each pair as a number, as interpreted by `metric.series_to_numeric_sequence`
+        """
+        if self.__numeric_index is None:
+            if pandas.api.types.is_numeric_dtype(self.__index):
+                self.__numeric_index = self.__index.to_numpy(dtype=float)
+            elif pandas.api.types.is_datetime64_any_dtype(self.__index):
+                # Matches `pandas.Timestamp.timestamp` for every entry without creating each Timestamp
+                self.__numeric_index = numpy.round(pandas.DatetimeIndex(self.__index).asi8 / 1e9, 6)
+            else:
+                self.__numeric_index = self.__positions.astype(float)
+        return self.__numeric_index
+
+
+def _pearson_correlation_coefficient(slot: ThresholdSlot) -> numpy.ndarray:
+    return numpy.where(slot.sample_size > 0, slot.correlation, numpy.nan)
+
+
+def _kling_gupta_efficiency(slot: ThresholdSlot) -> numpy.ndarray:
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        alpha = slot.correlation
+        beta = slot.predicted_mean / slot.observed_mean
+        gamma = slot.predicted_standard_deviation / slot.observed_standard_deviation
+        result = 1.0 - numpy.sqrt((alpha - 1)**2 + (beta - 1)**2 + (gamma - 1)**2)
+    return numpy.where(slot.sample_size > 0, result, numpy.nan)
+
+
+def _normalized_nash_sutcliffe_efficiency(slot: ThresholdSlot) -> numpy.ndarray:
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        nash_sutcliffe_efficiency = 1 - (slot.sum_of_squared_error / slot.observed_sum_of_squares)
+        result = 1 / (2 - nash_sutcliffe_efficiency)
+    return numpy.where(slot.sample_size > 0, result, numpy.nan)
+
+
+def _volume_error(slot: ThresholdSlot) -> numpy.ndarray:
+    return numpy.where(slot.sample_size > 0, slot.volume_error, 0)
+
+
+def _linear_temporal_trend_absolute_error(slot: ThresholdSlot) -> numpy.ndarray:
+    result = numpy.rad2deg(numpy.arctan(slot.absolute_error_trend)) / 90.0
+    return numpy.where(slot.sample_size > 1, result, numpy.nan)
+
+
+VECTORIZED_METRICS: typing.Dict[typing.Type[scoring.Metric], typing.Callable[[ThresholdSlot], numpy.ndarray]] = {
+    metric_functions.PearsonCorrelationCoefficient: _pearson_correlation_coefficient,
+    metric_functions.KlingGuptaEfficiency: _kling_gupta_efficiency,
+    metric_functions.NormalizedNashSutcliffeEfficiency: _normalized_nash_sutcliffe_efficiency,
+    metric_functions.VolumeError: _volume_error,
+    metric_functions.LinearTemporalTrendAbsoluteError: _linear_temporal_trend_absolute_error,
+}
+"""
+Functions that calculate a metric for every group of a threshold slot at once, keyed by the metric they calculate
+"""
+
+
+def _can_be_batched(thresholds: typing.Sequence[Threshold]) -> bool:
+    return not any(threshold.transformation_function for threshold in thresholds)
+
+
+def score_groups(
+    metrics: typing.Sequence[scoring.Metric],
+    pairs: pandas.DataFrame,
+    group_by: typing.Sequence[str],
+    observed_value_label: str,
+    predicted_value_label: str,
+    thresholds: typing.Mapping[GROUP_IDENTIFIER, typing.Sequence[Threshold]],
+    score_group: GROUP_SCORER,
+    weight: float = None,
+    metadata_fields: typing.Sequence[str] = None,
+    communicators: CommunicatorGroup = None,
+    metric_timings: typing.MutableMapping[str, float] = None
+) -> typing.Dict[GROUP_IDENTIFIER, scoring.MetricResults]:
+    """
+    Scores every group of pairs at once
+
+    Args:
+        metrics: The metrics to calculate
+        pairs: Observations and predictions paired together
+        group_by: The columns used to group pairs together
+        observed_value_label: The name of the column containing observations
+        predicted_value_label: The name of the column containing predictions
+        thresholds: The thresholds to apply to each group, keyed by the group's identifier
+        score_group: A function used to score an individual group that can't be scored with the rest
+        weight: The weight of the results for each group
+        metadata_fields: Names for each member of a group identifier used when describing results
+        communicators: Communicators used to broadcast results
+        metric_timings: Cumulative seconds spent on each metric, keyed by metric name, to add the time spent on
+            batched metrics to
+
+    Returns:
+        The results for each group that had thresholds, keyed by the group's identifier
+    """
+    communicators = communicators or CommunicatorGroup()
+    metric_timings = metric_timings if metric_timings is not None else dict()
+    weight = 1 if not weight or numpy.isnan(weight) else weight
+    metadata_fields = metadata_fields or group_by
+
+    grouper = pairs.groupby(by=list(group_by), sort=True)
+    identifiers = [_identifier_to_tuple(identifier) for identifier in grouper.size().index]
+    codes = numpy.nan_to_num(grouper.ngroup().to_numpy(dtype=float), nan=-1).astype(int)
+    grouped_rows = codes >= 0
+
+    group_thresholds = [thresholds.get(identifier) for identifier in identifiers]
+
+    observations = pairs[observed_value_label].to_numpy(dtype=float)
+    predictions = pairs[predicted_value_label].to_numpy(dtype=float)
+    missing_values = numpy.isnan(observations) | numpy.isnan(predictions)
+    groups_missing_values = numpy.bincount(
+        codes[grouped_rows],
+        weights=missing_values[grouped_rows],
+        minlength=len(identifiers)
+    ) > 0
+
+    batchable_groups = [
+        group_index
+        for group_index, location_thresholds in enumerate(group_thresholds)
+        if location_thresholds
+           and not groups_missing_values[group_index]
+           and _can_be_batched(location_thresholds)
+    ]
+
+    batch_codes = numpy.full(len(identifiers) + 1, -1, dtype=int)
+    batch_codes[batchable_groups] = numpy.arange(len(batchable_groups))
+    row_codes = batch_codes[codes]
+
+    batched_rows = numpy.flatnonzero(row_codes >= 0)
+    order = batched_rows[numpy.argsort(row_codes[batched_rows], kind="stable")]
+
+    grouped_pairs = GroupedPairs(
+        pairs=pairs,
+        order=order,
+        group_ids=row_codes[order],
+        identifiers=[identifiers[group_index] for group_index in batchable_groups],
+        thresholds=[group_thresholds[group_index] for group_index in batchable_groups],
+        observed_value_label=observed_value_label,
+        predicted_value_label=predicted_value_label
+    )
+
+    batched_results = _score_grouped_pairs(
+        metrics,
+        grouped_pairs,
+        observed_value_label,
+        predicted_value_label,
+        weight,
+        metadata_fields,
+        communicators,
+        metric_timings
+    )
+
+    results: typing.Dict[GROUP_IDENTIFIER, scoring.MetricResults] = dict()
+
+    for group_index, identifier in enumerate(identifiers):
+        if identifier in batched_results:
+            results[identifier] = batched_results[identifier]
+        elif group_thresholds[group_index]:
+            group = pairs.iloc[numpy.flatnonzero(codes == group_index)]
+            truth_tables = categorical.TruthTables(
+                group[observed_value_label],
+                group[predicted_value_label],
+                group_thresholds[group_index]
+            )
+            results[identifier] = score_group(
+                group,
+                observed_value_label,
+                predicted_value_label,
+                group_thresholds[group_index],
+                dict(zip(metadata_fields, identifier)),
+                truth_tables
+            )
+
+    return results
+
+
+def _score_grouped_pairs(
+    metrics: typing.Sequence[scoring.Metric],
+    grouped_pairs: GroupedPairs,
+    observed_value_label: str,
+    predicted_value_label: str,
+    weight: float,
+    metadata_fields: typing.Sequence[str],
+    communicators: CommunicatorGroup,
+    metric_timings: typing.MutableMapping[str, float]
+) -> typing.Dict[GROUP_IDENTIFIER, scoring.MetricResults]:
+    if grouped_pairs.group_count == 0:
+        return dict()
+
+    slots = [grouped_pairs.slot(position) for position in range(grouped_pairs.slot_count)]
+
+    tables_per_slot: typing.Optional[typing.List[typing.List[typing.Optional[categorical.TruthTable]]]] = None
+
+    if any(isinstance(metric, metric_functions.CategoricalMetric) for metric in metrics) \
+            or any(type(metric) not in VECTORIZED_METRICS for metric in metrics):
+        tables_per_slot = [slot.truth_tables() for slot in slots]
+
+    # Calculate every vectorized metric for every group ahead of time
+    vectorized_values: typing.Dict[int, typing.List[numpy.ndarray]] = dict()
+
+    for metric_index, metric in enumerate(metrics):
+        if type(metric) in VECTORIZED_METRICS:
+            metric_start = time.perf_counter()
+            vectorized_values[metric_index] = [VECTORIZED_METRICS[type(metric)](slot) for slot in slots]
+            metric_timings[metric.name] = metric_timings.get(metric.name, 0.0) + time.perf_counter() - metric_start
+
+    table_metric_names: typing.Dict[int, str] = {
+        metric_index: metric.get_table_metric_name()
+        for metric_index, metric in enumerate(metrics)
+        if isinstance(metric, metric_functions.CategoricalMetric)
+    }
+
+    results: typing.Dict[GROUP_IDENTIFIER, scoring.MetricResults] = dict()
+
+    for group_index, identifier in enumerate(grouped_pairs.identifiers):
+        location_thresholds = grouped_pairs.thresholds[group_index]
+        location_results = scoring.MetricResults(weight=weight)
+
+        truth_tables: typing.Optional[categorical.TruthTables] = None
+        if tables_per_slot is not None:
+            truth_tables = categorical.TruthTables(
+                tables=[
+                    tables_per_slot[position][group_index]
+                    for position in range(len(location_thresholds))
+                ]
+            )
+
+        for metric_index, metric in enumerate(metrics):
+            metric_start = time.perf_counter()
+
+            if metric_index in vectorized_values:
+                scores = scoring.Scores(
+                    metric,
+                    [
+                        scoring.Score(
+                            metric,
+                            vectorized_values[metric_index][position][group_index],
+                            threshold,
+                            sample_size=int(slots[position].sample_size[group_index])
+                        )
+                        for position, threshold in enumerate(location_thresholds)
+                    ]
+                )
+            elif metric_index in table_metric_names:
+                table_metric_name = table_metric_names[metric_index]
+                scores = scoring.Scores(
+                    metric,
+                    [
+                        scoring.Score(metric, getattr(table, table_metric_name)(), table.threshold, len(table))
+                        for table in truth_tables.values()
+                    ]
+                )
+            else:
+                scores = metric(
+                    pairs=grouped_pairs.group(group_index),
+                    observed_value_label=observed_value_label,
+                    predicted_value_label=predicted_value_label,
+                    thresholds=location_thresholds,
+                    truth_tables=truth_tables
+                )
+
+            metric_timings[metric.name] = metric_timings.get(metric.name, 0.0) + time.perf_counter() - metric_start
+            location_results.add_scores(scores)
+
+            if communicators.send_all():
+                message = {
+                    "metric": scores.metric.name,
+                    "description": scores.metric.get_descriptions(),
+                    "weight": scores.metric.weight,
+                    "total": scores.total,
+                    "scores": scores.to_dict(),
+                    "metadata": dict(zip(metadata_fields, identifier))
+                }
+                communicators.write(reason="metric", data=message, verbosity=Verbosity.ALL)
+
+        results[identifier] = location_results
+
+    return results
@@ -286,15 +286,9 @@ class TruthTable(object):
             predictions: An ordered series of values representing all predictions used to form the truth table
             threshold: The threshold used to indicate something that might constitute a notable event
         """
-        self.__name = threshold.name or "Unknown"
-        self.__threshold = threshold
-
         observed_values_that_matter = threshold(observations)
         predicted_values_that_matter = threshold(predictions)
 
-        self.__observation_had_activity = observed_values_that_matter.any()
-        self.__predictions_had_activity = predicted_values_that_matter.any()
-
         # Creates a contingency table matching:
         #
         #  Observations     False                   True
@@ -323,32 +317,73 @@ class TruthTable(object):
         #
         contingency_table = pandas.crosstab(predicted_values_that_matter.values, observed_values_that_matter.values)
 
-        # Store evaluated parameters so they don't have to be evaluated multiple times
-        self.__hits = 0
-        self.__false_positives = 0
-        self.__true_negatives = 0
-        self.__misses = 0
+        hits = 0
+        false_positives = 0
+        true_negatives = 0
+        misses = 0
 
         if True in contingency_table:
-            self.__hits = contingency_table[True][True] if True in contingency_table[True] else 0
-            self.__misses = contingency_table[True][False] if False in contingency_table[True] else 0
+            hits = contingency_table[True][True] if True in contingency_table[True] else 0
+            misses = contingency_table[True][False] if False in contingency_table[True] else 0
 
         if False in contingency_table:
-            self.__true_negatives = contingency_table[False][False] if False in contingency_table[False] else 0
-            self.__false_positives = contingency_table[False][True] if True in contingency_table[False] else 0
+            true_negatives = contingency_table[False][False] if False in contingency_table[False] else 0
+            false_positives = contingency_table[False][True] if True in contingency_table[False] else 0
 
-        # Adds the values in each column together, then adds those numbers togethers.
-        #
-        # From the Example above:
-        #
-        #  Observations     False       True
-        #  Predictions
-        #  False            51          2
-        #  True             0           1
-        #
-        #  contingency_table.sum() => (False, 51), (True, 3)
-        #  contingency_table.sum().sum() => 54
-        self.__size = contingency_table.sum().sum()
+        self.__load(threshold, hits, misses, false_positives, true_negatives)
+
+    @classmethod
+    def from_counts(
+        cls,
+        threshold: Threshold,
+        hits: int,
+        misses: int,
+        false_positives: int,
+        true_negatives: int
+    ) -> "TruthTable":
+        """
+        Creates a truth table from contingency counts that have already been tallied
+
+        Args:
+            threshold: The threshold used to indicate something that might constitute a notable event
+            hits: The number of times both the observation and the prediction fit within the threshold
+            misses: The number of times the observation fit within the threshold but the prediction did not
+            false_positives: The number of times the prediction fit within the threshold but the observation did not
+            true_negatives: The number of times neither the observation nor the prediction fit within the threshold
+
+        Returns:
+            A truth table bearing the given counts
+        """
+        table = cls.__new__(cls)
+        table.__load(threshold, hits, misses, false_positives, true_negatives)
+        return table
+
+    def __load(self, threshold: Threshold, hits: int, misses: int, false_positives: int, true_negatives: int):
+        """
+        Stores contingency counts and prepares the metrics that may be derived from them
+
+        Args:
+            threshold: The threshold used to indicate something that might constitute a notable event
+            hits: The number of times both the observation and the prediction fit within the threshold
+            misses: The number of times the observation fit within the threshold but the prediction did not
+            false_positives: The number of times the prediction fit within the threshold but the observation did not
+            true_negatives: The number of times neither the observation nor the prediction fit within the threshold
+        """
+        self.__name = threshold.name or "Unknown"
+        self.__threshold = threshold
+
+        # Store evaluated parameters so they don't have to be evaluated multiple times
+        self.__hits = hits
+        self.__false_positives = false_positives
+        self.__true_negatives = true_negatives
+        self.__misses = misses
+
+        self.__observation_had_activity = (hits + misses) > 0
+        self.__predictions_had_activity = (hits + false_positives) > 0
+
+        # Every pair lands in exactly one cell of the contingency table, so the size of the table is the total
+        # of all of its cells
+        self.__size = hits + misses + false_positives + true_negatives
 
         self.__observed_positives = self.__hits + self.__misses
         self.__observed_negatives = self.__false_positives + self.__true_negatives
@@ -722,10 +757,98 @@ class TruthTable(object):
         return self.__size
 
 
+def count_contingencies(
+    observations: numpy.ndarray,
+    predictions: numpy.ndarray,
+    thresholds: typing.Sequence[Threshold],
+    threshold_values: numpy.ndarray
+) -> numpy.ndarray:
+    """
+    Tallies the cells of a contingency table for each threshold at once
+
+    Args:
+        observations: The observed values
+        predictions: The predicted values that line up with the observations
+        thresholds: The thresholds whose operators determine whether a value counts as an event
+        threshold_values: A matrix with a row of threshold values per threshold and a column per observation
+
+    Returns:
+        A matrix with a row per threshold whose columns are hits, misses, false positives, and true negatives
+    """
+    observations = numpy.asarray(observations, dtype=float)
+    predictions = numpy.asarray(predictions, dtype=float)
+    threshold_values = numpy.asarray(threshold_values, dtype=float).reshape(len(thresholds), len(observations))
+
+    observed_events = numpy.empty(threshold_values.shape, dtype=bool)
+    predicted_events = numpy.empty(threshold_values.shape, dtype=bool)
+
+    with numpy.errstate(invalid="ignore"):
+        for row_number, threshold in enumerate(thresholds):
+            observed_events[row_number] = threshold.operator(observations, threshold_values[row_number])
+            predicted_events[row_number] = threshold.operator(predictions, threshold_values[row_number])
+
+    observed_positives = numpy.count_nonzero(observed_events, axis=1)
+    predicted_positives = numpy.count_nonzero(predicted_events, axis=1)
+    hits = numpy.count_nonzero(observed_events & predicted_events, axis=1)
+    misses = observed_positives - hits
+    false_positives = predicted_positives - hits
+    true_negatives = len(observations) - hits - misses - false_positives
+
+    return numpy.stack([hits, misses, false_positives, true_negatives], axis=1)
+
+
 class TruthTables(object):
     """
     A collection of truth tables organized by threshold
     """
+    @classmethod
+    def from_arrays(
+        cls,
+        observations: numpy.ndarray,
+        predictions: numpy.ndarray,
+        thresholds: typing.Sequence[Threshold],
+        threshold_values: numpy.ndarray = None,
+        index: pandas.Index = None,
+        weight: float = None
+    ) -> "TruthTables":
+        """
+        Creates truth tables for every threshold from raw arrays in a single pass
+
+        Contingency counts for every threshold are tallied together and each `TruthTable` is only created
+        once it is requested
+
+        Args:
+            observations: The observed values
+            predictions: The predicted values that line up with the observations
+            thresholds: The thresholds used to define what does and does not make a table
+            threshold_values: A matrix with a row of threshold values per threshold and a column per observation.
+                Values are aligned from the thresholds themselves if not given
+            index: The index of the observations, used to align indexed threshold values if no matrix is given
+            weight: The relative significance of the data in the table. The value is 1 if none is passed.
+
+        Returns:
+            A collection of truth tables for each threshold
+        """
+        thresholds = list(thresholds or [])
+
+        if not thresholds:
+            raise ValueError("No tables are available to provide metrics for")
+
+        for threshold in thresholds:
+            if threshold.transformation_function:
+                raise ValueError(
+                    f"Truth tables cannot be formed from arrays for '{threshold.name}' since it transforms its data"
+                )
+
+        if threshold_values is None:
+            if index is None:
+                index = pandas.RangeIndex(len(observations))
+            threshold_values = numpy.stack([threshold.align(index) for threshold in thresholds])
+
+        counts = count_contingencies(observations, predictions, thresholds, threshold_values)
+
+        return cls(weight=weight, views=(thresholds, counts))
+
     def __init__(
         self,
         observations: pandas.Series = None,
@@ -733,6 +856,7 @@ class TruthTables(object):
         thresholds: typing.Iterable[Threshold] = None,
         tables: typing.Iterable[TruthTable] = None,
         weight: float = None,
+        views: typing.Tuple[typing.Sequence[Threshold], numpy.ndarray] = None
     ):
         """
         Constructor
@@ -746,13 +870,27 @@ class TruthTables(object):
             tables: An optional collection of premade tables to use
             weight: The relative significance of the data in the table. The value is 1 if none is passed.
                 Must be either None or a positive number
+            views: Thresholds paired with a matrix of their contingency counts whose tables should only be created
+                when requested. See `TruthTables.from_arrays`
         """
         if weight is not None and weight <= 0:
             raise ValueError(
                 f"If defined, the weight of this truth table must be greater than 0; the passed weight was {weight}"
             )
 
-        self.__tables: typing.Dict[str, TruthTable] = dict()
+        self.__tables: typing.Dict[str, typing.Optional[TruthTable]] = dict()
+        self.__views: typing.Dict[str, typing.Tuple[Threshold, numpy.ndarray]] = dict()
+
+        if views is not None:
+            view_thresholds, counts = views
+            for threshold, threshold_counts in zip(view_thresholds, counts):
+                name = threshold.name or "Unknown"
+                if name in self.__tables:
+                    raise ValueError(
+                        f"There is already a truth table named '{name}' in this set of truth tables"
+                    )
+                self.__tables[name] = None
+                self.__views[name] = (threshold, threshold_counts)
 
         has_usable_observations = observations is not None and isinstance(observations, pandas.Series)
         has_usable_predictions = predictions is not None and isinstance(predictions, pandas.Series)
@@ -831,6 +969,31 @@ class TruthTables(object):
 
         return self
 
+    def __get_table(self, name: str) -> TruthTable:
+        """
+        Retrieve a table by name, creating it from its contingency counts if it has not been created yet
+        """
+        table = self.__tables[name]
+
+        if table is None:
+            threshold, counts = self.__views.pop(name)
+            table = TruthTable.from_counts(threshold, *(int(count) for count in counts))
+            self.__tables[name] = table
+
+            if threshold.name.isidentifier():
+                setattr(self, name, table)
+
+        return table
+
+    def __getattr__(self, name: str) -> TruthTable:
+        # Only called when normal attribute lookup fails; tables that have not been created yet are found here
+        views = self.__dict__.get("_TruthTables__views")
+
+        if views and name in views:
+            return self.__get_table(name)
+
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
     @property
     def weight(self) -> float:
         """
@@ -851,7 +1014,7 @@ class TruthTables(object):
                 "value": table.hits(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(hit_count)
@@ -869,7 +1032,7 @@ class TruthTables(object):
                 "value": table.misses(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(miss_count)
@@ -887,7 +1050,7 @@ class TruthTables(object):
                 "value": table.false_positives(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(false_positive_count)
@@ -905,7 +1068,7 @@ class TruthTables(object):
                 "value": table.true_negatives(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(true_negative_count)
@@ -923,7 +1086,7 @@ class TruthTables(object):
                 "value": table.probability_of_detection(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(probabilities_of_detection)
@@ -941,7 +1104,7 @@ class TruthTables(object):
                 "value": table.false_alarm_ratio(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(ratios_of_false_alarms)
@@ -959,7 +1122,7 @@ class TruthTables(object):
                 "value": table.probability_of_false_detection(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(false_detection_probabilities)
@@ -977,7 +1140,7 @@ class TruthTables(object):
                 "value": table.frequency_bias(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(frequency_biases)
@@ -995,7 +1158,7 @@ class TruthTables(object):
                 "value": table.accuracy(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(accuracies)
@@ -1013,7 +1176,7 @@ class TruthTables(object):
                 "value": table.precision(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(precision_rows)
@@ -1031,7 +1194,7 @@ class TruthTables(object):
                 "value": table.critical_success_index(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(indices)
@@ -1049,7 +1212,7 @@ class TruthTables(object):
                 "value": table.equitable_threat_score(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(scores)
@@ -1067,7 +1230,7 @@ class TruthTables(object):
                 "value": table.general_skill(),
                 "sample_size": len(table)
             }
-            for table in self.__tables.values()
+            for table in self.values()
         ]
 
         return pandas.DataFrame(skills)
@@ -1079,7 +1242,7 @@ class TruthTables(object):
         """
         metric_data = list()
 
-        for table in self.__tables.values():
+        for table in self.values():
             for metric in TruthTable.metrics():
                 metric_data.append(
                     {
@@ -1105,8 +1268,8 @@ class TruthTables(object):
             return self.__usefullness
 
         # Evaluate usefulness
-        max_possible_usefulness = max([table.weight for table in self.__tables.values()])
-        current_usefulness = max([table.usefulness for table in self.__tables.values()])
+        max_possible_usefulness = max([table.weight for table in self.values()])
+        current_usefulness = max([table.usefulness for table in self.values()])
 
         self.__usefullness = (current_usefulness / max_possible_usefulness) * self.weight
 
@@ -1122,14 +1285,14 @@ class TruthTables(object):
         """
         Every contained truth table
         """
-        return self.__tables.values()
+        return [self.__get_table(name) for name in self.__tables]
 
     def items(self) -> typing.ItemsView[str, TruthTable]:
         """
         Returns:
             An iterable collection of pairs of keys and their tables
         """
-        return self.__tables.items()
+        return {name: self.__get_table(name) for name in self.__tables}.items()
 
     def __getitem__(self, key: typing.Union[Threshold, str]) -> TruthTable:
         """
@@ -1144,7 +1307,7 @@ class TruthTables(object):
         if isinstance(key, Threshold):
             key = key.name
 
-        return self.__tables[key]
+        return self.__get_table(key)
 
     def __len__(self):
         """
@@ -18,7 +18,6 @@ import logging
 
 import numpy
 import pandas
-import sklearn.metrics
 import scipy.stats
 
 from pandas.api import types as pandas_types
@@ -27,6 +26,7 @@ from . import common
 from . import scoring
 from . import threshold
 from . import categorical
+from .statistics import PairStatistics
 from .threshold import Threshold
 
 
@@ -254,6 +254,14 @@ class CategoricalMetric(scoring.Metric, abc.ABC):
     def get_name(cls):
         return cls.get_metadata().name
 
+    @classmethod
+    def get_table_metric_name(cls) -> str:
+        """
+        Returns:
+            The name of the function on a `categorical.TruthTable` that calculates this metric
+        """
+        return cls.get_metadata().name.lower().replace(" ", "_")
+
     def __init__(self, weight: NUMBER):
         """
         Constructor
@@ -376,20 +384,27 @@ class LinearTemporalTrendAbsoluteError(scoring.Metric):
         if not thresholds:
             thresholds = [threshold.Threshold.default()]
 
+        statistics = PairStatistics.for_pairs(
+            kwargs.get("statistics"),
+            pairs,
+            observed_value_label,
+            predicted_value_label
+        )
+
         scores: typing.List[scoring.Score] = list()
 
         for error_threshold in thresholds:
             result = numpy.nan
-            filtered_pairs = error_threshold(pairs)
+            threshold_statistics = statistics[error_threshold]
 
-            if len(filtered_pairs) > 1:
-                errors = abs(filtered_pairs[observed_value_label] - filtered_pairs[predicted_value_label])
-                index_values = series_to_numeric_sequence(filtered_pairs)
+            if threshold_statistics.size > 1:
+                errors = numpy.abs(threshold_statistics.observed_values - threshold_statistics.predicted_values)
+                index_values = series_to_numeric_sequence(threshold_statistics.index)
                 regression_line = scipy.stats.linregress(index_values, errors)
                 result = numpy.rad2deg(numpy.arctan(regression_line.slope)) / 90.0
 
             scores.append(
-                scoring.Score(self, result, error_threshold, sample_size=len(filtered_pairs))
+                scoring.Score(self, result, error_threshold, sample_size=threshold_statistics.size)
             )
 
         return scoring.Scores(self, scores)
@@ -433,16 +448,22 @@ class PearsonCorrelationCoefficient(scoring.Metric):
 
         scores: typing.List[scoring.Score] = list()
 
-        for pearson_threshold in thresholds:
-            result = numpy.nan
-            filtered_pairs = pearson_threshold(pairs)
+        statistics = PairStatistics.for_pairs(
+            kwargs.get("statistics"),
+            pairs,
+            observed_value_label,
+            predicted_value_label
+        )
 
-            if not filtered_pairs.empty:
-                result = numpy.corrcoef(filtered_pairs[observed_value_label], filtered_pairs[predicted_value_label])
-                if result is not None and len(result) > 0:
-                    result = result[0][1]
+        for pearson_threshold in thresholds:
+            threshold_statistics = statistics[pearson_threshold]
             scores.append(
-                scoring.Score(self, result, pearson_threshold, sample_size=len(filtered_pairs))
+                scoring.Score(
+                    self,
+                    threshold_statistics.pearson_correlation_coefficient,
+                    pearson_threshold,
+                    sample_size=threshold_statistics.size
+                )
             )
 
         return scoring.Scores(self, scores)
@@ -493,49 +514,39 @@ class KlingGuptaEfficiency(scoring.Metric):
         if gamma_scale is None or numpy.isnan(gamma_scale):
             gamma_scale = 1
 
-        alpha_values = PearsonCorrelationCoefficient(self.weight)(
+        statistics = PairStatistics.for_pairs(
+            kwargs.get("statistics"),
             pairs,
             observed_value_label,
-            predicted_value_label,
-            thresholds,
-            *args,
-            **kwargs
+            predicted_value_label
         )
 
         scores: typing.List[scoring.Score] = list()
 
         for kling_threshold in thresholds:
             result = numpy.nan
-            filtered_pairs = kling_threshold(pairs)
-
-            if not filtered_pairs.empty:
-                observed_values: pandas.Series = filtered_pairs[observed_value_label]
-                predicted_values: pandas.Series = filtered_pairs[predicted_value_label]
-
-                observed_mean = observed_values.mean()
-                predicted_mean = predicted_values.mean()
-
-                observed_std = observed_values.std()
-                predicted_std = predicted_values.std()
+            threshold_statistics = statistics[kling_threshold]
 
+            if not threshold_statistics.empty:
                 # The ratio between the standard deviation of the simulated values and the standard deviation of the
                 # observed ones. Ideal value is Alpha=1
-                alpha = alpha_values[kling_threshold].value
+                alpha = threshold_statistics.pearson_correlation_coefficient
                 alpha *= alpha_scale
 
                 # The ratio between the mean of the simulated values and the mean of the observed ones.
                 # Ideal value is Beta=1
-                beta = predicted_mean / observed_mean
+                beta = threshold_statistics.predicted_mean / threshold_statistics.observed_mean
                 beta *= beta_scale
 
                 # The ratio between the coefficient of variation (CV) of the simulated values to the coefficient of
                 # variation of the observed ones. Ideal value is Gamma=1
-                gamma = predicted_std / observed_std
+                gamma = threshold_statistics.predicted_standard_deviation
+                gamma /= threshold_statistics.observed_standard_deviation
                 gamma *= gamma_scale
 
                 initial_result = math.sqrt((alpha - 1)**2 + (beta - 1)**2 + (gamma - 1)**2)
                 result = 1.0 - initial_result
-            scores.append(scoring.Score(self, result, kling_threshold, sample_size=len(filtered_pairs)))
+            scores.append(scoring.Score(self, result, kling_threshold, sample_size=threshold_statistics.size))
 
         return scoring.Scores(self, scores)
 
@@ -574,15 +585,20 @@ class NormalizedNashSutcliffeEfficiency(scoring.Metric):
     ) -> scoring.Scores:
         scores: typing.List[scoring.Score] = list()
 
+        statistics = PairStatistics.for_pairs(
+            kwargs.get("statistics"),
+            pairs,
+            observed_value_label,
+            predicted_value_label
+        )
+
         for nnse_threshold in thresholds:
             normalized_nash_sutcliffe_efficiency = numpy.nan
-            filtered_pairs = nnse_threshold(pairs)
+            threshold_statistics = statistics[nnse_threshold]
 
-            if not filtered_pairs.empty:
-                mean_observation = filtered_pairs[observed_value_label].mean()
-
-                numerator = (filtered_pairs[observed_value_label].sub(filtered_pairs[predicted_value_label])**2).sum()
-                denominator = (filtered_pairs[observed_value_label].sub(mean_observation)**2).sum()
+            if not threshold_statistics.empty:
+                numerator = threshold_statistics.sum_of_squared_error
+                denominator = threshold_statistics.observed_sum_of_squares
 
                 nash_suttcliffe_efficiency = 1 - (numerator / denominator)
 
@@ -593,7 +609,7 @@ class NormalizedNashSutcliffeEfficiency(scoring.Metric):
                     self,
                     normalized_nash_sutcliffe_efficiency,
                     nnse_threshold,
-                    sample_size=len(filtered_pairs)
+                    sample_size=threshold_statistics.size
                 )
             )
 
@@ -633,15 +649,23 @@ class VolumeError(scoring.Metric):
     ) -> scoring.Scores:
         scores: typing.List[scoring.Score] = list()
 
+        statistics = PairStatistics.for_pairs(
+            kwargs.get("statistics"),
+            pairs,
+            observed_value_label,
+            predicted_value_label
+        )
+
         for volume_threshold in thresholds:
-            filtered_pairs = volume_threshold(pairs)
-            difference = 0
-            if not filtered_pairs.empty:
-                dates: typing.List[int] = [value.astype("int") for value in filtered_pairs.index.values]
-                area_under_observations = sklearn.metrics.auc(dates, filtered_pairs[observed_value_label])
-                area_under_predictions = sklearn.metrics.auc(dates, filtered_pairs[predicted_value_label])
-                difference = area_under_predictions - area_under_observations
-            scores.append(scoring.Score(self, difference, volume_threshold, sample_size=len(filtered_pairs)))
+            threshold_statistics = statistics[volume_threshold]
+            scores.append(
+                scoring.Score(
+                    self,
+                    threshold_statistics.volume_error,
+                    volume_threshold,
+                    sample_size=threshold_statistics.size
+                )
+            )
 
         return scoring.Scores(self, scores)
 
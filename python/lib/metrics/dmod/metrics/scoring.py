@@ -4,6 +4,7 @@ import string
 import abc
 import re
 import json
+import time
 
 from collections import defaultdict
 from collections import abc as abstract_collections
@@ -16,6 +17,7 @@ import numpy
 import dmod.core.common as common
 
 from .threshold import Threshold
+from .statistics import PairStatistics
 from .communication import Verbosity
 from .communication import CommunicatorGroup
 
@@ -815,6 +817,27 @@ class ScoringScheme(object):
     ):
         self.__metrics = metrics or list()
         self.__communicators = communicators or CommunicatorGroup()
+        self.__metric_timings: typing.Dict[str, float] = defaultdict(float)
+
+    @property
+    def metrics(self) -> typing.Sequence[Metric]:
+        """
+        The metrics that will be used to score pairs, in the order they will be called
+        """
+        return list(self.__metrics)
+
+    @property
+    def metric_timings(self) -> typing.Dict[str, float]:
+        """
+        The cumulative number of seconds spent calculating each metric, keyed by metric name
+        """
+        return dict(self.__metric_timings)
+
+    def reset_metric_timings(self):
+        """
+        Forget how long metrics have taken so far
+        """
+        self.__metric_timings.clear()
 
     def score(
         self,
@@ -836,8 +859,13 @@ class ScoringScheme(object):
 
         results = MetricResults(weight=weight)
 
+        # Filtered pairs and their statistics are shared between metrics so that each threshold is only applied once
+        if kwargs.get("statistics") is None:
+            kwargs["statistics"] = PairStatistics(pairs, observed_value_label, predicted_value_label)
+
         for metric in self.__metrics:  # type: Metric
             self.__communicators.info(f"Calling {metric.name}", verbosity=Verbosity.LOUD, publish=True)
+            metric_start = time.perf_counter()
             scores = metric(
                 pairs=pairs,
                 observed_value_label=observed_value_label,
@@ -846,6 +874,7 @@ class ScoringScheme(object):
                 *args,
                 **kwargs
             )
+            self.__metric_timings[metric.name] += time.perf_counter() - metric_start
             results.add_scores(scores)
 
             if self.__communicators.send_all():
@@ -863,3 +892,62 @@ class ScoringScheme(object):
                 self.__communicators.write(reason="metric", data=message, verbosity=Verbosity.ALL)
 
         return results
+
+    def score_groups(
+        self,
+        pairs: pandas.DataFrame,
+        group_by: typing.Sequence[str],
+        observed_value_label: str,
+        predicted_value_label: str,
+        thresholds: typing.Mapping[typing.Tuple[typing.Hashable, ...], typing.Sequence[Threshold]],
+        weight: NUMBER = None,
+        metadata_fields: typing.Sequence[str] = None
+    ) -> typing.Dict[typing.Tuple[typing.Hashable, ...], MetricResults]:
+        """
+        Scores every group of pairs at once rather than one group at a time
+
+        Results match those of calling `score` on each group individually
+
+        Args:
+            pairs: Observations and predictions paired together
+            group_by: The columns used to group pairs together
+            observed_value_label: The name of the column containing observations
+            predicted_value_label: The name of the column containing predictions
+            thresholds: The thresholds to apply to each group, keyed by the group's identifier
+            weight: The weight of the results for each group
+            metadata_fields: Names for each member of a group identifier used when describing results
+
+        Returns:
+            The results for each group that had thresholds, keyed by the group's identifier
+        """
+        if len(self.__metrics) == 0:
+            raise ValueError(
+                "No metrics were attached to the scoring scheme - values cannot be scored and aggregated"
+            )
+
+        from . import batch
+
+        def score_group(group, observed_label, predicted_label, group_thresholds, metadata, truth_tables):
+            return self.score(
+                group,
+                observed_label,
+                predicted_label,
+                group_thresholds,
+                weight=weight,
+                metadata=metadata,
+                truth_tables=truth_tables
+            )
+
+        return batch.score_groups(
+            metrics=self.__metrics,
+            pairs=pairs,
+            group_by=group_by,
+            observed_value_label=observed_value_label,
+            predicted_value_label=predicted_value_label,
+            thresholds=thresholds,
+            score_group=score_group,
+            weight=weight,
+            metadata_fields=metadata_fields,
+            communicators=self.__communicators,
+            metric_timings=self.__metric_timings
+        )
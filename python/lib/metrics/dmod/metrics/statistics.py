@@ -0,0 +1,303 @@
+"""
+Defines structures that share filtered pairs and the statistics derived from them between metrics
+
+Many metrics filter the same pairs by the same thresholds and then calculate the same means, deviations, and sums.
+A `PairStatistics` instance holds those results for a single set of pairs so that each threshold is applied once
+and each statistic is calculated once, regardless of how many metrics need them.
+"""
+import typing
+
+import numpy
+import pandas
+import sklearn.metrics
+
+from .threshold import Threshold
+
+NUMBER = typing.Union[int, float]
+
+
+class ThresholdStatistics:
+    """
+    Values that passed a single threshold along with lazily calculated statistics about them
+
+    Statistics follow the conventions of the pandas operations that metrics previously used, so missing values
+    are skipped for means, deviations, and sums, and standard deviations use one degree of freedom
+    """
+    def __init__(
+        self,
+        observed_values: numpy.ndarray,
+        predicted_values: numpy.ndarray,
+        index: pandas.Index
+    ):
+        """
+        Constructor
+
+        Args:
+            observed_values: The observations that passed the threshold
+            predicted_values: The predictions that passed the threshold
+            index: The index that the pairs would bear once filtered by the threshold
+        """
+        self.__observed_values = observed_values
+        self.__predicted_values = predicted_values
+        self.__index = index
+        self.__values: typing.Dict[str, typing.Any] = dict()
+
+    def __get(self, name: str, calculate: typing.Callable[[], typing.Any]) -> typing.Any:
+        if name not in self.__values:
+            with numpy.errstate(all="ignore"):
+                self.__values[name] = calculate()
+        return self.__values[name]
+
+    @property
+    def index(self) -> pandas.Index:
+        """
+        The index that the pairs would bear once filtered by the threshold
+
+        Filtering pairs resets their index, so this is the position of each passing pair within the original pairs if
+        the threshold could remove anything and the original index of the pairs if it could not
+        """
+        return self.__index
+
+    @property
+    def empty(self) -> bool:
+        return self.size == 0
+
+    @property
+    def size(self) -> int:
+        """
+        The number of pairs that passed the threshold
+        """
+        return len(self.__observed_values)
+
+    @property
+    def observed_values(self) -> numpy.ndarray:
+        return self.__observed_values
+
+    @property
+    def predicted_values(self) -> numpy.ndarray:
+        return self.__predicted_values
+
+    @property
+    def observed_count(self) -> int:
+        """
+        The number of observations that have values
+        """
+        return self.__get("observed_count", lambda: int(numpy.count_nonzero(~numpy.isnan(self.observed_values))))
+
+    @property
+    def predicted_count(self) -> int:
+        """
+        The number of predictions that have values
+        """
+        return self.__get("predicted_count", lambda: int(numpy.count_nonzero(~numpy.isnan(self.predicted_values))))
+
+    @property
+    def observed_mean(self) -> float:
+        return self.__get("observed_mean", lambda: _mean(self.observed_values, self.observed_count))
+
+    @property
+    def predicted_mean(self) -> float:
+        return self.__get("predicted_mean", lambda: _mean(self.predicted_values, self.predicted_count))
+
+    @property
+    def observed_sum_of_squares(self) -> float:
+        """
+        The sum of the squared differences between each observation and the mean observation
+        """
+        return self.__get(
+            "observed_sum_of_squares",
+            lambda: numpy.nansum((self.observed_values - self.observed_mean) ** 2)
+        )
+
+    @property
+    def predicted_sum_of_squares(self) -> float:
+        """
+        The sum of the squared differences between each prediction and the mean prediction
+        """
+        return self.__get(
+            "predicted_sum_of_squares",
+            lambda: numpy.nansum((self.predicted_values - self.predicted_mean) ** 2)
+        )
+
+    @property
+    def observed_standard_deviation(self) -> float:
+        return self.__get(
+            "observed_standard_deviation",
+            lambda: _standard_deviation(self.observed_sum_of_squares, self.observed_count)
+        )
+
+    @property
+    def predicted_standard_deviation(self) -> float:
+        return self.__get(
+            "predicted_standard_deviation",
+            lambda: _standard_deviation(self.predicted_sum_of_squares, self.predicted_count)
+        )
+
+    @property
+    def sum_of_squared_error(self) -> float:
+        """
+        The sum of the squared differences between each observation and its prediction
+        """
+        return self.__get(
+            "sum_of_squared_error",
+            lambda: numpy.nansum((self.observed_values - self.predicted_values) ** 2)
+        )
+
+    @property
+    def pearson_correlation_coefficient(self) -> float:
+        """
+        The linear correlation between the observations and predictions
+        """
+        def calculate() -> float:
+            if self.empty:
+                return numpy.nan
+            return numpy.corrcoef(self.observed_values, self.predicted_values)[0][1]
+
+        return self.__get("pearson_correlation_coefficient", calculate)
+
+    @property
+    def volume_error(self) -> float:
+        """
+        The difference between the area under the predictions and the area under the observations, positioned
+        along the integer value of the index
+        """
+        def calculate() -> float:
+            if self.empty:
+                return 0
+            x_values: numpy.ndarray = self.index.values.astype("int")
+            area_under_observations = sklearn.metrics.auc(x_values, self.observed_values)
+            area_under_predictions = sklearn.metrics.auc(x_values, self.predicted_values)
+            return area_under_predictions - area_under_observations
+
+        return self.__get("volume_error", calculate)
+
+
+def _mean(values: numpy.ndarray, count: int) -> float:
+    if count == 0:
+        return numpy.nan
+    return numpy.nansum(values) / count
+
+
+def _standard_deviation(sum_of_squares: float, count: int) -> float:
+    if count < 2:
+        return numpy.nan
+    return numpy.sqrt(sum_of_squares / (count - 1))
+
+
+class PairStatistics:
+    """
+    A cache of threshold masks and statistics for a single set of pairs
+
+    Thresholds are applied to NumPy views of the observed and predicted values, so filtered copies of the whole
+    set of pairs are never built unless a threshold needs to transform the data first
+    """
+    @classmethod
+    def for_pairs(
+        cls,
+        statistics: typing.Optional["PairStatistics"],
+        pairs: pandas.DataFrame,
+        observed_value_label: str,
+        predicted_value_label: str
+    ) -> "PairStatistics":
+        """
+        Get statistics that may be used for the given pairs, reusing the passed statistics if they describe them
+
+        Args:
+            statistics: Previously built statistics
+            pairs: The pairs that need statistics
+            observed_value_label: The name of the column containing observations
+            predicted_value_label: The name of the column containing predictions
+
+        Returns:
+            Statistics that describe the given pairs
+        """
+        if statistics is not None and statistics.describes(pairs, observed_value_label, predicted_value_label):
+            return statistics
+        return cls(pairs, observed_value_label, predicted_value_label)
+
+    def __init__(self, pairs: pandas.DataFrame, observed_value_label: str, predicted_value_label: str):
+        """
+        Constructor
+
+        Args:
+            pairs: Observations and predictions paired together
+            observed_value_label: The name of the column containing observations
+            predicted_value_label: The name of the column containing predictions
+        """
+        self.__pairs = pairs
+        self.__observed_value_label = observed_value_label
+        self.__predicted_value_label = predicted_value_label
+        self.__observed_values: typing.Optional[numpy.ndarray] = None
+        self.__predicted_values: typing.Optional[numpy.ndarray] = None
+        self.__masks: typing.Dict[Threshold, numpy.ndarray] = dict()
+        self.__statistics: typing.Dict[Threshold, ThresholdStatistics] = dict()
+
+    def describes(self, pairs: pandas.DataFrame, observed_value_label: str, predicted_value_label: str) -> bool:
+        """
+        Whether these statistics were built for the given pairs and labels
+        """
+        return self.__pairs is pairs \
+            and self.__observed_value_label == observed_value_label \
+            and self.__predicted_value_label == predicted_value_label
+
+    @property
+    def observed_values(self) -> numpy.ndarray:
+        if self.__observed_values is None:
+            self.__observed_values = self.__pairs[self.__observed_value_label].to_numpy(
+                dtype=float,
+                na_value=numpy.nan
+            )
+        return self.__observed_values
+
+    @property
+    def predicted_values(self) -> numpy.ndarray:
+        if self.__predicted_values is None:
+            self.__predicted_values = self.__pairs[self.__predicted_value_label].to_numpy(
+                dtype=float,
+                na_value=numpy.nan
+            )
+        return self.__predicted_values
+
+    def mask(self, threshold: Threshold) -> numpy.ndarray:
+        """
+        Get which pairs pass the given threshold, only computing it the first time it is requested
+
+        Args:
+            threshold: The threshold to apply
+
+        Returns:
+            An array of booleans indicating whether each pair passes the threshold
+        """
+        if threshold not in self.__masks:
+            self.__masks[threshold] = threshold.mask(self.__pairs)
+        return self.__masks[threshold]
+
+    def __build_statistics(self, threshold: Threshold) -> ThresholdStatistics:
+        if threshold.transformation_function:
+            filtered_pairs = threshold(self.__pairs)
+            return ThresholdStatistics(
+                filtered_pairs[self.__observed_value_label].to_numpy(dtype=float, na_value=numpy.nan),
+                filtered_pairs[self.__predicted_value_label].to_numpy(dtype=float, na_value=numpy.nan),
+                filtered_pairs.index
+            )
+
+        if not threshold.filters_values:
+            return ThresholdStatistics(self.observed_values, self.predicted_values, self.__pairs.index)
+
+        mask = self.mask(threshold)
+        return ThresholdStatistics(
+            self.observed_values[mask],
+            self.predicted_values[mask],
+            pandas.Index(numpy.flatnonzero(mask))
+        )
+
+    def __getitem__(self, threshold: Threshold) -> ThresholdStatistics:
+        if threshold not in self.__statistics:
+            self.__statistics[threshold] = self.__build_statistics(threshold)
+        return self.__statistics[threshold]
+
+    def __contains__(self, threshold: Threshold) -> bool:
+        return threshold in self.__statistics
+
+    def __len__(self) -> int:
+        return len(self.__statistics)
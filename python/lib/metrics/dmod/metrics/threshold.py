@@ -138,6 +138,63 @@ class ValueFilter(typing.Callable[[PANDAS_DATA], PANDAS_DATA]):
         self._threshold_value = threshold_value
         self._threshold_is_indexible = threshold_is_indexible
 
+    def align(self, index: pandas.Index) -> numpy.ndarray:
+        """
+        Lines up the threshold value with each entry of an index
+
+        Args:
+            index: The index of the data that will be compared against the threshold
+
+        Returns:
+            An array bearing the threshold value for each entry in the index
+        """
+        if isinstance(self._threshold_value, pandas.Series):
+            return self._threshold_value.reindex(index).to_numpy(dtype=float, na_value=numpy.nan)
+
+        return numpy.broadcast_to(numpy.asarray(self._threshold_value, dtype=float), (len(index),))
+
+    @staticmethod
+    def _get_key_name(key: typing.Union[str, pandas.Series, None]) -> typing.Optional[str]:
+        if key and isinstance(key, str):
+            return key
+        elif key is not None and not isinstance(key, str):
+            return key.name
+        return None
+
+    def mask(self, frame: pandas.DataFrame) -> numpy.ndarray:
+        """
+        Determine which rows of a frame pass the filter without building a new frame
+
+        The mask lines up with the rows of the given frame; filters with a transformation function operate on
+        transformed data, so they cannot be described by a mask over the original rows.
+
+        Args:
+            frame: The data to compare against the threshold value
+
+        Returns:
+            An array of booleans indicating whether each row passes the filter
+        """
+        if self._transformation_function:
+            raise ValueError("A mask cannot be created for a filter that transforms the data it filters")
+
+        observation_key = self._get_key_name(self._observation_key)
+        prediction_key = self._get_key_name(self._prediction_key)
+
+        keep = numpy.ones(len(frame), dtype=bool)
+
+        if not observation_key and not prediction_key:
+            return keep
+
+        threshold_values = self.align(frame.index)
+
+        for key in (observation_key, prediction_key):
+            if key:
+                values = frame[key].to_numpy(dtype=float, na_value=numpy.nan)
+                with numpy.errstate(invalid="ignore"):
+                    keep &= numpy.asarray(self._operator(values, threshold_values), dtype=bool)
+
+        return keep
+
     def filter_series(self, series: pandas.Series) -> pandas.Series:
         """
         Apply the threshold to a single series
@@ -270,9 +327,10 @@ class Threshold(FRAME_FILTER):
         self._observed_value_key = observed_value_key
         self._predicted_value_key = predicted_value_key
         self._transformation_function = transformation_function
-        self._allow = self._build_filter(value, operator)
+        self._operator = operator or Operators.greater_than_or_equal
+        self._allow = self._build_filter(value, self._operator)
 
-    def _build_filter(self, threshold_value: NUMBER, operator: NUMERIC_FILTER = None) -> FRAME_FILTER:
+    def _build_filter(self, threshold_value: NUMBER, operator: NUMERIC_FILTER = None) -> ValueFilter:
         if operator is None:
             operator = Operators.greater_than_or_equal
 
@@ -300,6 +358,68 @@ class Threshold(FRAME_FILTER):
     def weight(self) -> NUMBER:
         return self._weight
 
+    @property
+    def operator(self) -> NUMERIC_FILTER:
+        """
+        The function used to compare values against the threshold
+        """
+        return self._operator
+
+    @property
+    def observed_value_key(self) -> typing.Optional[str]:
+        """
+        The name of the observed values that the threshold is applied to, if it is applied to observations at all
+        """
+        return self._observed_value_key if self._on_observed else None
+
+    @property
+    def predicted_value_key(self) -> typing.Optional[str]:
+        """
+        The name of the predicted values that the threshold is applied to, if it is applied to predictions at all
+        """
+        return self._predicted_value_key if self._on_predicted else None
+
+    @property
+    def filters_values(self) -> bool:
+        """
+        Whether applying the threshold to a set of pairs may remove any of them
+        """
+        return bool(self.observed_value_key or self.predicted_value_key)
+
+    @property
+    def transformation_function(self) -> typing.Optional[INDEX_TRANSFORMATION_FUNCTION]:
+        """
+        A function used to transform data prior to applying the threshold
+        """
+        return self._transformation_function
+
+    def align(self, index: pandas.Index) -> numpy.ndarray:
+        """
+        Lines up the threshold value with each entry of an index
+
+        Args:
+            index: The index of the data that will be compared against the threshold
+
+        Returns:
+            An array bearing the threshold value for each entry in the index
+        """
+        return self._allow.align(index)
+
+    def mask(self, pairs: pandas.DataFrame) -> numpy.ndarray:
+        """
+        Determine which pairs pass the threshold without building a new frame
+
+        `pairs[threshold.mask(pairs)]` holds the same values as `threshold(pairs)` for thresholds that do not
+        transform their data, though the latter resets the index of the pairs whenever values are filtered
+
+        Args:
+            pairs: The data to compare against the threshold
+
+        Returns:
+            An array of booleans indicating whether each pair passes the threshold
+        """
+        return self._allow.mask(pairs)
+
     def __str__(self) -> str:
         return f"{self.name}"
 
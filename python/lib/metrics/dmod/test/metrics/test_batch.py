@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+import typing
+import math
+import unittest
+
+import pandas
+
+from ...metrics import scoring
+from ...metrics import metric as metrics
+from ...metrics.threshold import Threshold
+
+from .test_scoring import get_observations
+from .test_scoring import get_model_data
+from .test_scoring import get_thresholds
+from .test_scoring import OBSERVATION_VALUE_KEY
+from .test_scoring import MODEL_VALUE_KEY
+
+
+def get_all_metrics() -> typing.List[scoring.Metric]:
+    return [
+        metrics.PearsonCorrelationCoefficient(1),
+        metrics.ProbabilityOfDetection(1),
+        metrics.FalseAlarmRatio(1),
+        metrics.Precision(1),
+        metrics.Accuracy(1),
+        metrics.KlingGuptaEfficiency(1),
+        metrics.FrequencyBias(1),
+        metrics.GeneralSkill(1),
+        metrics.EquitableThreatScore(1),
+        metrics.NormalizedNashSutcliffeEfficiency(1),
+        metrics.CriticalSuccessIndex(1),
+        metrics.VolumeError(1),
+        metrics.LinearTemporalTrendAbsoluteError(1),
+    ]
+
+
+class TestBatchScoring(unittest.TestCase):
+    def setUp(self) -> None:
+        observations = get_observations()
+        frames = list()
+
+        for name, data in get_model_data().items():
+            pairs = observations.join(data).dropna(subset=[MODEL_VALUE_KEY])
+            pairs["model"] = name
+            frames.append(pairs)
+
+        self.pairs = pandas.concat(frames)
+        self.thresholds: typing.Sequence[Threshold] = get_thresholds()
+        self.scheme = scoring.ScoringScheme(get_all_metrics())
+
+    def assertResultsEqual(self, expected: scoring.MetricResults, actual: scoring.MetricResults):
+        expected_rows = expected.rows()
+        actual_rows = actual.rows()
+        self.assertEqual(len(expected_rows), len(actual_rows))
+
+        for expected_row, actual_row in zip(expected_rows, actual_rows):
+            self.assertEqual(expected_row['threshold_name'], actual_row['threshold_name'])
+            self.assertEqual(expected_row['metric'], actual_row['metric'])
+
+            message = f"{expected_row['metric']} @ {expected_row['threshold_name']}"
+            if math.isnan(expected_row['result']):
+                self.assertTrue(math.isnan(actual_row['result']), message)
+            else:
+                self.assertAlmostEqual(expected_row['result'], actual_row['result'], places=8, msg=message)
+
+        self.assertAlmostEqual(expected.scaled_value, actual.scaled_value, places=8)
+
+    def test_score_groups_matches_score(self):
+        """
+        Test that scoring every group at once yields the same results as scoring each group separately
+        """
+        thresholds = {(name,): self.thresholds for name in self.pairs['model'].unique()}
+
+        grouped_results = self.scheme.score_groups(
+            pairs=self.pairs,
+            group_by=["model"],
+            observed_value_label=OBSERVATION_VALUE_KEY,
+            predicted_value_label=MODEL_VALUE_KEY,
+            thresholds=thresholds,
+            metadata_fields=["model"]
+        )
+
+        self.assertEqual(len(grouped_results), len(thresholds))
+
+        for identifier, actual in grouped_results.items():
+            group = self.pairs[self.pairs['model'] == identifier[0]]
+            expected = self.scheme.score(
+                pairs=group,
+                observed_value_label=OBSERVATION_VALUE_KEY,
+                predicted_value_label=MODEL_VALUE_KEY,
+                thresholds=self.thresholds,
+                truth_tables=metrics.categorical.TruthTables(
+                    group[OBSERVATION_VALUE_KEY],
+                    group[MODEL_VALUE_KEY],
+                    self.thresholds
+                )
+            )
+            self.assertResultsEqual(expected, actual)
+
+    def test_groups_without_thresholds_are_skipped(self):
+        thresholds = {("Model 1",): self.thresholds}
+
+        grouped_results = self.scheme.score_groups(
+            pairs=self.pairs,
+            group_by=["model"],
+            observed_value_label=OBSERVATION_VALUE_KEY,
+            predicted_value_label=MODEL_VALUE_KEY,
+            thresholds=thresholds
+        )
+
+        self.assertEqual(list(grouped_results.keys()), [("Model 1",)])
+
+    def test_score_groups_requires_metrics(self):
+        with self.assertRaises(ValueError):
+            scoring.ScoringScheme().score_groups(
+                pairs=self.pairs,
+                group_by=["model"],
+                observed_value_label=OBSERVATION_VALUE_KEY,
+                predicted_value_label=MODEL_VALUE_KEY,
+                thresholds={}
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+import unittest
+
+import numpy
+import pandas
+
+from ...metrics import categorical
+from ...metrics.threshold import Threshold
+
+from .test_metrics import get_thresholds
+from .test_metrics import OBSERVATION_DATA_PATH
+from .test_metrics import MODEL_DATA_PATH
+from .test_metrics import OBSERVATION_VALUE_KEY
+from .test_metrics import MODEL_VALUE_KEY
+
+
+class TestTruthTablesFromArrays(unittest.TestCase):
+    def setUp(self) -> None:
+        observations = pandas.read_csv(OBSERVATION_DATA_PATH, index_col="date", parse_dates=["date"])
+        model = pandas.read_csv(MODEL_DATA_PATH, index_col="date", parse_dates=["date"])
+        self.pairs = observations.join(model).dropna(subset=[MODEL_VALUE_KEY])
+        self.thresholds = get_thresholds()
+
+    def test_from_arrays_matches_crosstab(self):
+        expected = categorical.TruthTables(
+            self.pairs[OBSERVATION_VALUE_KEY],
+            self.pairs[MODEL_VALUE_KEY],
+            self.thresholds
+        )
+        actual = categorical.TruthTables.from_arrays(
+            self.pairs[OBSERVATION_VALUE_KEY].to_numpy(),
+            self.pairs[MODEL_VALUE_KEY].to_numpy(),
+            self.thresholds
+        )
+
+        self.assertListEqual(list(expected.keys()), list(actual.keys()))
+
+        for name in expected:
+            self.assertEqual(expected[name].hits(), actual[name].hits())
+            self.assertEqual(expected[name].misses(), actual[name].misses())
+            self.assertEqual(expected[name].false_positives(), actual[name].false_positives())
+            self.assertEqual(expected[name].true_negatives(), actual[name].true_negatives())
+            self.assertEqual(len(expected[name]), len(actual[name]))
+
+        pandas.testing.assert_frame_equal(expected.metrics, actual.metrics)
+
+    def test_tables_are_created_when_requested(self):
+        tables = categorical.TruthTables.from_arrays(
+            self.pairs[OBSERVATION_VALUE_KEY].to_numpy(),
+            self.pairs[MODEL_VALUE_KEY].to_numpy(),
+            self.thresholds
+        )
+
+        self.assertEqual(len(tables), len(self.thresholds))
+        self.assertIn("Minor", tables)
+        self.assertIs(tables.Minor, tables["Minor"])
+        self.assertIs(tables["Major"], tables["Major"])
+
+    def test_threshold_matrix(self):
+        observations = numpy.array([1.0, 5.0, 3.0, numpy.nan, 7.0])
+        predictions = numpy.array([2.0, 4.0, 1.0, 6.0, numpy.nan])
+        thresholds = [
+            Threshold(name="Low", value=0, weight=1, observed_value_key="observed"),
+            Threshold(name="Rising", value=0, weight=1, observed_value_key="observed"),
+        ]
+        threshold_values = numpy.array([
+            [2.0, 2.0, 2.0, 2.0, 2.0],
+            [1.0, 6.0, 2.0, 5.0, 5.0],
+        ])
+
+        counts = categorical.count_contingencies(observations, predictions, thresholds, threshold_values)
+
+        # Low: observed events (F, T, T, F, T), predicted events (T, T, F, T, F)
+        # Rising: observed events (T, F, T, F, T), predicted events (T, F, F, T, F)
+        numpy.testing.assert_array_equal(counts, [[1, 2, 2, 0], [1, 2, 1, 1]])
+
+        tables = categorical.TruthTables.from_arrays(observations, predictions, thresholds, threshold_values)
+        self.assertEqual(tables["Rising"].true_negatives(), 1)
+        self.assertEqual(tables["Low"].misses(), 2)
+
+    def test_no_thresholds(self):
+        with self.assertRaises(ValueError):
+            categorical.TruthTables.from_arrays(numpy.array([1.0]), numpy.array([1.0]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
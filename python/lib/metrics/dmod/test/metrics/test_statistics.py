@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import unittest
+
+import numpy
+import pandas
+
+from ...metrics.threshold import Threshold
+from ...metrics.statistics import PairStatistics
+
+
+class TestPairStatistics(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pairs = pandas.DataFrame(
+            {
+                "observed": [1.0, 4.0, 2.5, 8.0, numpy.nan, 6.0, 3.0],
+                "predicted": [1.5, 3.0, 2.0, 9.5, 4.0, numpy.nan, 2.0],
+            },
+            index=pandas.date_range("2023-01-01", periods=7, freq="H")
+        )
+        self.statistics = PairStatistics(self.pairs, "observed", "predicted")
+        self.threshold = Threshold(
+            name="Minor", value=2.0, weight=1, observed_value_key="observed", predicted_value_key="predicted"
+        )
+
+    def test_statistics_match_pandas(self):
+        threshold_statistics = self.statistics[self.threshold]
+        filtered_pairs = self.threshold(self.pairs)
+        observed = filtered_pairs["observed"]
+        predicted = filtered_pairs["predicted"]
+
+        self.assertEqual(threshold_statistics.size, len(filtered_pairs))
+        self.assertListEqual(threshold_statistics.index.to_list(), filtered_pairs.index.to_list())
+        self.assertAlmostEqual(threshold_statistics.observed_mean, observed.mean())
+        self.assertAlmostEqual(threshold_statistics.predicted_mean, predicted.mean())
+        self.assertAlmostEqual(threshold_statistics.observed_standard_deviation, observed.std())
+        self.assertAlmostEqual(threshold_statistics.predicted_standard_deviation, predicted.std())
+        self.assertAlmostEqual(threshold_statistics.sum_of_squared_error, ((observed - predicted) ** 2).sum())
+        self.assertAlmostEqual(
+            threshold_statistics.observed_sum_of_squares,
+            ((observed - observed.mean()) ** 2).sum()
+        )
+
+        expected_correlation = numpy.corrcoef(observed, predicted)[0][1]
+        self.assertTrue(numpy.isnan(expected_correlation))
+        self.assertTrue(numpy.isnan(threshold_statistics.pearson_correlation_coefficient))
+
+    def test_thresholds_are_applied_once(self):
+        first = self.statistics[self.threshold]
+        second = self.statistics[self.threshold]
+
+        self.assertIs(first, second)
+        self.assertIs(self.statistics.mask(self.threshold), self.statistics.mask(self.threshold))
+        self.assertEqual(len(self.statistics), 1)
+
+    def test_for_pairs(self):
+        reused = PairStatistics.for_pairs(self.statistics, self.pairs, "observed", "predicted")
+        self.assertIs(reused, self.statistics)
+
+        other_pairs = self.pairs.copy()
+        rebuilt = PairStatistics.for_pairs(self.statistics, other_pairs, "observed", "predicted")
+        self.assertIsNot(rebuilt, self.statistics)
+
+        rebuilt = PairStatistics.for_pairs(None, self.pairs, "observed", "predicted")
+        self.assertIsNot(rebuilt, self.statistics)
+
+    def test_empty_threshold(self):
+        threshold = Threshold(name="Record", value=100, weight=1, observed_value_key="observed")
+        threshold_statistics = self.statistics[threshold]
+
+        self.assertTrue(threshold_statistics.empty)
+        self.assertEqual(threshold_statistics.size, 0)
+        self.assertTrue(numpy.isnan(threshold_statistics.observed_mean))
+        self.assertTrue(numpy.isnan(threshold_statistics.pearson_correlation_coefficient))
+
+
+if __name__ == "__main__":
+    unittest.main()
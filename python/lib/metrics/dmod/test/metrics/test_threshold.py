@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import unittest
+
+import numpy
+import pandas
+
+from ...metrics.threshold import Threshold
+from ...metrics.threshold import Operators
+
+
+class TestThresholdMask(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pairs = pandas.DataFrame(
+            {
+                "observed": [1.0, 4.0, 2.5, 8.0, numpy.nan, 6.0],
+                "predicted": [1.5, 3.0, 2.0, 9.5, 4.0, 1.0],
+            },
+            index=pandas.Index([10, 11, 12, 13, 14, 15], name="day")
+        )
+
+    def assertMaskMatchesFilter(self, threshold: Threshold):
+        mask = threshold.mask(self.pairs)
+        filtered_pairs = threshold(self.pairs)
+
+        self.assertEqual(mask.dtype, bool)
+        self.assertEqual(len(mask), len(self.pairs))
+        self.assertListEqual(
+            self.pairs[mask]["observed"].to_list(),
+            filtered_pairs["observed"].to_list()
+        )
+        self.assertListEqual(
+            self.pairs[mask]["predicted"].to_list(),
+            filtered_pairs["predicted"].to_list()
+        )
+
+    def test_scalar_threshold(self):
+        threshold = Threshold(name="Minor", value=2.5, weight=1, observed_value_key="observed")
+        self.assertMaskMatchesFilter(threshold)
+        self.assertListEqual(threshold.mask(self.pairs).tolist(), [False, True, True, True, False, True])
+
+    def test_threshold_on_both_values(self):
+        threshold = Threshold(
+            name="Both",
+            value=3,
+            weight=1,
+            on_predicted=True,
+            observed_value_key="observed",
+            predicted_value_key="predicted",
+            operator=Operators.greater_than
+        )
+        self.assertMaskMatchesFilter(threshold)
+        self.assertListEqual(threshold.mask(self.pairs).tolist(), [False, False, False, True, False, False])
+
+    def test_indexed_threshold(self):
+        values = pandas.Series([1, 5, 2, 10, 0, 7], index=self.pairs.index, name="daily_threshold")
+        threshold = Threshold(name="Daily", value=values, weight=1, observed_value_key="observed")
+        self.assertMaskMatchesFilter(threshold)
+        self.assertListEqual(threshold.mask(self.pairs).tolist(), [True, False, True, False, False, False])
+
+    def test_threshold_without_keys(self):
+        mask = Threshold.default().mask(self.pairs)
+        self.assertTrue(mask.all())
+        self.assertEqual(len(mask), len(self.pairs))
+
+    def test_transformation_cannot_be_masked(self):
+        threshold = Threshold(
+            name="Transformed",
+            value=1,
+            weight=1,
+            observed_value_key="observed",
+            transformation_function=lambda frame, observation_key, prediction_key: frame
+        )
+        self.assertRaises(ValueError, threshold.mask, self.pairs)
+
+
+if __name__ == "__main__":
+    unittest.main()
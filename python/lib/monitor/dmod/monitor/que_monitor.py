@@ -3,12 +3,10 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 import logging
 from typing import Dict, List, Optional, Set, Tuple
-import json
 import docker
 from docker.models.services import Service
-from dmod.redis import RedisBacked
 from dmod.scheduler.job import Job, JobStatus, JobExecStep
-from dmod.scheduler.job.job_manager import RedisBackedJobManager
+from dmod.scheduler.job.job_util import RedisBackedJobUtil
 
 MAX_JOBS = 210
 Max_Redis_Init = 5
@@ -383,20 +381,18 @@ class DockerSwarmMonitor(Monitor, ABC):
         return previous_status, updated_job_status
 
 
-class RedisBackedMonitor(Monitor, RedisBacked, ABC):
+class RedisBackedMonitor(Monitor, RedisBackedJobUtil, ABC):
     """
-    Subtype of ::class:`Monitor` and ::class:`RedisBacked` that determines jobs to monitor from Redis.
+    Subtype of ::class:`Monitor` and ::class:`RedisBackedJobUtil` that determines jobs to monitor from Redis.
+
+    Job records are read the same way as by the job manager, so records in either the JSON or the compact format can be
+    monitored.
     """
     def __init__(self, resource_pool: str,
                  redis_host: Optional[str] = None, redis_port: Optional[int] = None,
                  redis_pass: Optional[str] = None, **kwargs):
-        RedisBacked.__init__(self=self, resource_pool=resource_pool, redis_host=redis_host,
-                             redis_port=redis_port, redis_pass=redis_pass, **kwargs)
-        if 'type' in kwargs:
-            key_prefix = RedisBackedJobManager.get_key_prefix(environment_type=kwargs['type'])
-        else:
-            key_prefix = RedisBackedJobManager.get_key_prefix()
-        self._active_jobs_set_key = self.keynamehelper.create_key_name(key_prefix, 'active_jobs')
+        RedisBackedJobUtil.__init__(self, resource_pool=resource_pool, redis_host=redis_host, redis_port=redis_port,
+                                    redis_pass=redis_pass, **kwargs)
 
     def get_jobs_to_monitor(self) -> List[Job]:
         """
@@ -410,15 +406,7 @@ class RedisBackedMonitor(Monitor, RedisBacked, ABC):
         List[Job]
             A list of the job objects corresponding to executing jobs within the runtime that need to be monitored.
         """
-        active_jobs = []
-        for active_job_redis_key in self.redis.smembers(self._active_jobs_set_key):
-            # If key exists
-            if self.redis.exists(active_job_redis_key) == 1:
-                serialized_job = json.loads(self.redis.get(active_job_redis_key))
-                job = Job.factory_init_from_deserialized_json(serialized_job)
-                if isinstance(job, Job):
-                    active_jobs.append(job)
-        return active_jobs
+        return self.get_all_active_jobs()
 
 
 class RedisDockerSwarmMonitor(DockerSwarmMonitor, RedisBackedMonitor):
@@ -1,5 +1,10 @@
+import os
 import unittest
 from ..monitor import que_monitor as qm
+from dmod.communication import NWMRequest
+from dmod.scheduler.job.job import JobExecPhase, JobExecStep, JobStatus, RequestedJob, SchedulerRequestMessage
+from dmod.scheduler.job.job_util import RedisBackedJobUtil
+from uuid import UUID
 
 
 # TODO: rework testing here with two mock subtypes (separate for Docker and Redis testing)
@@ -38,3 +43,62 @@ class IntegrationTestRedisManager(unittest.TestCase):
 
     def tearDown(self) -> None:
         pass
+
+
+class _RedisBackedTestMonitor(qm.RedisBackedMonitor):
+    """
+    Minimal concrete ::class:`RedisBackedMonitor` for testing which jobs are monitored, without a Docker runtime.
+    """
+
+    def monitor_job(self, job):
+        return None
+
+
+class IntegrationTestRedisBackedMonitor(unittest.TestCase):
+    """
+    Tests of how the ::class:`RedisBackedMonitor` reads the jobs to monitor from Redis.
+    """
+
+    def setUp(self) -> None:
+        self.redis_params = {'redis_host': '127.0.0.1', 'redis_port': os.getenv('IT_REDIS_CONTAINER_HOST_PORT'),
+                             'redis_pass': os.getenv('IT_REDIS_CONTAINER_PASS'), 'type': 'dev'}
+        self.monitor = _RedisBackedTestMonitor(resource_pool='test_pool', **self.redis_params)
+
+        request = SchedulerRequestMessage(
+            model_request=NWMRequest.factory_init_from_deserialized_json(
+                {"model": {"nwm": {"config_data_id": "0", "data_requirements": [{"domain": {
+                    "data_format": "NWM_CONFIG", "continuous": [], "discrete": [{"variable": "data_id", "values": ["0"]}]},
+                    "is_input": True,
+                    "category": "CONFIG"}]}},
+                 "session-secret": "f21f27ac3d443c0948aab924bddefc64891c455a756ca77a4d86ec2f697cd13c"}),
+            user_id='someone',
+            cpus=4,
+            mem=500000,
+            allocation_paradigm='single-node')
+        self.job = RequestedJob(request)
+        self.job.job_id = UUID('00000000-0000-0000-0000-000000000000')
+        self.job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.SCHEDULED)
+
+    def tearDown(self) -> None:
+        self.monitor.redis.flushdb()
+
+    # Test jobs saved as compact records are monitored, with the state saved separately from the rest of the record
+    def test_get_jobs_to_monitor_1_a(self):
+        job_util = RedisBackedJobUtil(compact_job_records=True, **self.redis_params)
+        job_util.save_job(self.job)
+        self.job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.RUNNING)
+        job_util.save_job(self.job)
+
+        jobs = self.monitor.get_jobs_to_monitor()
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0].to_dict(), self.job.to_dict())
+        self.assertEqual(jobs[0].status_step, JobExecStep.RUNNING)
+
+    # Test jobs saved as JSON records are monitored
+    def test_get_jobs_to_monitor_1_b(self):
+        job_util = RedisBackedJobUtil(**self.redis_params)
+        job_util.save_job(self.job)
+
+        jobs = self.monitor.get_jobs_to_monitor()
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0].to_dict(), self.job.to_dict())
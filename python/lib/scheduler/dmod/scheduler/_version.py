@@ -1 +1 @@
-__version__ = '0.10.0'
+__version__ = '0.11.0'
\ No newline at end of file
@@ -19,6 +19,12 @@ if TYPE_CHECKING:
 
 import logging
 
+try:
+    import msgpack
+except ImportError:
+    # Only needed for the optional compact serialization of jobs
+    msgpack = None
+
 
 class JobExecStep(Enum):
     """
@@ -680,8 +686,67 @@ class JobImpl(Job):
     Basic implementation of ::class:`Job`
 
     Job ids are simply the string cast of generated UUID values, stored within the ::attribute:`job_uuid` property.
+
+    In addition to JSON, instances support a compact serialization split into two parts:  a ``msgpack`` encoded
+    payload of everything that rarely changes, and a small mapping of the frequently changing "state" values (see
+    ::attribute:`COMPACT_STATE_KEYS`).  This allows records to be kept so that status changes only rewrite the state.
+    The payload is a ``msgpack`` array of the schema version (::attribute:`COMPACT_SCHEMA_VERSION`) and the payload
+    dictionary.
     """
 
+    COMPACT_SCHEMA_VERSION = 1
+    """ The current version of the schema for compactly serialized job payloads. """
+    COMPACT_STATE_KEYS = ('status', 'allocation_priority', 'last_updated')
+    """ Keys of the serialized values that are kept apart from the payload in compact serialization. """
+
+    @classmethod
+    def factory_init_from_compact_serialization(cls, payload: bytes, state: Dict[str, str]):
+        """
+        Factory create a new instance of this type from the parts of a compact serialization.
+
+        Parameters
+        ----------
+        payload : bytes
+            The ``msgpack`` encoded payload, containing the schema version and the values that rarely change.
+        state : Dict[str, str]
+            The frequently changing state values.
+
+        Returns
+        -------
+        A new object of this type instantiated from the compactly serialized parts.
+
+        Raises
+        -------
+        RuntimeError
+            If the ``msgpack`` package is not installed.
+        ValueError
+            If the payload was serialized with an unsupported schema version.
+
+        See Also
+        -------
+        to_compact_serialization
+        """
+        if msgpack is None:
+            raise RuntimeError("Compact serialization of {} objects requires 'msgpack'".format(cls.__name__))
+        schema_version, json_obj = msgpack.unpackb(payload, raw=False)
+        if schema_version != cls.COMPACT_SCHEMA_VERSION:
+            msg = "Unsupported schema version {} for compactly serialized {} (expected {})"
+            raise ValueError(msg.format(schema_version, cls.__name__, cls.COMPACT_SCHEMA_VERSION))
+        json_obj.update(state)
+        return cls.factory_init_from_deserialized_json(json_obj)
+
+    @classmethod
+    def is_compact_serialization_supported(cls) -> bool:
+        """
+        Get whether compact serialization is supported, which requires the optional ``msgpack`` package.
+
+        Returns
+        -------
+        bool
+            Whether compact serialization is supported.
+        """
+        return msgpack is not None
+
     @classmethod
     def _parse_serialized_allocation_paradigm(cls, json_obj: dict, key: str):
         paradigm = AllocationParadigm.get_from_name(name=json_obj[key], strict=True) if key in json_obj else None
@@ -1290,6 +1355,35 @@ class JobImpl(Job):
 
         return serial
 
+    def to_compact_serialization(self) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Get the compact serialization of this instance, split into its payload and its frequently changing state.
+
+        The serialized values are the same as those from ::method:`to_dict`.  Those with keys in
+        ::attribute:`COMPACT_STATE_KEYS` are converted to strings and returned separately, and the rest are encoded
+        with ``msgpack`` along with the current ::attribute:`COMPACT_SCHEMA_VERSION`.
+
+        Returns
+        -------
+        Tuple[bytes, Dict[str, str]]
+            The ``msgpack`` encoded payload and the mapping of state values.
+
+        Raises
+        -------
+        RuntimeError
+            If the ``msgpack`` package is not installed.
+
+        See Also
+        -------
+        factory_init_from_compact_serialization
+        """
+        if msgpack is None:
+            msg = "Compact serialization of {} objects requires 'msgpack'"
+            raise RuntimeError(msg.format(self.__class__.__name__))
+        serial = self.to_dict()
+        state = {key: str(serial.pop(key)) for key in self.COMPACT_STATE_KEYS if key in serial}
+        return msgpack.packb([self.COMPACT_SCHEMA_VERSION, serial], use_bin_type=True), state
+
 
 class RequestedJob(JobImpl):
     """
@@ -1,12 +1,11 @@
 import uuid
 from abc import ABC, abstractmethod
-from asyncio import sleep
 from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID, uuid4 as random_uuid
-from dmod.core.execution import AllocationParadigm
 from dmod.communication.maas_request.dmod_job_request import DmodJobRequest
 from .job import Job, JobExecPhase, JobExecStep, JobStatus, RequestedJob
 from .job_util import JobUtil, RedisBackedJobUtil
+from ..resources.allocation_strategy import get_allocation_strategy
 from ..resources.resource_allocation import ResourceAllocation
 from ..resources.resource_manager import ResourceManager
 from ..scheduler import Launcher
@@ -231,6 +230,13 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
     scheduling and execution.
     """
 
+    _STEPS_MANAGED_ELSEWHERE = (JobExecStep.AWAITING_DATA_CHECK, JobExecStep.AWAITING_PARTITIONING,
+                                JobExecStep.AWAITING_DATA)
+    """ Job steps at which jobs are handled by other services, and so aren't locked by the manager. """
+
+    _STEPS_AWAITING_ALLOCATION = (JobExecStep.AWAITING_ALLOCATION, JobExecStep.STOPPED)
+    """ Job steps at which jobs may be allocated resources during a pass. """
+
     @classmethod
     def build_prioritized_pending_allocation_queues(cls, jobs_eligible_for_allocate: List[RequestedJob]) -> Dict[
             str, List[Tuple[int, RequestedJob]]]:
@@ -414,7 +420,7 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
         # Then at the end, bump priorities for skipped
         for j in priorities_to_bump:
             j.allocation_priority = j.allocation_priority + 1
-            self.save_job(j)
+        self.save_jobs(priorities_to_bump)
         return allocated_successfully
 
     def create_job(self, request: SchedulerRequestMessage, *args, **kwargs) -> RequestedJob:
@@ -456,7 +462,8 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
             job_uuid = random_uuid()
 
         job_obj.job_id = job_uuid
-        self.save_job(job_obj)
+        # Announce new jobs without a source, so that this instance also reacts to them immediately
+        self._save_job(job_obj, event_source='')
         return job_obj
 
     def delete_job(self, job_id) -> bool:
@@ -498,8 +505,12 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
                 if job_obj.status.is_active:
                     # Make sure not in active set
                     pipeline.srem(self._active_jobs_set_key, job_key)
-                pipeline.delete(job_key)
+                pipeline.delete(job_key, self._get_job_state_key(job_key))
+                pipeline.hdel(self._job_versions_hash_key, job_key)
                 pipeline.execute()
+                self._job_payload_digests.pop(job_key, None)
+                if self._job_cache is not None:
+                    self._job_cache.pop(job_key, None)
                 # Try to do this, but don't fully fail just for this part
                 try:
                     job_obj.rsa_key_pair.delete_key_files()
@@ -526,75 +537,148 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
         logging.debug("Failed to start job")
         return False, ()
 
+    def _lock_jobs_to_manage(self, jobs: List[RequestedJob], lock_id: str) -> List[RequestedJob]:
+        """
+        Lock those of the given active jobs this manager may act upon, returning freshly retrieved objects for those
+        locked.
+
+        Jobs at steps handled by other services are left alone, as are jobs locked elsewhere, which will be considered
+        again on a later pass.  The locks are acquired, and the jobs reloaded, with a single round trip to Redis each.
+
+        Parameters
+        ----------
+        jobs : List[RequestedJob]
+            The active jobs to consider.
+        lock_id : str
+            The unique identifier for the acquired locks.
+
+        Returns
+        -------
+        List[RequestedJob]
+            The locked jobs.
+        """
+        locked_job_ids = self._lock_jobs([j.job_id for j in jobs if j.status_step not in self._STEPS_MANAGED_ELSEWHERE],
+                                         lock_id)
+        # Reload, as the jobs may have changed before the locks were acquired
+        reloaded = self._retrieve_jobs_by_redis_keys([self._get_job_key_for_id(i) for i in locked_job_ids])
+        deleted_job_ids = [job_id for job_id, job in zip(locked_job_ids, reloaded) if job is None]
+        if len(deleted_job_ids) > 0:
+            self._unlock_jobs(deleted_job_ids, lock_id)
+        return [job for job in reloaded if job is not None]
+
+    def _manage_jobs(self, jobs: List[RequestedJob]) -> bool:
+        """
+        Lock and process those of the given jobs this manager may act upon, keeping them locked only for the pass.
+
+        Parameters
+        ----------
+        jobs : List[RequestedJob]
+            The active jobs to consider.
+
+        Returns
+        -------
+        bool
+            Whether any allocations were released during the pass.
+        """
+        lock_id = str(uuid.uuid4())
+        active_jobs: List[RequestedJob] = self._lock_jobs_to_manage(jobs, lock_id)
+        try:
+            # Allocation priorities only hold when every waiting job is considered together, so when any of these jobs
+            # may be allocated, also bring in whatever other jobs are already waiting for allocation
+            if any(j.status_step in self._STEPS_AWAITING_ALLOCATION for j in active_jobs):
+                locked_job_ids = set(j.job_id for j in active_jobs)
+                waiting_jobs = [j for j in self.get_all_active_jobs()
+                                if j.status_step in self._STEPS_AWAITING_ALLOCATION and j.job_id not in locked_job_ids]
+                active_jobs.extend(self._lock_jobs_to_manage(waiting_jobs, lock_id))
+            with self.renewed_job_locks([j.job_id for j in active_jobs], lock_id):
+                # Pass a copy, since jobs completing a phase are removed from the collection as it is processed
+                return self._process_active_jobs(list(active_jobs))
+        finally:
+            self._unlock_jobs([j.job_id for j in active_jobs], lock_id)
+
     async def manage_job_processing(self):
         """
         Monitor for created jobs and perform steps for job queueing, allocation of resources, and hand-off to scheduler.
+
+        A pass is made over the jobs created or updated by another service as soon as that happens, and over all active
+        jobs periodically as a fallback.  A pass including any job awaiting allocation also includes every other job
+        awaiting allocation, so that allocation is always by priority across all of them.  Since released allocations
+        may let any waiting job be allocated, a pass that releases any is followed right away by one over all active
+        jobs.  Only the jobs acted upon are locked, and only for the duration of a pass.
         """
         logging.debug("Starting job management async task")
-        while True:
+        async for jobs in self.watch_active_jobs():
             logging.info("Starting next iteration of job manager async task")
+            if self._manage_jobs(jobs):
+                self._manage_jobs(self.get_all_active_jobs())
 
-            # TODO: do this better
-            lock_id = str(uuid.uuid4())
-            while not self.lock_active_jobs(lock_id):
-                await sleep(2)
-
-            # Get collection of "active" jobs
-            active_jobs: List[RequestedJob] = self.get_all_active_jobs()
-
-            for j in active_jobs:
-                if j.status_step.is_error:
-                    logging.error("Requested job {} has failed due to {}".format(j.job_id, j.status_step.name))
-                if j.status_step.completes_phase:
-                    active_jobs.remove(j)
-                    self.save_job(j)
-
-            # TODO: something must transition MODEL_EXEC_RUNNING Jobs to MODEL_EXEC_COMPLETED (probably Monitor class)
-            # TODO: something must transition OUTPUT_EXEC_RUNNING Jobs to OUTPUT_EXEC_COMPLETED (probably Monitor class)
-
-            # Process the jobs into various organized collections
-            organized_lists = self._organize_active_jobs(active_jobs)
-            jobs_eligible_for_allocate = organized_lists[0]
-            jobs_to_release_resources = organized_lists[1]
-            jobs_completed_phase = organized_lists[2]
-
-            for job_with_allocations_to_release in jobs_to_release_resources:
-                self.release_allocations(job_with_allocations_to_release)
-                self.save_job(job_with_allocations_to_release)
-
-            for job_transitioning_phases in jobs_completed_phase:
-                # TODO: figure out what to do here; e.g., start output service after model_exec is done
-                pass
-
-            # Build prioritized list/queue of allocation eligible Jobs
-            priority_queues = self.build_prioritized_pending_allocation_queues(jobs_eligible_for_allocate)
-            high_priority_queue = priority_queues['high']
-            # Do this here to get size in case queue is altered below
-            initial_high_priority_queue_size = len(high_priority_queue)
-            low_priority_queue = priority_queues['low']
-            med_priority_queue = priority_queues['medium']
-
-            # Request allocations and get collection of jobs that were allocated, starting first with high priorities
-            allocated_successfully = self._request_allocations_for_queue(high_priority_queue)
-            # Only even process others if any and all high priority jobs get allocated
-            if len(allocated_successfully) == initial_high_priority_queue_size:
-                allocated_successfully.extend(self._request_allocations_for_queue(med_priority_queue))
-                allocated_successfully.extend(self._request_allocations_for_queue(low_priority_queue))
-
-            # TODO: have data management service handle the AWAITING_DATA step so it can transition to the AWAITING_SCHEDULING step
-
-            # For each Job that is at the AWAITING_SCHEDULING, save updated state and pass to scheduler
-            for job in [j for j in active_jobs if j.status_step == JobExecStep.AWAITING_SCHEDULING]:
-                scheduling_result: Tuple[bool, tuple] = self.request_scheduling(job)
-                if scheduling_result[0]:
-                    job.status_step = JobExecStep.SCHEDULED
-                else:
-                    job.status_step = JobExecStep.FAILED
-                    # TODO: probably log something about this, or raise exception
-                self.save_job(job)
+    def _process_active_jobs(self, active_jobs: List[RequestedJob]):
+        """
+        Perform the steps for job queueing, allocation of resources, and hand-off to scheduler for the given jobs.
 
-            self.unlock_active_jobs(lock_id)
-            await sleep(5)
+        Parameters
+        ----------
+        active_jobs : List[RequestedJob]
+            The active jobs to process, which should be locked by the caller.
+
+        Returns
+        -------
+        bool
+            Whether any allocations were released.
+        """
+        for j in active_jobs:
+            if j.status_step.is_error:
+                logging.error("Requested job {} has failed due to {}".format(j.job_id, j.status_step.name))
+            if j.status_step.completes_phase:
+                active_jobs.remove(j)
+                self.save_job(j)
+
+        # TODO: something must transition MODEL_EXEC_RUNNING Jobs to MODEL_EXEC_COMPLETED (probably Monitor class)
+        # TODO: something must transition OUTPUT_EXEC_RUNNING Jobs to OUTPUT_EXEC_COMPLETED (probably Monitor class)
+
+        # Process the jobs into various organized collections
+        organized_lists = self._organize_active_jobs(active_jobs)
+        jobs_eligible_for_allocate = organized_lists[0]
+        jobs_to_release_resources = organized_lists[1]
+        jobs_completed_phase = organized_lists[2]
+
+        for job_with_allocations_to_release in jobs_to_release_resources:
+            self.release_allocations(job_with_allocations_to_release)
+            self.save_job(job_with_allocations_to_release)
+
+        for job_transitioning_phases in jobs_completed_phase:
+            # TODO: figure out what to do here; e.g., start output service after model_exec is done
+            pass
+
+        # Build prioritized list/queue of allocation eligible Jobs
+        priority_queues = self.build_prioritized_pending_allocation_queues(jobs_eligible_for_allocate)
+        high_priority_queue = priority_queues['high']
+        # Do this here to get size in case queue is altered below
+        initial_high_priority_queue_size = len(high_priority_queue)
+        low_priority_queue = priority_queues['low']
+        med_priority_queue = priority_queues['medium']
+
+        # Request allocations and get collection of jobs that were allocated, starting first with high priorities
+        allocated_successfully = self._request_allocations_for_queue(high_priority_queue)
+        # Only even process others if any and all high priority jobs get allocated
+        if len(allocated_successfully) == initial_high_priority_queue_size:
+            allocated_successfully.extend(self._request_allocations_for_queue(med_priority_queue))
+            allocated_successfully.extend(self._request_allocations_for_queue(low_priority_queue))
+
+        # TODO: have data management service handle the AWAITING_DATA step so it can transition to the
+        #  AWAITING_SCHEDULING step
+
+        # For each Job that is at the AWAITING_SCHEDULING, save updated state and pass to scheduler
+        for job in [j for j in active_jobs if j.status_step == JobExecStep.AWAITING_SCHEDULING]:
+            scheduling_result: Tuple[bool, tuple] = self.request_scheduling(job)
+            if scheduling_result[0]:
+                job.status_step = JobExecStep.SCHEDULED
+            else:
+                job.status_step = JobExecStep.FAILED
+                # TODO: probably log something about this, or raise exception
+            self.save_job(job)
+
+        return len(jobs_to_release_resources) > 0
 
     def release_allocations(self, job: Job):
         """
@@ -636,14 +720,11 @@ class RedisBackedJobManager(JobManager, RedisBackedJobUtil):
         """
         if require_awaiting_status and job.status_step != JobExecStep.AWAITING_ALLOCATION:
             return False
-        if job.allocation_paradigm == AllocationParadigm.SINGLE_NODE:
-            alloc = self._resource_manager.allocate_single_node(job.cpu_count, job.memory_size)
-        elif job.allocation_paradigm == AllocationParadigm.FILL_NODES:
-            alloc = self._resource_manager.allocate_fill_nodes(job.cpu_count, job.memory_size)
-        elif job.allocation_paradigm == AllocationParadigm.ROUND_ROBIN:
-            alloc = self._resource_manager.allocate_round_robin(job.cpu_count, job.memory_size)
-        else:
+        strategy = get_allocation_strategy(job.allocation_paradigm, partition_config=job.partition_config)
+        if strategy is None:
             alloc = [None]
+        else:
+            alloc = self._resource_manager.allocate_with_strategy(strategy, job.cpu_count, job.memory_size)
         if isinstance(alloc, list) and len(alloc) > 0 and isinstance(alloc[0], ResourceAllocation):
             job.allocations = alloc
             job.status_step = JobExecStep.AWAITING_DATA
@@ -1,9 +1,61 @@
+import asyncio
+import hashlib
 import json
+import logging
+import threading
+import time
 
 from .job import Job, JobStatus, RequestedJob
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dmod.redis import KeyNameHelper, RedisBacked
-from typing import List, Optional
+from redis import ConnectionPool, Redis
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from uuid import uuid4
+
+# Delete the job lock at KEYS[1] if it is held with the lock id in ARGV[1], returning 0 only if held with another id
+UNLOCK_JOB_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    return 1
+end
+if current == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+return 0
+"""
+
+RENEW_JOB_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+""" Reset the expiration of a job lock, but only if the lock is still held with the given lock id. """
+
+SAVE_COMPACT_JOB_SCRIPT = """
+if ARGV[1] == '' then
+    if redis.call('HGET', KEYS[2], 'payload_digest') ~= ARGV[2] then
+        return 0
+    end
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+redis.call('HSET', KEYS[2], 'payload_digest', ARGV[2], unpack(ARGV, 7))
+local version = redis.call('HINCRBY', KEYS[3], KEYS[1], 1)
+if ARGV[3] == '1' then
+    redis.call('SADD', KEYS[4], KEYS[1])
+else
+    redis.call('SREM', KEYS[4], KEYS[1])
+end
+redis.call('XADD', KEYS[5], 'MAXLEN', '~', ARGV[6], '*', 'job_key', KEYS[1], 'status_step', ARGV[4], 'source', ARGV[5])
+return version
+"""
+"""
+Save a compact job record, skipping its payload when passed as empty, but only if the saved payload digest matches.
+"""
 
 
 class DefaultJobUtilFactory:
@@ -113,6 +165,87 @@ class JobUtil(ABC):
         """
         pass
 
+    @abstractmethod
+    def lock_job(self, job_id, lock_id: str) -> bool:
+        """
+        Attempt to acquire a lock for exclusive access to modify the job with the given id.
+
+        Unlike ::method:`lock_active_jobs`, this only prevents other users from modifying the one job, so users working
+        on different jobs do not wait on each other.
+
+        Implementations may be defined such that locks expire automatically, though this should be clearly documented.
+
+        Parameters
+        ----------
+        job_id
+            The unique id of the job to lock.
+        lock_id : str
+            The string form of some unique identifier for the requested lock.
+
+        Returns
+        -------
+        bool
+            ``True`` if a lock was acquired, or ``False`` if it was not (i.e., an active lock is held elsewhere).
+
+        See Also
+        -------
+        locked_job
+        unlock_job
+        """
+        pass
+
+    @contextmanager
+    def locked_job(self, job_id) -> Iterator[Optional[Job]]:
+        """
+        Context manager that holds the lock for the job with the given id, providing a freshly retrieved job object.
+
+        The job is retrieved after the lock is acquired, so its state reflects any changes saved by previous holders of
+        the lock.  ``None`` is provided if the lock could not be acquired or the job no longer exists, in which case the
+        caller should leave the job for now.
+
+        Parameters
+        ----------
+        job_id
+            The unique id of the job to lock.
+
+        Returns
+        -------
+        Iterator[Optional[Job]]
+            The locked job, or ``None`` if it could not be locked.
+        """
+        lock_id = str(uuid4())
+        if not self.lock_job(job_id, lock_id):
+            yield None
+            return
+        try:
+            with self.renewed_job_locks([job_id], lock_id):
+                yield self.retrieve_job(job_id) if self.does_job_exist(job_id) else None
+        finally:
+            self.unlock_job(job_id, lock_id)
+
+    @contextmanager
+    def renewed_job_locks(self, job_ids: Sequence, lock_id: str) -> Iterator[Set]:
+        """
+        Context manager that keeps the given job locks from expiring for as long as it is active.
+
+        This base implementation does nothing, which is suitable for implementations whose locks do not expire.  Others
+        should override this to periodically renew the locks while they are still held with the given lock id.
+
+        Parameters
+        ----------
+        job_ids : Sequence
+            The unique ids of the locked jobs.
+        lock_id : str
+            The string form of the unique identifier with which the locks are held.
+
+        Returns
+        -------
+        Iterator[Set]
+            The set of ids of the jobs whose locks were found to be lost (e.g., having expired anyway), which may grow
+            while the context is active.
+        """
+        yield set()
+
     @abstractmethod
     def retrieve_job(self, job_id) -> Job:
         """
@@ -151,6 +284,45 @@ class JobUtil(ABC):
         """
         pass
 
+    def save_jobs(self, jobs: Iterable[Job]):
+        """
+        Add or update each of the given job objects in the backend data store of job record data.
+
+        The default implementation simply calls ::method:`save_job` for each job, but subclasses should override this
+        when their backend supports saving many records more efficiently.
+
+        Parameters
+        ----------
+        jobs : Iterable[Job]
+            The jobs to be updated or added.
+        """
+        for job in jobs:
+            self.save_job(job)
+
+    @abstractmethod
+    def unlock_job(self, job_id, lock_id: str) -> bool:
+        """
+        Release a lock on the job with the given id, if the lock is associated with the given lock id.
+
+        Parameters
+        ----------
+        job_id
+            The unique id of the locked job.
+        lock_id : str
+            The string form of some unique identifier for the lock to release.
+
+        Returns
+        -------
+        bool
+            ``True`` if there is no longer (or not) a lock on the job; ``False`` if there is still a lock on the job
+            held with some other unique identifier.
+
+        See Also
+        -------
+        lock_job
+        """
+        pass
+
     @abstractmethod
     def unlock_active_jobs(self, lock_id: str) -> bool:
         """
@@ -184,6 +356,32 @@ class JobUtil(ABC):
         """
         pass
 
+    async def watch_active_jobs(self, poll_seconds: float = 30.0,
+                                include_own_updates: bool = False) -> AsyncIterator[List[Job]]:
+        """
+        Asynchronously iterate over collections of active jobs that may need attention.
+
+        This base implementation simply polls, providing all active jobs and then waiting before doing so again.
+        Implementations able to learn when jobs are updated should override this to provide just the updated jobs as
+        soon as they are saved, while still periodically providing all active jobs as a fallback.
+
+        Parameters
+        ----------
+        poll_seconds : float
+            The time between providing all active jobs.
+        include_own_updates : bool
+            Whether jobs should be provided because of updates saved through this same instance, which by default is
+            ``False``; this is ignored by this base implementation.
+
+        Returns
+        -------
+        AsyncIterator[List[Job]]
+            An asynchronous iterator of lists of active jobs.
+        """
+        while True:
+            yield self.get_all_active_jobs()
+            await asyncio.sleep(poll_seconds)
+
 
 class RedisBackedJobUtil(JobUtil, RedisBacked):
     """
@@ -194,6 +392,13 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
     """
 
     _ACTIVE_JOBS_LOCK_KEY = b':lock:active_jobs:'
+    _JOB_LOCK_EXPIRATION_MS = 60000
+    """ Milliseconds after which per-job locks expire, in case a holder fails before releasing its lock. """
+    _JOB_LOCK_RENEWAL_MS = 20000
+    """ Milliseconds between renewals of held per-job locks (see ::method:`renewed_job_locks`). """
+    _JOB_EVENTS_MAX_LENGTH = 10000
+    """ Approximate number of recent job events kept in the job events stream. """
+    _JOB_EVENTS_READ_COUNT = 1000
 
     # TODO: look at either deprecating this or applying it appropriately to all managed objects
     @classmethod
@@ -205,10 +410,24 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
             return 'job_mgr'
 
     def __init__(self, redis_host: Optional[str] = None, redis_port: Optional[int] = None,
-                 redis_pass: Optional[str] = None, **kwargs):
+                 redis_pass: Optional[str] = None, cache_jobs: bool = False, compact_job_records: bool = False,
+                 **kwargs):
         """
         Initialize this instance.
 
+        When ``cache_jobs`` is ``True``, deserialized job objects are kept in memory along with the version of the
+        record they came from.  Retrieving a job whose record has not been saved since then just returns the cached
+        object, rather than transferring and deserializing the record again.  Note that this means the same object is
+        returned by repeated retrievals, so any modifications to a retrieved job must be saved (or discarded by not
+        using the object again).
+
+        When ``compact_job_records`` is ``True``, job records are saved using the compact serialization of
+        ::class:`RequestedJob`, which requires the optional ``msgpack`` package.  Each record is split into a payload
+        and a small Redis hash of frequently changing state (e.g., status and allocation priority).  When only the state
+        of a job has changed since this instance last read or wrote its record, only the state hash is written, unless
+        the digest of the payload kept in that hash shows the record was saved by someone else in the meantime.  Records
+        in either format can always be read, so instances with and without this enabled can be used together.
+
         Parameters
         ----------
         redis_host : Optional[str]
@@ -217,6 +436,10 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
             Optional explicit string init param for the Redis connection port value.
         redis_pass : Optional[str]
             Optional explicit string init param for the Redis connection password value.
+        cache_jobs : bool
+            Whether to cache deserialized job objects in memory, which by default is ``False``.
+        compact_job_records : bool
+            Whether to save job records in the compact, split format, which by default is ``False``.
         kwargs
             Keyword args, passed through to the ::class:`RedisBacked` superclass init function.
         """
@@ -226,6 +449,25 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         else:
             key_prefix = self.get_key_prefix()
         self._active_jobs_set_key = self.keynamehelper.create_key_name(key_prefix, 'active_jobs')
+        self._job_events_stream_key = self.keynamehelper.create_key_name(key_prefix, 'job_events')
+        # Hash of job keys to the number of times each job record has been saved
+        self._job_versions_hash_key = self.keynamehelper.create_key_name(key_prefix, 'job_versions')
+        # Cached tuples of record version and deserialized job, by job key, when caching is enabled
+        self._job_cache: Optional[Dict[str, Tuple[int, RequestedJob]]] = dict() if cache_jobs else None
+        if compact_job_records and not RequestedJob.is_compact_serialization_supported():
+            raise RuntimeError("Compact job records require the 'msgpack' package to be installed")
+        self._compact_job_records = compact_job_records
+        # Digests of the compact payloads most recently read or written by this instance, by job key
+        self._job_payload_digests: Dict[str, str] = dict()
+        # Like the main client, but without decoding responses, since compact payloads are binary
+        pool = self.redis.connection_pool
+        self._binary_redis = Redis(connection_pool=ConnectionPool(
+            connection_class=pool.connection_class, **{**pool.connection_kwargs, 'decode_responses': False}))
+        # Identifies the events for updates saved by this instance
+        self._event_source_id = str(uuid4())
+        self._unlock_job_script = self.redis.register_script(UNLOCK_JOB_SCRIPT)
+        self._renew_job_lock_script = self.redis.register_script(RENEW_JOB_LOCK_SCRIPT)
+        self._save_compact_job_script = self._binary_redis.register_script(SAVE_COMPACT_JOB_SCRIPT)
 
     def _dev_setup(self):
         self._clean_keys()
@@ -266,6 +508,302 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         """
         return self.create_key_name('job', str(job_id))
 
+    def _get_job_lock_key(self, job_id) -> str:
+        """
+        Get the Redis key for the lock on the job with the given id.
+
+        Parameters
+        ----------
+        job_id
+            The id of the job of interest.
+
+        Returns
+        -------
+        str
+            The Redis key for the lock on the job with the given id.
+        """
+        return self.create_key_name('lock', 'job', str(job_id))
+
+    def _get_job_state_key(self, job_redis_key: str) -> str:
+        """
+        Get the Redis key for the hash of frequently changing state values of a compact job record.
+
+        Parameters
+        ----------
+        job_redis_key : str
+            The Redis key for the job's saved record.
+
+        Returns
+        -------
+        str
+            The Redis key for the hash of state values of the job's record, if it is a compact record.
+        """
+        return self.create_derived_key(job_redis_key, 'state')
+
+    def _deserialize_job_record(self, job_redis_key: str, payload: bytes, state: Dict[bytes, bytes]) -> RequestedJob:
+        """
+        Deserialize a job from its saved record, which may be either a JSON record or a compact, split record.
+
+        Parameters
+        ----------
+        job_redis_key : str
+            The Redis key for the job's saved record.
+        payload : bytes
+            The value of the record at the job's key.
+        state : Dict[bytes, bytes]
+            The values in the state hash of the record, which is empty for JSON records.
+
+        Returns
+        -------
+        RequestedJob
+            The deserialized job.
+        """
+        if payload[:1] == b'{':
+            # Whatever compact payload was known for this key before has since been overwritten
+            self._job_payload_digests.pop(job_redis_key, None)
+            return RequestedJob.factory_init_from_deserialized_json(json.loads(payload))
+        state = {k.decode(): v.decode() for k, v in state.items()}
+        self._job_payload_digests[job_redis_key] = state.pop('payload_digest', None)
+        return RequestedJob.factory_init_from_compact_serialization(payload, state)
+
+    def _read_job_events(self, last_event_id: str, block_ms: int,
+                         include_own_updates: bool) -> Tuple[str, List[str]]:
+        """
+        Read the job events after the given event, waiting up to the given time for one to occur.
+
+        Parameters
+        ----------
+        last_event_id : str
+            The id of the last job event already read.
+        block_ms : int
+            The maximum number of milliseconds to wait for a new event.
+        include_own_updates : bool
+            Whether to include events for updates saved by this instance.
+
+        Returns
+        -------
+        Tuple[str, List[str]]
+            The id of the last event read, and the Redis keys of the updated jobs.
+        """
+        result = self.redis.xread({self._job_events_stream_key: last_event_id}, count=self._JOB_EVENTS_READ_COUNT,
+                                  block=block_ms)
+        job_keys = []
+        for _, events in result or []:
+            for event_id, fields in events:
+                last_event_id = event_id
+                if not include_own_updates and fields.get('source') == self._event_source_id:
+                    continue
+                if fields['job_key'] not in job_keys:
+                    job_keys.append(fields['job_key'])
+        return last_event_id, job_keys
+
+    def _retrieve_jobs_by_redis_keys(self, job_redis_keys: Sequence[str]) -> List[Optional[RequestedJob]]:
+        """
+        Get the jobs for the given Redis keys, using as few round trips to Redis as possible.
+
+        Without caching, all records are obtained with a single ``MGET``.  With caching, the current versions of the
+        records are obtained first, and only the records for jobs not cached at their current version are obtained and
+        deserialized.
+
+        Parameters
+        ----------
+        job_redis_keys : Sequence[str]
+            The Redis keys for the jobs' saved records.
+
+        Returns
+        -------
+        List[Optional[RequestedJob]]
+            The jobs for the given Redis keys, in the same order, with ``None`` for any key without a job record.
+        """
+        if len(job_redis_keys) == 0:
+            return []
+
+        if self._job_cache is None:
+            return self._read_job_records(job_redis_keys)[0]
+
+        versions = self._binary_redis.hmget(self._job_versions_hash_key, job_redis_keys)
+        jobs = [None] * len(job_redis_keys)
+        stale_indices = []
+        for i, job_key in enumerate(job_redis_keys):
+            cached = self._job_cache.get(job_key)
+            if versions[i] is not None and cached is not None and cached[0] == int(versions[i]):
+                jobs[i] = cached[1]
+            else:
+                stale_indices.append(i)
+
+        if len(stale_indices) > 0:
+            stale_keys = [job_redis_keys[i] for i in stale_indices]
+            stale_jobs, stale_versions = self._read_job_records(stale_keys)
+            for i, job, version in zip(stale_indices, stale_jobs, stale_versions):
+                jobs[i] = job
+                if job is None:
+                    self._job_cache.pop(job_redis_keys[i], None)
+                elif version is not None:
+                    self._job_cache[job_redis_keys[i]] = (int(version), job)
+        return jobs
+
+    def _read_job_records(self, job_redis_keys: Sequence[str]) -> Tuple[List[Optional[RequestedJob]], List[bytes]]:
+        """
+        Read and deserialize the job records for the given keys, along with their versions, in a single transaction.
+
+        Parameters
+        ----------
+        job_redis_keys : Sequence[str]
+            The Redis keys for the jobs' saved records.
+
+        Returns
+        -------
+        Tuple[List[Optional[RequestedJob]], List[bytes]]
+            The jobs for the given Redis keys, in the same order, with ``None`` for any key without a job record, and
+            the current versions of the records.
+        """
+        with self._binary_redis.pipeline() as pipeline:
+            pipeline.mget(job_redis_keys)
+            pipeline.hmget(self._job_versions_hash_key, job_redis_keys)
+            for job_key in job_redis_keys:
+                pipeline.hgetall(self._get_job_state_key(job_key))
+            results = pipeline.execute()
+        payloads, versions, states = results[0], results[1], results[2:]
+        jobs = [None if payloads[i] is None else self._deserialize_job_record(k, payloads[i], states[i])
+                for i, k in enumerate(job_redis_keys)]
+        return jobs, versions
+
+    def _save_job(self, job: RequestedJob, event_source: str):
+        """
+        Add or update the given job object's Redis record, also maintaining a Redis set of the ids of 'active' jobs and
+        adding an event for the update to the job events stream.
+
+        Parameters
+        ----------
+        job : RequestedJob
+            The job to be updated or added.
+        event_source : str
+            The source recorded for the update's event.
+        """
+        self._save_jobs([job], event_source)
+
+    def _save_jobs(self, jobs: Iterable[RequestedJob], event_source: str):
+        """
+        Add or update the given job objects' Redis records in a single pipeline, also maintaining a Redis set of the ids
+        of 'active' jobs and adding an event for each update to the job events stream.
+
+        Compact records are saved with a script that also keeps a digest of the payload in the record's state hash.
+        When a job's payload matches the one this instance last read or wrote, it is only sent if the saved digest turns
+        out to differ (e.g., because another instance saved the record since), which requires a second round trip.
+
+        Parameters
+        ----------
+        jobs : Iterable[RequestedJob]
+            The jobs to be updated or added.
+        event_source : str
+            The source recorded for the updates' events.
+        """
+        saved = []
+        with self._binary_redis.pipeline() as pipeline:
+            for job in jobs:
+                job_key = self._get_job_key_for_id(job.job_id)
+                if self._compact_job_records:
+                    payload, state = job.to_compact_serialization()
+                    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+                    compact = (payload, state, digest)
+                    # Skip sending the payload when it is the same as in the record last read or written
+                    self._queue_compact_job_save(pipeline, job, job_key, compact, event_source,
+                                                 include_payload=self._job_payload_digests.get(job_key) != digest)
+                else:
+                    compact = None
+                    self._queue_json_job_save(pipeline, job, job_key, event_source)
+                # Track where the result giving the record's new version will be
+                saved.append((job_key, job, compact, len(pipeline) - 1))
+            if len(saved) == 0:
+                return
+            results = pipeline.execute()
+
+        # Payloads skipped for records saved by someone else since being read here must be sent after all
+        resent = [(job_key, job, compact) for job_key, job, compact, i in saved
+                  if compact is not None and not results[i]]
+        if len(resent) > 0:
+            with self._binary_redis.pipeline() as pipeline:
+                for job_key, job, compact in resent:
+                    self._queue_compact_job_save(pipeline, job, job_key, compact, event_source, include_payload=True)
+                resent_versions = dict(zip((job_key for job_key, _, _ in resent), pipeline.execute()))
+        else:
+            resent_versions = dict()
+
+        for job_key, job, compact, version_index in saved:
+            version = resent_versions.get(job_key, results[version_index])
+            if compact is None or not job.status.is_active:
+                self._job_payload_digests.pop(job_key, None)
+            else:
+                self._job_payload_digests[job_key] = compact[2]
+            if self._job_cache is not None:
+                if job.status.is_active:
+                    self._job_cache[job_key] = (int(version), job)
+                else:
+                    self._job_cache.pop(job_key, None)
+
+    def _queue_compact_job_save(self, pipeline, job: RequestedJob, job_key: str,
+                                compact: Tuple[bytes, Dict[str, str], str], event_source: str, include_payload: bool):
+        """
+        Add to the given pipeline a call to the script saving a compact job record.
+
+        The last result added to the pipeline is the record's new version, or ``0`` if the payload was not included and
+        did not match the saved payload, in which case nothing was saved.
+
+        Parameters
+        ----------
+        pipeline
+            The pipeline to which to add the call.
+        job : RequestedJob
+            The job being saved.
+        job_key : str
+            The Redis key for the job's record.
+        compact : Tuple[bytes, Dict[str, str], str]
+            The job's compact payload, its state values, and the hex digest of the payload.
+        event_source : str
+            The source recorded for the update's event.
+        include_payload : bool
+            Whether to send the payload rather than relying on the saved payload matching the digest.
+        """
+        payload, state, digest = compact
+        args = [payload if include_payload else b'', digest, '1' if job.status.is_active else '0',
+                job.status_step.name, event_source, self._JOB_EVENTS_MAX_LENGTH]
+        for field, value in state.items():
+            args.extend((field, value))
+        self._save_compact_job_script(keys=[job_key, self._get_job_state_key(job_key), self._job_versions_hash_key,
+                                            self._active_jobs_set_key, self._job_events_stream_key],
+                                      args=args, client=pipeline)
+
+    def _queue_json_job_save(self, pipeline, job: RequestedJob, job_key: str, event_source: str):
+        """
+        Add to the given pipeline the commands saving a JSON job record.
+
+        The last result added to the pipeline is the record's new version.
+
+        Parameters
+        ----------
+        pipeline
+            The pipeline to which to add the commands.
+        job : RequestedJob
+            The job being saved.
+        job_key : str
+            The Redis key for the job's record.
+        event_source : str
+            The source recorded for the update's event.
+        """
+        pipeline.set(job_key, job.to_json())
+        # This also clears the digest of any compact payload previously saved for the job
+        pipeline.delete(self._get_job_state_key(job_key))
+        if job.status.is_active:
+            # Add to active set
+            pipeline.sadd(self._active_jobs_set_key, job_key)
+        else:
+            # Make sure not in active set
+            pipeline.srem(self._active_jobs_set_key, job_key)
+        pipeline.xadd(self._job_events_stream_key,
+                      {'job_key': job_key, 'status_step': job.status_step.name, 'source': event_source},
+                      maxlen=self._JOB_EVENTS_MAX_LENGTH, approximate=True)
+        pipeline.hincrby(self._job_versions_hash_key, job_key, 1)
+
     def does_job_exist(self, job_id) -> bool:
         """
         Test whether a job with the given job id exists.
@@ -291,10 +829,16 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         List[RequestedJob]
             A list of every job known to this util object that is considered active based on each job's status.
         """
-        active_jobs = []
-        for active_job_redis_key in self.redis.smembers(self._active_jobs_set_key):
-            active_jobs.append(self.retrieve_job_by_redis_key(active_job_redis_key))
-        return active_jobs
+        active_job_keys = list(self.redis.smembers(self._active_jobs_set_key))
+        # Drop anything tracked for jobs that are no longer active, so these don't keep growing
+        active_job_keys_set = set(active_job_keys)
+        for job_key in [k for k in self._job_payload_digests if k not in active_job_keys_set]:
+            self._job_payload_digests.pop(job_key)
+        if self._job_cache is not None:
+            for job_key in [k for k in self._job_cache if k not in active_job_keys_set]:
+                self._job_cache.pop(job_key)
+        # Skip any job records deleted after getting the active set
+        return [j for j in self._retrieve_jobs_by_redis_keys(active_job_keys) if j is not None]
 
     def get_jobs_for_status(self, status: JobStatus) -> List[Job]:
         """
@@ -356,11 +900,10 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         ValueError
             If no job record exists with given key.
         """
-        if self._does_redis_key_exist(job_redis_key):
-            serialized_job = json.loads(self.redis.get(job_redis_key))
-            return RequestedJob.factory_init_from_deserialized_json(json_obj=serialized_job)
-        else:
+        job = self._retrieve_jobs_by_redis_keys([job_redis_key])[0]
+        if job is None:
             raise ValueError('No job record found for job with key {}'.format(job_redis_key))
+        return job
 
     def lock_active_jobs(self, lock_id: str) -> bool:
         """
@@ -398,30 +941,173 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
         result = self.redis.get(self._ACTIVE_JOBS_LOCK_KEY)
         return lock_id == result
 
+    def lock_job(self, job_id, lock_id: str) -> bool:
+        """
+        Attempt to acquire a lock for exclusive access to modify the job with the given id.
+
+        As with ::method:`lock_active_jobs`, the lock is a special key-value pair set only if the key does not already
+        exist.  Locks expire automatically after ::attribute:`_JOB_LOCK_EXPIRATION_MS` milliseconds, unless renewed
+        (see ::method:`renewed_job_locks`, which ::method:`locked_job` uses for as long as the lock is held).
+
+        Parameters
+        ----------
+        job_id
+            The unique id of the job to lock.
+        lock_id : str
+            The string form of some unique identifier for the requested lock.
+
+        Returns
+        -------
+        bool
+            ``True`` if a lock was acquired, or ``False`` if it was not (i.e., an active lock is held elsewhere).
+
+        See Also
+        -------
+        locked_job
+        unlock_job
+        """
+        return bool(self.redis.set(self._get_job_lock_key(job_id), lock_id, nx=True, px=self._JOB_LOCK_EXPIRATION_MS))
+
+    def _lock_jobs(self, job_ids: Sequence, lock_id: str) -> List:
+        """
+        Attempt to lock each of the jobs with the given ids, as with ::method:`lock_job`, in a single pipeline.
+
+        Parameters
+        ----------
+        job_ids : Sequence
+            The unique ids of the jobs to lock.
+        lock_id : str
+            The string form of some unique identifier for the requested locks.
+
+        Returns
+        -------
+        List
+            The ids of the jobs that were locked.
+        """
+        with self.redis.pipeline(transaction=False) as pipeline:
+            for job_id in job_ids:
+                pipeline.set(self._get_job_lock_key(job_id), lock_id, nx=True, px=self._JOB_LOCK_EXPIRATION_MS)
+            results = pipeline.execute()
+        return [job_id for job_id, locked in zip(job_ids, results) if locked]
+
+    def _unlock_jobs(self, job_ids: Sequence, lock_id: str):
+        """
+        Release the locks on the jobs with the given ids, as with ::method:`unlock_job`, in a single pipeline.
+
+        Parameters
+        ----------
+        job_ids : Sequence
+            The unique ids of the locked jobs.
+        lock_id : str
+            The string form of some unique identifier for the locks to release.
+        """
+        with self.redis.pipeline(transaction=False) as pipeline:
+            for job_id in job_ids:
+                self._unlock_job_script(keys=[self._get_job_lock_key(job_id)], args=[lock_id], client=pipeline)
+            pipeline.execute()
+
+    def _renew_job_locks(self, job_ids: Sequence, lock_id: str) -> List:
+        """
+        Reset the expiration of the locks on the jobs with the given ids, for those still held with the given lock id.
+
+        Parameters
+        ----------
+        job_ids : Sequence
+            The unique ids of the locked jobs.
+        lock_id : str
+            The string form of the unique identifier with which the locks are held.
+
+        Returns
+        -------
+        List
+            The ids of the jobs whose locks are no longer held with the given lock id.
+        """
+        with self.redis.pipeline(transaction=False) as pipeline:
+            for job_id in job_ids:
+                self._renew_job_lock_script(keys=[self._get_job_lock_key(job_id)],
+                                            args=[lock_id, self._JOB_LOCK_EXPIRATION_MS], client=pipeline)
+            results = pipeline.execute()
+        return [job_id for job_id, renewed in zip(job_ids, results) if renewed != 1]
+
+    @contextmanager
+    def renewed_job_locks(self, job_ids: Sequence, lock_id: str) -> Iterator[Set]:
+        """
+        Context manager that keeps the given job locks from expiring for as long as it is active.
+
+        A background thread renews the locks every ::attribute:`_JOB_LOCK_RENEWAL_MS` milliseconds, for as long as they
+        are still held with the given lock id, so long-running work (including work awaited within the context) does not
+        lose its locks.  Locks still expire as usual if the process holding them stops.
+
+        Parameters
+        ----------
+        job_ids : Sequence
+            The unique ids of the locked jobs.
+        lock_id : str
+            The string form of the unique identifier with which the locks are held.
+
+        Returns
+        -------
+        Iterator[Set]
+            The set of ids of the jobs whose locks were found to be lost (e.g., having expired while the holder could
+            not reach Redis), which may grow while the context is active.
+        """
+        job_ids = list(job_ids)
+        lost_job_ids = set()
+        stopped = threading.Event()
+
+        def renew():
+            while not stopped.wait(self._JOB_LOCK_RENEWAL_MS / 1000):
+                held_job_ids = [i for i in job_ids if i not in lost_job_ids]
+                if len(held_job_ids) == 0:
+                    return
+                try:
+                    newly_lost = self._renew_job_locks(held_job_ids, lock_id)
+                except Exception as e:
+                    logging.error("Failed to renew locks for {} jobs: {}".format(len(held_job_ids), e))
+                    continue
+                for job_id in newly_lost:
+                    logging.warning("Lock on job {} was lost before being released".format(job_id))
+                lost_job_ids.update(newly_lost)
+
+        renewer = threading.Thread(target=renew, name='job-lock-renewer-{}'.format(lock_id), daemon=True)
+        renewer.start()
+        try:
+            yield lost_job_ids
+        finally:
+            stopped.set()
+            renewer.join()
+
     def save_job(self, job: RequestedJob):
         """
         Add or update the given job object's Redis record, also maintaining a Redis set of the ids of 'active' jobs.
 
+        An event for the update is also added to the job events stream, so that listeners in other services can react
+        immediately.
+
         Parameters
         ----------
         job : RequestedJob
             The job to be updated or added.
         """
-        job_key = self._get_job_key_for_id(job.job_id)
-        serialized_job_str = job.to_json()
+        self._save_job(job, event_source=self._event_source_id)
 
-        pipeline = self.redis.pipeline()
-        try:
-            pipeline.set(job_key, serialized_job_str)
-            if job.status.is_active:
-                # Add to active set
-                pipeline.sadd(self._active_jobs_set_key, job_key)
-            else:
-                # Make sure not in active set
-                pipeline.srem(self._active_jobs_set_key, job_key)
-            pipeline.execute()
-        finally:
-            pipeline.reset()
+    def save_jobs(self, jobs: Iterable[RequestedJob]):
+        """
+        Add or update the given job objects' Redis records, maintaining the set of 'active' jobs and the job events
+        stream as in ::method:`save_job`.
+
+        All the updates are sent to Redis in a single pipeline.
+
+        Parameters
+        ----------
+        jobs : Iterable[RequestedJob]
+            The jobs to be updated or added.
+
+        See Also
+        -------
+        save_job
+        """
+        self._save_jobs(jobs, event_source=self._event_source_id)
 
     def unlock_active_jobs(self, lock_id: str) -> bool:
         """
@@ -458,3 +1144,71 @@ class RedisBackedJobUtil(JobUtil, RedisBacked):
             return True
         else:
             return False
+
+    def unlock_job(self, job_id, lock_id: str) -> bool:
+        """
+        Release a lock on the job with the given id, if the lock is associated with the given lock id.
+
+        The check and the release are performed atomically.
+
+        Parameters
+        ----------
+        job_id
+            The unique id of the locked job.
+        lock_id : str
+            The string form of some unique identifier for the lock to release.
+
+        Returns
+        -------
+        bool
+            ``True`` if there is no longer (or not) a lock on the job; ``False`` if there is still a lock on the job
+            held with some other unique identifier.
+
+        See Also
+        -------
+        lock_job
+        """
+        return self._unlock_job_script(keys=[self._get_job_lock_key(job_id)], args=[lock_id]) == 1
+
+    async def watch_active_jobs(self, poll_seconds: float = 30.0,
+                                include_own_updates: bool = False) -> AsyncIterator[List[RequestedJob]]:
+        """
+        Asynchronously iterate over collections of active jobs that may need attention.
+
+        All active jobs are provided initially, and again every ``poll_seconds`` as a fallback.  In between, the job
+        events stream is watched, and active jobs are provided as soon as updates to them are saved.
+
+        Parameters
+        ----------
+        poll_seconds : float
+            The time between providing all active jobs.
+        include_own_updates : bool
+            Whether jobs should be provided because of updates saved through this same instance, which by default is
+            ``False``.
+
+        Returns
+        -------
+        AsyncIterator[List[RequestedJob]]
+            An asynchronous iterator of lists of active jobs.
+        """
+        loop = asyncio.get_event_loop()
+        # Start after the latest existing event, so nothing saved after the first full set of jobs is missed
+        latest_events = self.redis.xrevrange(self._job_events_stream_key, count=1)
+        last_event_id = latest_events[0][0] if len(latest_events) > 0 else '0-0'
+        next_poll_time = time.monotonic()
+
+        while True:
+            if time.monotonic() >= next_poll_time:
+                next_poll_time = time.monotonic() + poll_seconds
+                yield self.get_all_active_jobs()
+                continue
+
+            # Wait for events in another thread so other tasks keep running
+            block_ms = max(int((next_poll_time - time.monotonic()) * 1000), 1)
+            last_event_id, job_keys = await loop.run_in_executor(None, self._read_job_events, last_event_id, block_ms,
+                                                                 include_own_updates)
+            # Skip any jobs that have since been deleted
+            updated_jobs = [j for j in self._retrieve_jobs_by_redis_keys(job_keys)
+                            if j is not None and j.status.is_active]
+            if len(updated_jobs) > 0:
+                yield updated_jobs
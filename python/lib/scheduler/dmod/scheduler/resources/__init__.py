@@ -1,4 +1,6 @@
 from .resource import Resource, ResourceAvailability, ResourceState
 from .resource_allocation import ResourceAllocation
+from .allocation_strategy import AllocationStrategy, BestFitStrategy, FillNodesStrategy, PartitionAwareStrategy, \
+    RoundRobinStrategy, SingleNodeStrategy, WorstFitStrategy, get_allocation_strategy
 from .redis_manager import RedisManager
 from .resource_manager import ResourceManager
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+import heapq
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from dmod.core.execution import AllocationParadigm
+from .resource import Resource
+
+if TYPE_CHECKING:
+    from dmod.modeldata.hydrofabric import PartitionConfig
+
+AllocationRequest = Tuple[str, int, int]
+""" A request for a single allocation, as the resource id, the number of CPUs, and the amount of memory in bytes """
+
+
+class AllocationStrategy(ABC):
+    """
+    Abstract type for deciding how a request for compute assets is divided into allocations across resources.
+
+    Strategies only plan; they work against an in-memory snapshot of the useable resources and produce the complete set
+    of requested allocations, which a ::class:`ResourceManager` then claims all at once.  Every planned allocation is
+    for a single CPU, with the requested memory divided evenly among them.
+    """
+
+    @classmethod
+    def get_capacity(cls, resource: Resource, per_alloc_mem: int) -> int:
+        """
+        Get the number of single-cpu allocations with the given memory that a resource can currently hold.
+
+        Parameters
+        ----------
+        resource : Resource
+            The resource in question.
+        per_alloc_mem : int
+            The memory required by each allocation.
+
+        Returns
+        -------
+        int
+            The number of single-cpu allocations the resource can currently hold.
+        """
+        if per_alloc_mem <= 0:
+            return max(resource.cpu_count, 0)
+        return max(min(resource.cpu_count, resource.memory // per_alloc_mem), 0)
+
+    @abstractmethod
+    def plan(self, resources: Sequence[Resource], cpus: int, memory: int) -> Optional[List[AllocationRequest]]:
+        """
+        Plan the allocations needed to fulfill a request for compute assets from the given resources.
+
+        Parameters
+        ----------
+        resources : Sequence[Resource]
+            Snapshot of the useable resources, which must not be modified.
+        cpus : int
+            Total number of CPUs requested.
+        memory : int
+            Amount of memory required in bytes.
+
+        Returns
+        -------
+        Optional[List[AllocationRequest]]
+            The requests for every allocation, in the order the allocations should be used, or ``None`` if the resources
+            cannot fulfill the request.
+        """
+        pass
+
+
+class SingleNodeStrategy(AllocationStrategy):
+    """
+    Strategy placing all allocations on the first resource able to hold all of them.
+    """
+
+    def plan(self, resources: Sequence[Resource], cpus: int, memory: int) -> Optional[List[AllocationRequest]]:
+        per_alloc_mem = int(memory / cpus)
+        for res in resources:
+            if res.cpu_count >= cpus and res.memory >= memory:
+                return [(res.resource_id, 1, per_alloc_mem)] * cpus
+        return None
+
+
+class FillNodesStrategy(AllocationStrategy):
+    """
+    Strategy claiming all it can from each resource, in order, before moving to the next.
+    """
+
+    def plan(self, resources: Sequence[Resource], cpus: int, memory: int) -> Optional[List[AllocationRequest]]:
+        requests = []
+        per_alloc_mem = int(memory / cpus)
+
+        for res in resources:
+            # Greedily plan to claim as many single-cpu allocations from this resource as it can hold
+            claimable = min(cpus, self.get_capacity(res, per_alloc_mem))
+            requests.extend([(res.resource_id, 1, per_alloc_mem)] * claimable)
+            cpus -= claimable
+            # If we have all needed allocations, stop (otherwise, continue to next resource)
+            if cpus < 1:
+                return requests
+        return None
+
+
+class RoundRobinStrategy(AllocationStrategy):
+    """
+    Strategy planning single-cpu allocations one after the other across all resources, skipping exhausted resources.
+    """
+
+    def plan(self, resources: Sequence[Resource], cpus: int, memory: int) -> Optional[List[AllocationRequest]]:
+        per_alloc_mem = int(memory / cpus)
+        num_node = len(resources)
+        if num_node == 0:
+            return None
+
+        requests = []
+        # Track what is left of each resource as allocations are planned against it
+        remaining = [self.get_capacity(r, per_alloc_mem) for r in resources]
+
+        resource_index = 0
+        exhausted_in_a_row = 0
+        while exhausted_in_a_row < num_node and cpus > 0:
+            # Plan an allocation from this resource if it still has room, otherwise note that it is exhausted
+            if remaining[resource_index] > 0:
+                requests.append((resources[resource_index].resource_id, 1, per_alloc_mem))
+                remaining[resource_index] -= 1
+                cpus -= 1
+                exhausted_in_a_row = 0
+            else:
+                exhausted_in_a_row += 1
+            # Regardless, always move to the next resource (index) for next loop iteration
+            resource_index = (resource_index + 1) % num_node
+
+        return requests if cpus < 1 else None
+
+
+class BestFitStrategy(AllocationStrategy):
+    """
+    Bin-packing strategy that uses as few resources as possible while leaving the least capacity stranded.
+
+    When the outstanding allocations fit on some resource, they are placed on the resource that fits them most tightly.
+    Otherwise, the resource with the most capacity is filled and the process repeats for what remains.  This keeps
+    large resources free for large requests and naturally handles uneven availability.
+    """
+
+    def plan(self, resources: Sequence[Resource], cpus: int, memory: int) -> Optional[List[AllocationRequest]]:
+        per_alloc_mem = int(memory / cpus)
+        capacities = [self.get_capacity(r, per_alloc_mem) for r in resources]
+        if sum(capacities) < cpus:
+            return None
+
+        requests = []
+        unused = [i for i in range(len(resources)) if capacities[i] > 0]
+        while cpus > 0:
+            fitting = [i for i in unused if capacities[i] >= cpus]
+            if len(fitting) > 0:
+                index = min(fitting, key=lambda i: capacities[i])
+            else:
+                index = max(unused, key=lambda i: capacities[i])
+            claimed = min(cpus, capacities[index])
+            requests.extend([(resources[index].resource_id, 1, per_alloc_mem)] * claimed)
+            cpus -= claimed
+            unused.remove(index)
+        return requests
+
+
+class WorstFitStrategy(AllocationStrategy):
+    """
+    Bin-packing strategy that places each allocation on the resource with the most remaining capacity.
+
+    This spreads load evenly, leaving resources as equally utilized as possible.  Allocations from the same resource are
+    grouped together in the plan, in the order the resources were given.
+    """
+
+    def plan(self, resources: Sequence[Resource], cpus: int, memory: int) -> Optional[List[AllocationRequest]]:
+        per_alloc_mem = int(memory / cpus)
+        capacities = [self.get_capacity(r, per_alloc_mem) for r in resources]
+        if sum(capacities) < cpus:
+            return None
+
+        # Max heap of remaining capacity, breaking ties by resource order
+        heap = [(-capacities[i], i) for i in range(len(resources)) if capacities[i] > 0]
+        heapq.heapify(heap)
+        counts = [0] * len(resources)
+        for _ in range(cpus):
+            neg_capacity, index = heapq.heappop(heap)
+            counts[index] += 1
+            if neg_capacity < -1:
+                heapq.heappush(heap, (neg_capacity + 1, index))
+
+        requests = []
+        for index, count in enumerate(counts):
+            requests.extend([(resources[index].resource_id, 1, per_alloc_mem)] * count)
+        return requests
+
+
+class PartitionAwareStrategy(AllocationStrategy):
+    """
+    Strategy placing the partitions of a partitioned hydrofabric so that strongly linked partitions share a host.
+
+    Each allocation corresponds to the MPI rank, and thus the partition, with the same index.  Partitions are linked by
+    every nexus that one of them lists as a remote upstream or downstream nexus and the other also references, since
+    data for such nexuses must be communicated between the ranks.  Hosts are filled largest first, each time seeding
+    with the unplaced partition having the most links to other unplaced partitions and then repeatedly adding the
+    unplaced partition with the most links to those already on the host.  This keeps as much of the cross-partition
+    communication as possible within a host.
+
+    If no partition config is available, or it does not have a partition for each requested CPU, this falls back to the
+    ::class:`BestFitStrategy`.
+    """
+
+    @classmethod
+    def get_link_weights(cls, partition_config: 'PartitionConfig') -> Dict[int, Dict[int, int]]:
+        """
+        Get the number of nexuses shared across the boundaries of each pair of partitions.
+
+        Parameters
+        ----------
+        partition_config : PartitionConfig
+            The partition config in question.
+
+        Returns
+        -------
+        Dict[int, Dict[int, int]]
+            A nested mapping from partition index to linked partition index to the number of shared remote nexuses, for
+            partition indices in the (sorted) order of the config's partitions.
+        """
+        referencing = defaultdict(set)
+        remote_nexus_ids = set()
+        for index, partition in enumerate(partition_config.partitions):
+            remote = partition.remote_upstream_nexus_ids | partition.remote_downstream_nexus_ids
+            remote_nexus_ids.update(remote)
+            for nexus_id in partition.nexus_ids | remote:
+                referencing[nexus_id].add(index)
+
+        weights = defaultdict(dict)
+        for nexus_id in remote_nexus_ids:
+            for index in referencing[nexus_id]:
+                for other in referencing[nexus_id]:
+                    if other != index:
+                        weights[index][other] = weights[index].get(other, 0) + 1
+        return dict(weights)
+
+    def __init__(self, partition_config: Optional['PartitionConfig'] = None):
+        self._partition_config = partition_config
+
+    def plan(self, resources: Sequence[Resource], cpus: int, memory: int) -> Optional[List[AllocationRequest]]:
+        if self._partition_config is None or len(self._partition_config.partitions) != cpus:
+            return BestFitStrategy().plan(resources, cpus, memory)
+
+        per_alloc_mem = int(memory / cpus)
+        capacities = [self.get_capacity(r, per_alloc_mem) for r in resources]
+        if sum(capacities) < cpus:
+            return None
+
+        weights = self.get_link_weights(self._partition_config)
+        unplaced = set(range(cpus))
+        # Links from each unplaced partition to the other unplaced partitions, and to those on the current host
+        outside_links = {i: sum(weights.get(i, {}).values()) for i in unplaced}
+        placements = [None] * cpus
+
+        for index in sorted(range(len(resources)), key=lambda i: -capacities[i]):
+            if len(unplaced) == 0:
+                break
+            host_links = defaultdict(int)
+            for _ in range(min(capacities[index], len(unplaced))):
+                partition = max(unplaced, key=lambda p: (host_links[p], outside_links[p], -p))
+                unplaced.remove(partition)
+                placements[partition] = resources[index].resource_id
+                for linked, weight in weights.get(partition, {}).items():
+                    host_links[linked] += weight
+                    outside_links[linked] -= weight
+
+        return [(resource_id, 1, per_alloc_mem) for resource_id in placements]
+
+
+def get_allocation_strategy(paradigm: AllocationParadigm,
+                            partition_config: Optional['PartitionConfig'] = None) -> Optional[AllocationStrategy]:
+    """
+    Get the allocation strategy for the given allocation paradigm.
+
+    Parameters
+    ----------
+    paradigm : AllocationParadigm
+        The allocation paradigm of a job.
+    partition_config : Optional[PartitionConfig]
+        The partition config of the job, if it has one, for use by topology-aware strategies.
+
+    Returns
+    -------
+    Optional[AllocationStrategy]
+        The appropriate allocation strategy, or ``None`` if the paradigm is not supported.
+    """
+    if paradigm == AllocationParadigm.SINGLE_NODE:
+        return SingleNodeStrategy()
+    elif paradigm == AllocationParadigm.FILL_NODES:
+        return FillNodesStrategy()
+    elif paradigm == AllocationParadigm.ROUND_ROBIN:
+        return RoundRobinStrategy()
+    elif paradigm == AllocationParadigm.BEST_FIT:
+        return BestFitStrategy()
+    elif paradigm == AllocationParadigm.WORST_FIT:
+        return WorstFitStrategy()
+    elif paradigm == AllocationParadigm.PARTITION_AWARE:
+        return PartitionAwareStrategy(partition_config)
+    else:
+        return None
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 import os
-from typing import Iterable, List, Union, Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Union, Optional, Sequence, Tuple
 from redis import WatchError
 import logging
 
 from dmod.redis import RedisBacked
 ## local imports
-from .resource_manager import ResourceManager
+from .resource_manager import AllocationRequest, ResourceManager
 from .resource import Resource, ResourceAvailability, ResourceState
 from .resource_allocation import ResourceAllocation
 
@@ -18,6 +20,62 @@ logging.basicConfig(
     format="%(asctime)s,%(msecs)d %(levelname)s: %(message)s",
     datefmt="%H:%M:%S")
 
+# KEYS: the involved resource keys, followed by the keys of the allocation records to create
+# ARGV: the cpu hash field, the memory hash field, the number of resources, the cpus and memory to take from each
+#       resource, then for each allocation record the index of its resource, its field count, and its field/value pairs
+# Returns the hostname of each resource, or -i/i if the i-th resource is missing/has insufficient cpus or memory
+ALLOCATE_SCRIPT = """
+local cpu_field, memory_field = ARGV[1], ARGV[2]
+local resource_count = tonumber(ARGV[3])
+local hostnames = {}
+for i = 1, resource_count do
+    local values = redis.call('HMGET', KEYS[i], cpu_field, memory_field, 'Hostname')
+    if not values[1] then
+        return -i
+    end
+    if tonumber(values[1]) < tonumber(ARGV[2 + 2 * i]) or tonumber(values[2]) < tonumber(ARGV[3 + 2 * i]) then
+        return i
+    end
+    hostnames[i] = values[3]
+end
+for i = 1, resource_count do
+    redis.call('HINCRBY', KEYS[i], cpu_field, '-' .. ARGV[2 + 2 * i])
+    if ARGV[3 + 2 * i] ~= '0' then
+        redis.call('HINCRBY', KEYS[i], memory_field, '-' .. ARGV[3 + 2 * i])
+    end
+end
+local position = 4 + 2 * resource_count
+for j = resource_count + 1, #KEYS do
+    local field_count = tonumber(ARGV[position + 1])
+    redis.call('HSET', KEYS[j], 'Hostname', hostnames[tonumber(ARGV[position])],
+               unpack(ARGV, position + 2, position + 1 + 2 * field_count))
+    position = position + 2 + 2 * field_count
+end
+return hostnames
+"""
+
+# KEYS: the involved resource keys, followed by the keys of the allocation records to delete
+# ARGV: the cpu hash field, the memory hash field, the number of resources, then the cpus and memory to give back to
+#       each resource
+# Returns 0, or i if the i-th resource is missing
+RELEASE_SCRIPT = """
+local cpu_field, memory_field = ARGV[1], ARGV[2]
+local resource_count = tonumber(ARGV[3])
+for i = 1, resource_count do
+    if redis.call('EXISTS', KEYS[i]) == 0 then
+        return i
+    end
+end
+for i = 1, resource_count do
+    redis.call('HINCRBY', KEYS[i], cpu_field, ARGV[2 + 2 * i])
+    redis.call('HINCRBY', KEYS[i], memory_field, ARGV[3 + 2 * i])
+end
+for j = resource_count + 1, #KEYS do
+    redis.call('DEL', KEYS[j])
+end
+return 0
+"""
+
 
 class RedisManager(ResourceManager, RedisBacked):
     """
@@ -31,6 +89,48 @@ class RedisManager(ResourceManager, RedisBacked):
         super().__init__(redis_host=redis_host, redis_port=redis_port, redis_pass=redis_pass, **kwargs)
         self.resource_pool = resource_pool
         self.resource_pool_key = self.keynamehelper.create_key_name("resource_pool", self.resource_pool)
+        self._allocate_script = self.redis.register_script(ALLOCATE_SCRIPT)
+        self._release_script = self.redis.register_script(RELEASE_SCRIPT)
+
+    def _sum_by_resource(self, amounts: Iterable[Tuple[str, int, int]]) -> Dict[str, Tuple[int, int]]:
+        """
+        Total up CPU and memory amounts for each involved resource, keyed by the resource's unique key.
+
+        Parameters
+        ----------
+        amounts : Iterable[Tuple[str, int, int]]
+            Tuples of a resource id, a number of CPUs, and an amount of memory.
+
+        Returns
+        -------
+        Dict[str, Tuple[int, int]]
+            The total CPUs and memory for each resource key, in the order each resource was first seen.
+        """
+        totals = OrderedDict()
+        for resource_id, cpus, memory in amounts:
+            resource_key = Resource.generate_unique_id(resource_id, separator=self.keynamehelper.separator)
+            total_cpus, total_memory = totals.get(resource_key, (0, 0))
+            totals[resource_key] = (total_cpus + cpus, total_memory + memory)
+        return totals
+
+    def _get_script_args(self, totals: Dict[str, Tuple[int, int]]) -> List[Union[str, int]]:
+        """
+        Get the leading script arguments describing how much of each resource is involved.
+
+        Parameters
+        ----------
+        totals : Dict[str, Tuple[int, int]]
+            The total CPUs and memory for each resource key, as produced by ::method:`_sum_by_resource`.
+
+        Returns
+        -------
+        List[Union[str, int]]
+            The cpu and memory hash fields, the number of resources, and the CPUs and memory for each resource.
+        """
+        args = [Resource.get_cpu_hash_key(), 'MemoryBytes', len(totals)]
+        for cpus, memory in totals.values():
+            args.extend((cpus, memory))
+        return args
 
     def add_resource(self, resource: Resource, resource_pool_key: Optional[str] = None):
         """
@@ -165,6 +265,67 @@ class RedisManager(ResourceManager, RedisBacked):
                 break
         return allocation
 
+    def allocate_resources(self, requests: Sequence[AllocationRequest]) -> Optional[List[ResourceAllocation]]:
+        """
+        Atomically allocate several requests at once, in a single round trip, fulfilling all of them or none of them.
+
+        Parameters
+        ----------
+        requests : Sequence[AllocationRequest]
+            Tuples of the resource id, number of CPUs, and amount of memory for each desired allocation.
+
+        Returns
+        -------
+        Optional[List[ResourceAllocation]]
+            An allocation for each request, in the same order, or ``None`` if the involved resources did not have enough
+            CPUs and memory available to fulfill all the requests.
+
+        Raises
+        ------
+        ValueError
+            If any request is invalid due to either an unrecognized source resource or requested CPU count of less than
+            1.
+        """
+        if any(cpus <= 0 for _, cpus, _ in requests):
+            raise ValueError("Invalid < 1 CPU allocation requested")
+
+        totals = self._sum_by_resource(requests)
+        resource_keys = list(totals.keys())
+
+        # Allocation keys are based on creation time, so make sure each allocation gets a distinct time
+        start_time = datetime.now()
+        created_times = [start_time + timedelta(microseconds=i) for i in range(len(requests))]
+        resource_indices = []
+        allocation_keys = []
+        args = self._get_script_args(totals)
+        for (resource_id, cpus, memory), created in zip(requests, created_times):
+            resource_indices.append(resource_keys.index(
+                Resource.generate_unique_id(resource_id, separator=self.keynamehelper.separator)))
+            # The hostname isn't known until the script reads the resource record, so the script fills it in
+            placeholder = ResourceAllocation(resource_id, None, cpus, memory, created=created)
+            placeholder.unique_id_separator = self.keynamehelper.separator
+            allocation_keys.append(placeholder.unique_id)
+            fields = [(k, v) for k, v in placeholder.to_dict().items() if k != 'Hostname']
+            args.extend((resource_indices[-1] + 1, len(fields)))
+            for field in fields:
+                args.extend(field)
+
+        result = self._allocate_script(keys=resource_keys + allocation_keys, args=args)
+
+        if isinstance(result, int):
+            if result < 0:
+                raise ValueError("Invalid allocation request to unrecognized resource {}".format(
+                    resource_keys[-result - 1]))
+            logging.debug("Insufficient resources in {} for bulk allocation".format(resource_keys[result - 1]))
+            return None
+
+        allocations = []
+        for (resource_id, cpus, memory), created, index in zip(requests, created_times, resource_indices):
+            allocation = ResourceAllocation(resource_id, result[index], cpus, memory, created=created)
+            allocation.unique_id_separator = self.keynamehelper.separator
+            allocations.append(allocation)
+        return allocations
+
     def release_resource(self, allocation: ResourceAllocation):
         """
         Release a resource allocated to the manager.
@@ -212,15 +373,31 @@ class RedisManager(ResourceManager, RedisBacked):
 
     def release_resources(self, allocated_resources: Iterable[ResourceAllocation]):
         """
-        Release any allocated resources to the manager.
+        Atomically release any allocated resources to the manager, in a single round trip.
 
         Parameters
         ----------
         allocated_resources : Iterable[ResourceAllocation]
             An iterable of resource allocation objects.
+
+        Raises
+        ------
+        RuntimeError
+            If the source resource of any of the allocations does not exist, in which case nothing is released.
         """
-        for allocation in allocated_resources:
-            self.release_resource(allocation)
+        allocations = [a for a in allocated_resources if a is not None]
+        if len(allocations) == 0:
+            return
+        for allocation in allocations:
+            allocation.unique_id_separator = self.keynamehelper.separator
+
+        totals = self._sum_by_resource((a.resource_id, a.cpu_count, a.memory) for a in allocations)
+        resource_keys = list(totals.keys())
+        result = self._release_script(keys=resource_keys + [a.unique_id for a in allocations],
+                                      args=self._get_script_args(totals))
+        if result != 0:
+            raise RuntimeError("RedisManager::release_resources -- No key {} exists to release resources to".format(
+                resource_keys[result - 1]))
 
     def get_available_cpu_count(self) -> int:
         """
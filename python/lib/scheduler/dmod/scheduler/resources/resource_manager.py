@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import logging
-from typing import Iterable, Optional, Union, List
+from typing import Iterable, Optional, Union, List, Sequence
 from abc import ABC, abstractmethod
 from .resource import Resource
 from .resource_allocation import ResourceAllocation
+from .allocation_strategy import AllocationRequest, AllocationStrategy, FillNodesStrategy, RoundRobinStrategy, \
+    SingleNodeStrategy
 
 # As a pure ABC probably don't need logging
 logging.basicConfig(
@@ -97,6 +99,32 @@ class ResourceManager(ABC):
         """
         pass
 
+    def allocate_resources(self, requests: Sequence[AllocationRequest]) -> Optional[List[ResourceAllocation]]:
+        """
+        Attempt to allocate several requests at once, either fulfilling all of them or none of them.
+
+        This default implementation makes each allocation in turn and releases those already made if any request cannot
+        be fulfilled.  Implementations able to claim everything in a single atomic operation should override it.
+
+        Parameters
+        ----------
+        requests : Sequence[AllocationRequest]
+            Tuples of the resource id, number of CPUs, and amount of memory for each desired allocation.
+
+        Returns
+        -------
+        Optional[List[ResourceAllocation]]
+            An allocation for each request, in the same order, or ``None`` if any request could not be fulfilled.
+        """
+        allocations = []
+        for resource_id, cpus, memory in requests:
+            alloc = self.allocate_resource(resource_id=resource_id, requested_cpus=cpus, requested_memory=memory)
+            if alloc is None:
+                self.release_resources(allocations)
+                return None
+            allocations.append(alloc)
+        return allocations
+
     @abstractmethod
     def release_resources(self, allocated_resources: Iterable[ResourceAllocation]):
         """
@@ -153,6 +181,39 @@ class ResourceManager(ABC):
         if not (isinstance(memory, int) and memory > 0):
             raise(ValueError("memory must be an integer > 0"))
 
+    def allocate_with_strategy(self, strategy: AllocationStrategy, cpus: int, memory: int,
+                               attempts: int = 3) -> List[Optional[ResourceAllocation]]:
+        """
+        Allocate job request according to the given strategy, claiming all planned allocations at once.
+
+        The strategy plans against a snapshot of the useable resources.  If the resources change before the plan can be
+        claimed, so that the claim fails, a new snapshot is taken and the process is retried.
+
+        Parameters
+        ----------
+            strategy: The strategy for dividing the request into allocations across resources
+            cpus: Total number of CPUs requested
+            memory: Amount of memory required in bytes
+            attempts: Maximum number of times to plan and attempt to claim the allocations
+
+        Returns
+        -------
+        [ResourceAlloction]
+            List of one or more ResourceAllocation if allocation successful, otherwise, [None]
+        """
+        self.validate_allocation_parameters(cpus, memory)
+        for _ in range(attempts):
+            requests = strategy.plan(list(self.get_useable_resources()), cpus, memory)
+            # If the resources can't fulfill the request, there is no point in trying again
+            if requests is None:
+                return [None]
+            allocations = self.allocate_resources(requests)
+            if allocations is not None:
+                return allocations
+            logging.debug("Resources changed before allocations planned by {} could be claimed".format(
+                strategy.__class__.__name__))
+        return [None]
+
     def allocate_single_node(self, cpus: int, memory: int) -> List[Optional[ResourceAllocation]]:
         """
         Check available resources to allocate job request to single-cpu allocations on a single node.
@@ -167,23 +228,7 @@ class ResourceManager(ABC):
         [ResourceAlloction]
             List of ResourceAllocation if allocation successful; otherwise, [None]
         """
-        #Fit the entire allocation on a single resource
-        self.validate_allocation_parameters(cpus, memory)
-
-        for res in self.get_useable_resources():
-            if res.cpu_count >= cpus and res.memory >= memory:
-                allocations = []
-                mem = int(memory / cpus)
-                for i in range(cpus):
-                    alloc = self.allocate_resource(resource_id=res.resource_id, requested_cpus=1, requested_memory=mem)
-                    if alloc is None:
-                        allocations = None
-                        break
-                    else:
-                        allocations.append(alloc)
-                if allocations is not None:
-                    return allocations
-        return [None]
+        return self.allocate_with_strategy(SingleNodeStrategy(), cpus, memory)
 
     def allocate_fill_nodes(self, cpus: int, memory: int) -> List[Optional[ResourceAllocation]]:
         """
@@ -202,45 +247,15 @@ class ResourceManager(ABC):
         [ResourceAlloction]
             List of one or more ResourceAllocation if allocation successful, otherwise, [None]
         """
-        self.validate_allocation_parameters(cpus, memory)
-        #TODO fill_nodes really should allocate on a MEM per CPU basis???
-        allocations = []
-        per_alloc_mem = int(memory / cpus)
-
-        for res in self.get_useable_resources(): #i in range(len(resources)):
-            # Greedily allocate a (potentially) partial allocation on this resource
-            alloc = self.allocate_resource(resource_id=res.resource_id, requested_cpus=1,
-                                           requested_memory=per_alloc_mem, partial=True)
-            # Whenever the allocation was (partially) successful
-            while alloc is not None and cpus > 0:
-                # Append, then do it again
-                allocations.append(alloc)
-                cpus -= 1
-                alloc = self.allocate_resource(resource_id=res.resource_id, requested_cpus=1,
-                                               requested_memory=per_alloc_mem, partial=True)
-                # TODO what about memory?  If mem_per_node, don't change it
-            # TODO think about mem per process type allocation
-            # Here (back in outer loop), if we have all needed allocations, break (otherwise, continue to next resource)
-            if cpus < 1:
-                break
-
-        # If not enough resources found, roll back and release the acquired allocations
-        if cpus > 0:
-            self.release_resources(allocations)
-            allocations = [None]
-        # Otherwise, return the allocations
-        return allocations
+        return self.allocate_with_strategy(FillNodesStrategy(), cpus, memory)
 
     def allocate_round_robin(self, cpus: int, memory: int) -> List[Optional[ResourceAllocation]]:
         """
             Check available resources on host nodes and allocate in round robin manner even the request
             can fit in a single node.
 
-            TODO this is a balanced round robin algorithm, assuming an even distribution is possible across all resources,
-            with up to num_node-1 remainders to fill in.  This is not the most generic "round robin" in which we allocate
-            cpus one after the other across all available resources and don't try to balance.
-            i.e. a request for 10 cpus with an available resource view of [4, 2, 4] would fail to allocate with this
-            algorithm, because it assumes an availablity of [4, 3, 3]
+            Single-cpu allocations are planned one after the other across all resources, skipping resources once they
+            are exhausted, and are then claimed all at once.
 
             Parameters
             ----------
@@ -252,44 +267,4 @@ class ResourceManager(ABC):
             [ResourceAlloction]
                 List of one or more ResourceAllocation if allocation successful, otherwise, [None]
         """
-        #TODO consider scaling memory per cpu
-        #Find the number of cpus to allocate to each node
-        self.validate_allocation_parameters(cpus, memory)
-        resources = list(self.get_useable_resources())
-        per_alloc_mem = int(memory / cpus)
-
-        num_node = len(resources)
-        if num_node == 0:
-            return [None]
-
-        allocations = []
-
-        # Keep track of when we have exhausted resources and can no longer allocate from them
-        resource_is_exhausted = []
-        for r in resources:
-            resource_is_exhausted.append(False)
-
-        #
-        resource_index = 0
-        while not all(resource_is_exhausted) and cpus > 0:
-            # If the resource for this iteration is not known to be exhausted, try to allocate from it
-            if not resource_is_exhausted[resource_index]:
-                # Assuming this resource isn't already known to be exhausted, try to allocate
-                alloc = self.allocate_resource(resource_id=resources[resource_index].resource_id, requested_cpus=1,
-                                               requested_memory=per_alloc_mem, partial=True)
-                # If we can't actually allocate from it, mark this resource as being exhausted
-                if alloc is None:
-                    resource_is_exhausted[resource_index] = True
-                # Whenever allocation was (partially) successful, add the allocation and decrement the cpus remaining
-                else:
-                    allocations.append(alloc)
-                    cpus -= 1
-            # Regardless, always move to the next resource (index) for next loop iteration
-            resource_index = (resource_index + 1) % len(resources)
-
-        # If this occurs, all resources were exhausted before everything could be fulfilled, so rollback and release
-        if cpus > 0:
-            self.release_resources(allocations)
-            allocations = [None]
-
-        return allocations
+        return self.allocate_with_strategy(RoundRobinStrategy(), cpus, memory)
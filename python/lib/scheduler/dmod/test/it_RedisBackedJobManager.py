@@ -1,13 +1,18 @@
+import asyncio
 import os
+import time
 import unittest
 from ..scheduler.job.job import Job, JobStatus, JobExecPhase, JobExecStep, RequestedJob, SchedulerRequestMessage
 from ..scheduler.job.job_manager import RedisBackedJobManager
+from ..scheduler.job.job_util import RedisBackedJobUtil
+from ..scheduler.resources.resource_allocation import ResourceAllocation
 from ..scheduler.rsa_key_pair import RsaKeyPair
 from . import MockResourceManager, mock_resources
 from dmod.communication import NWMRequest
 from dotenv import load_dotenv
 from pathlib import Path
 from typing import List, Optional, Tuple
+from unittest import mock
 from uuid import UUID
 
 
@@ -326,6 +331,31 @@ class IntegrationTestRedisBackedJobManager(unittest.TestCase):
 
         self.assertEqual(job_ids, active_job_ids)
 
+    # Test get_all_active_jobs with caching gives cached jobs until their records are saved elsewhere
+    def test_get_all_active_jobs_3_a(self):
+        jobs = [self._create_example_job_for_index(i) for i in range(2)]
+        self._job_manager.save_jobs(jobs)
+        caching_util = RedisBackedJobUtil(redis_host=self.redis_test_host, redis_port=self.redis_test_port,
+                                          redis_pass=self.redis_test_pass, cache_jobs=True, type=self._env_type)
+        first_jobs = {j.job_id: j for j in caching_util.get_all_active_jobs()}
+        second_jobs = {j.job_id: j for j in caching_util.get_all_active_jobs()}
+        self.assertEqual(first_jobs.keys(), {j.job_id for j in jobs})
+        self.assertTrue(all(second_jobs[job_id] is first_jobs[job_id] for job_id in first_jobs))
+
+        jobs[0].allocation_priority = jobs[0].allocation_priority + 1
+        self._job_manager.save_job(jobs[0])
+        third_jobs = {j.job_id: j for j in caching_util.get_all_active_jobs()}
+        self.assertIsNot(third_jobs[jobs[0].job_id], first_jobs[jobs[0].job_id])
+        self.assertEqual(third_jobs[jobs[0].job_id].allocation_priority, jobs[0].allocation_priority)
+        self.assertIs(third_jobs[jobs[1].job_id], first_jobs[jobs[1].job_id])
+
+    # Test save_jobs saves records for all the jobs, with the property values correctly
+    def test_save_jobs_1_a(self):
+        jobs = [self._create_example_job_for_index(i) for i in range(2)]
+        self._job_manager.save_jobs(jobs)
+        for job in jobs:
+            self.assertEqual(job.to_dict(), self._job_manager.retrieve_job(job.job_id).to_dict())
+
     # Test save_job saves a record (i.e., it later exists)
     def test_save_job_1_a(self):
         example_index = 0
@@ -377,6 +407,72 @@ class IntegrationTestRedisBackedJobManager(unittest.TestCase):
         saved_job = self._job_manager.retrieve_job(job.job_id)
         self.assertEqual(job.rsa_key_pair, saved_job.rsa_key_pair)
 
+    # Test compact job records can be read by utils both with and without compact records enabled
+    def test_save_job_3_a(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        compact_util = RedisBackedJobUtil(redis_host=self.redis_test_host, redis_port=self.redis_test_port,
+                                          redis_pass=self.redis_test_pass, compact_job_records=True,
+                                          type=self._env_type)
+        compact_util.save_job(job)
+        self.assertEqual(job.to_dict(), compact_util.retrieve_job(job.job_id).to_dict())
+        self.assertEqual(job.to_dict(), self._job_manager.retrieve_job(job.job_id).to_dict())
+
+    # Test saving only a status change to a compact job record doesn't rewrite the record's payload
+    def test_save_job_3_b(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        compact_util = RedisBackedJobUtil(redis_host=self.redis_test_host, redis_port=self.redis_test_port,
+                                          redis_pass=self.redis_test_pass, compact_job_records=True,
+                                          type=self._env_type)
+        compact_util.save_job(job)
+        # Writing the payload would clear this expiration
+        job_key = compact_util._get_job_key_for_id(job.job_id)
+        compact_util.redis.expire(job_key, 1000)
+        job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_ALLOCATION)
+        compact_util.save_job(job)
+        self.assertGreater(compact_util.redis.ttl(job_key), 0)
+        self.assertEqual(self._job_manager.retrieve_job(job.job_id).status_step, JobExecStep.AWAITING_ALLOCATION)
+
+    # Test a compact record saved over a JSON record saved by another util keeps all of its values
+    def test_save_job_3_c(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_DATA_CHECK)
+        compact_util = RedisBackedJobUtil(redis_host=self.redis_test_host, redis_port=self.redis_test_port,
+                                          redis_pass=self.redis_test_pass, compact_job_records=True,
+                                          type=self._env_type)
+        compact_util.save_job(job)
+
+        json_job = self._job_manager.retrieve_job(job.job_id)
+        json_job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_PARTITIONING)
+        self._job_manager.save_job(json_job)
+
+        compact_job = compact_util.retrieve_job(job.job_id)
+        compact_job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_ALLOCATION)
+        compact_util.save_job(compact_job)
+        self.assertEqual(compact_util.retrieve_job(job.job_id).status_step, JobExecStep.AWAITING_ALLOCATION)
+        self.assertEqual(self._job_manager.retrieve_job(job.job_id).status_step, JobExecStep.AWAITING_ALLOCATION)
+
+    # Test a payload is still saved when the record was saved by another compact util since last being read
+    def test_save_job_3_d(self):
+        example_index = 0
+        job = self._create_example_job_for_index(example_index)
+        first_util, second_util = [RedisBackedJobUtil(redis_host=self.redis_test_host, redis_port=self.redis_test_port,
+                                                      redis_pass=self.redis_test_pass, compact_job_records=True,
+                                                      type=self._env_type) for _ in range(2)]
+        first_util.save_job(job)
+
+        other_job = second_util.retrieve_job(job.job_id)
+        other_job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_PARTITIONING)
+        other_job.allocations = [ResourceAllocation('node001', 'node001', 4, 1000)]
+        second_util.save_job(other_job)
+
+        # The first util's payload is unchanged since it last saved it, but no longer matches the saved record
+        job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_ALLOCATION)
+        first_util.save_job(job)
+        self.assertEqual(job.to_dict(), second_util.retrieve_job(job.job_id).to_dict())
+
     # Test retrieve_job retrieves the expected Job object
     def test_retrieve_job_1_a(self):
         example_index = 0
@@ -393,6 +489,131 @@ class IntegrationTestRedisBackedJobManager(unittest.TestCase):
 
     # Note that retrieve_job_by_redis_key() function is always exercised by retrieve_job(), and thus implicitly tested
 
+    # Test a job lock can only be acquired again after being released
+    def test_lock_job_1_a(self):
+        example_index = 0
+        expected_job, created_job = self._exec_job_manager_create_from_expected(example_index)
+        self.assertTrue(self._job_manager.lock_job(created_job.job_id, 'lock_1'))
+        self.assertFalse(self._job_manager.lock_job(created_job.job_id, 'lock_2'))
+        self.assertFalse(self._job_manager.unlock_job(created_job.job_id, 'lock_2'))
+        self.assertTrue(self._job_manager.unlock_job(created_job.job_id, 'lock_1'))
+        self.assertTrue(self._job_manager.lock_job(created_job.job_id, 'lock_2'))
+        self._job_manager.unlock_job(created_job.job_id, 'lock_2')
+
+    # Test locking one job doesn't prevent locking another
+    def test_lock_job_1_b(self):
+        expected_job_1, created_job_1 = self._exec_job_manager_create_from_expected(0)
+        expected_job_2, created_job_2 = self._exec_job_manager_create_from_expected(1)
+        self.assertTrue(self._job_manager.lock_job(created_job_1.job_id, 'lock_1'))
+        self.assertTrue(self._job_manager.lock_job(created_job_2.job_id, 'lock_2'))
+        self._job_manager.unlock_job(created_job_1.job_id, 'lock_1')
+        self._job_manager.unlock_job(created_job_2.job_id, 'lock_2')
+
+    # Test locked_job provides the latest saved job, and nothing when the job is locked elsewhere
+    def test_locked_job_1_a(self):
+        example_index = 0
+        expected_job, created_job = self._exec_job_manager_create_from_expected(example_index)
+        with self._job_manager.locked_job(created_job.job_id) as locked_job:
+            self.assertEqual(locked_job, created_job)
+            with self._job_manager.locked_job(created_job.job_id) as other_locked_job:
+                self.assertIsNone(other_locked_job)
+        self.assertTrue(self._job_manager.lock_job(created_job.job_id, 'lock_1'))
+        self._job_manager.unlock_job(created_job.job_id, 'lock_1')
+
+    # Test locked_job keeps its lock past the lock expiration time, and releases it after
+    def test_locked_job_1_b(self):
+        example_index = 0
+        expected_job, created_job = self._exec_job_manager_create_from_expected(example_index)
+        self._job_manager._JOB_LOCK_EXPIRATION_MS = 300
+        self._job_manager._JOB_LOCK_RENEWAL_MS = 100
+        with self._job_manager.locked_job(created_job.job_id) as locked_job:
+            time.sleep(1)
+            self.assertFalse(self._job_manager.lock_job(created_job.job_id, 'lock_1'))
+        self.assertTrue(self._job_manager.lock_job(created_job.job_id, 'lock_1'))
+        self._job_manager.unlock_job(created_job.job_id, 'lock_1')
+
+    # Test renewed_job_locks reports a lock taken over by another holder as lost, and doesn't renew it
+    def test_renewed_job_locks_1_a(self):
+        expected_job_1, created_job_1 = self._exec_job_manager_create_from_expected(0)
+        expected_job_2, created_job_2 = self._exec_job_manager_create_from_expected(1)
+        self._job_manager._JOB_LOCK_RENEWAL_MS = 100
+        job_ids = [created_job_1.job_id, created_job_2.job_id]
+        self.assertTrue(all(self._job_manager.lock_job(i, 'lock_1') for i in job_ids))
+        with self._job_manager.renewed_job_locks(job_ids, 'lock_1') as lost_job_ids:
+            self._job_manager.redis.set(self._job_manager._get_job_lock_key(created_job_2.job_id), 'lock_2')
+            time.sleep(0.5)
+            self.assertEqual(lost_job_ids, {created_job_2.job_id})
+        lock_key = self._job_manager._get_job_lock_key(created_job_2.job_id)
+        self.assertEqual(self._job_manager.redis.get(lock_key), 'lock_2')
+        self.assertFalse(self._job_manager.unlock_job(created_job_2.job_id, 'lock_1'))
+        self.assertTrue(self._job_manager.unlock_job(created_job_1.job_id, 'lock_1'))
+
+    # Test only the given jobs are locked for management, and not those handled by other services
+    def test_lock_jobs_to_manage_1_a(self):
+        expected_job_1, created_job_1 = self._exec_job_manager_create_from_expected(0)
+        expected_job_2, created_job_2 = self._exec_job_manager_create_from_expected(1)
+        expected_job_3, created_job_3 = self._exec_job_manager_create_from_expected(2)
+        for job in (created_job_1, created_job_2):
+            job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_ALLOCATION)
+        created_job_3.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_PARTITIONING)
+        self._job_manager.save_jobs([created_job_1, created_job_2, created_job_3])
+
+        locked_jobs = self._job_manager._lock_jobs_to_manage([created_job_1, created_job_3], 'lock_1')
+        self.assertEqual([j.job_id for j in locked_jobs], [created_job_1.job_id])
+        self.assertFalse(self._job_manager.lock_job(created_job_1.job_id, 'lock_2'))
+        self.assertTrue(self._job_manager.lock_job(created_job_2.job_id, 'lock_2'))
+        self.assertTrue(self._job_manager.lock_job(created_job_3.job_id, 'lock_2'))
+
+    # Test a low priority job arriving by event isn't allocated ahead of a high priority job already waiting
+    def test_manage_jobs_1_a(self):
+        expected_job_1, waiting_job = self._exec_job_manager_create_from_expected(0)
+        expected_job_2, arriving_job = self._exec_job_manager_create_from_expected(1)
+        for job, priority in ((waiting_job, 150), (arriving_job, 10)):
+            job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_ALLOCATION)
+            job.allocation_priority = priority
+        self._job_manager.save_jobs([waiting_job, arriving_job])
+
+        requested_job_ids = []
+
+        # Only the arriving job fits in what is available
+        def request_allocations(job, require_awaiting_status: bool = True) -> bool:
+            requested_job_ids.append(job.job_id)
+            if job.job_id != arriving_job.job_id:
+                return False
+            job.status_step = JobExecStep.AWAITING_DATA
+            return True
+
+        with mock.patch.object(self._job_manager, 'request_allocations', side_effect=request_allocations):
+            self._job_manager._manage_jobs([arriving_job])
+
+        self.assertEqual(requested_job_ids, [waiting_job.job_id])
+        self.assertEqual(self._job_manager.retrieve_job(arriving_job.job_id).status_step,
+                         JobExecStep.AWAITING_ALLOCATION)
+        # Neither job should be left locked after the pass
+        self.assertTrue(self._job_manager.lock_job(waiting_job.job_id, 'lock_2'))
+        self.assertTrue(self._job_manager.lock_job(arriving_job.job_id, 'lock_2'))
+
+    # Test watch_active_jobs provides all active jobs, then a job as soon as another instance saves an update to it
+    def test_watch_active_jobs_1_a(self):
+        example_index = 0
+        expected_job, created_job = self._exec_job_manager_create_from_expected(example_index)
+        other_util = RedisBackedJobUtil(redis_host=self.redis_test_host, redis_port=self.redis_test_port,
+                                        redis_pass=self.redis_test_pass, type=self._env_type)
+
+        async def watch_for_update():
+            watcher = self._job_manager.watch_active_jobs(poll_seconds=60)
+            all_active_jobs = await watcher.__anext__()
+            created_job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_ALLOCATION)
+            other_util.save_job(created_job)
+            updated_jobs = await asyncio.wait_for(watcher.__anext__(), timeout=5)
+            await watcher.aclose()
+            return all_active_jobs, updated_jobs
+
+        all_active_jobs, updated_jobs = asyncio.run(watch_for_update())
+        self.assertIn(created_job.job_id, [j.job_id for j in all_active_jobs])
+        self.assertEqual([j.job_id for j in updated_jobs], [created_job.job_id])
+        self.assertEqual(updated_jobs[0].status_step, JobExecStep.AWAITING_ALLOCATION)
+
     # TODO: tests for request_allocations
     # Test request_allocations for a job with a single-node allocation paradigm fails with default status after creation
     def test_request_allocations_1_a(self):
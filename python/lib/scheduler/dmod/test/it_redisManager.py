@@ -432,6 +432,51 @@ class IntegrationTestRedisManager(unittest.TestCase):
         self.assertEqual(looked_up_resource_2nd.cpu_count, looked_up_resource_2nd.total_cpu_count)
         self.assertEqual(looked_up_resource_2nd.memory, looked_up_resource_2nd.total_memory)
 
+    def test_allocate_resources_1(self):
+        """
+            Test bulk allocating across multiple resources, and that nothing is allocated when any request can't be met
+        """
+        self.resource_manager.set_resources(self.mock_resources[0:2])
+        first, second = self.mock_resources[0:2]
+        requests = [(first.resource_id, first.cpu_count, 100), (second.resource_id, 1, 100)]
+
+        allocations = self.resource_manager.allocate_resources(requests)
+
+        self.assertEqual(len(allocations), 2)
+        self.assertEqual(allocations[0].hostname, first.hostname)
+        self.assertEqual(allocations[1].hostname, second.hostname)
+        for allocation in allocations:
+            self.assertTrue(self.redis.exists(allocation.unique_id))
+        looked_up_first = Resource.factory_init_from_dict(self.redis.hgetall(first.unique_id))
+        looked_up_second = Resource.factory_init_from_dict(self.redis.hgetall(second.unique_id))
+        self.assertEqual(looked_up_first.cpu_count, 0)
+        self.assertEqual(looked_up_second.cpu_count, second.total_cpu_count - 1)
+
+        # The first resource is now exhausted, so the second resource must not be touched either
+        self.assertIsNone(self.resource_manager.allocate_resources([(second.resource_id, 1, 0),
+                                                                    (first.resource_id, 1, 0)]))
+        looked_up_second = Resource.factory_init_from_dict(self.redis.hgetall(second.unique_id))
+        self.assertEqual(looked_up_second.cpu_count, second.total_cpu_count - 1)
+
+    def test_release_resources_2(self):
+        """
+            Test releasing bulk allocations across multiple resources
+        """
+        self.resource_manager.set_resources(self.mock_resources[0:2])
+        first, second = self.mock_resources[0:2]
+        allocations = self.resource_manager.allocate_resources([(first.resource_id, 1, 100),
+                                                                (first.resource_id, 1, 100),
+                                                                (second.resource_id, 2, 100)])
+
+        self.resource_manager.release_resources(allocations)
+
+        for resource in (first, second):
+            looked_up_resource = Resource.factory_init_from_dict(self.redis.hgetall(resource.unique_id))
+            self.assertEqual(looked_up_resource.cpu_count, looked_up_resource.total_cpu_count)
+            self.assertEqual(looked_up_resource.memory, looked_up_resource.total_memory)
+        for allocation in allocations:
+            self.assertFalse(self.redis.exists(allocation.unique_id))
+
     def test_get_available_cpu_count_1(self):
         """
             Test that all available CPUS are reported with 1 resource
@@ -0,0 +1,104 @@
+import unittest
+from collections import Counter
+from typing import List
+from dmod.core.execution import AllocationParadigm
+from dmod.modeldata.hydrofabric import Partition, PartitionConfig
+from ..scheduler.resources.allocation_strategy import BestFitStrategy, PartitionAwareStrategy, RoundRobinStrategy, \
+    WorstFitStrategy, get_allocation_strategy
+from ..scheduler.resources.resource import Resource
+
+
+def make_resources(cpu_counts: List[int], memory: int = 100000000000) -> List[Resource]:
+    return [Resource.factory_init_from_dict({'node_id': "Node-{:04d}".format(i + 1),
+                                             'Hostname': "hostname{}".format(i + 1),
+                                             'Availability': "active",
+                                             'State': "ready",
+                                             'CPUs': cpus,
+                                             'MemoryBytes': memory}) for i, cpus in enumerate(cpu_counts)]
+
+
+class TestAllocationStrategy(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # The uneven availability the original balanced round robin could not handle
+        self.resources = make_resources([4, 2, 4])
+        # Two chains of partitions, 0 -> 2 -> 4 and 1 -> 3 -> 5, linked only within each chain
+        self.partition_config = PartitionConfig([
+            Partition(partition_id=0, catchment_ids=['cat-0'], nexus_ids=['nex-0'],
+                      remote_down_nexuses=['nex-a', 'nex-b']),
+            Partition(partition_id=1, catchment_ids=['cat-1'], nexus_ids=['nex-1'],
+                      remote_down_nexuses=['nex-c', 'nex-d']),
+            Partition(partition_id=2, catchment_ids=['cat-2'], nexus_ids=['nex-2'],
+                      remote_up_nexuses=['nex-a', 'nex-b'], remote_down_nexuses=['nex-e']),
+            Partition(partition_id=3, catchment_ids=['cat-3'], nexus_ids=['nex-3'],
+                      remote_up_nexuses=['nex-c', 'nex-d'], remote_down_nexuses=['nex-f']),
+            Partition(partition_id=4, catchment_ids=['cat-4'], nexus_ids=['nex-4'], remote_up_nexuses=['nex-e']),
+            Partition(partition_id=5, catchment_ids=['cat-5'], nexus_ids=['nex-5'], remote_up_nexuses=['nex-f'])
+        ])
+
+    def tearDown(self) -> None:
+        pass
+
+    def _count_by_resource(self, requests) -> Counter:
+        return Counter(resource_id for resource_id, _, _ in requests)
+
+    # Test that round robin can use all CPUs across unevenly available resources
+    def test_round_robin_1_a(self):
+        requests = RoundRobinStrategy().plan(self.resources, 10, 10000)
+        self.assertEqual(self._count_by_resource(requests), {'Node-0001': 4, 'Node-0002': 2, 'Node-0003': 4})
+
+    # Test that best fit places a request on the resource that fits it most tightly
+    def test_best_fit_1_a(self):
+        requests = BestFitStrategy().plan(self.resources, 2, 2000)
+        self.assertEqual(self._count_by_resource(requests), {'Node-0002': 2})
+
+    # Test that best fit fills the largest resource and then fits the remainder most tightly
+    def test_best_fit_1_b(self):
+        requests = BestFitStrategy().plan(self.resources, 5, 5000)
+        self.assertEqual(self._count_by_resource(requests), {'Node-0001': 4, 'Node-0002': 1})
+        self.assertTrue(all(cpus == 1 and memory == 1000 for _, cpus, memory in requests))
+
+    # Test that best fit doesn't plan anything when the request can't be fulfilled
+    def test_best_fit_1_c(self):
+        self.assertIsNone(BestFitStrategy().plan(self.resources, 11, 11000))
+
+    # Test that best fit accounts for memory when determining what a resource can hold
+    def test_best_fit_1_d(self):
+        resources = make_resources([4, 4], memory=2000)
+        self.assertIsNone(BestFitStrategy().plan(resources, 5, 5000))
+        requests = BestFitStrategy().plan(resources, 4, 4000)
+        self.assertEqual(self._count_by_resource(requests), {'Node-0001': 2, 'Node-0002': 2})
+
+    # Test that worst fit spreads allocations so that resources are left with even remaining capacity
+    def test_worst_fit_1_a(self):
+        requests = WorstFitStrategy().plan(self.resources, 6, 6000)
+        self.assertEqual(self._count_by_resource(requests), {'Node-0001': 3, 'Node-0002': 1, 'Node-0003': 2})
+        # Allocations from the same resource are grouped together
+        self.assertEqual([r for r, _, _ in requests], ['Node-0001'] * 3 + ['Node-0002'] + ['Node-0003'] * 2)
+
+    # Test that worst fit doesn't plan anything when the request can't be fulfilled
+    def test_worst_fit_1_b(self):
+        self.assertIsNone(WorstFitStrategy().plan(self.resources, 11, 11000))
+
+    # Test that link weights count the nexuses shared across partition boundaries
+    def test_get_link_weights_1_a(self):
+        weights = PartitionAwareStrategy.get_link_weights(self.partition_config)
+        self.assertEqual(weights[0], {2: 2})
+        self.assertEqual(weights[2], {0: 2, 4: 1})
+        self.assertEqual(weights[5], {3: 1})
+
+    # Test that linked partitions are placed on the same host, with allocations in partition (i.e., rank) order
+    def test_partition_aware_1_a(self):
+        requests = PartitionAwareStrategy(self.partition_config).plan(make_resources([3, 3, 1]), 6, 6000)
+        self.assertEqual([r for r, _, _ in requests], ['Node-0001', 'Node-0002'] * 3)
+
+    # Test that the partition aware strategy falls back to best fit when the partitions don't match the request
+    def test_partition_aware_1_b(self):
+        requests = PartitionAwareStrategy(self.partition_config).plan(self.resources, 2, 2000)
+        self.assertEqual(requests, BestFitStrategy().plan(self.resources, 2, 2000))
+
+    # Test that the expected strategy is supplied for an allocation paradigm
+    def test_get_allocation_strategy_1_a(self):
+        strategy = get_allocation_strategy(AllocationParadigm.PARTITION_AWARE, self.partition_config)
+        self.assertIsInstance(strategy, PartitionAwareStrategy)
+        self.assertIsInstance(get_allocation_strategy(AllocationParadigm.WORST_FIT), WorstFitStrategy)
@@ -1,5 +1,5 @@
 import unittest
-from ..scheduler.job.job import Job, JobImpl, RequestedJob
+from ..scheduler.job.job import Job, JobExecPhase, JobExecStep, JobImpl, JobStatus, RequestedJob
 from dmod.core.meta_data import TimeRange
 from dmod.communication import NWMRequest, NGENRequest, SchedulerRequestMessage
 
@@ -198,3 +198,43 @@ class TestJob(unittest.TestCase):
 
         for f in [req.fulfilled_by for req in deserialized_job.data_requirements]:
             self.assertIsNotNone(f)
+
+    # Test that RequestedJob compact serialization deserializes to equal object, with the same state
+    @unittest.skipUnless(RequestedJob.is_compact_serialization_supported(), "requires msgpack")
+    def test_factory_init_from_compact_serialization_1_a(self):
+        example_index = 1
+
+        base_job = self._example_jobs[example_index]
+        base_job.allocation_priority = 5
+        payload, state = base_job.to_compact_serialization()
+        deserialized_job = RequestedJob.factory_init_from_compact_serialization(payload, state)
+        self.assertEqual(RequestedJob, deserialized_job.__class__)
+        self.assertEqual(base_job, deserialized_job)
+        self.assertEqual(base_job.status, deserialized_job.status)
+        self.assertEqual(deserialized_job.allocation_priority, 5)
+        self.assertEqual(base_job.to_dict(), deserialized_job.to_dict())
+
+    # Test that RequestedJob compact serialization keeps state values out of the payload
+    @unittest.skipUnless(RequestedJob.is_compact_serialization_supported(), "requires msgpack")
+    def test_to_compact_serialization_1_a(self):
+        example_index = 1
+
+        base_job = self._example_jobs[example_index]
+        payload, state = base_job.to_compact_serialization()
+        self.assertEqual(set(state.keys()), set(RequestedJob.COMPACT_STATE_KEYS))
+        base_job.status = JobStatus(JobExecPhase.MODEL_EXEC, JobExecStep.AWAITING_ALLOCATION)
+        base_job.allocation_priority = base_job.allocation_priority + 1
+        updated_payload, updated_state = base_job.to_compact_serialization()
+        self.assertEqual(payload, updated_payload)
+        self.assertNotEqual(state, updated_state)
+
+    # Test that compact serialization from an unsupported schema version is rejected
+    @unittest.skipUnless(RequestedJob.is_compact_serialization_supported(), "requires msgpack")
+    def test_factory_init_from_compact_serialization_1_b(self):
+        import msgpack
+        example_index = 1
+
+        payload, state = self._example_jobs[example_index].to_compact_serialization()
+        schema_version, serial = msgpack.unpackb(payload)
+        payload = msgpack.packb([schema_version + 1, serial])
+        self.assertRaises(ValueError, RequestedJob.factory_init_from_compact_serialization, payload, state)
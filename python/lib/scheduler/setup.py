@@ -21,7 +21,8 @@ setup(
     url='',
     license='',
     install_requires=['docker', 'Faker', 'dmod-communication>=0.8.0', 'dmod-modeldata>=0.7.1', 'dmod-redis>=0.1.0',
-                      'dmod-core>=0.2.0', 'cryptography', 'uri', 'pyyaml'],
+                      'dmod-core>=0.7.0', 'cryptography', 'uri', 'pyyaml'],
+    extras_require={'msgpack': ['msgpack']},
     packages=find_namespace_packages(exclude=['dmod.test', 'src'])
 )
 
@@ -936,63 +936,60 @@ class ServiceManager(WebSocketInterface):
         whether each individual requirement can be fulfilled for a job.  If so, the job is moved to the
         ``AWAITING_PARTITIONING`` step and any needed output datasets are created.  If not, the job is moved to the
         ``DATA_UNPROVIDEABLE`` step.
+
+        Jobs are examined as soon as they are updated, with all active jobs also examined periodically as a fallback.
+        Each job is locked only while it is being examined.
         """
         logging.debug("Starting task loop for performing checks for required data for jobs.")
-        while True:
-            lock_id = str(uuid4())
-            while not self._job_util.lock_active_jobs(lock_id):
-                await asyncio.sleep(2)
-
-            for job in self._job_util.get_all_active_jobs():
-                if job.status_step != JobExecStep.AWAITING_DATA_CHECK:
-                    continue
-
-                logging.debug("Checking if required data is available for job {}.".format(job.job_id))
-                # Check if all requirements for this job can be fulfilled, updating the job's status based on result
-                if await self.perform_checks_for_job(job):
-                    logging.info("All required data for {} is available.".format(job.job_id))
-                    # Before moving to next successful step, also create output datasets and requirement entries
-                    self._create_output_datasets(job)
-                    job.status_step = JobExecStep.AWAITING_PARTITIONING if job.cpu_count > 1 else JobExecStep.AWAITING_ALLOCATION
-                else:
-                    logging.error("Some or all required data for {} is unprovideable.".format(job.job_id))
-                    job.status_step = JobExecStep.DATA_UNPROVIDEABLE
-                # Regardless, save the updated job state
-                try:
-                    self._job_util.save_job(job)
-                except:
-                    # TODO: logging would be good, and perhaps maybe retries
-                    pass
-            self._job_util.unlock_active_jobs(lock_id)
-            await asyncio.sleep(5)
+        async for jobs in self._job_util.watch_active_jobs():
+            for job_id in [j.job_id for j in jobs if j.status_step == JobExecStep.AWAITING_DATA_CHECK]:
+                with self._job_util.locked_job(job_id) as job:
+                    # Skip jobs locked elsewhere or already moved along; any later update will bring them back
+                    if job is None or job.status_step != JobExecStep.AWAITING_DATA_CHECK:
+                        continue
+
+                    logging.debug("Checking if required data is available for job {}.".format(job.job_id))
+                    # Check if all requirements for this job can be fulfilled, updating the job's status based on result
+                    if await self.perform_checks_for_job(job):
+                        logging.info("All required data for {} is available.".format(job.job_id))
+                        # Before moving to next successful step, also create output datasets and requirement entries
+                        self._create_output_datasets(job)
+                        job.status_step = JobExecStep.AWAITING_PARTITIONING if job.cpu_count > 1 else JobExecStep.AWAITING_ALLOCATION
+                    else:
+                        logging.error("Some or all required data for {} is unprovideable.".format(job.job_id))
+                        job.status_step = JobExecStep.DATA_UNPROVIDEABLE
+                    # Regardless, save the updated job state
+                    try:
+                        self._job_util.save_job(job)
+                    except:
+                        # TODO: logging would be good, and perhaps maybe retries
+                        pass
 
     async def manage_data_provision(self):
         """
-        Task method to periodically associate and (when needed) generate required datasets with/for jobs.
+        Task method to associate and (when needed) generate required datasets with/for jobs as they begin awaiting data.
         """
         logging.debug("Starting task loop for performing data provisioning for requested jobs.")
-        while True:
-            lock_id = str(uuid4())
-            while not self._job_util.lock_active_jobs(lock_id):
-                await asyncio.sleep(2)
-
-            for job in [j for j in self._job_util.get_all_active_jobs() if j.status_step == JobExecStep.AWAITING_DATA]:
-                logging.debug("Managing provisioning for job {} that is awaiting data.".format(job.job_id))
-
-                # Initialize dataset Docker volumes required for a job
-                try:
-                    logging.debug('Initializing any required S3FS dataset volumes for {}'.format(job.job_id))
-                    self._docker_s3fs_helper.init_volumes(job=job)
-                except Exception as e:
-                    job.status_step = JobExecStep.DATA_FAILURE
+        async for jobs in self._job_util.watch_active_jobs():
+            for job_id in [j.job_id for j in jobs if j.status_step == JobExecStep.AWAITING_DATA]:
+                with self._job_util.locked_job(job_id) as job:
+                    # Skip jobs locked elsewhere or already moved along; any later update will bring them back
+                    if job is None or job.status_step != JobExecStep.AWAITING_DATA:
+                        continue
+
+                    logging.debug("Managing provisioning for job {} that is awaiting data.".format(job.job_id))
+
+                    # Initialize dataset Docker volumes required for a job
+                    try:
+                        logging.debug('Initializing any required S3FS dataset volumes for {}'.format(job.job_id))
+                        self._docker_s3fs_helper.init_volumes(job=job)
+                    except Exception as e:
+                        job.status_step = JobExecStep.DATA_FAILURE
+                        self._job_util.save_job(job)
+                        continue
+
+                    job.status_step = JobExecStep.AWAITING_SCHEDULING
                     self._job_util.save_job(job)
-                    continue
-
-                job.status_step = JobExecStep.AWAITING_SCHEDULING
-                self._job_util.save_job(job)
-
-            self._job_util.unlock_active_jobs(lock_id)
-            await asyncio.sleep(5)
 
     async def perform_checks_for_job(self, job: Job) -> bool:
         """
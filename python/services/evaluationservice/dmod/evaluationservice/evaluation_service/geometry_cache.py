@@ -0,0 +1,359 @@
+"""
+Keeps geometry datasets in memory so that map requests don't need to read them from disk every time
+
+Each dataset is read once per modification, projected for display, and simplified for a handful of zoom tiers. Every
+tier carries a spatial index so that bounding box queries can be answered without touching the file.
+"""
+import typing
+import os
+import json
+import hashlib
+import threading
+
+from collections import OrderedDict
+
+import numpy
+import pandas
+import geopandas
+import shapely
+
+from pandas.api.types import is_integer_dtype
+from pandas.api.types import is_float_dtype
+
+from dmod.evaluations.backends.cache import ByteCache
+
+
+DISPLAY_CRS = "EPSG:4326"
+"""The coordinate reference system that geometry is served in; GeoJSON is expected to use WGS84"""
+
+SIMPLIFICATION_TOLERANCES: typing.Sequence[float] = (0.0, 0.0005, 0.005, 0.05)
+"""How far (in degrees) geometry may be simplified for each zoom tier; the first tier is full detail"""
+
+ZOOM_TIER_THRESHOLDS: typing.Sequence[int] = (11, 8, 5)
+"""The lowest map zoom level that will be served each tier of detail, from most detailed to least"""
+
+NULL_VALUES = ("nan", "null", "na", "none")
+
+BOUNDING_BOX = typing.Sequence[float]
+
+
+def get_cached_dataset_count() -> int:
+    """
+    The optional `EVALUATION_GEOMETRY_CACHE_SIZE` environment variable may be set to control how many datasets are
+    kept in memory
+
+    Returns:
+        The number of datasets to keep in memory
+    """
+    return max(int(os.environ.get("EVALUATION_GEOMETRY_CACHE_SIZE", 4)), 1)
+
+
+def get_response_cache_bytes() -> int:
+    """
+    The optional `EVALUATION_GEOMETRY_RESPONSE_CACHE_BYTES` environment variable may be set to control how much
+    memory may be used for prepared responses
+
+    Returns:
+        The number of bytes that compressed responses may occupy
+    """
+    return int(os.environ.get("EVALUATION_GEOMETRY_RESPONSE_CACHE_BYTES", 64 * 1024 * 1024))
+
+
+def get_zoom_tier(zoom: typing.Union[str, int, float, None]) -> int:
+    """
+    Determine what tier of detail should be used for a map zoom level
+
+    Args:
+        zoom: The zoom level of the map requesting geometry. Full detail is used if it isn't given
+
+    Returns:
+        The index of the tier of detail to use
+    """
+    if zoom is None or (isinstance(zoom, str) and not zoom.strip()):
+        return 0
+
+    try:
+        zoom = float(zoom)
+    except ValueError:
+        return 0
+
+    for tier, minimum_zoom in enumerate(ZOOM_TIER_THRESHOLDS):
+        if zoom >= minimum_zoom:
+            return tier
+
+    return len(ZOOM_TIER_THRESHOLDS)
+
+
+def get_pertinent_columns(frame: pandas.DataFrame) -> typing.List[str]:
+    """
+    Args:
+        frame: A frame of geometry
+
+    Returns:
+        The names of the columns that are worth serving
+    """
+    return [
+        column_name
+        for column_name in frame.keys()
+        if column_name.lower() in ("name", "geometry")
+           or column_name.lower().endswith("id")
+    ]
+
+
+def create_etag(*parts) -> str:
+    """
+    Create an entity tag describing a response built from the given parts
+
+    Args:
+        *parts: Everything that determines the content of a response
+
+    Returns:
+        A quoted entity tag suitable for an `ETag` header
+    """
+    serialized_parts = json.dumps(parts, sort_keys=True, default=str)
+    return f'"{hashlib.sha256(serialized_parts.encode()).hexdigest()[:32]}"'
+
+
+class GeometryTier:
+    """
+    Geometry at a single level of detail along with a spatial index for it
+    """
+    def __init__(self, geometry: geopandas.GeoDataFrame, tolerance: float):
+        """
+        Constructor
+
+        Args:
+            geometry: The full detail geometry
+            tolerance: How far geometry may be simplified
+        """
+        if tolerance > 0:
+            geometry = geometry.copy()
+            geometry["geometry"] = geometry.geometry.simplify(tolerance, preserve_topology=True)
+
+        self.__geometry = geometry
+        self.__tolerance = tolerance
+        self.__tree = shapely.STRtree(geometry.geometry.values)
+
+    @property
+    def geometry(self) -> geopandas.GeoDataFrame:
+        return self.__geometry
+
+    @property
+    def tolerance(self) -> float:
+        return self.__tolerance
+
+    def query(
+        self,
+        bounding_box: BOUNDING_BOX = None,
+        filters: typing.Mapping[str, typing.Optional[str]] = None,
+        geometry_name: str = None
+    ) -> geopandas.GeoDataFrame:
+        """
+        Find geometry matching the given criteria
+
+        Args:
+            bounding_box: The minimum x, minimum y, maximum x, and maximum y that geometry must intersect
+            filters: Values that columns must be equal to; null-like values match missing values
+            geometry_name: The id or name of a specific geometry
+
+        Returns:
+            All matching geometry
+        """
+        geometry = self.__geometry
+
+        if bounding_box is not None:
+            positions = self.__tree.query(shapely.box(*bounding_box), predicate="intersects")
+            geometry = geometry.iloc[numpy.sort(positions)]
+
+        for column_name, value in (filters or dict()).items():
+            if column_name == "geometry" or column_name not in geometry:
+                continue
+
+            column = geometry[column_name]
+
+            if value is None or value.lower().strip() in NULL_VALUES:
+                geometry = geometry[column.isnull()]
+            elif is_integer_dtype(column.dtype):
+                geometry = geometry[column == int(float(value))]
+            elif is_float_dtype(column.dtype):
+                geometry = geometry[column == float(value)]
+            else:
+                geometry = geometry[column == value]
+
+        if "id" in geometry:
+            geometry = geometry.set_index("id")
+        elif "name" in geometry:
+            geometry = geometry.set_index("name")
+
+        if geometry_name:
+            geometry = geometry.filter(items=[geometry_name], axis=0)
+
+        return geometry
+
+
+class CachedGeometry:
+    """
+    A geometry dataset read from a single version of a file, with tiers of detail built as they are needed
+    """
+    def __init__(self, path: str, modification_time: int, size: int):
+        """
+        Constructor
+
+        Args:
+            path: The path to the dataset
+            modification_time: When the dataset was last modified, in nanoseconds
+            size: The size of the dataset in bytes
+        """
+        self.__path = path
+        self.__modification_time = modification_time
+        self.__size = size
+        self.__tiers: typing.Dict[int, GeometryTier] = dict()
+        self.__lock = threading.Lock()
+
+        geometry = geopandas.read_file(path)
+
+        if geometry.crs is not None and not geometry.crs.equals(DISPLAY_CRS):
+            geometry = geometry.to_crs(DISPLAY_CRS)
+
+        self.__geometry: geopandas.GeoDataFrame = geometry[get_pertinent_columns(geometry)]
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def version(self) -> typing.Tuple[int, int]:
+        """
+        Returns:
+            The modification time and size of the file that this was read from
+        """
+        return self.__modification_time, self.__size
+
+    def get_tier(self, tier: int) -> GeometryTier:
+        """
+        Args:
+            tier: The index of the level of detail to get
+
+        Returns:
+            The geometry at the given level of detail
+        """
+        tier = min(max(tier, 0), len(SIMPLIFICATION_TOLERANCES) - 1)
+
+        with self.__lock:
+            if tier not in self.__tiers:
+                self.__tiers[tier] = GeometryTier(self.__geometry, SIMPLIFICATION_TOLERANCES[tier])
+            return self.__tiers[tier]
+
+
+class GeometryCache:
+    """
+    A limited number of the most recently used geometry datasets
+    """
+    def __init__(self, max_entries: int = None):
+        """
+        Constructor
+
+        Args:
+            max_entries: The number of datasets to keep in memory
+        """
+        self.__max_entries = max_entries or get_cached_dataset_count()
+        self.__entries: typing.OrderedDict[typing.Any, CachedGeometry] = OrderedDict()
+        self.__lock = threading.Lock()
+
+        # Held while a dataset is being read so that simultaneous requests for it only read it once
+        self.__loading_locks: typing.Dict[typing.Any, threading.Lock] = dict()
+
+    def __find(
+        self,
+        key: typing.Hashable,
+        path: str,
+        version: typing.Tuple[int, int]
+    ) -> typing.Optional[CachedGeometry]:
+        """
+        Get a dataset if the given version of it is already in memory; the caller must hold the lock
+
+        Args:
+            key: The identifier for the dataset
+            path: Where the dataset is stored
+            version: The modification time and size of the dataset on disk
+
+        Returns:
+            The dataset if it has already been read
+        """
+        cached_geometry = self.__entries.get(key)
+
+        if cached_geometry is None or cached_geometry.path != path or cached_geometry.version != version:
+            return None
+
+        self.__entries.move_to_end(key)
+        return cached_geometry
+
+    def get(self, key: typing.Hashable, path: str, status: os.stat_result = None) -> CachedGeometry:
+        """
+        Get a dataset, reading it again if its file has changed since it was last read
+
+        Only one request reads a dataset at a time; others asking for the same dataset wait for that read to finish
+
+        Args:
+            key: The identifier for the dataset
+            path: Where the dataset is stored
+            status: The status of the file at `path` if the caller has already checked it
+
+        Returns:
+            The dataset as it currently exists on disk
+        """
+        if status is None:
+            status = os.stat(path)
+
+        version = (status.st_mtime_ns, status.st_size)
+
+        with self.__lock:
+            cached_geometry = self.__find(key, path, version)
+
+            if cached_geometry is not None:
+                return cached_geometry
+
+            loading_lock = self.__loading_locks.setdefault(key, threading.Lock())
+
+        # Read outside of the main lock so that requests for other datasets aren't held up
+        with loading_lock:
+            with self.__lock:
+                # The dataset may have been read while this request was waiting for its turn
+                cached_geometry = self.__find(key, path, version)
+
+                if cached_geometry is not None:
+                    return cached_geometry
+
+            try:
+                cached_geometry = CachedGeometry(path, *version)
+            finally:
+                with self.__lock:
+                    if cached_geometry is not None:
+                        self.__entries[key] = cached_geometry
+                        self.__entries.move_to_end(key)
+
+                        while len(self.__entries) > self.__max_entries:
+                            self.__entries.popitem(last=False)
+
+                    if self.__loading_locks.get(key) is loading_lock:
+                        del self.__loading_locks[key]
+
+        return cached_geometry
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def __contains__(self, key) -> bool:
+        with self.__lock:
+            return key in self.__entries
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
+
+GEOMETRY = GeometryCache()
+"""Geometry datasets that have been requested by this process"""
+
+RESPONSES = ByteCache(max_bytes=get_response_cache_bytes())
+"""Compressed responses for geometry requests, keyed by their entity tags"""
@@ -0,0 +1,81 @@
+import json
+import unittest
+
+from unittest import mock
+
+import fakeredis
+
+from utilities import communication
+
+
+class RedisCommunicatorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = fakeredis.FakeServer()
+        connection_patch = mock.patch.object(
+            communication.redis,
+            "Redis",
+            side_effect=lambda *args, **kwargs: fakeredis.FakeRedis(server=self.server)
+        )
+        connection_patch.start()
+        self.addCleanup(connection_patch.stop)
+
+        self.connection = fakeredis.FakeRedis(server=self.server)
+
+        # The timer should never be what sends messages in these tests
+        self.communicator = communication.RedisCommunicator("batch-test", batch_size=4, flush_interval=600)
+        self.info_key = communication.get_evaluation_pointers("batch-test")["info_key"]
+
+        self.listener = self.connection.pubsub(ignore_subscribe_messages=True)
+        self.listener.subscribe(self.communicator.channel)
+
+    def tearDown(self) -> None:
+        self.listener.close()
+
+    def get_published_events(self) -> list:
+        events = list()
+        message = self.listener.get_message()
+
+        while message is not None:
+            events.append(json.loads(message["data"]))
+            message = self.listener.get_message()
+
+        return events
+
+    def test_messages_are_sent_in_batches(self):
+        # The registration message from the constructor is already buffered
+        self.communicator.info("first")
+        self.communicator.info("second")
+        self.assertEqual(self.connection.llen(self.info_key), 0)
+
+        self.communicator.info("third")
+        self.assertEqual(self.connection.llen(self.info_key), 4)
+        self.assertEqual(self.communicator.statistics.flush_count, 1)
+        self.assertEqual(self.communicator.statistics.largest_batch, 4)
+
+        self.communicator.info("fourth")
+        self.assertEqual(self.connection.llen(self.info_key), 4)
+
+        self.communicator.flush()
+        self.assertEqual(
+            [message.decode() for message in self.connection.lrange(self.info_key, 1, -1)],
+            ["first", "second", "third", "fourth"]
+        )
+
+    def test_completion_flushes_and_later_messages_follow_it(self):
+        self.communicator.info("scoring", publish=True)
+        self.assertEqual(self.get_published_events(), [])
+
+        self.communicator.update(complete=True)
+        events = self.get_published_events()
+        self.assertEqual([event["event"] for event in events], ["info", "update"])
+
+        # Nothing may be left to flush a message sent after completion, so it has to go out right away
+        self.communicator.info("batch-test is complete", publish=True)
+        events = self.get_published_events()
+        self.assertEqual([event["event"] for event in events], ["info"])
+        self.assertIn("batch-test is complete", events[0]["data"])
+        self.assertEqual(self.connection.lrange(self.info_key, -1, -1)[0].decode(), "batch-test is complete")
+
+
+if __name__ == '__main__':
+    unittest.main()
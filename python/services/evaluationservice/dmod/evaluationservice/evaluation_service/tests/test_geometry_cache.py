@@ -0,0 +1,179 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from unittest import mock
+
+import geopandas
+import shapely
+
+from evaluation_service import geometry_cache
+
+
+WEB_MERCATOR = "EPSG:3857"
+
+
+def write_geometry(directory: str, file_name: str = "geometry.geojson") -> str:
+    """
+    Write a few points with nullable attributes to a file in a projected coordinate reference system
+    """
+    points = geopandas.GeoDataFrame(
+        {
+            "id": ["cat-1", "cat-2", "cat-3", "cat-4"],
+            "name": ["one", "two", "three", "four"],
+            "toid": ["nex-1", None, "nex-3", None],
+            "order_id": [1, 2, 2, 3],
+            "ignored": ["a", "b", "c", "d"],
+        },
+        geometry=[
+            shapely.Point(0, 0),
+            shapely.Point(1, 0),
+            shapely.Point(0, 1),
+            shapely.Point(-10, -10),
+        ],
+        crs="EPSG:4326"
+    ).to_crs(WEB_MERCATOR)
+
+    path = os.path.join(directory, file_name)
+    points.to_file(path, driver="GeoJSON")
+    return path
+
+
+class GeometryCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = write_geometry(self.directory.name)
+
+    def test_get_zoom_tier(self):
+        self.assertEqual(geometry_cache.get_zoom_tier(None), 0)
+        self.assertEqual(geometry_cache.get_zoom_tier(""), 0)
+        self.assertEqual(geometry_cache.get_zoom_tier("not a zoom"), 0)
+        self.assertEqual(geometry_cache.get_zoom_tier(14), 0)
+        self.assertEqual(geometry_cache.get_zoom_tier("9.5"), 1)
+        self.assertEqual(geometry_cache.get_zoom_tier(5), 2)
+        self.assertEqual(geometry_cache.get_zoom_tier(2), 3)
+
+    def test_create_etag(self):
+        entity_tag = geometry_cache.create_etag(1, "path", {"b": "2", "a": "1"})
+
+        self.assertTrue(entity_tag.startswith('"') and entity_tag.endswith('"'))
+        self.assertEqual(entity_tag, geometry_cache.create_etag(1, "path", {"a": "1", "b": "2"}))
+        self.assertNotEqual(entity_tag, geometry_cache.create_etag(1, "path", {"a": "1", "b": "3"}))
+
+    def test_geometry_is_served_in_display_crs(self):
+        cached_geometry = geometry_cache.CachedGeometry(self.path, 0, 0)
+        geometry = cached_geometry.get_tier(0).geometry
+
+        self.assertTrue(geometry.crs.equals(geometry_cache.DISPLAY_CRS))
+        self.assertEqual(list(geometry.keys()), ["id", "name", "toid", "order_id", "geometry"])
+
+        point = geometry.set_index("id").geometry["cat-2"]
+        self.assertAlmostEqual(point.x, 1.0, places=4)
+        self.assertAlmostEqual(point.y, 0.0, places=4)
+
+    def test_bounding_box_query(self):
+        tier = geometry_cache.CachedGeometry(self.path, 0, 0).get_tier(0)
+
+        self.assertEqual(list(tier.query().index), ["cat-1", "cat-2", "cat-3", "cat-4"])
+        self.assertEqual(list(tier.query(bounding_box=[-0.5, -0.5, 1.5, 0.5]).index), ["cat-1", "cat-2"])
+        self.assertEqual(list(tier.query(bounding_box=[-11, -11, -9, -9]).index), ["cat-4"])
+        self.assertEqual(len(tier.query(bounding_box=[50, 50, 60, 60])), 0)
+
+    def test_attribute_filters(self):
+        tier = geometry_cache.CachedGeometry(self.path, 0, 0).get_tier(0)
+
+        self.assertEqual(list(tier.query(filters={"name": "three"}).index), ["cat-3"])
+        self.assertEqual(list(tier.query(filters={"order_id": "2"}).index), ["cat-2", "cat-3"])
+        self.assertEqual(list(tier.query(filters={"order_id": "2.0"}).index), ["cat-2", "cat-3"])
+
+        # Null-like values should match missing values
+        self.assertEqual(list(tier.query(filters={"toid": "null"}).index), ["cat-2", "cat-4"])
+        self.assertEqual(list(tier.query(filters={"toid": " None "}).index), ["cat-2", "cat-4"])
+        self.assertEqual(list(tier.query(filters={"toid": None}).index), ["cat-2", "cat-4"])
+
+        # Unknown columns and the geometry itself can't be filtered on
+        self.assertEqual(len(tier.query(filters={"missing": "value", "geometry": "POINT (0 0)"})), 4)
+
+        self.assertEqual(
+            list(tier.query(bounding_box=[-0.5, -0.5, 1.5, 1.5], filters={"order_id": "2"}).index),
+            ["cat-2", "cat-3"]
+        )
+
+    def test_geometry_name(self):
+        tier = geometry_cache.CachedGeometry(self.path, 0, 0).get_tier(0)
+
+        self.assertEqual(list(tier.query(geometry_name="cat-3").index), ["cat-3"])
+        self.assertEqual(len(tier.query(geometry_name="cat-5")), 0)
+        self.assertEqual(len(tier.query(bounding_box=[-0.5, -0.5, 1.5, 0.5], geometry_name="cat-3")), 0)
+
+    def test_tiers_are_simplified(self):
+        cached_geometry = geometry_cache.CachedGeometry(self.path, 0, 0)
+
+        self.assertEqual(cached_geometry.get_tier(0).tolerance, 0.0)
+        self.assertEqual(cached_geometry.get_tier(-1).tolerance, 0.0)
+        self.assertEqual(
+            cached_geometry.get_tier(len(geometry_cache.SIMPLIFICATION_TOLERANCES) + 3).tolerance,
+            geometry_cache.SIMPLIFICATION_TOLERANCES[-1]
+        )
+        self.assertIs(cached_geometry.get_tier(1), cached_geometry.get_tier(1))
+
+    def test_datasets_are_reread_when_changed(self):
+        cache = geometry_cache.GeometryCache(max_entries=2)
+
+        first_read = cache.get(1, self.path)
+        self.assertIs(cache.get(1, self.path), first_read)
+
+        os.utime(self.path, ns=(first_read.version[0] + 10**9, first_read.version[0] + 10**9))
+        self.assertIsNot(cache.get(1, self.path), first_read)
+
+    def test_simultaneous_requests_read_once(self):
+        cache = geometry_cache.GeometryCache(max_entries=2)
+        request_count = 8
+        start = threading.Barrier(request_count)
+        read_file = geometry_cache.geopandas.read_file
+        read_paths = list()
+        results = list()
+
+        def slow_read(path, *args, **kwargs):
+            read_paths.append(path)
+            # Give every other request time to arrive while this one is reading
+            time.sleep(0.2)
+            return read_file(path, *args, **kwargs)
+
+        def request_geometry():
+            start.wait()
+            results.append(cache.get(1, self.path))
+
+        with mock.patch.object(geometry_cache.geopandas, "read_file", side_effect=slow_read):
+            requests = [threading.Thread(target=request_geometry) for _ in range(request_count)]
+
+            for request in requests:
+                request.start()
+
+            for request in requests:
+                request.join()
+
+        self.assertEqual(read_paths, [self.path])
+        self.assertEqual(len(results), request_count)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_least_recently_used_datasets_are_dropped(self):
+        cache = geometry_cache.GeometryCache(max_entries=2)
+        other_path = write_geometry(self.directory.name, "other.geojson")
+
+        cache.get(1, self.path)
+        cache.get(2, other_path)
+        cache.get(1, self.path)
+        cache.get(3, other_path)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn(1, cache)
+        self.assertNotIn(2, cache)
+        self.assertIn(3, cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import gzip
+import json
+import tempfile
+
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.test import RequestFactory
+
+from evaluation_service import geometry_cache
+from evaluation_service.views import geometry
+
+from .test_geometry_cache import write_geometry
+
+
+class GetGeometryTest(SimpleTestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.dataset = SimpleNamespace(pk=1, name="Test Geometry", path=write_geometry(self.directory.name))
+
+        dataset_patch = mock.patch.object(geometry, "get_object_or_404", return_value=self.dataset)
+        self.get_dataset = dataset_patch.start()
+        self.addCleanup(dataset_patch.stop)
+
+        geometry_cache.GEOMETRY.clear()
+        geometry_cache.RESPONSES.clear()
+        self.addCleanup(geometry_cache.GEOMETRY.clear)
+        self.addCleanup(geometry_cache.RESPONSES.clear)
+
+        self.factory = RequestFactory()
+        self.view = geometry.GetGeometry.as_view()
+
+    def get(self, geometry_name: str = None, headers: dict = None, **query):
+        request = self.factory.get(f"/geometry/{self.dataset.pk}", data=query, headers=headers)
+        return self.view(request, dataset_id=self.dataset.pk, geometry_name=geometry_name)
+
+    @staticmethod
+    def get_feature_ids(response) -> list:
+        return [feature["id"] for feature in json.loads(response.content)["features"]]
+
+    def test_geometry_is_filtered(self):
+        response = self.get(bbox="[-0.5, -0.5, 1.5, 1.5]", toid="null")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_feature_ids(response), ["cat-2"])
+
+        response = self.get(geometry_name="cat-4", zoom="12")
+        self.assertEqual(self.get_feature_ids(response), ["cat-4"])
+
+        # GeoJSON is expected to be in WGS84 no matter how the dataset was stored
+        longitude, latitude = json.loads(response.content)["features"][0]["geometry"]["coordinates"]
+        self.assertAlmostEqual(longitude, -10.0, places=4)
+        self.assertAlmostEqual(latitude, -10.0, places=4)
+
+    def test_responses_are_compressed_when_accepted(self):
+        plain_response = self.get(bbox="-0.5,-0.5,1.5,0.5")
+        self.assertNotIn("Content-Encoding", plain_response.headers)
+        self.assertEqual(self.get_feature_ids(plain_response), ["cat-1", "cat-2"])
+
+        compressed_response = self.get(bbox="-0.5,-0.5,1.5,0.5", headers={"Accept-Encoding": "gzip, deflate"})
+        self.assertEqual(compressed_response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", compressed_response.headers["Vary"])
+        self.assertEqual(gzip.decompress(compressed_response.content), plain_response.content)
+
+        # Both responses describe the same content and should have been built once
+        self.assertEqual(compressed_response.headers["ETag"], plain_response.headers["ETag"])
+        self.assertEqual(len(geometry_cache.RESPONSES), 1)
+
+    def test_unchanged_geometry_is_not_sent_again(self):
+        response = self.get(zoom="6")
+        entity_tag = response.headers["ETag"]
+
+        not_modified = self.get(zoom="6", headers={"If-None-Match": entity_tag})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.headers["ETag"], entity_tag)
+        self.assertEqual(not_modified.content, b"")
+
+        # A different level of detail is different content
+        self.assertNotEqual(self.get(zoom="14").headers["ETag"], entity_tag)
+        self.assertEqual(self.get(zoom="14", headers={"If-None-Match": entity_tag}).status_code, 200)
+
+    def test_dataset_is_only_looked_up_once(self):
+        with mock.patch.object(geometry.os, "stat", wraps=geometry.os.stat) as stat:
+            response = self.get(bbox="-0.5,-0.5,1.5,0.5")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_dataset.call_count, 1)
+        self.assertEqual([call.args[0] for call in stat.call_args_list], [self.dataset.path])
+
+    def test_missing_data_is_reported(self):
+        os.remove(self.dataset.path)
+        self.assertEqual(self.get().status_code, 500)
@@ -3,6 +3,7 @@ import typing
 import os
 import json
 import re
+import gzip
 
 from django.views.generic import View
 from django.shortcuts import render
@@ -14,6 +15,7 @@ from django.http import HttpRequest
 from django.http import HttpResponseRedirect
 from django.http import JsonResponse
 from django.http import HttpResponseServerError
+from django.http import HttpResponseNotModified
 
 from rest_framework.views import APIView
 
@@ -25,6 +27,7 @@ import utilities
 from service import application_values
 from evaluation_service import models
 from evaluation_service import choices
+from evaluation_service import geometry_cache
 
 
 EVALUATION_ID_PATTERN = r"[a-zA-Z0-9\.\-_]+"
@@ -48,74 +51,96 @@ This will match on strings like:
 
 
 class GetGeometry(APIView):
+    """
+    Serves geometry from stored datasets as GeoJSON
+
+    Datasets are held in memory by `geometry_cache.GEOMETRY`, and the compressed responses are held by
+    `geometry_cache.RESPONSES` under their entity tags. That means repeated requests from a panning map don't need to
+    touch the disk. A `zoom` parameter may be passed to receive simplified geometry suited to that map zoom level.
+    """
+    @staticmethod
+    def _get_bounding_box(query: typing.Mapping) -> typing.Optional[typing.List[float]]:
+        if query.get("bbox") is not None:
+            bounding_box_match = BBOX_PATTERN.search(query.get("bbox"))
+
+            if bounding_box_match:
+                return [float(val.strip()) for val in bounding_box_match.group().split(",")]
+
+        return None
+
+    @staticmethod
+    def _get_filters(query: typing.Mapping) -> typing.Dict[str, typing.Optional[str]]:
+        return {
+            query_key: query_value
+            for query_key, query_value in query.items()
+            if query_key not in ("geometry", "bbox", "zoom")
+        }
+
     def _find_geometry(
         self,
-        query: typing.Dict,
-        dataset_id: int,
+        query: typing.Mapping,
+        dataset: models.StoredDataset,
+        status: os.stat_result,
         geometry_name: str = None
-    ) -> typing.Union[geopandas.GeoDataFrame, HttpResponse]:
-        dataset = get_object_or_404(models.StoredDataset, pk=dataset_id)
+    ) -> geopandas.GeoDataFrame:
+        cached_geometry = geometry_cache.GEOMETRY.get(dataset.pk, dataset.path, status)
+        tier = cached_geometry.get_tier(geometry_cache.get_zoom_tier(query.get("zoom")))
 
-        if not os.path.exists(dataset.path):
-            return HttpResponseServerError(f"The data for {dataset.name} is not available")
+        return tier.query(
+            bounding_box=self._get_bounding_box(query),
+            filters=self._get_filters(query),
+            geometry_name=geometry_name
+        ).copy()
 
-        bounding_box = None
-        if query.get("bbox") is not None:
-            bounding_box_match = BBOX_PATTERN.search(query.get("bbox"))
+    def _respond(self, request: HttpRequest, query: typing.Mapping, dataset_id: int, geometry_name: str = None):
+        dataset = get_object_or_404(models.StoredDataset, pk=dataset_id)
 
-            if bounding_box_match:
-                bounding_box = [float(val.strip()) for val in bounding_box_match.group().split(",")]
+        try:
+            status = os.stat(dataset.path)
+        except OSError:
+            return HttpResponseServerError(f"The data for {dataset.name} is not available")
 
-        geometry = geopandas.read_file(filename=dataset.path, bbox=bounding_box)
+        entity_tag = geometry_cache.create_etag(
+            dataset.pk,
+            dataset.path,
+            status.st_mtime_ns,
+            status.st_size,
+            geometry_cache.get_zoom_tier(query.get("zoom")),
+            self._get_bounding_box(query),
+            self._get_filters(query),
+            geometry_name
+        )
 
-        pertinent_columns = [
-            column_name
-            for column_name in geometry.keys()
-            if column_name.lower() in ("name", "geometry")
-               or column_name.lower().endswith("id")
-        ]
+        cache_headers = {
+            "ETag": entity_tag,
+            "Vary": "Accept-Encoding",
+            "Cache-Control": "private, must-revalidate",
+        }
 
-        geometry = geometry[pertinent_columns]
+        if entity_tag in request.headers.get("If-None-Match", ""):
+            return HttpResponseNotModified(headers=cache_headers)
 
-        for query_key, query_value in query.items():
-            if query_key == "geometry":
-                continue
+        compressed_data = geometry_cache.RESPONSES.get(entity_tag)
 
-            if query_key in pertinent_columns:
-                if query_value is None or query_value.lower().strip() in ("nan", "null", "na", "none"):
-                    geometry = geometry[geometry[query_key].isnull()]
-                elif pertinent_columns[query_key].dtype == int:
-                    value = int(float(query_value))
-                    geometry = geometry[geometry[query_key] == value]
-                elif pertinent_columns[query_key].dtype == float:
-                    value = float(query_value)
-                    geometry = geometry[geometry[query_key] == value]
-                else:
-                    geometry = geometry[geometry[query_key] == query_value]
+        if compressed_data is None:
+            data = self._find_geometry(query, dataset, status, geometry_name)
+            compressed_data = gzip.compress(data.to_json().encode(), compresslevel=6)
+            geometry_cache.RESPONSES.put(entity_tag, compressed_data)
 
-        if "id" in geometry:
-            geometry.set_index("id", inplace=True)
-        elif "name" in geometry:
-            geometry.set_index("name", inplace=True)
+        headers = {"Content-Type": "application/json"}
+        headers.update(cache_headers)
 
-        if geometry_name:
-            geometry = geometry.filter(items=[geometry_name], axis=0)
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            return HttpResponse(compressed_data, headers=headers)
 
-        return geometry.copy()
+        return HttpResponse(gzip.decompress(compressed_data), headers=headers)
 
     def get(self, request: HttpRequest, dataset_id: int, geometry_name: str = None) -> HttpResponse:
-        data = self._find_geometry(request.GET, dataset_id, geometry_name)
-        if isinstance(data, HttpResponse):
-            return data
-
-        return HttpResponse(data.to_json().encode(), headers={"Content-Type": "application/json"})
+        return self._respond(request, request.GET, dataset_id, geometry_name)
 
     def post(self, request: HttpRequest, dataset_id: int, geometry_name: str = None) -> HttpResponse:
-        data = self._find_geometry(request.POST, dataset_id, geometry_name)
-        if isinstance(data, HttpResponse):
-            return data
-
-        return HttpResponse(data.to_json().encode(), headers={"Content-Type": "application/json"})
+        return self._respond(request, request.POST, dataset_id, geometry_name)
 
 
 class GetGeometryDatasets(APIView):
@@ -17,6 +17,32 @@ def signal_handler(signum, frame):
     exit(1)
 
 
+_BASE_CONTEXT = multiprocessing.get_context()
+
+
+class EvaluationProcess(_BASE_CONTEXT.Process):
+    """
+    A pool process that is never daemonic
+
+    Daemonic processes may not start children, so an evaluation running in one could never score locations in
+    parallel. Pool processes are still terminated explicitly when the pool is closed.
+    """
+    @property
+    def daemon(self) -> bool:
+        return False
+
+    @daemon.setter
+    def daemon(self, value: bool):
+        pass
+
+
+class EvaluationContext(type(_BASE_CONTEXT)):
+    """
+    The default multiprocessing context, except that pools create processes that may start their own children
+    """
+    Process = EvaluationProcess
+
+
 class Arguments(object):
     def __init__(self, *args):
         self.__host: typing.Optional[str] = None
@@ -194,7 +220,8 @@ def listen(
             )
             listener = connection.pubsub()
             listener.subscribe(channel)
-            with multiprocessing.Pool(processes=job_limit) as worker_pool:
+            # Evaluations may score locations across their own process pools (see EVALUATION_SCORING_WORKERS)
+            with EvaluationContext().Pool(processes=job_limit) as worker_pool:
                 for message in listener.listen():
                     run_job(message, worker_pool)
         except Exception as exception:
@@ -2,9 +2,11 @@
 import typing
 import os
 import json
+import threading
 import traceback
 
 from time import sleep
+from time import perf_counter
 from datetime import timedelta
 
 import redis
@@ -158,6 +160,37 @@ def get_maximum_retries() -> int:
     return 5
 
 
+def get_batch_size() -> int:
+    """
+    The optional `EVALUATION_COMMUNICATOR_BATCH_SIZE` environment variable may be set to buffer messages
+
+    Returns:
+        The number of buffered redis commands that will trigger a flush; 1 means commands are sent immediately
+    """
+    batch_size = os.environ.get("EVALUATION_COMMUNICATOR_BATCH_SIZE")
+
+    if batch_size:
+        return max(int(float(batch_size)), 1)
+
+    return 1
+
+
+def get_flush_interval() -> float:
+    """
+    The optional `EVALUATION_COMMUNICATOR_FLUSH_SECONDS` environment variable may be set to control how long
+    messages may be buffered
+
+    Returns:
+        The maximum number of seconds that a buffered command may wait before being sent
+    """
+    seconds = os.environ.get("EVALUATION_COMMUNICATOR_FLUSH_SECONDS")
+
+    if seconds:
+        return max(float(seconds), 0.0)
+
+    return 1.0
+
+
 def get_evaluation_pointers(evaluation_id: str) -> typing.Dict[str, str]:
     """
     Gets the keys for an evaluation's record that point to other Redis objects, such as a list of messages
@@ -182,10 +215,173 @@ def get_evaluation_pointers(evaluation_id: str) -> typing.Dict[str, str]:
     }
 
 
+class BatchStatistics:
+    """
+    Measurements describing how buffered messages have been sent to redis
+    """
+    def __init__(self):
+        self.flush_count: int = 0
+        self.command_count: int = 0
+        self.largest_batch: int = 0
+        self.last_batch_size: int = 0
+        self.total_flush_seconds: float = 0.0
+        self.last_flush_seconds: float = 0.0
+        self.longest_flush_seconds: float = 0.0
+
+    def record(self, batch_size: int, seconds: float):
+        """
+        Record the sending of a batch of commands
+
+        Args:
+            batch_size: The number of commands that were sent together
+            seconds: The number of seconds it took to send them
+        """
+        self.flush_count += 1
+        self.command_count += batch_size
+        self.largest_batch = max(self.largest_batch, batch_size)
+        self.last_batch_size = batch_size
+        self.total_flush_seconds += seconds
+        self.last_flush_seconds = seconds
+        self.longest_flush_seconds = max(self.longest_flush_seconds, seconds)
+
+    @property
+    def average_batch_size(self) -> float:
+        return self.command_count / self.flush_count if self.flush_count else 0.0
+
+    @property
+    def average_flush_seconds(self) -> float:
+        return self.total_flush_seconds / self.flush_count if self.flush_count else 0.0
+
+    def to_dict(self) -> typing.Dict[str, typing.Union[int, float]]:
+        return {
+            "flush_count": self.flush_count,
+            "command_count": self.command_count,
+            "largest_batch": self.largest_batch,
+            "last_batch_size": self.last_batch_size,
+            "average_batch_size": self.average_batch_size,
+            "total_flush_seconds": self.total_flush_seconds,
+            "last_flush_seconds": self.last_flush_seconds,
+            "longest_flush_seconds": self.longest_flush_seconds,
+            "average_flush_seconds": self.average_flush_seconds,
+        }
+
+    def __str__(self):
+        return (
+            f"{self.command_count} commands sent in {self.flush_count} batches "
+            f"(average of {self.average_batch_size:.1f} per batch, {self.average_flush_seconds:.4f}s per flush)"
+        )
+
+
 class RedisCommunicator(communication.Communicator):
     """
     A communicator where all state and message information passes through a redis instance
+
+    When constructed with a batch size greater than 1, messages and their publications are buffered and sent through
+    a single pipeline once the batch is full, once the oldest buffered message has waited for the flush interval,
+    or once an error, completion, or sunset is recorded. Messages sent after completion or failure has been recorded
+    are sent immediately, since nothing may be left running to flush them later.
     """
+    def _send(self, command: str, *args):
+        """
+        Send a command to redis, buffering it if this communicator sends commands in batches
+
+        Args:
+            command: The name of the redis command to call, such as 'rpush' or 'publish'
+            *args: Arguments for the command
+        """
+        if self.__batch_size <= 1 or self.__is_finished:
+            # Send anything still buffered first so that messages stay in order
+            with self.__flush_lock:
+                self.flush()
+                started_at = perf_counter()
+                getattr(self.__connection, command)(*args)
+                with self.__buffer_lock:
+                    self.__statistics.record(1, perf_counter() - started_at)
+            return
+
+        with self.__buffer_lock:
+            self.__buffer.append((command, args))
+            should_flush = len(self.__buffer) >= self.__batch_size
+
+            if not should_flush and self.__flush_timer is None and self.__flush_interval > 0:
+                self.__flush_timer = threading.Timer(self.__flush_interval, self.__flush_on_timer)
+                self.__flush_timer.daemon = True
+                self.__flush_timer.start()
+
+        if should_flush or self.__flush_interval <= 0:
+            self.flush()
+
+    def __flush_on_timer(self):
+        try:
+            self.flush()
+        except Exception as e:
+            service.error(f"Buffered messages for {self.communicator_id} could not be sent: {e}")
+
+    def flush(self):
+        """
+        Send all buffered commands to redis through a single pipeline
+
+        Only one flush runs at a time so that commands keep their order, but the buffer itself is not locked while
+        sending, so other threads may keep adding messages while a flush waits to retry
+        """
+        with self.__flush_lock:
+            with self.__buffer_lock:
+                if self.__flush_timer is not None:
+                    self.__flush_timer.cancel()
+                    self.__flush_timer = None
+
+                if not self.__buffer:
+                    return
+
+                commands = self.__buffer
+                self.__buffer = list()
+
+            try_count = 0
+            latest_error = None
+
+            while try_count < get_maximum_retries():
+                pipeline = self.__connection.pipeline(transaction=False)
+                try:
+                    started_at = perf_counter()
+                    for command, args in commands:
+                        getattr(pipeline, command)(*args)
+
+                    pipeline.execute()
+                    with self.__buffer_lock:
+                        self.__statistics.record(len(commands), perf_counter() - started_at)
+                    return
+                except Exception as e:
+                    latest_error = e
+                    try_count += 1
+                    sleep(get_retry_delay())
+                finally:
+                    if pipeline:
+                        pipeline.reset()
+
+            # Keep the commands so that they may be sent with the next flush
+            with self.__buffer_lock:
+                self.__buffer = commands + self.__buffer
+
+        message = f"{len(commands)} buffered commands for {self.communicator_id} could not be sent"
+        service.error(message)
+        raise latest_error or Exception(message)
+
+    @property
+    def statistics(self) -> BatchStatistics:
+        """
+        Returns:
+            Measurements for how many commands have been sent to redis and how long it took
+        """
+        return self.__statistics
+
+    @property
+    def batch_size(self) -> int:
+        """
+        Returns:
+            The number of commands that may be buffered before they are sent
+        """
+        return self.__batch_size
+
     def update(self, **kwargs):
         """
         Updates state information for the communicator
@@ -218,6 +414,11 @@ class RedisCommunicator(communication.Communicator):
                 pipeline.execute()
                 data_updated = True
                 self.write(reason="update", data=kwargs)
+
+                # Anything listening for the end of the evaluation needs every message sent before it
+                if kwargs.get("complete") or kwargs.get("failed"):
+                    self.__is_finished = True
+                    self.flush()
                 break
             except Exception as e:
                 latest_error = e
@@ -243,6 +444,8 @@ class RedisCommunicator(communication.Communicator):
         Args:
             seconds: The number of seconds left for this communicator's state to live
         """
+        self.flush()
+
         retry_count = 0
         latest_error = None
         remaining_lifespan = int(seconds or default_sunset())
@@ -255,6 +458,8 @@ class RedisCommunicator(communication.Communicator):
                 pipeline.execute()
                 self.__has_sunset = True
                 self.info(f"Resources associated with {self.__core_key} have been sunset for {remaining_lifespan}")
+                self.flush()
+                service.debug(f"Redis traffic for {self.__core_key}: {self.__statistics}")
             except Exception as e:
                 latest_error = e
                 retry_count += 1
@@ -299,11 +504,13 @@ class RedisCommunicator(communication.Communicator):
             timestamp = common.now()
             message = f"[{timestamp}] {message}"
 
-        self.__connection.rpush(self.__error_key, message)
+        self._send("rpush", self.__error_key, message)
 
         if publish:
             self.write(reason="error", data={"error": message})
 
+        self.flush()
+
     def info(self, message: str, verbosity: communication.Verbosity = None, publish: bool = None):
         """
         Publishes a message to the communicator's set of basic information.
@@ -333,7 +540,7 @@ class RedisCommunicator(communication.Communicator):
             timestamp = common.now()
             message = f"[{timestamp}] {message}"
 
-        self.__connection.rpush(self.__info_key, message)
+        self._send("rpush", self.__info_key, message)
         service.info(message)
 
         if publish:
@@ -348,6 +555,7 @@ class RedisCommunicator(communication.Communicator):
         Returns:
             All recorded error messages for this evaluation so far
         """
+        self.flush()
         return self.__connection.lrange(self.__error_key, 0, -1)
 
     def read_info(self) -> typing.Iterable[str]:
@@ -355,6 +563,7 @@ class RedisCommunicator(communication.Communicator):
         Returns:
             All basic notifications for this evaluation so far
         """
+        self.flush()
         return self.__connection.lrange(self.__info_key, 0, -1)
 
     def _validate(self) -> typing.Sequence[str]:
@@ -392,7 +601,7 @@ class RedisCommunicator(communication.Communicator):
         }
 
         # Publish and indent by 4 for later readability
-        self.__connection.publish(self.__channel_name, to_json(message, indent=4))
+        self._send("publish", self.__channel_name, to_json(message, indent=4))
 
         try:
             for handler in self._handlers.get('write', []):
@@ -447,8 +656,30 @@ class RedisCommunicator(communication.Communicator):
         handlers: typing.Dict[str, MESSAGE_HANDLERS] = None,
         include_timestamp: bool = None,
         timestamp_format: str = None,
+        batch_size: int = None,
+        flush_interval: float = None,
         **kwargs
     ):
+        """
+        Constructor
+
+        Args:
+            communicator_id: The ID for the evaluation that this communicates for
+            verbosity: How much information should be communicated
+            host: The host of the redis instance
+            port: The port of the redis instance
+            password: The password for the redis instance
+            timeout: The number of seconds to wait for a message when reading
+            on_receive: Handlers to call when a message is received
+            handlers: Handlers to call for other events
+            include_timestamp: Whether to add timestamps to recorded messages
+            timestamp_format: How timestamps should be formatted
+            batch_size: The number of commands to buffer before sending them to redis; 1 sends them immediately.
+                Defaults to the value from `get_batch_size()`
+            flush_interval: The maximum number of seconds that commands may be buffered. Defaults to the value from
+                `get_flush_interval()`
+            **kwargs:
+        """
         super().__init__(
             communicator_id=communicator_id,
             verbosity=verbosity,
@@ -469,6 +700,14 @@ class RedisCommunicator(communication.Communicator):
         self.__has_sunset = False
         self.__include_timestamp = include_timestamp if include_timestamp is not None else False
         self.__timestamp_format = timestamp_format or application_values.COMMON_DATETIME_FORMAT
+        self.__batch_size = max(int(batch_size), 1) if batch_size is not None else get_batch_size()
+        self.__flush_interval = float(flush_interval) if flush_interval is not None else get_flush_interval()
+        self.__buffer: typing.List[typing.Tuple[str, tuple]] = list()
+        self.__buffer_lock = threading.RLock()
+        self.__flush_lock = threading.RLock()
+        self.__is_finished = False
+        self.__flush_timer: typing.Optional[threading.Timer] = None
+        self.__statistics = BatchStatistics()
 
         if 'receive' in self._handlers:
             self.__publisher_and_subscriber = self.__connection.pubsub()
@@ -492,6 +731,9 @@ class RedisCommunicator(communication.Communicator):
         )
 
     def __del__(self):
+        # Nothing will be left to flush messages once this is gone, so whatever is sent from here on goes out directly
+        self.__is_finished = True
+
         try:
             if self.__publisher_and_subscriber:
                 self.__publisher_and_subscriber.close()
@@ -503,6 +745,11 @@ class RedisCommunicator(communication.Communicator):
                 self.sunset()
             except Exception as e:
                 self.error(f"Data for {self.__core_key} could not be scheduled for deletion", e)
+        else:
+            try:
+                self.flush()
+            except Exception as e:
+                service.error(f"Buffered messages for {self.__core_key} could not be sent: {e}")
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}: {self.channel}"
@@ -205,7 +205,8 @@ def evaluate(evaluation_id: str, definition_json: str, arguments: Arguments = No
     }
 
     try:
-        evaluator = Evaluator(definition, communicators=communicators, verbosity=verbosity)
+        scoring_workers = int(float(os.environ.get("EVALUATION_SCORING_WORKERS", 1)))
+        evaluator = Evaluator(definition, communicators=communicators, verbosity=verbosity, workers=scoring_workers)
         communicators.info(f"starting {evaluation_id}", publish=should_publish)
         results = evaluator.evaluate()
         communicators.info("Result: {:.2f}%".format(results.grade), publish=should_publish)
@@ -18,5 +18,6 @@ setup(
     url='',
     license='',
     install_requires=['redis', 'dmod-evaluations', 'channels', 'channels-redis'],
+    extras_require={'test': ['fakeredis']},
     packages=find_namespace_packages(exclude=['dmod.test', 'deprecated', 'conf', 'schemas', 'ssl', 'src'])
 )
@@ -444,42 +444,43 @@ class ServiceManager(HydrofabricFilesManager, WebSocketInterface):
 
     async def manage_job_partitioning(self):
         """
-        Task method to periodically generate partition configs for jobs that require them.
+        Task method to generate partition configs for jobs as they come to require them.
+
+        Jobs are examined as soon as they are updated, with all active jobs also examined periodically as a fallback.
+        Each job is locked only while it is being partitioned.
         """
         logging.info("Starting partitioner service management loop for job partition generation.")
-        while True:
-            lock_id = str(uuid4())
-            while not self._job_util.lock_active_jobs(lock_id):
-                await asyncio.sleep(2)
-
-            for job in [j for j in self._job_util.get_all_active_jobs() if
-                        j.status_step == JobExecStep.AWAITING_PARTITIONING]:
-
-                if job.cpu_count == 1:
-                    logging.warning("No need to partition job {} with only 1 CPU allocated".format(job.job_id))
-                    job.status_step = JobExecStep.AWAITING_ALLOCATION
-                    continue
-
-                logging.info("Processing partitioning for active job {}".format(job.job_id))
-                try:
-                    # See if there is already an existing dataset to use for this
-                    part_dataset_search_result = await self._find_partition_dataset(job)
-                    # If either one was found, or we can create a new partition config dataset, move to allocations
-                    if part_dataset_search_result.success or (await self._generate_partition_config_dataset(job)):
+        async for jobs in self._job_util.watch_active_jobs():
+            for job_id in [j.job_id for j in jobs if j.status_step == JobExecStep.AWAITING_PARTITIONING]:
+                with self._job_util.locked_job(job_id) as job:
+                    # Skip jobs locked elsewhere or already moved along; any later update will bring them back
+                    if job is None or job.status_step != JobExecStep.AWAITING_PARTITIONING:
+                        continue
+
+                    if job.cpu_count == 1:
+                        logging.warning("No need to partition job {} with only 1 CPU allocated".format(job.job_id))
                         job.status_step = JobExecStep.AWAITING_ALLOCATION
-                    else:
+                        continue
+
+                    logging.info("Processing partitioning for active job {}".format(job.job_id))
+                    try:
+                        # See if there is already an existing dataset to use for this
+                        part_dataset_search_result = await self._find_partition_dataset(job)
+                        # If either one was found, or we can create a new partition config dataset, move to allocations
+                        if part_dataset_search_result.success or (await self._generate_partition_config_dataset(job)):
+                            job.status_step = JobExecStep.AWAITING_ALLOCATION
+                        else:
+                            job.status_step = JobExecStep.PARTITIONING_FAILED
+                    except Exception as e:
+                        logging.error("Partition dataset generation for {} failed due to error - {}".format(job.job_id,
+                                                                                                            e))
                         job.status_step = JobExecStep.PARTITIONING_FAILED
-                except Exception as e:
-                    logging.error("Partition dataset generation for {} failed due to error - {}".format(job.job_id, e))
-                    job.status_step = JobExecStep.PARTITIONING_FAILED
-                # Protect service task against problems with an individual save attempt
-                try:
-                    self._job_util.save_job(job)
-                except:
-                    # TODO: (later) logging would be good, and perhaps maybe retries
-                    pass
-            self._job_util.unlock_active_jobs(lock_id)
-            await asyncio.sleep(5)
+                    # Protect service task against problems with an individual save attempt
+                    try:
+                        self._job_util.save_job(job)
+                    except:
+                        # TODO: (later) logging would be good, and perhaps maybe retries
+                        pass
 
 
 